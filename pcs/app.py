@@ -20,26 +20,6 @@ from pcs.cli.reports.output import (
     error,
     print_to_stderr,
 )
-from pcs.cli.routing import (
-    acl,
-    alert,
-    booth,
-    client,
-    cluster,
-    config,
-    constraint,
-    dr,
-    host,
-    node,
-    pcsd,
-    prop,
-    qdevice,
-    quorum,
-    resource,
-    status,
-    stonith,
-    tag,
-)
 from pcs.common import capabilities
 from pcs.lib.errors import LibraryError
 
@@ -117,24 +97,14 @@ usefile = False
 filename = ""
 
 
-def main(argv=None):
-    # pylint: disable=global-statement
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-locals
-    # pylint: disable=too-many-statements
-    if completion.has_applicable_environment(os.environ):
-        print(
-            completion.make_suggestions(
-                os.environ, usage.generate_completion_tree_from_usage()
-            )
-        )
-        sys.exit()
-
-    argv = argv if argv else sys.argv[1:]
-    utils.subprocess_setup()
-    global filename, usefile
-    utils.pcs_options = {}
+def split_options(argv):
+    """
+    Split command line arguments to pcs options and command arguments, exit
+    if the options cannot be parsed
 
+    Return a list of option-value pairs, command arguments and the value of
+    --wait
+    """
     # we want to support optional arguments for --wait, so if an argument
     # is specified with --wait (ie. --wait=30) then we use them
     waitsecs = None
@@ -179,6 +149,76 @@ def main(argv=None):
         print_to_stderr(usage.main())
         sys.exit(1)
 
+    return pcs_options, argv, waitsecs
+
+
+def run_command(argv):
+    """
+    Run a pcs command with pcs options already stored in utils, exit if the
+    command fails
+    """
+    # Command modules are imported only when their command is run, so that
+    # pcs doesn't spend time on loading all of them on each run.
+    cmd_map = {
+        cmd: routing.create_lazy_cmd(f"pcs.cli.routing.{module}", func)
+        for cmd, module, func in (
+            ("resource", "resource", "resource_cmd"),
+            ("cluster", "cluster", "cluster_cmd"),
+            ("stonith", "stonith", "stonith_cmd"),
+            ("property", "prop", "property_cmd"),
+            ("constraint", "constraint", "constraint_cmd"),
+            ("acl", "acl", "acl_cmd"),
+            ("status", "status", "status_cmd"),
+            ("config", "config", "config_cmd"),
+            ("pcsd", "pcsd", "pcsd_cmd"),
+            ("node", "node", "node_cmd"),
+            ("quorum", "quorum", "quorum_cmd"),
+            ("qdevice", "qdevice", "qdevice_cmd"),
+            ("alert", "alert", "alert_cmd"),
+            ("booth", "booth", "booth_cmd"),
+            ("host", "host", "host_cmd"),
+            ("client", "client", "client_cmd"),
+            ("dr", "dr", "dr_cmd"),
+            ("tag", "tag", "tag_cmd"),
+        )
+    }
+    cmd_map["help"] = lambda lib, argv, modifiers: print(usage.main())
+    try:
+        routing.create_router(cmd_map, [])(
+            utils.get_library_wrapper(), argv, utils.get_input_modifiers()
+        )
+    except LibraryError as e:
+        if e.output:
+            sys.stderr.write(e.output)
+            sys.exit(1)
+        process_library_reports(e.args)
+    except errors.CmdLineInputError:
+        if argv and argv[0] in cmd_map:
+            usage.show(argv[0], [])
+        else:
+            print_to_stderr(usage.main())
+        sys.exit(1)
+
+
+def main(argv=None):
+    # pylint: disable=global-statement
+    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-statements
+    if completion.has_applicable_environment(os.environ):
+        print(
+            completion.make_suggestions(
+                os.environ, usage.generate_completion_tree_from_usage()
+            )
+        )
+        sys.exit()
+
+    argv = argv if argv else sys.argv[1:]
+    utils.subprocess_setup()
+    global filename, usefile
+    utils.pcs_options = {}
+
+    pcs_options, argv, waitsecs = split_options(argv)
+
     full = False
     for option, dummy_value in pcs_options:
         if option == "--full":
@@ -243,39 +283,4 @@ def main(argv=None):
 
     if (os.getuid() != 0) and (argv and argv[0] != "help") and not usefile:
         _non_root_run(argv)
-    cmd_map = {
-        "resource": resource.resource_cmd,
-        "cluster": cluster.cluster_cmd,
-        "stonith": stonith.stonith_cmd,
-        "property": prop.property_cmd,
-        "constraint": constraint.constraint_cmd,
-        "acl": acl.acl_cmd,
-        "status": status.status_cmd,
-        "config": config.config_cmd,
-        "pcsd": pcsd.pcsd_cmd,
-        "node": node.node_cmd,
-        "quorum": quorum.quorum_cmd,
-        "qdevice": qdevice.qdevice_cmd,
-        "alert": alert.alert_cmd,
-        "booth": booth.booth_cmd,
-        "host": host.host_cmd,
-        "client": client.client_cmd,
-        "dr": dr.dr_cmd,
-        "tag": tag.tag_cmd,
-        "help": lambda lib, argv, modifiers: print(usage.main()),
-    }
-    try:
-        routing.create_router(cmd_map, [])(
-            utils.get_library_wrapper(), argv, utils.get_input_modifiers()
-        )
-    except LibraryError as e:
-        if e.output:
-            sys.stderr.write(e.output)
-            sys.exit(1)
-        process_library_reports(e.args)
-    except errors.CmdLineInputError:
-        if argv and argv[0] in cmd_map:
-            usage.show(argv[0], [])
-        else:
-            print_to_stderr(usage.main())
-        sys.exit(1)
+    run_command(argv)
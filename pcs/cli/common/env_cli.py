@@ -11,3 +11,5 @@ class Env:
         self.debug = False
         self.request_timeout = None
         self.report_processor = None
+        # shared by read-only library commands run by one CLI command
+        self.cib_snapshot = None
@@ -1,39 +1,14 @@
 import logging
 from collections import namedtuple
+from contextlib import contextmanager
+from typing import Iterator
 
 from pcs import settings
 from pcs.cli.common import middleware
-from pcs.lib.commands import (
-    acl,
-    alert,
-    booth,
-    cib,
-    cib_options,
-    cluster,
-    cluster_property,
-    dr,
-    fencing_topology,
-    node,
-    pcsd,
-    qdevice,
-    quorum,
-    remote_node,
-    resource,
-    resource_agent,
-    sbd,
-    scsi,
-    services,
-    status,
-    stonith,
-    stonith_agent,
-    tag,
-)
-from pcs.lib.commands.constraint import colocation as constraint_colocation
-from pcs.lib.commands.constraint import common as constraint_common
-from pcs.lib.commands.constraint import location as constraint_location
-from pcs.lib.commands.constraint import order as constraint_order
-from pcs.lib.commands.constraint import ticket as constraint_ticket
+from pcs.lib.cib.snapshot import CibSnapshot
 from pcs.lib.env import LibraryEnvironment
+from pcs.lib.pacemaker.capabilities import PcmkCapabilityCache
+from pcs.lib.resource_agent import ResourceAgentMetadataCache
 
 
 def wrapper(dictionary):
@@ -51,9 +26,31 @@ def cli_env_to_lib_env(cli_env):
         booth_files_data=cli_env.booth,
         known_hosts_getter=cli_env.known_hosts_getter,
         request_timeout=cli_env.request_timeout,
+        resource_agent_metadata_cache=ResourceAgentMetadataCache(
+            settings.resource_agent_metadata_cache_dir
+        ),
+        cib_snapshot=cli_env.cib_snapshot,
+        pcmk_capability_cache=PcmkCapabilityCache(
+            settings.pacemaker_capabilities_cache_file
+        ),
     )
 
 
+@contextmanager
+def shared_cib_snapshot(cli_env) -> Iterator[None]:
+    """
+    Let read-only library commands run in the block load the CIB only once
+    """
+    if cli_env.cib_snapshot is not None:
+        yield
+        return
+    cli_env.cib_snapshot = CibSnapshot()
+    try:
+        yield
+    finally:
+        cli_env.cib_snapshot = None
+
+
 def lib_env_to_cli_env(lib_env, cli_env):
     if not lib_env.is_cib_live:
         cli_env.cib_data = lib_env.final_mocked_cib_content
@@ -103,9 +100,16 @@ def bind_all(env, run_with_middleware, dictionary):
 
 
 def load_module(env, middleware_factory, name):
+    # pylint: disable=import-outside-toplevel
     # pylint: disable=too-many-branches
+    # pylint: disable=too-many-locals
     # pylint: disable=too-many-return-statements
+    # pylint: disable=too-many-statements
+    # Library commands are imported only when they are needed. Importing all
+    # of them would significantly slow down startup of every pcs command.
     if name == "acl":
+        from pcs.lib.commands import acl
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -129,6 +133,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "alert":
+        from pcs.lib.commands import alert
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -144,6 +150,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "booth":
+        from pcs.lib.commands import booth
+
         bindings = {
             "config_setup": booth.config_setup,
             "config_destroy": booth.config_destroy,
@@ -180,6 +188,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cib":
+        from pcs.lib.commands import cib
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -189,6 +199,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cluster":
+        from pcs.lib.commands import cluster
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -214,6 +226,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "dr":
+        from pcs.lib.commands import dr
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -226,6 +240,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "remote_node":
+        from pcs.lib.commands import remote_node
+
         return bind_all(
             env,
             middleware.build(
@@ -241,6 +257,10 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_colocation":
+        from pcs.lib.commands.constraint import (
+            colocation as constraint_colocation,
+        )
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -250,6 +270,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_location":
+        from pcs.lib.commands.constraint import location as constraint_location
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -260,6 +282,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_order":
+        from pcs.lib.commands.constraint import order as constraint_order
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -269,6 +293,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_ticket":
+        from pcs.lib.commands.constraint import ticket as constraint_ticket
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -280,6 +306,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint":
+        from pcs.lib.commands.constraint import common as constraint_common
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -289,6 +317,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "fencing_topology":
+        from pcs.lib.commands import fencing_topology
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -304,6 +334,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "node":
+        from pcs.lib.commands import node
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -324,6 +356,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "pcsd":
+        from pcs.lib.commands import pcsd
+
         return bind_all(
             env,
             middleware.build(),
@@ -331,6 +365,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "qdevice":
+        from pcs.lib.commands import qdevice
+
         return bind_all(
             env,
             middleware.build(),
@@ -356,6 +392,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "quorum":
+        from pcs.lib.commands import quorum
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -376,10 +414,13 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource_agent":
+        from pcs.lib.commands import resource_agent
+
         return bind_all(
             env,
             middleware.build(),
             {
+                "clear_metadata_cache": resource_agent.clear_metadata_cache,
                 "describe_agent": resource_agent.describe_agent,
                 "get_agent_default_operations": resource_agent.get_agent_default_operations,
                 "get_agent_metadata": resource_agent.get_agent_metadata,
@@ -395,6 +436,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource":
+        from pcs.lib.commands import resource
+
         return bind_all(
             env,
             middleware.build(
@@ -408,6 +451,7 @@ def load_module(env, middleware_factory, name):
                 "bundle_update": resource.bundle_update,
                 "create": resource.create,
                 "create_as_clone": resource.create_as_clone,
+                "create_bulk": resource.create_bulk,
                 "create_in_group": resource.create_in_group,
                 "create_into_bundle": resource.create_into_bundle,
                 "disable": resource.disable,
@@ -431,6 +475,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cib_options":
+        from pcs.lib.commands import cib_options
+
         return bind_all(
             env,
             middleware.build(
@@ -449,6 +495,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "status":
+        from pcs.lib.commands import status
+
         return bind_all(
             env,
             middleware.build(
@@ -465,6 +513,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith":
+        from pcs.lib.commands import stonith
+
         return bind_all(
             env,
             middleware.build(
@@ -482,6 +532,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "sbd":
+        from pcs.lib.commands import sbd
+
         return bind_all(
             env,
             middleware.build(),
@@ -502,6 +554,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "services":
+        from pcs.lib.commands import services
+
         return bind_all(
             env,
             middleware.build(),
@@ -514,6 +568,8 @@ def load_module(env, middleware_factory, name):
             },
         )
     if name == "scsi":
+        from pcs.lib.commands import scsi
+
         return bind_all(
             env,
             middleware.build(),
@@ -524,6 +580,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith_agent":
+        from pcs.lib.commands import stonith_agent
+
         return bind_all(
             env,
             middleware.build(),
@@ -534,6 +592,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "tag":
+        from pcs.lib.commands import tag
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -546,6 +606,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cluster_property":
+        from pcs.lib.commands import cluster_property
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
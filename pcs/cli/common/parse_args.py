@@ -118,6 +118,8 @@ PCS_LONG_OPTIONS: Final = [
     "quiet",
     # proceed with dangerous actions, meant for / used in CLI only
     "yes",
+    # drop cached metadata of resource and stonith agents
+    "refresh-cache",
 ]
 
 
@@ -557,6 +559,7 @@ class InputModifiers:
                 "--overwrite": "--overwrite" in options,
                 "--pacemaker": "--pacemaker" in options,
                 "--promoted": "--promoted" in options,
+                "--refresh-cache": "--refresh-cache" in options,
                 "--safe": "--safe" in options,
                 "--simulate": "--simulate" in options,
                 "--skip-offline": "--skip-offline" in options,
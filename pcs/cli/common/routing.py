@@ -1,3 +1,4 @@
+import importlib
 from typing import (
     Any,
     Callable,
@@ -39,3 +40,18 @@ def create_router(
             )
 
     return _router
+
+
+def create_lazy_cmd(module_name: str, cmd_name: str) -> CliCmdInterface:
+    """
+    Return a command which imports its module only when it is run
+
+    module_name -- full name of a module defining the command
+    cmd_name -- name of the command function in the module
+    """
+
+    def _cmd(lib: Any, argv: List[str], modifiers: InputModifiers) -> None:
+        cmd = getattr(importlib.import_module(module_name), cmd_name)
+        return cmd(lib, argv, modifiers)
+
+    return _cmd
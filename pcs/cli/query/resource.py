@@ -1,6 +1,14 @@
+import json
+import shlex
+import sys
+from dataclasses import dataclass
 from typing import (
     Any,
+    Callable,
+    Mapping,
+    NoReturn,
     Optional,
+    Union,
     cast,
 )
 
@@ -33,18 +41,23 @@ from pcs.common.str_tools import (
     format_list,
     format_optional,
 )
+from pcs.common.tools import format_os_error
 
 
-def _handle_query_result(result: bool, quiet: bool) -> SystemExit:
-    if not quiet:
-        print(result)
+@dataclass(frozen=True)
+class _QueryOutcome:
+    # result of is-* queries, None for get-* queries
+    result: Optional[bool]
+    # value returned by get-* queries and ids of containers in is-in-* queries
+    value: Union[None, int, str, list[str]]
+    # items printed by the query, each one by its own print call
+    output: list[Any]
+
 
-    if result:
-        return SystemExit(0)
-    return SystemExit(2)
+_Query = Callable[[ResourcesStatusFacade], _QueryOutcome]
 
 
-def _handle_resource_exception(e: ResourceException) -> None:
+def _handle_resource_exception(e: ResourceException) -> NoReturn:
     resource_id = f"{e.resource_id}{format_optional(e.instance_id, ':{}')}"
     if isinstance(e, ResourceNonExistentException):
         raise CmdLineInputError(f"Resource '{resource_id}' does not exist")
@@ -64,7 +77,7 @@ def _handle_resource_exception(e: ResourceException) -> None:
     raise CmdLineInputError(f"Unknown error with resource '{resource_id}'")
 
 
-def _handle_query_exception(e: QueryException) -> None:
+def _handle_query_exception(e: QueryException) -> NoReturn:
     if isinstance(e, MembersQuantifierUnsupportedException):
         raise CmdLineInputError(
             "'members' quantifier can be used only on group resources or "
@@ -92,6 +105,33 @@ def _handle_get_modifiers(modifiers: InputModifiers) -> None:
     modifiers.ensure_only_supported("-f")
 
 
+def _bool_outcome(result: bool) -> _QueryOutcome:
+    return _QueryOutcome(result, None, [result])
+
+
+def _evaluate_query(
+    query: _Query, resources_status: ResourcesStatusFacade
+) -> _QueryOutcome:
+    try:
+        return query(resources_status)
+    except ResourceException as e:
+        _handle_resource_exception(e)
+    except QueryException as e:
+        _handle_query_exception(e)
+    except NotImplementedError as e:
+        raise CmdLineInputError(str(e)) from e
+
+
+def _run_query(lib: Any, query: _Query, quiet: bool = False) -> None:
+    outcome = _evaluate_query(query, _get_resource_status_facade(lib))
+    if not quiet:
+        for item in outcome.output:
+            print(item)
+    if outcome.result is None:
+        return
+    raise SystemExit(0 if outcome.result else 2)
+
+
 def _get_resource_status_facade(lib: Any) -> ResourcesStatusFacade:
     dto = lib.status.resources_status()
     return ResourcesStatusFacade.from_resources_status_dto(dto)
@@ -164,33 +204,29 @@ def _pop_resource_id(argv: Argv) -> tuple[str, Optional[str]]:
     return resource_id, None
 
 
-def exists(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
-    """
-    Options:
-        * -f - CIB file
-        * --quiet - do not print anything to output
-    """
+def _parse_exists(argv: Argv) -> _Query:
     resource_id, instance_id = _pop_resource_id(argv)
     if argv:
         raise CmdLineInputError()
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    raise _handle_query_result(
-        _get_resource_status_facade(lib).exists(resource_id, instance_id),
-        quiet,
+    return lambda resources_status: _bool_outcome(
+        resources_status.exists(resource_id, instance_id)
     )
 
 
-def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def exists(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
-
+    query = _parse_exists(argv)
     quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
+
+
+def _parse_is_type(argv: Argv) -> _Query:
+    resource_id, instance_id = _pop_resource_id(argv)
 
     sections = group_by_keywords(argv, ["unique", "promotable"], "type")
     sections.ensure_unique_keywords()
@@ -229,128 +265,127 @@ def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
                 f"type '{expected_type.value}' cannot be promotable"
             )
 
-    resources_status = _get_resource_status_facade(lib)
-    try:
+    def query(resources_status: ResourcesStatusFacade) -> _QueryOutcome:
         result = (
             resources_status.get_type(resource_id, instance_id) == expected_type
         )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    if result and check_unique:
-        result = resources_status.is_unique(resource_id, instance_id)
-
-    if result and check_promotable:
-        result = resources_status.is_promotable(resource_id, instance_id)
+        if result and check_unique:
+            result = resources_status.is_unique(resource_id, instance_id)
+        if result and check_promotable:
+            result = resources_status.is_promotable(resource_id, instance_id)
+        return _bool_outcome(result)
 
-    raise _handle_query_result(result, quiet)
+    return query
 
 
-def get_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def is_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, _parse_is_type(argv), quiet)
+
 
+def _parse_get_type(argv: Argv) -> _Query:
+    resource_id, instance_id = _pop_resource_id(argv)
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
-    resource_status = _get_resource_status_facade(lib)
-
-    try:
-        resource_type = resource_status.get_type(resource_id, instance_id)
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    output = [resource_type.value]
-    if can_be_unique(resource_type) and resource_status.is_unique(
-        resource_id, instance_id
-    ):
-        output.append("unique")
-    if can_be_promotable(resource_type) and resource_status.is_promotable(
-        resource_id, instance_id
-    ):
-        output.append("promotable")
+    def query(resources_status: ResourcesStatusFacade) -> _QueryOutcome:
+        resource_type = resources_status.get_type(resource_id, instance_id)
+        output = [resource_type.value]
+        if can_be_unique(resource_type) and resources_status.is_unique(
+            resource_id, instance_id
+        ):
+            output.append("unique")
+        if can_be_promotable(resource_type) and resources_status.is_promotable(
+            resource_id, instance_id
+        ):
+            output.append("promotable")
+        value = " ".join(output)
+        return _QueryOutcome(None, value, [value])
 
-    print(" ".join(output))
+    return query
 
 
-def is_stonith(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def get_type(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
-        * --quiet - do not print anything to output
     """
+    query = _parse_get_type(argv)
+    _handle_get_modifiers(modifiers)
+    _run_query(lib, query)
+
+
+def _parse_is_stonith(argv: Argv) -> _Query:
     resource_id, instance_id = _pop_resource_id(argv)
     if argv:
         raise CmdLineInputError()
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    try:
-        result = _get_resource_status_facade(lib).is_stonith(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    raise _handle_query_result(result, quiet)
+    return lambda resources_status: _bool_outcome(
+        resources_status.is_stonith(resource_id, instance_id)
+    )
 
 
-def get_members(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def is_stonith(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
+    query = _parse_is_stonith(argv)
+    quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
+
+
+def _list_outcome(items: list[str]) -> _QueryOutcome:
+    return _QueryOutcome(None, items, ["\n".join(items)])
+
+
+def _parse_get_members(argv: Argv) -> _Query:
     resource_id, instance_id = _pop_resource_id(argv)
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
-
-    try:
-        members = _get_resource_status_facade(lib).get_members(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    print("\n".join(members))
+    return lambda resources_status: _list_outcome(
+        resources_status.get_members(resource_id, instance_id)
+    )
 
 
-def get_nodes(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def get_members(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
-        * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    query = _parse_get_members(argv)
+    _handle_get_modifiers(modifiers)
+    _run_query(lib, query)
+
 
+def _parse_get_nodes(argv: Argv) -> _Query:
+    resource_id, instance_id = _pop_resource_id(argv)
     if argv:
         raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
-    try:
-        nodes = _get_resource_status_facade(lib).get_nodes(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-
-    print("\n".join(nodes))
+    return lambda resources_status: _list_outcome(
+        resources_status.get_nodes(resource_id, instance_id)
+    )
 
 
-def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+def get_nodes(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
-        * --quiet - do not print anything to output
     """
-    # pylint: disable=too-many-locals
+    query = _parse_get_nodes(argv)
+    _handle_get_modifiers(modifiers)
+    _run_query(lib, query)
+
+
+def _parse_is_state(argv: Argv) -> _Query:
     resource_id, instance_id = _pop_resource_id(argv)
 
     sections = group_by_keywords(
@@ -376,24 +411,23 @@ def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     members_quantifier = _parse_more_members_quantifier(sections, "members")
     instances_quantifier = _parse_more_members_quantifier(sections, "instances")
 
-    quiet = _handle_is_modifiers(modifiers)
-
-    resource_status = _get_resource_status_facade(lib)
-    try:
+    def query(resources_status: ResourcesStatusFacade) -> _QueryOutcome:
         if expected_value is not None and (
             expected_state in (ResourceState.LOCKED_TO, ResourceState.PENDING)
         ):
-            result = resource_status.is_state_exact_value(
-                resource_id,
-                instance_id,
-                cast(ResourceStateExactCheck, expected_state),
-                expected_value,
-                expected_node_name,
-                members_quantifier,
-                instances_quantifier,
+            return _bool_outcome(
+                resources_status.is_state_exact_value(
+                    resource_id,
+                    instance_id,
+                    cast(ResourceStateExactCheck, expected_state),
+                    expected_value,
+                    expected_node_name,
+                    members_quantifier,
+                    instances_quantifier,
+                )
             )
-        else:
-            result = resource_status.is_state(
+        return _bool_outcome(
+            resources_status.is_state(
                 resource_id,
                 instance_id,
                 expected_state,
@@ -401,31 +435,55 @@ def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
                 members_quantifier,
                 instances_quantifier,
             )
-    except ResourceException as e:
-        _handle_resource_exception(e)
-    except QueryException as e:
-        _handle_query_exception(e)
-    except NotImplementedError as e:
-        raise CmdLineInputError(str(e)) from e
+        )
+
+    return query
 
-    raise _handle_query_result(result, quiet)
+
+def is_state(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    query = _parse_is_state(argv)
+    quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
 
 
-def _handle_is_in_container(
-    real_id: Optional[str], expected_id: Optional[str], quiet: bool
-) -> SystemExit:
+def _in_container_outcome(
+    real_id: Optional[str], expected_id: Optional[str]
+) -> _QueryOutcome:
     is_in_container = real_id is not None and (
         expected_id is None or real_id == expected_id
     )
+    output: list[Any] = [is_in_container]
+    if real_id is not None:
+        output.append(real_id)
+    return _QueryOutcome(is_in_container, real_id, output)
+
+
+def _parse_is_in_container(
+    argv: Argv,
+    get_container_id: Callable[
+        [ResourcesStatusFacade, str, Optional[str]], Optional[str]
+    ],
+) -> _Query:
+    resource_id, instance_id = _pop_resource_id(argv)
+    if len(argv) > 1:
+        raise CmdLineInputError()
+    expected_id = argv[0] if argv else None
+
+    return lambda resources_status: _in_container_outcome(
+        get_container_id(resources_status, resource_id, instance_id),
+        expected_id,
+    )
 
-    if not quiet:
-        print(is_in_container)
-        if real_id is not None:
-            print(real_id)
 
-    if not is_in_container:
-        return SystemExit(2)
-    return SystemExit(0)
+def _parse_is_in_group(argv: Argv) -> _Query:
+    return _parse_is_in_container(
+        argv, ResourcesStatusFacade.get_parent_group_id
+    )
 
 
 def is_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
@@ -434,21 +492,15 @@ def is_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_group_id = argv[0] if argv else None
-
+    query = _parse_is_in_group(argv)
     quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
 
-    try:
-        group_id = _get_resource_status_facade(lib).get_parent_group_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
 
-    raise _handle_is_in_container(group_id, expected_group_id, quiet)
+def _parse_is_in_clone(argv: Argv) -> _Query:
+    return _parse_is_in_container(
+        argv, ResourcesStatusFacade.get_parent_clone_id
+    )
 
 
 def is_in_clone(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
@@ -457,22 +509,15 @@ def is_in_clone(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
-
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_clone_id = argv[0] if argv else None
-
+    query = _parse_is_in_clone(argv)
     quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
 
-    try:
-        clone_id = _get_resource_status_facade(lib).get_parent_clone_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
 
-    raise _handle_is_in_container(clone_id, expected_clone_id, quiet)
+def _parse_is_in_bundle(argv: Argv) -> _Query:
+    return _parse_is_in_container(
+        argv, ResourcesStatusFacade.get_parent_bundle_id
+    )
 
 
 def is_in_bundle(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
@@ -481,42 +526,126 @@ def is_in_bundle(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         * -f - CIB file
         * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    query = _parse_is_in_bundle(argv)
+    quiet = _handle_is_modifiers(modifiers)
+    _run_query(lib, query, quiet)
 
-    if len(argv) > 1:
-        raise CmdLineInputError()
-    expected_bundle_id = argv[0] if argv else None
 
-    quiet = _handle_is_modifiers(modifiers)
+def _parse_get_index_in_group(argv: Argv) -> _Query:
+    resource_id, instance_id = _pop_resource_id(argv)
+    if argv:
+        raise CmdLineInputError()
 
-    try:
-        bundle_id = _get_resource_status_facade(lib).get_parent_bundle_id(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
+    def query(resources_status: ResourcesStatusFacade) -> _QueryOutcome:
+        index = resources_status.get_index_in_group(resource_id, instance_id)
+        return _QueryOutcome(None, index, [index])
 
-    raise _handle_is_in_container(bundle_id, expected_bundle_id, quiet)
+    return query
 
 
 def get_index_in_group(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
         * -f - CIB file
-        * --quiet - do not print anything to output
     """
-    resource_id, instance_id = _pop_resource_id(argv)
+    query = _parse_get_index_in_group(argv)
+    _handle_get_modifiers(modifiers)
+    _run_query(lib, query)
 
-    if argv:
-        raise CmdLineInputError()
 
-    _handle_get_modifiers(modifiers)
+_QUERY_PARSERS: Mapping[str, Callable[[Argv], _Query]] = {
+    "exists": _parse_exists,
+    "is-in-bundle": _parse_is_in_bundle,
+    "is-in-clone": _parse_is_in_clone,
+    "is-in-group": _parse_is_in_group,
+    "is-state": _parse_is_state,
+    "is-stonith": _parse_is_stonith,
+    "is-type": _parse_is_type,
+    "get-type": _parse_get_type,
+    "get-members": _parse_get_members,
+    "get-nodes": _parse_get_nodes,
+    "get-index-in-group": _parse_get_index_in_group,
+}
+
 
+def _parse_batch_query(query_line: str) -> _Query:
     try:
-        index = _get_resource_status_facade(lib).get_index_in_group(
-            resource_id, instance_id
-        )
-    except ResourceException as e:
-        _handle_resource_exception(e)
+        argv = shlex.split(query_line)
+    except ValueError as e:
+        raise CmdLineInputError(f"Unable to parse the query: {e}") from e
+    if len(argv) < 3 or argv[0] != "resource":
+        raise CmdLineInputError()
+    resource_id, query_name = argv[1], argv[2]
+    if query_name not in _QUERY_PARSERS:
+        raise CmdLineInputError(f"Unknown query '{query_name}'")
+    return _QUERY_PARSERS[query_name]([resource_id] + argv[3:])
+
+
+def _load_batch_queries(argv: Argv) -> list[str]:
+    if argv and argv[0] == "file":
+        if len(argv) != 2:
+            raise CmdLineInputError()
+        try:
+            with open(argv[1], encoding="utf-8") as query_file:
+                lines = query_file.read().splitlines()
+        except OSError as e:
+            raise CmdLineInputError(
+                f"Unable to read queries: {format_os_error(e)}"
+            ) from e
+    elif argv:
+        lines = argv
+    else:
+        lines = sys.stdin.read().splitlines()
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def batch(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+        * -f - CIB file
+        * --quiet - do not print anything to output
+    """
+    query_lines = _load_batch_queries(argv)
+    quiet = _handle_is_modifiers(modifiers)
+    if not query_lines:
+        raise CmdLineInputError("No queries specified")
+
+    parsed_queries: list[Union[_Query, CmdLineInputError]] = []
+    for query_line in query_lines:
+        try:
+            parsed_queries.append(_parse_batch_query(query_line))
+        except CmdLineInputError as e:
+            parsed_queries.append(e)
+
+    resources_status = None
+    result_list = []
+    for query_line, query in zip(query_lines, parsed_queries):
+        query_result: dict[str, Any] = {
+            "query": query_line,
+            "result": None,
+            "value": None,
+            "error": None,
+        }
+        try:
+            if isinstance(query, CmdLineInputError):
+                raise query
+            if resources_status is None:
+                resources_status = _get_resource_status_facade(lib)
+            outcome = _evaluate_query(query, resources_status)
+            query_result["result"] = outcome.result
+            query_result["value"] = outcome.value
+        except CmdLineInputError as e:
+            query_result["error"] = e.message or "Invalid query"
+        result_list.append(query_result)
 
-    print(index)
+    if not quiet:
+        print(json.dumps(result_list, indent=2))
+    if any(query_result["error"] for query_result in result_list):
+        raise SystemExit(1)
+    if any(query_result["result"] is False for query_result in result_list):
+        raise SystemExit(2)
+    raise SystemExit(0)
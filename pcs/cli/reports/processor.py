@@ -33,6 +33,10 @@ class ReportProcessorToConsole(ReportProcessor):
         self._ignore_severities = self._get_ignored_severities([])
         self._report_item_preprocessor: ReportItemPreprocessor = lambda x: x
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self.debug
+
     def _do_report(self, report_item: ReportItem) -> None:
         filtered_report_item = self._report_item_preprocessor(report_item)
         if not filtered_report_item:
@@ -51,6 +51,7 @@ cluster_cmd = create_router(
         "enable": cluster.cluster_enable_cmd,
         "disable": cluster.cluster_disable_cmd,
         "cib": cluster.get_cib,
+        "cib-batch": cluster.cluster_cib_batch,
         "cib-push": cluster.cluster_push,
         "cib-upgrade": cluster.cluster_cib_upgrade_cmd,
         "edit": cluster.cluster_edit,
@@ -19,6 +19,7 @@ resource_cmd = create_router(
         "list": resource.resource_list_available,
         "describe": resource.resource_list_options,
         "create": resource.resource_create,
+        "create-bulk": resource.resource_create_bulk,
         "move": resource.resource_move,
         "move-with-constraint": resource.resource_move_with_constraint,
         "ban": resource.resource_ban,
@@ -64,7 +64,8 @@ status_cmd = create_router(
         "xml": status.xml_status,
         "status": status.full_status,
         "query": create_router(
-            {"resource": _query_resource_router}, ["status", "query"]
+            {"batch": resource.batch, "resource": _query_resource_router},
+            ["status", "query"],
         ),
         "wait": status_command.wait_for_pcmk_idle,
     },
@@ -3,10 +3,10 @@ import datetime
 import json
 import math
 import os
+import shlex
 import subprocess
 import sys
 import tempfile
-import time
 import xml.dom.minidom
 from typing import (
     Any,
@@ -20,6 +20,7 @@ from typing import (
 
 import pcs.lib.pacemaker.live as lib_pacemaker
 from pcs import (
+    app,
     settings,
     utils,
 )
@@ -81,6 +82,8 @@ from pcs.lib.corosync.live import (
 )
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.tools import get_tmp_dir
+from pcs.lib.waiter import Backoff
 from pcs.utils import parallel_for_nodes
 
 
@@ -384,14 +387,15 @@ def is_node_fully_started(node_status) -> bool:
 
 
 def wait_for_local_node_started(
-    stop_at: datetime.datetime, interval: float
+    stop_at: datetime.datetime,
 ) -> tuple[int, str]:
     """
     Commandline options: no options
     """
+    backoff = Backoff()
     try:
         while True:
-            time.sleep(interval)
+            backoff.sleep()
             node_status = lib_pacemaker.get_local_node_status(
                 utils.cmd_runner()
             )
@@ -414,14 +418,15 @@ def wait_for_local_node_started(
 
 
 def wait_for_remote_node_started(
-    node: str, stop_at: datetime.datetime, interval: float
+    node: str, stop_at: datetime.datetime
 ) -> tuple[int, str]:
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
+    backoff = Backoff()
     while True:
-        time.sleep(interval)
+        backoff.sleep()
         code, output = utils.getPacemakerNodeStatus(node)
         # HTTP error, permission denied or unable to auth
         # there is no point in trying again as it won't get magically fixed
@@ -448,11 +453,10 @@ def wait_for_nodes_started(
         node_list is not empty list
     """
     timeout = 60 * 15 if timeout is None else timeout
-    interval = 2
     stop_at = datetime.datetime.now() + datetime.timedelta(seconds=timeout)
     print_to_stderr("Waiting for node(s) to start...")
     if not node_list:
-        code, output = wait_for_local_node_started(stop_at, interval)
+        code, output = wait_for_local_node_started(stop_at)
         if code != 0:
             utils.err(output)
         else:
@@ -460,7 +464,7 @@ def wait_for_nodes_started(
     else:
         utils.read_known_hosts_file()  # cache known hosts
         node_errors = parallel_for_nodes(
-            wait_for_remote_node_started, node_list, stop_at, interval
+            wait_for_remote_node_started, node_list, stop_at
         )
         if node_errors:
             utils.err("unable to verify all nodes have started")
@@ -850,37 +854,12 @@ def cluster_push(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         utils.err("unable to parse new cib: %s" % e)
 
     if diff_against:
-        runner = utils.cmd_runner()
-        command = [
-            settings.crm_diff_exec,
-            "--original",
-            diff_against,
-            "--new",
-            filename,
-            "--no-version",
-        ]
-        patch, stderr, retval = runner.run(command)
-        #  0 (CRM_EX_OK) - success with no difference
-        #  1 (CRM_EX_ERROR) - success with difference
-        # 64 (CRM_EX_USAGE) - usage error
-        # 65 (CRM_EX_DATAERR) - XML fragments not parseable
-        if retval > 1:
-            utils.err("unable to diff the CIBs:\n" + stderr)
-        if retval == 0:
+        if not _push_cib_diff(diff_against, filename):
             print_to_stderr(
                 "The new CIB is the same as the original CIB, nothing to push."
             )
             sys.exit(0)
 
-        command = [
-            settings.cibadmin_exec,
-            "--patch",
-            "--xml-pipe",
-        ]
-        output, stderr, retval = runner.run(command, patch)
-        if retval != 0:
-            utils.err("unable to push cib\n" + stderr + output)
-
     else:
         command = ["cibadmin", "--replace", "--xml-file", filename]
         if scope:
@@ -901,8 +880,51 @@ def cluster_push(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
 
     print_to_stderr("CIB updated")
 
-    if not modifiers.is_specified("--wait"):
-        return
+    if modifiers.is_specified("--wait"):
+        _wait_for_cluster_idle(timeout)
+
+
+def _push_cib_diff(original_filename: str, new_filename: str) -> bool:
+    """
+    Push differences between two CIB files to the live CIB, return False if
+    there is nothing to push
+
+    Commandline options: no options
+    """
+    runner = utils.cmd_runner()
+    command = [
+        settings.crm_diff_exec,
+        "--original",
+        original_filename,
+        "--new",
+        new_filename,
+        "--no-version",
+    ]
+    patch, stderr, retval = runner.run(command)
+    #  0 (CRM_EX_OK) - success with no difference
+    #  1 (CRM_EX_ERROR) - success with difference
+    # 64 (CRM_EX_USAGE) - usage error
+    # 65 (CRM_EX_DATAERR) - XML fragments not parseable
+    if retval > 1:
+        utils.err("unable to diff the CIBs:\n" + stderr)
+    if retval == 0:
+        return False
+
+    command = [
+        settings.cibadmin_exec,
+        "--patch",
+        "--xml-pipe",
+    ]
+    output, stderr, retval = runner.run(command, patch)
+    if retval != 0:
+        utils.err("unable to push cib\n" + stderr + output)
+    return True
+
+
+def _wait_for_cluster_idle(timeout: Optional[int]) -> None:
+    """
+    Commandline options: no options
+    """
     cmd = ["crm_resource", "--wait"]
     if timeout:
         cmd.extend(["--timeout", str(timeout)])
@@ -916,6 +938,168 @@ def cluster_push(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         utils.err("\n".join(msg).strip())
 
 
+# options which apply to pcs as a whole or to communication with cluster nodes,
+# commands in a batch only modify a CIB file
+_BATCH_FORBIDDEN_OPTIONS = frozenset(
+    (
+        "-f",
+        "--corosync_conf",
+        "--fullhelp",
+        "--version",
+        "-h",
+        "--help",
+        "--request-timeout",
+    )
+)
+
+
+def cluster_cib_batch(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+      * --wait
+      * -f - CIB file
+    """
+    del lib
+    modifiers.ensure_only_supported("--wait", "-f")
+    if len(argv) > 1:
+        raise CmdLineInputError()
+    timeout = None
+    if modifiers.is_specified("--wait"):
+        timeout = utils.validate_wait_get_timeout()
+
+    commands = _read_batch_commands(argv[0] if argv else "-")
+    if not commands:
+        utils.err("No commands specified")
+
+    if modifiers.is_specified("-f"):
+        try:
+            with open(utils.filename, encoding="utf-8") as cib_file:
+                original_cib = cib_file.read()
+        except OSError as e:
+            utils.err(f"Unable to read the CIB: {format_os_error(e)}")
+    else:
+        original_cib = utils.get_cib()
+
+    # Run the commands on a copy of the CIB, so that the CIB stays untouched
+    # if any of them fails.
+    with tempfile.NamedTemporaryFile(
+        mode="w+", suffix=".pcs", dir=get_tmp_dir()
+    ) as new_cib_file:
+        new_cib_file.write(original_cib)
+        new_cib_file.flush()
+        failed_line = _run_batch_commands(commands, new_cib_file.name)
+        if failed_line is not None:
+            utils.err(
+                f"Command on line {failed_line} failed, no changes have been "
+                "made to the CIB"
+            )
+
+        if modifiers.is_specified("-f"):
+            new_cib_file.seek(0)
+            try:
+                with open(utils.filename, "w", encoding="utf-8") as cib_file:
+                    cib_file.write(new_cib_file.read())
+            except OSError as e:
+                utils.err(f"Unable to write the CIB: {format_os_error(e)}")
+            return
+
+        with tempfile.NamedTemporaryFile(
+            mode="w+", suffix=".pcs", dir=get_tmp_dir()
+        ) as original_cib_file:
+            original_cib_file.write(original_cib)
+            original_cib_file.flush()
+            if not _push_cib_diff(original_cib_file.name, new_cib_file.name):
+                print_to_stderr(
+                    "The commands made no changes, nothing to push."
+                )
+                return
+    print_to_stderr("CIB updated")
+
+    if modifiers.is_specified("--wait"):
+        _wait_for_cluster_idle(timeout)
+
+
+def _read_batch_commands(
+    filename: str,
+) -> list[tuple[int, dict[str, Any], Argv]]:
+    """
+    Read pcs commands to be run in a batch, return their line numbers, pcs
+    options and arguments
+
+    filename -- file to read the commands from, '-' for stdin
+
+    Commandline options: no options
+    """
+    try:
+        if filename == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(filename, encoding="utf-8") as batch_file:
+                lines = batch_file.read().splitlines()
+    except OSError as e:
+        utils.err(f"Unable to read commands: {format_os_error(e)}")
+
+    commands = []
+    for line_no, line in enumerate(lines, 1):
+        try:
+            cmd_argv = shlex.split(line, comments=True)
+        except ValueError as e:
+            utils.err(f"Unable to parse command on line {line_no}: {e}")
+        # allow pasting commands including the 'pcs' executable, such as the
+        # ones exported by 'pcs config export pcs-commands'
+        if cmd_argv and cmd_argv[0] == "pcs":
+            cmd_argv = cmd_argv[1:]
+        if not cmd_argv:
+            continue
+        option_list, cmd_argv, wait_value = app.split_options(cmd_argv)
+        options: dict[str, Any] = {}
+        for option, value in option_list:
+            if option in _BATCH_FORBIDDEN_OPTIONS:
+                utils.err(
+                    f"Option '{option}' is not allowed in a batch, line "
+                    f"{line_no}"
+                )
+            if option in options:
+                utils.err(f"{option} can only be used once, line {line_no}")
+            options[option] = wait_value if option == "--wait" else value
+        if cmd_argv[:2] == ["cluster", "cib-batch"]:
+            utils.err(f"Nested batches are not allowed, line {line_no}")
+        commands.append((line_no, options, cmd_argv))
+    return commands
+
+
+def _run_batch_commands(
+    commands: Iterable[tuple[int, dict[str, Any], Argv]], cib_filename: str
+) -> Optional[int]:
+    """
+    Run pcs commands one by one against a CIB file, stop on the first failed
+    command and return its line number
+
+    commands -- line numbers, pcs options and arguments of the commands
+    cib_filename -- CIB file shared by all the commands
+
+    Commandline options: no options
+    """
+    saved_state = (utils.pcs_options, utils.usefile, utils.filename)
+    # all the commands work on the CIB file as if they were run with -f
+    utils.usefile = True
+    utils.filename = cib_filename
+    try:
+        for line_no, options, cmd_argv in commands:
+            utils.pcs_options = {**options, "-f": cib_filename}
+            # the runner is cached and its environment depends on pcs options
+            utils.cmd_runner.cache_clear()
+            try:
+                app.run_command(cmd_argv)
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    return line_no
+        return None
+    finally:
+        utils.pcs_options, utils.usefile, utils.filename = saved_state
+        utils.cmd_runner.cache_clear()
+
+
 def cluster_edit(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
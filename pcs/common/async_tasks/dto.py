@@ -12,6 +12,7 @@ from pcs.common.reports.dto import ReportItemDto
 from .types import (
     TaskFinishType,
     TaskKillReason,
+    TaskLane,
     TaskState,
 )
 
@@ -44,3 +45,42 @@ class TaskResultDto(DataTransferObject):
     task_finish_type: TaskFinishType
     kill_reason: Optional[TaskKillReason]
     result: Any
+
+
+@dataclass(frozen=True)
+class TaskStateDto(DataTransferObject):
+    task_ident: str
+    state: TaskState
+    task_finish_type: TaskFinishType
+    kill_reason: Optional[TaskKillReason]
+    result: Any
+
+
+@dataclass(frozen=True)
+class LaneMetricsDto(DataTransferObject):
+    lane: TaskLane
+    # tasks held back by the scheduler because of concurrency limits
+    held: int
+    # tasks waiting for a free worker
+    queued: int
+    executed: int
+
+
+@dataclass(frozen=True)
+class CommandMetricsDto(DataTransferObject):
+    # pylint: disable=too-many-instance-attributes
+    command_name: str
+    lane: TaskLane
+    finished_count: int
+    executed_count: int
+    # times in seconds, wait time spans from creating a task to its execution
+    wait_time_avg: float
+    wait_time_max: float
+    run_time_avg: float
+    run_time_max: float
+
+
+@dataclass(frozen=True)
+class SchedulerMetricsDto(DataTransferObject):
+    lanes: List[LaneMetricsDto]
+    commands: List[CommandMetricsDto]
@@ -22,3 +22,9 @@ class TaskKillReason(AutoNameEnum):
     USER = auto()
     COMPLETION_TIMEOUT = auto()
     INTERNAL_MESSAGING_ERROR = auto()
+
+
+class TaskLane(AutoNameEnum):
+    READ_ONLY = auto()
+    MUTATING = auto()
+    LONG_RUNNING = auto()
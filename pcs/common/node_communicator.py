@@ -1,11 +1,13 @@
 import base64
 import io
 import re
+import threading
 from dataclasses import (
     dataclass,
     field,
 )
 from typing import (
+    Any,
     Generator,
     Iterable,
     Mapping,
@@ -185,6 +187,7 @@ class Response:
     property.
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         handle: pycurl.Curl,
@@ -196,8 +199,11 @@ class Response:
         self._was_connected = was_connected
         self._errno = errno
         self._error_msg = error_msg
-        self._data = None
-        self._debug = None
+        self._data: Optional[str] = None
+        self._debug: Optional[str] = None
+        self._request: Optional[Request] = None
+        self._response_code: Optional[int] = None
+        self._is_detached = False
 
     @classmethod
     def connection_successful(cls, handle: pycurl.Curl) -> "Response":
@@ -221,8 +227,43 @@ class Response:
         """
         return cls(handle, False, errno, error_msg)
 
+    @classmethod
+    def detached_from_data(
+        cls, request: Request, response_code: int, data: str
+    ) -> "Response":
+        """
+        Returns Response instance not bound to any curl handle, e.g. a part of
+        a response to a request carrying several requests.
+
+        request -- request the response belongs to
+        response_code -- HTTP status code of the response
+        data -- body of the response
+        """
+        response = cls(None, True)  # type: ignore[arg-type]
+        response._request = request
+        response._response_code = response_code
+        response._data = data
+        response._debug = ""
+        response._is_detached = True
+        return response
+
+    def detach(self) -> None:
+        """
+        Read all the response data out of the curl handle
+
+        This allows the handle to be reused for another request while the
+        response remains usable.
+        """
+        self._request = self.request
+        self._response_code = self.response_code
+        self._data = self.data
+        self._debug = self.debug
+        self._is_detached = True
+
     @property
     def request(self) -> Request:
+        if self._is_detached:
+            return self._request  # type: ignore[return-value]
         return self._handle.request_obj  # type: ignore[attr-defined]
 
     @property
@@ -257,6 +298,8 @@ class Response:
     def response_code(self) -> Optional[int]:
         if not self.was_connected:
             return None
+        if self._is_detached:
+            return self._response_code
         return self._handle.getinfo(pycurl.RESPONSE_CODE)
 
     def __repr__(self) -> str:
@@ -286,6 +329,104 @@ class CommunicatorLoggerInterface:
     def log_no_more_addresses(self, response: Response) -> None:
         raise NotImplementedError()
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        """
+        Tell whether debugging output of requests is logged anywhere
+        """
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True)
+class CurlHandlePoolStats:
+    hits: int
+    misses: int
+    idle: int
+
+
+class CurlHandlePool:
+    """
+    Keeps idle curl easy handles of finished requests for reuse
+
+    A reused handle keeps its connections, DNS cache and TLS sessions, so
+    repeated requests to the same node don't need to do a new TCP connection
+    and TLS handshake. Handles are kept separately for each node address. All
+    handles share DNS cache, TLS sessions and connections, if supported by
+    curl, so even a new handle benefits from previous requests.
+
+    The pool is thread-safe, a handle is owned by one Communicator at a time.
+    """
+
+    max_idle_per_dest = 4
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle_handles: dict[Destination, list[pycurl.Curl]] = {}
+        self._share: Optional[pycurl.CurlShare] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> CurlHandlePoolStats:
+        with self._lock:
+            return CurlHandlePoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                idle=sum(
+                    len(handles) for handles in self._idle_handles.values()
+                ),
+            )
+
+    @property
+    def share(self) -> pycurl.CurlShare:
+        """
+        Return a curl share object to be set to all handles from the pool
+        """
+        with self._lock:
+            if self._share is None:
+                self._share = _create_share()
+            return self._share
+
+    def get(self, dest: Destination) -> pycurl.Curl:
+        """
+        Return an idle handle used for the destination before or a new handle
+
+        dest -- address and port the handle is going to connect to
+        """
+        with self._lock:
+            idle_handles = self._idle_handles.get(dest)
+            if idle_handles:
+                self._hits += 1
+                return idle_handles.pop()
+            self._misses += 1
+        return pycurl.Curl()
+
+    def put(self, dest: Destination, handle: pycurl.Curl) -> None:
+        """
+        Return a handle of a finished request to the pool
+
+        dest -- address and port the handle was connected to
+        handle -- the handle, it must not be used by the caller anymore
+        """
+        # drop all options and references to request data, keep connections
+        handle.reset()
+        with self._lock:
+            idle_handles = self._idle_handles.setdefault(dest, [])
+            if len(idle_handles) < self.max_idle_per_dest:
+                idle_handles.append(handle)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle_handles = {}
+
+
+# Handles are reused by all communicators in a process
+_curl_handle_pool = CurlHandlePool()
+
+
+def get_curl_handle_pool() -> CurlHandlePool:
+    return _curl_handle_pool
+
 
 class Communicator:
     """
@@ -294,6 +435,7 @@ class Communicator:
     only in a single thread. Use an unique instance for each thread.
     """
 
+    # pylint: disable=too-many-instance-attributes
     curl_multi_select_timeout_default = 0.8  # in seconds
 
     def __init__(
@@ -302,8 +444,20 @@ class Communicator:
         user: Optional[str],
         groups: Optional[StringIterable],
         request_timeout: Optional[int] = None,
+        debug: bool = True,
+        handle_pool: Optional[CurlHandlePool] = None,
     ) -> None:
+        """
+        communicator_logger -- logs requests and responses
+        user -- CIB user to send in requests
+        groups -- CIB user groups to send in requests
+        request_timeout -- timeout of a request in seconds
+        debug -- if True, record debugging output of requests
+        handle_pool -- if set, reuse curl handles (and connections) from it
+        """
         self._logger = communicator_logger
+        self._debug = debug
+        self._handle_pool = handle_pool
         self._auth_cookies = _get_auth_cookies(user, groups)
         self._request_timeout = (
             request_timeout
@@ -333,6 +487,8 @@ class Communicator:
                 request,
                 self._auth_cookies,
                 self._request_timeout,
+                debug=self._debug,
+                handle_pool=self._handle_pool,
             )
             self._easy_handle_list.append(handle)
             self._multi_handle.add_handle(handle)
@@ -377,7 +533,14 @@ class Communicator:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
                 self._logger.log_response(response)
+                if self._handle_pool is not None:
+                    response.detach()
                 yield response
+                if self._handle_pool is not None:
+                    self._handle_pool.put(
+                        response.handle.pool_dest,  # type: ignore[attr-defined]
+                        response.handle,
+                    )
                 # if something was added to the queue in the meantime, run it
                 # immediately, so we don't need to wait until all responses will
                 # be processed
@@ -466,6 +629,23 @@ class NodeCommunicatorFactory:
         self._groups = groups
         self._request_timeout = request_timeout
 
+    @property
+    def request_timeout(self) -> int:
+        """
+        Timeout of a request in seconds used by created communicators
+        """
+        return (
+            self._request_timeout
+            if self._request_timeout
+            else settings.default_request_timeout
+        )
+
+    def _get_communicator_kwargs(self) -> dict[str, Any]:
+        return dict(
+            debug=self._logger.is_debug_enabled,
+            handle_pool=get_curl_handle_pool(),
+        )
+
     def get_communicator(
         self, request_timeout: Optional[int] = None
     ) -> Communicator:
@@ -476,7 +656,11 @@ class NodeCommunicatorFactory:
     ) -> Communicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            **self._get_communicator_kwargs(),
         )
 
     def get_multiaddress_communicator(
@@ -484,7 +668,11 @@ class NodeCommunicatorFactory:
     ) -> MultiaddressCommunicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return MultiaddressCommunicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            **self._get_communicator_kwargs(),
         )
 
 
@@ -513,8 +701,28 @@ def _get_auth_cookies(
     return cookies
 
 
+def _create_share() -> pycurl.CurlShare:
+    share = pycurl.CurlShare()
+    for lock_data in (
+        "LOCK_DATA_DNS",
+        "LOCK_DATA_SSL_SESSION",
+        "LOCK_DATA_CONNECT",
+    ):
+        # not all the options are supported by older curl versions
+        if hasattr(pycurl, lock_data):
+            try:
+                share.setopt(pycurl.SH_SHARE, getattr(pycurl, lock_data))
+            except pycurl.error:
+                pass
+    return share
+
+
 def _create_request_handle(
-    request: Request, cookies: Mapping[str, str], timeout: int
+    request: Request,
+    cookies: Mapping[str, str],
+    timeout: int,
+    debug: bool = True,
+    handle_pool: Optional[CurlHandlePool] = None,
 ) -> pycurl.Curl:
     """
     Returns Curl object (easy handle) which is set up with specified parameters.
@@ -522,6 +730,8 @@ def _create_request_handle(
     request -- request specification
     cookies -- cookies to add to request
     timeout -- request timeout
+    debug -- if True, record debugging output of the request
+    handle_pool -- if set, take the handle from the pool instead of creating it
     """
 
     # it is not possible to take this callback out of this function, because of
@@ -546,13 +756,19 @@ def _create_request_handle(
     debug_output = io.BytesIO()
     handle_cookies = dict(cookies.items())
     handle_cookies.update(request.cookies)
-    handle = pycurl.Curl()
+    if handle_pool is None:
+        handle = pycurl.Curl()
+    else:
+        handle = handle_pool.get(request.dest)
+        handle.setopt(pycurl.SHARE, handle_pool.share)
     handle.setopt(pycurl.PROTOCOLS, pycurl.PROTO_HTTPS)
     handle.setopt(pycurl.TIMEOUT, timeout)
     handle.setopt(pycurl.URL, request.url.encode("utf-8"))
     handle.setopt(pycurl.WRITEFUNCTION, output.write)
-    handle.setopt(pycurl.VERBOSE, 1)
-    handle.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
+    if debug:
+        # tracing has its cost, only do it if someone reads the output
+        handle.setopt(pycurl.VERBOSE, 1)
+        handle.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
     handle.setopt(pycurl.SSL_VERIFYHOST, 0)
     handle.setopt(pycurl.SSL_VERIFYPEER, 0)
     handle.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
@@ -571,6 +787,8 @@ def _create_request_handle(
     handle.request_obj = request  # type: ignore[attr-defined]
     handle.output_buffer = output  # type: ignore[attr-defined]
     handle.debug_buffer = debug_output  # type: ignore[attr-defined]
+    # the request may move to another destination, remember where it went
+    handle.pool_dest = request.dest  # type: ignore[attr-defined]
     return handle
 
 
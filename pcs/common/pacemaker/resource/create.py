@@ -0,0 +1,28 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from pcs.common.interface.dto import DataTransferObject
+
+
+@dataclass(frozen=True)
+class ResourceCreateCloneDto(DataTransferObject):
+    clone_id: Optional[str] = None
+    meta_attributes: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ResourceCreateDto(DataTransferObject):
+    resource_id: str
+    agent_name: str
+    instance_attributes: Mapping[str, str] = field(default_factory=dict)
+    meta_attributes: Mapping[str, str] = field(default_factory=dict)
+    operations: Sequence[Mapping[str, str]] = field(default_factory=list)
+    group_id: Optional[str] = None
+    clone: Optional[ResourceCreateCloneDto] = None
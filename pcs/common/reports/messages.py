@@ -5414,6 +5414,22 @@ class WaitForNodeStartupStarted(ReportItemMessage):
         return f"Waiting for node(s) to start: {nodes}..."
 
 
+@dataclass(frozen=True)
+class WaitForNodeStartupFinished(ReportItemMessage):
+    """
+    All nodes have started
+
+    duration -- time spent waiting in seconds
+    """
+
+    duration: float
+    _code = codes.WAIT_FOR_NODE_STARTUP_FINISHED
+
+    @property
+    def message(self) -> str:
+        return f"Node(s) started in {self.duration:.1f} seconds"
+
+
 @dataclass(frozen=True)
 class WaitForNodeStartupTimedOut(ReportItemMessage):
     _code = codes.WAIT_FOR_NODE_STARTUP_TIMED_OUT
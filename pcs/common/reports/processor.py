@@ -15,6 +15,13 @@ class ReportProcessor(abc.ABC):
     def has_errors(self) -> bool:
         return self._has_errors
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        """
+        Tell whether debug report items are processed or thrown away
+        """
+        return True
+
     def report(self, report_item: ReportItem) -> "ReportProcessor":
         if _is_error(report_item):
             self._has_errors = True
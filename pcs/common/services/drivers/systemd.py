@@ -1,6 +1,7 @@
 import os.path
 import re
 from typing import (
+    Dict,
     List,
     Optional,
 )
@@ -12,6 +13,22 @@ from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceState
+
+# unit file states for which 'systemctl is-enabled' succeeds
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    (
+        "alias",
+        "enabled",
+        "enabled-runtime",
+        "generated",
+        "indirect",
+        "static",
+        "transient",
+    )
+)
+# unit active states for which 'systemctl is-active' succeeds
+_RUNNING_ACTIVE_STATES = frozenset(("active", "reloading", "refreshing"))
 
 
 class SystemdDriver(ServiceManagerInterface):
@@ -109,6 +126,45 @@ class SystemdDriver(ServiceManagerInterface):
         )
         return result.retval == 0
 
+    def get_states(self, services: StringIterable) -> Dict[str, ServiceState]:
+        service_list = list(dict.fromkeys(services))
+        if not service_list:
+            return {}
+        result = self._executor.run(
+            [
+                self._systemctl_bin,
+                "show",
+                "--property=ActiveState,UnitFileState",
+            ]
+            + [_format_service_name(service, None) for service in service_list]
+        )
+        unit_properties_list = (
+            _parse_show_output(result.stdout) if result.retval == 0 else []
+        )
+        if len(unit_properties_list) != len(service_list):
+            # unexpected output, check the services one by one
+            return {
+                service: ServiceState(
+                    enabled=self.is_enabled(service),
+                    running=self.is_running(service),
+                )
+                for service in service_list
+            }
+        return {
+            service: ServiceState(
+                enabled=(
+                    unit_properties.get("UnitFileState")
+                    in _ENABLED_UNIT_FILE_STATES
+                ),
+                running=(
+                    unit_properties.get("ActiveState") in _RUNNING_ACTIVE_STATES
+                ),
+            )
+            for service, unit_properties in zip(
+                service_list, unit_properties_list
+            )
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
@@ -140,3 +196,25 @@ class SystemdDriver(ServiceManagerInterface):
 def _format_service_name(service: str, instance: Optional[str]) -> str:
     instance_str = f"@{instance}" if instance else ""
     return f"{service}{instance_str}.service"
+
+
+def _parse_show_output(output: str) -> List[Dict[str, str]]:
+    """
+    Parse output of 'systemctl show' run for several units
+
+    Properties of each unit are printed as 'name=value' lines, units are
+    separated by an empty line.
+    """
+    unit_properties_list: List[Dict[str, str]] = []
+    unit_properties: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if unit_properties:
+                unit_properties_list.append(unit_properties)
+                unit_properties = {}
+            continue
+        name, _, value = line.partition("=")
+        unit_properties[name] = value
+    if unit_properties:
+        unit_properties_list.append(unit_properties)
+    return unit_properties_list
@@ -1,14 +1,18 @@
 import os.path
 from typing import (
+    Dict,
     List,
     Optional,
 )
 
+from pcs.common.types import StringIterable
+
 from .. import errors
 from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceState
 
 
 class SysVInitRhelDriver(ServiceManagerInterface):
@@ -59,6 +63,15 @@ class SysVInitRhelDriver(ServiceManagerInterface):
             == 0
         )
 
+    def get_states(self, services: StringIterable) -> Dict[str, ServiceState]:
+        return {
+            service: ServiceState(
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in services
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
@@ -1,8 +1,13 @@
 from typing import (
+    Dict,
     List,
     Optional,
 )
 
+from pcs.common.types import StringIterable
+
+from ..types import ServiceState
+
 
 class ServiceManagerInterface:
     def start(self, service: str, instance: Optional[str] = None) -> None:
@@ -65,6 +70,16 @@ class ServiceManagerInterface:
         """
         raise NotImplementedError()
 
+    def get_states(self, services: StringIterable) -> Dict[str, ServiceState]:
+        """
+        services -- names of services to be checked
+
+        Returns enabled and running state of each specified service. This is
+        equivalent to calling is_enabled and is_running for each service, but
+        the states are obtained at once where the init system allows it.
+        """
+        raise NotImplementedError()
+
     def is_installed(self, service: str) -> bool:
         """
         service -- name of service to be checked
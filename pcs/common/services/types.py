@@ -12,3 +12,9 @@ class ExecutorResult:
     @property
     def joined_output(self) -> str:
         return join_multilines([self.stderr, self.stdout])
+
+
+@dataclass(frozen=True)
+class ServiceState:
+    enabled: bool
+    running: bool
@@ -91,3 +91,10 @@ AnyResourceStatusDto = Union[
 @dataclass(frozen=True)
 class ResourcesStatusDto(DataTransferObject):
     resources: Sequence[AnyResourceStatusDto]
+
+
+@dataclass(frozen=True)
+class ResourcesStatusSnapshotDto(DataTransferObject):
+    generation: int
+    age_ms: int
+    resources_status: ResourcesStatusDto
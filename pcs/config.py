@@ -31,6 +31,7 @@ from pcs.cli.cluster_property.output import (
 )
 from pcs.cli.common import middleware
 from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.common.lib_wrapper import shared_cib_snapshot
 from pcs.cli.common.output import (
     INDENT_STEP,
     smart_wrap_text,
@@ -66,22 +67,27 @@ def config_show(lib, argv, modifiers):
 
     corosync_conf_dto = None
     cluster_name = ""
-    properties_facade = PropertyConfigurationFacade.from_properties_config(
-        lib.cluster_property.get_properties(),
-    )
-    try:
-        corosync_conf_dto = lib.cluster.get_corosync_conf_struct()
-        cluster_name = corosync_conf_dto.cluster_name
-    except LibraryError:
-        # there is no corosync.conf on remote nodes, we can try to
-        # get cluster name from pacemaker
-        pass
-    if not cluster_name:
-        cluster_name = properties_facade.get_property_value("cluster-name", "")
-    print("Cluster Name: %s" % cluster_name)
-
-    status.nodes_status(lib, ["config"], modifiers.get_subset("-f"))
-    cib_lines = _config_show_cib_lines(lib, properties_facade=properties_facade)
+    with shared_cib_snapshot(lib.env):
+        properties_facade = PropertyConfigurationFacade.from_properties_config(
+            lib.cluster_property.get_properties(),
+        )
+        try:
+            corosync_conf_dto = lib.cluster.get_corosync_conf_struct()
+            cluster_name = corosync_conf_dto.cluster_name
+        except LibraryError:
+            # there is no corosync.conf on remote nodes, we can try to
+            # get cluster name from pacemaker
+            pass
+        if not cluster_name:
+            cluster_name = properties_facade.get_property_value(
+                "cluster-name", ""
+            )
+        print("Cluster Name: %s" % cluster_name)
+
+        status.nodes_status(lib, ["config"], modifiers.get_subset("-f"))
+        cib_lines = _config_show_cib_lines(
+            lib, properties_facade=properties_facade
+        )
     if cib_lines:
         print()
         print("\n".join(cib_lines))
@@ -748,7 +754,8 @@ def _checkpoint_to_lines(lib, checkpoint_number):
     # export the CIB to text
     result = False, []
     if os.path.isfile(utils.filename):
-        result = True, _config_show_cib_lines(lib)
+        with shared_cib_snapshot(lib.env):
+            result = True, _config_show_cib_lines(lib)
     # restore original settings
     utils.usefile = orig_usefile
     utils.filename = orig_filename
@@ -14,14 +14,17 @@ from dacite import (
     MissingValueError,
     UnexpectedDataError,
 )
+from tornado.iostream import StreamClosedError
 from tornado.web import (
     HTTPError,
     MissingArgumentError,
 )
 
+from pcs import settings
 from pcs.common.async_tasks.dto import (
     CommandDto,
     TaskIdentDto,
+    TaskStateDto,
 )
 from pcs.common.interface.dto import (
     DTOTYPE,
@@ -229,6 +232,84 @@ class TaskInfoHandler(_BaseApiV2Handler):
             ) from exc
 
 
+class TaskProgressHandler(_BaseApiV2Handler):
+    """
+    Stream reports and state changes of a task as server-sent events
+
+    Each event carries a number of reports sent so far as its id. Clients
+    resume the stream by sending the id of the last received event in the
+    Last-Event-ID header or in the "report_offset" URL argument.
+    """
+
+    def _get_report_offset(self) -> int:
+        offset = self.get_query_argument(
+            "report_offset", self.request.headers.get("Last-Event-ID", "0")
+        )
+        try:
+            report_offset = int(cast(str, offset))
+        except ValueError:
+            report_offset = -1
+        if report_offset < 0:
+            raise APIError(
+                http_code=400,
+                error_msg="Report offset must be a non-negative integer.",
+            )
+        return report_offset
+
+    async def get(self) -> None:
+        auth_user = await self.get_auth_user()
+        try:
+            task_ident = cast(str, self.get_query_argument("task_ident"))
+        except MissingArgumentError as exc:
+            raise APIError(
+                http_code=400,
+                error_msg=f'URL argument "{exc.arg_name}" is missing.',
+            ) from exc
+        progress = self.scheduler.iter_task_progress(
+            task_ident,
+            auth_user,
+            self._get_report_offset(),
+            settings.task_progress_heartbeat_seconds,
+        )
+        # Headers are reset if an error is sent instead of the stream.
+        self.set_header("Content-Type", "text/event-stream")
+        self.set_header("Cache-Control", "no-cache")
+        try:
+            async for report_offset, item in progress:
+                if item is None:
+                    # keep the connection alive and find out if the client
+                    # has disconnected
+                    self.write(": heartbeat\n\n")
+                else:
+                    event = (
+                        "state" if isinstance(item, TaskStateDto) else "report"
+                    )
+                    self.write(
+                        f"id: {report_offset}\nevent: {event}\n"
+                        f"data: {json.dumps(to_dict(item))}\n\n"
+                    )
+                await self.flush()
+        except TaskNotFoundError as exc:
+            raise APIError(
+                http_code=404,
+                error_msg="Task with this identifier does not exist.",
+            ) from exc
+        except StreamClosedError:
+            # the client has disconnected, it may resume the stream later
+            return
+        finally:
+            await progress.aclose()
+        self.finish()
+
+
+class SchedulerMetricsHandler(_BaseApiV2Handler):
+    """Get scheduler queue depths and command wait and run times"""
+
+    async def get(self) -> None:
+        await self.get_auth_user()
+        self.write(json.dumps(to_dict(self.scheduler.get_metrics())))
+
+
 class KillTaskHandler(_BaseApiV2Handler):
     """Stop execution of a task"""
 
@@ -264,4 +345,6 @@ def get_routes(
         ("/api/v2/task/create", NewTaskHandler, params),
         ("/api/v2/task/kill", KillTaskHandler, params),
         ("/api/v2/task/run", RunTaskHandler, params),
+        ("/api/v2/task/progress", TaskProgressHandler, params),
+        ("/api/v2/scheduler/metrics", SchedulerMetricsHandler, params),
     ]
@@ -1,3 +1,5 @@
+import json
+
 from tornado.locks import Lock
 
 from pcs.daemon import ruby_pcsd
@@ -75,15 +77,40 @@ class SetCerts(SinatraRemote):
         super().initialize(ruby_pcsd_wrapper, auth_provider)
         self.__https_server_manage = https_server_manage
 
+    @staticmethod
+    def _are_certs_changed(result: ruby_pcsd.SinatraResult) -> bool:
+        return result.status == 200
+
     async def _handle_request(self):
         result = await self.ruby_pcsd_wrapper.request(
             self.effective_user, self.request
         )
-        if result.status == 200:
+        if self._are_certs_changed(result):
             self.__https_server_manage.reload_certs()
         self.send_sinatra_result(result)
 
 
+class NodeActions(SetCerts):
+    """
+    NodeActions handles url for running several actions in one request. The
+    actions may include setting new certificate and key, so the http server is
+    notified if that action succeeds.
+    """
+
+    @staticmethod
+    def _are_certs_changed(result: ruby_pcsd.SinatraResult) -> bool:
+        if result.status != 200:
+            return False
+        try:
+            return any(
+                action_result["command"] == "set_certs"
+                and action_result["code"] == 200
+                for action_result in json.loads(result.body)["results"]
+            )
+        except (ValueError, KeyError, TypeError):
+            return False
+
+
 def get_routes(
     ruby_pcsd_wrapper: ruby_pcsd.Wrapper,
     sync_config_lock: Lock,
@@ -105,6 +132,14 @@ def get_routes(
                 https_server_manage=https_server_manage,
             ),
         ),
+        (
+            r"/remote/node_actions",
+            NodeActions,
+            dict(
+                **sinatra_remote_options,
+                https_server_manage=https_server_manage,
+            ),
+        ),
         (
             r"/remote/(set_sync_options|set_configs)",
             SyncConfigMutualExclusive,
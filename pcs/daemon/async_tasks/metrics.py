@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Iterable,
+)
+
+from pcs.common.async_tasks.dto import (
+    CommandMetricsDto,
+    LaneMetricsDto,
+    SchedulerMetricsDto,
+)
+from pcs.common.async_tasks.types import (
+    TaskLane,
+    TaskState,
+)
+from pcs.common.types import StringIterable
+
+from .task import Task
+
+
+@dataclass
+class _CommandStats:
+    lane: TaskLane
+    finished_count: int = 0
+    executed_count: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+
+
+class SchedulerMetrics:
+    """
+    Collects wait and run times of finished tasks per command
+    """
+
+    def __init__(self) -> None:
+        self._command_stats: Dict[str, _CommandStats] = {}
+
+    def add_finished_task(self, task: Task) -> None:
+        """
+        Account a task which has just finished
+        """
+        stats = self._command_stats.setdefault(
+            task.command_name, _CommandStats(lane=task.lane)
+        )
+        stats.finished_count += 1
+        wait_time = task.get_wait_time()
+        if wait_time is None:
+            # the task has been killed before its execution started
+            return
+        stats.executed_count += 1
+        stats.wait_time_total += wait_time
+        stats.wait_time_max = max(stats.wait_time_max, wait_time)
+        run_time = task.get_run_time()
+        if run_time is not None:
+            stats.run_time_total += run_time
+            stats.run_time_max = max(stats.run_time_max, run_time)
+
+    def to_dto(
+        self, tasks: Iterable[Task], held_task_idents: StringIterable
+    ) -> SchedulerMetricsDto:
+        """
+        Export collected metrics together with current depths of lanes
+
+        tasks -- all tasks known to the scheduler
+        held_task_idents -- tasks held back because of concurrency limits
+        """
+        held = set(held_task_idents)
+        lane_counts = {
+            lane: {"held": 0, "queued": 0, "executed": 0} for lane in TaskLane
+        }
+        for task in tasks:
+            counts = lane_counts[task.lane]
+            if task.state == TaskState.CREATED:
+                if task.task_ident in held:
+                    counts["held"] += 1
+                else:
+                    counts["queued"] += 1
+            elif task.state == TaskState.QUEUED:
+                counts["queued"] += 1
+            elif task.state == TaskState.EXECUTED:
+                counts["executed"] += 1
+        return SchedulerMetricsDto(
+            lanes=[
+                LaneMetricsDto(lane=lane, **counts)
+                for lane, counts in lane_counts.items()
+            ],
+            commands=[
+                CommandMetricsDto(
+                    command_name=command_name,
+                    lane=stats.lane,
+                    finished_count=stats.finished_count,
+                    executed_count=stats.executed_count,
+                    wait_time_avg=(
+                        stats.wait_time_total / stats.executed_count
+                        if stats.executed_count
+                        else 0.0
+                    ),
+                    wait_time_max=stats.wait_time_max,
+                    run_time_avg=(
+                        stats.run_time_total / stats.executed_count
+                        if stats.executed_count
+                        else 0.0
+                    ),
+                    run_time_max=stats.run_time_max,
+                )
+                for command_name, stats in sorted(self._command_stats.items())
+            ],
+        )
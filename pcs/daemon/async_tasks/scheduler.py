@@ -1,29 +1,50 @@
 import multiprocessing as mp
 import sys
-from collections import defaultdict
+from collections import (
+    Counter,
+    defaultdict,
+)
 from dataclasses import dataclass
 from logging import handlers
+from multiprocessing.pool import Pool
 from multiprocessing.pool import worker as mp_worker_init  # type: ignore
-from queue import Empty
+from multiprocessing.queues import SimpleQueue
 from typing import (
+    Any,
+    AsyncGenerator,
     Dict,
     List,
+    Optional,
+    Tuple,
+    Union,
 )
 
+from tornado.ioloop import IOLoop
+
 from pcs import settings
-from pcs.common.async_tasks.dto import TaskResultDto
-from pcs.common.async_tasks.types import TaskKillReason
+from pcs.common.async_tasks.dto import (
+    SchedulerMetricsDto,
+    TaskResultDto,
+    TaskStateDto,
+)
+from pcs.common.async_tasks.types import (
+    TaskKillReason,
+    TaskLane,
+)
+from pcs.common.reports.dto import ReportItemDto
 from pcs.common.tools import get_unique_uuid
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.log import pcsd as pcsd_logger
 from pcs.lib.auth.types import AuthUser
 
+from .metrics import SchedulerMetrics
 from .task import (
     Task,
     TaskConfig,
     TaskState,
     UnknownMessageError,
 )
+from .worker.command_mapping import COMMAND_MAP
 from .worker.executor import (
     task_executor,
     worker_init,
@@ -43,12 +64,16 @@ class TaskNotFoundError(Exception):
 
 @dataclass(frozen=True)
 class SchedulerConfig:
+    # pylint: disable=too-many-instance-attributes
     worker_count: int = settings.pcsd_worker_count
+    fast_lane_worker_count: int = settings.pcsd_fast_lane_worker_count
     max_worker_count: int = (
         settings.pcsd_worker_count + settings.pcsd_temporary_workers
     )
     worker_reset_limit: int = settings.pcsd_worker_reset_limit
     deadlock_threshold_timeout: int = settings.pcsd_deadlock_threshold_timeout
+    max_long_running_tasks: int = settings.pcsd_max_long_running_tasks
+    max_tasks_per_user: int = settings.pcsd_max_tasks_per_user
     task_config: TaskConfig = TaskConfig()
 
 
@@ -63,10 +88,20 @@ class Scheduler:
         worker_count -- number of worker processes to use
         worker_reset_limit -- number of tasks a worker will process
             before restarting itself
+
+        Read-only tasks are executed by a separate small pool of workers, so
+        that they are not stuck behind long running or mutating tasks. Long
+        running tasks and tasks of one user may be limited to prevent them
+        from occupying all workers.
         """
         self._config = config
         self._proc_pool_manager = mp.Manager()
-        self._worker_message_q = self._proc_pool_manager.Queue()
+        # Workers send messages directly to the scheduler, not through the
+        # manager process, which would add one more hop to each message.
+        # SimpleQueue writes messages to its pipe in the sending thread. A
+        # Queue sends them from a feeder thread, which would be stopped with
+        # its worker before the message is sent when the worker pauses itself.
+        self._worker_message_q: SimpleQueue = mp.SimpleQueue()
         self._logger = pcsd_logger
         self._logging_q = self._proc_pool_manager.Queue()
         self._worker_log_listener = self._init_worker_logging()
@@ -78,7 +113,30 @@ class Scheduler:
             initializer=worker_init,
             initargs=[self._worker_message_q, self._logging_q],
         )
+        self._fast_lane_pool: Optional[Pool] = None
+        if self._config.fast_lane_worker_count > 0:
+            # pylint: disable=consider-using-with
+            self._fast_lane_pool = mp.Pool(
+                processes=self._config.fast_lane_worker_count,
+                maxtasksperchild=self._config.worker_reset_limit,
+                initializer=worker_init,
+                initargs=[self._worker_message_q, self._logging_q],
+            )
         self._task_register: Dict[str, Task] = {}
+        # Tasks held in CREATED state because of concurrency limits, in the
+        # order they were created. Dict is used as an ordered set.
+        self._held_task_idents: Dict[str, None] = {}
+        self._is_capacity_released = False
+        self._dispatched_long_running_count = 0
+        self._dispatched_per_user: Counter[str] = Counter()
+        self._metrics = SchedulerMetrics()
+        # Tasks created or updated since their last processing, they are
+        # processed right away when the event processing is enabled. Dict is
+        # used as an ordered set, so that tasks are dispatched in the order of
+        # their creation.
+        self._changed_task_idents: Dict[str, None] = {}
+        self._io_loop: Optional[IOLoop] = None
+        self._is_event_pass_scheduled = False
         self._logger.info("Scheduler was successfully initialized.")
         self._logger.debug(
             "Scheduler initialized with config: %s", self._config
@@ -117,6 +175,44 @@ class Scheduler:
         task.request_deletion()
         return task.to_dto()
 
+    async def iter_task_progress(
+        self,
+        task_ident: str,
+        auth_user: AuthUser,
+        report_offset: int = 0,
+        heartbeat_interval: Optional[float] = None,
+    ) -> AsyncGenerator[
+        Tuple[int, Union[ReportItemDto, TaskStateDto, None]], None
+    ]:
+        """
+        Yield new reports and state changes of a task until it finishes
+
+        Each item consists of a number of reports yielded so far, including
+        the skipped ones, and a report or a task state. The number allows
+        clients to resume the progress from where they have left off. The task
+        is not deleted when it finishes, its result is still available to other
+        clients.
+
+        report_offset -- number of reports to skip from the beginning
+        heartbeat_interval -- if the task does not change for this number of
+            seconds, yield None instead of a report or a task state
+        """
+        task = self._return_task(task_ident)
+        self._check_user(task, auth_user)
+        last_state = None
+        while True:
+            change_count = task.change_count
+            for report in task.get_reports(report_offset):
+                report_offset += 1
+                yield report_offset, report
+            if task.state != last_state:
+                last_state = task.state
+                yield report_offset, task.to_state_dto()
+            if last_state == TaskState.FINISHED:
+                return
+            if not await task.wait_for_change(change_count, heartbeat_interval):
+                yield report_offset, None
+
     def kill_task(self, task_ident: str, auth_user: AuthUser) -> None:
         """
         Terminates the specified task
@@ -138,8 +234,17 @@ class Scheduler:
         """
         task_ident = get_unique_uuid(tuple(self._task_register.keys()))
 
+        command_name = command.command_dto.command_name
         self._task_register[task_ident] = Task(
-            task_ident, command, auth_user, self._config.task_config
+            task_ident,
+            command,
+            auth_user,
+            self._config.task_config,
+            lane=(
+                COMMAND_MAP[command_name].lane
+                if command_name in COMMAND_MAP
+                else TaskLane.MUTATING
+            ),
         )
         self._logger.debug(
             (
@@ -151,12 +256,68 @@ class Scheduler:
             command.command_dto.params,
             command.is_legacy_command,
         )
+        self._changed_task_idents[task_ident] = None
+        self._request_event_pass()
         return task_ident
 
+    def get_metrics(self) -> SchedulerMetricsDto:
+        """
+        Return depths of scheduler lanes and wait and run times of commands
+        """
+        return self._metrics.to_dto(
+            self._task_register.values(), self._held_task_idents.keys()
+        )
+
+    def start_event_processing(self, io_loop: IOLoop) -> None:
+        """
+        Process new tasks and messages from workers as soon as they arrive
+
+        Without this, they are processed only by perform_actions, which is
+        expected to be called periodically. Timeouts, deadlock detection and
+        temporary workers are still handled only by perform_actions.
+        """
+        # pylint: disable=protected-access
+        self._io_loop = io_loop
+        io_loop.add_handler(
+            self._worker_message_q._reader.fileno(),  # type: ignore
+            self._on_worker_message,
+            IOLoop.READ,
+        )
+
+    def _on_worker_message(self, fd: Any, events: int) -> None:
+        del fd, events
+        self._request_event_pass()
+
+    def _request_event_pass(self) -> None:
+        if self._io_loop is None or self._is_event_pass_scheduled:
+            return
+        self._is_event_pass_scheduled = True
+        self._io_loop.add_callback(self._perform_event_actions)
+
+    async def _perform_event_actions(self) -> None:
+        """
+        Receive messages and process tasks affected by them and new tasks
+        """
+        self._is_event_pass_scheduled = False
+        await self._receive_messages()
+        changed_task_idents = self._changed_task_idents
+        self._changed_task_idents = {}
+        if self._is_capacity_released:
+            # give held tasks a chance to be dispatched in their order
+            self._is_capacity_released = False
+            for task_ident in list(self._held_task_idents):
+                changed_task_idents.pop(task_ident, None)
+                await self._process_task(self._task_register[task_ident])
+        for task_ident in changed_task_idents:
+            if task_ident in self._task_register:
+                await self._process_task(self._task_register[task_ident])
+
     def _is_possibly_dead_locked(self) -> bool:
         counter: Dict[TaskState, List[Task]] = defaultdict(list)
         for task in self._task_register.values():
-            counter[task.state].append(task)
+            # fast lane workers are not able to help with other tasks
+            if not self._is_in_fast_lane(task):
+                counter[task.state].append(task)
 
         return (
             len(counter[TaskState.CREATED]) + len(counter[TaskState.QUEUED]) > 0
@@ -168,14 +329,61 @@ class Scheduler:
             )
         )
 
+    def _is_in_fast_lane(self, task: Task) -> bool:
+        return (
+            self._fast_lane_pool is not None and task.lane == TaskLane.READ_ONLY
+        )
+
+    def _is_dispatch_allowed(self, task: Task) -> bool:
+        """
+        Check that the task does not exceed concurrency limits
+        """
+        if task.is_kill_requested():
+            return True
+        if (
+            task.lane == TaskLane.LONG_RUNNING
+            and self._config.max_long_running_tasks > 0
+            and self._dispatched_long_running_count
+            >= self._config.max_long_running_tasks
+        ):
+            return False
+        return not (
+            self._config.max_tasks_per_user > 0
+            and self._dispatched_per_user[task.auth_user.username]
+            >= self._config.max_tasks_per_user
+        )
+
+    def _on_task_dispatched(self, task: Task) -> None:
+        if task.lane == TaskLane.LONG_RUNNING:
+            self._dispatched_long_running_count += 1
+        self._dispatched_per_user[task.auth_user.username] += 1
+
+    def _on_task_finished(self, task: Task, was_dispatched: bool) -> None:
+        if was_dispatched:
+            if task.lane == TaskLane.LONG_RUNNING:
+                self._dispatched_long_running_count -= 1
+            username = task.auth_user.username
+            self._dispatched_per_user[username] -= 1
+            if self._dispatched_per_user[username] <= 0:
+                del self._dispatched_per_user[username]
+            if self._held_task_idents:
+                self._is_capacity_released = True
+        if task.command_name in COMMAND_MAP:
+            self._metrics.add_finished_task(task)
+
     def _schedule_task(self, task: Task) -> None:
         if task.is_kill_requested():
             # The task state and finish types are set during garbage
             # collection, we only prevent tasks here from queuing if
             # they are killed in CREATED state
             return
+        pool = (
+            self._fast_lane_pool
+            if self._fast_lane_pool is not None and self._is_in_fast_lane(task)
+            else self._proc_pool
+        )
         try:
-            self._proc_pool.apply_async(
+            pool.apply_async(
                 func=task_executor,
                 args=[task.to_worker_command()],
             )
@@ -186,20 +394,30 @@ class Scheduler:
             )
             sys.exit(1)
         task.state = TaskState.QUEUED
+        self._on_task_dispatched(task)
 
     async def _process_tasks(self) -> None:
+        self._changed_task_idents = {}
         for task in list(self._task_register.values()):
             await self._process_task(task)
 
     async def _process_task(self, task: Task) -> None:
         if task.state == TaskState.CREATED:
-            self._schedule_task(task)
+            if self._is_dispatch_allowed(task):
+                self._schedule_task(task)
+            else:
+                self._held_task_idents[task.task_ident] = None
         elif task.is_defunct():
             task.request_kill(TaskKillReason.COMPLETION_TIMEOUT)
         elif task.is_abandoned():
             task.request_deletion()
         if task.state != TaskState.FINISHED and task.is_kill_requested():
+            was_dispatched = task.state != TaskState.CREATED
             task.kill()
+            if task.state == TaskState.FINISHED:
+                self._on_task_finished(task, was_dispatched)
+        if task.state != TaskState.CREATED:
+            self._held_task_idents.pop(task.task_ident, None)
         if task.is_deletion_requested():
             del self._task_register[task.task_ident]
 
@@ -259,16 +477,9 @@ class Scheduler:
         Processes all incoming messages from workers
         :return: Number of received messages (useful for testing)
         """
-        # Unreliable message count, since this is the only consumer, there
-        # should not be less messages
         received_total = 0
-        for _ in range(self._worker_message_q.qsize()):
-            try:
-                message: Message = self._worker_message_q.get_nowait()
-            except Empty:
-                # This may happen when messages are on the way but not quite
-                # delivered yet. We'll get them later.
-                return received_total
+        while not self._worker_message_q.empty():
+            message: Message = self._worker_message_q.get()
             received_total += 1
             if not isinstance(message, Message):
                 self._logger.error(
@@ -286,6 +497,8 @@ class Scheduler:
                     message.task_ident,
                 )
                 continue
+            self._changed_task_idents[task.task_ident] = None
+            previous_state = task.state
             try:
                 task.receive_message(message)
             except UnknownMessageError as exc:
@@ -295,6 +508,11 @@ class Scheduler:
                     exc.payload_type,
                 )
                 task.request_kill(TaskKillReason.INTERNAL_MESSAGING_ERROR)
+            if (
+                previous_state != TaskState.FINISHED
+                and task.state == TaskState.FINISHED
+            ):
+                self._on_task_finished(task, was_dispatched=True)
         return received_total
 
     def _return_task(self, task_ident: str) -> Task:
@@ -312,6 +530,13 @@ class Scheduler:
         """
         Cleanly terminates the scheduler
         """
+        # pylint: disable=protected-access
+        if self._io_loop is not None:
+            self._io_loop.remove_handler(
+                self._worker_message_q._reader.fileno()  # type: ignore
+            )
         self._worker_log_listener.stop()
         self._proc_pool.terminate()
+        if self._fast_lane_pool is not None:
+            self._fast_lane_pool.terminate()
         self._logger.info("Scheduler is correctly terminated.")
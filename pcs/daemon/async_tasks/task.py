@@ -1,6 +1,8 @@
+import asyncio
 import datetime
 import os
 import signal
+import time
 from asyncio import Event
 from dataclasses import dataclass
 from typing import (
@@ -11,10 +13,14 @@ from typing import (
 )
 
 from pcs import settings
-from pcs.common.async_tasks.dto import TaskResultDto
+from pcs.common.async_tasks.dto import (
+    TaskResultDto,
+    TaskStateDto,
+)
 from pcs.common.async_tasks.types import (
     TaskFinishType,
     TaskKillReason,
+    TaskLane,
     TaskState,
 )
 from pcs.common.interface.dto import ImplementsToDto
@@ -60,15 +66,17 @@ class Task(ImplementsToDto):
     Task's representation in the scheduler
     """
 
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes, too-many-public-methods
     def __init__(
         self,
         task_ident: str,
         command: Command,
         auth_user: AuthUser,
         config: TaskConfig,
+        lane: TaskLane = TaskLane.MUTATING,
     ) -> None:
         self._config = config
+        self._lane = lane
         self._task_ident: str = task_ident
         self._command: Command = command
         self._auth_user = auth_user
@@ -81,7 +89,15 @@ class Task(ImplementsToDto):
         self._execution_started_at: Optional[datetime.datetime] = None
         self._worker_pid: int = -1
         self._finished_event = Event()
+        # Incremented and announced on each new report and state change, so
+        # that progress of the task can be streamed to clients
+        self._change_count = 0
+        self._changed_event = Event()
         self._to_delete_timestamp: Optional[datetime.datetime] = None
+        # monotonic times used for scheduler metrics
+        self._created_at_monotonic = time.monotonic()
+        self._executed_at_monotonic: Optional[float] = None
+        self._finished_at_monotonic: Optional[float] = None
 
     @property
     def state(self) -> TaskState:
@@ -106,9 +122,12 @@ class Task(ImplementsToDto):
         except ValueError as e:
             raise AssertionError(f"Invalid Task state: {state}") from e
         self._state = state
+        self._notify_change()
         if self.state == TaskState.FINISHED:
+            self._finished_at_monotonic = time.monotonic()
             self._finished_event.set()
         elif self.state == TaskState.EXECUTED:
+            self._executed_at_monotonic = time.monotonic()
             self._execution_started_at = datetime.datetime.now()
 
     @property
@@ -119,9 +138,74 @@ class Task(ImplementsToDto):
     def auth_user(self) -> AuthUser:
         return self._auth_user
 
+    @property
+    def command_name(self) -> str:
+        return self._command.command_dto.command_name
+
+    @property
+    def lane(self) -> TaskLane:
+        return self._lane
+
+    def get_wait_time(self) -> Optional[float]:
+        """
+        Return seconds from creating the task to starting its execution, None
+        if the task has not been executed
+        """
+        if self._executed_at_monotonic is None:
+            return None
+        return self._executed_at_monotonic - self._created_at_monotonic
+
+    def get_run_time(self) -> Optional[float]:
+        """
+        Return seconds the task has been executed for, None if the task has
+        not been executed and finished
+        """
+        if (
+            self._executed_at_monotonic is None
+            or self._finished_at_monotonic is None
+        ):
+            return None
+        return self._finished_at_monotonic - self._executed_at_monotonic
+
     def wait_until_finished(self) -> Awaitable[Any]:
         return self._finished_event.wait()
 
+    @property
+    def change_count(self) -> int:
+        return self._change_count
+
+    async def wait_for_change(
+        self, known_change_count: int, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until the task changes after it has been seen by a caller, return
+        False if it has not changed before the timeout
+
+        known_change_count -- change_count of the task seen by the caller
+        timeout -- maximal time to wait in seconds, None means no limit
+        """
+        if self._change_count != known_change_count:
+            return True
+        # the event is replaced on each change, so it is set only after a change
+        try:
+            await asyncio.wait_for(self._changed_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _notify_change(self) -> None:
+        self._change_count += 1
+        self._changed_event.set()
+        self._changed_event = Event()
+
+    def get_reports(self, offset: int = 0) -> List[ReportItemDto]:
+        """
+        Return reports of the task
+
+        offset -- number of reports to skip from the beginning
+        """
+        return self._reports[offset:]
+
     def _get_last_updated_timestamp(self) -> Optional[datetime.datetime]:
         """
         Helper function for getting timestamp of the last message received
@@ -283,6 +367,7 @@ class Task(ImplementsToDto):
         Handler for PCS reports
         """
         self._reports.append(message_payload)
+        self._notify_change()
 
     # Type conversions
     def to_worker_command(self) -> WorkerCommand:
@@ -292,6 +377,18 @@ class Task(ImplementsToDto):
         """
         return WorkerCommand(self._task_ident, self._command, self._auth_user)
 
+    def to_state_dto(self) -> TaskStateDto:
+        """
+        Prepares information about the task state without its reports
+        """
+        return TaskStateDto(
+            self._task_ident,
+            self._state,
+            self._task_finish_type,
+            self._kill_reason,
+            self._result,
+        )
+
     def to_dto(self) -> TaskResultDto:
         """
         Prepares response for task information query
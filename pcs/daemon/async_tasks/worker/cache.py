@@ -0,0 +1,40 @@
+from typing import (
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+)
+
+from pcs.common.host import PcsKnownHost
+from pcs.lib.file.facade_cache import (
+    FileSignature,
+    get_file_signature,
+)
+
+
+class KnownHostsCache:
+    """
+    Keeps known hosts in a worker until the known-hosts file changes
+    """
+
+    def __init__(
+        self, path: str, reader: Callable[[], Mapping[str, PcsKnownHost]]
+    ) -> None:
+        """
+        path -- path of the known-hosts file
+        reader -- function reading and parsing the known-hosts file
+        """
+        self._path = path
+        self._reader = reader
+        self._signature: Optional[FileSignature] = None
+        self._known_hosts: Dict[str, PcsKnownHost] = {}
+
+    def get(self) -> Dict[str, PcsKnownHost]:
+        signature = get_file_signature(self._path)
+        if signature is None or signature != self._signature:
+            # Get the signature before reading the file, so that a change of
+            # the file done while it is being read causes reading it again.
+            self._known_hosts = dict(self._reader())
+            self._signature = signature
+        # callers are allowed to modify the returned dict
+        return dict(self._known_hosts)
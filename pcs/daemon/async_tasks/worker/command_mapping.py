@@ -5,6 +5,7 @@ from typing import (
     Mapping,
 )
 
+from pcs.common.async_tasks.types import TaskLane
 from pcs.lib.commands import (  # services,
     acl,
     alert,
@@ -32,6 +33,20 @@ from pcs.lib.permissions.config.types import PermissionAccessType as p
 class _Cmd:
     cmd: Callable[..., Any]
     required_permission: p
+    # commands which may run for a long time, e.g. because they wait for the
+    # cluster or communicate with many nodes
+    long_running: bool = False
+
+    @property
+    def lane(self) -> TaskLane:
+        """
+        Scheduler lane tasks running the command are placed into
+        """
+        if self.long_running:
+            return TaskLane.LONG_RUNNING
+        if self.required_permission == p.READ:
+            return TaskLane.READ_ONLY
+        return TaskLane.MUTATING
 
 
 COMMAND_MAP: Mapping[str, _Cmd] = {
@@ -110,6 +125,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.add_nodes": _Cmd(
         cmd=cluster.add_nodes,
         required_permission=p.FULL,
+        long_running=True,
     ),
     "cluster.generate_cluster_uuid": _Cmd(
         cmd=cluster.generate_cluster_uuid,
@@ -122,10 +138,12 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.remove_nodes": _Cmd(
         cmd=cluster.remove_nodes,
         required_permission=p.FULL,
+        long_running=True,
     ),
     "cluster.setup": _Cmd(
         cmd=cluster.setup,
         required_permission=p.SUPERUSER,
+        long_running=True,
     ),
     "cluster_property.get_properties": _Cmd(
         cmd=cluster_property.get_properties,
@@ -142,6 +160,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.wait_for_pcmk_idle": _Cmd(
         cmd=cluster.wait_for_pcmk_idle,
         required_permission=p.READ,
+        long_running=True,
     ),
     "cib.remove_elements": _Cmd(
         cmd=cib.remove_elements,
@@ -277,6 +296,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource_agent.list_agents": _Cmd(
         cmd=resource_agent.list_agents,
         required_permission=p.READ,
+        long_running=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_agents_for_standard_and_provider": _Cmd(
@@ -305,6 +325,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=resource.create_as_clone,
         required_permission=p.WRITE,
     ),
+    "resource.create_bulk": _Cmd(
+        cmd=resource.create_bulk,
+        required_permission=p.WRITE,
+    ),
     "resource.create_in_group": _Cmd(
         cmd=resource.create_in_group,
         required_permission=p.WRITE,
@@ -340,6 +364,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.move_autoclean": _Cmd(
         cmd=resource.move_autoclean,
         required_permission=p.WRITE,
+        long_running=True,
     ),
     "resource.unmanage": _Cmd(
         cmd=resource.unmanage,
@@ -374,6 +399,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=status.resources_status,
         required_permission=p.READ,
     ),
+    "status.resources_status_snapshot": _Cmd(
+        cmd=status.resources_status_snapshot,
+        required_permission=p.READ,
+    ),
     # deprecated, API v1 compatibility
     "stonith_agent.describe_agent": _Cmd(
         cmd=stonith_agent.describe_agent,
@@ -383,6 +412,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "stonith_agent.list_agents": _Cmd(
         cmd=stonith_agent.list_agents,
         required_permission=p.READ,
+        long_running=True,
     ),
     "stonith.create": _Cmd(
         cmd=stonith.create,
@@ -1,11 +1,11 @@
-import multiprocessing as mp
+from multiprocessing.queues import SimpleQueue
 from threading import Lock
 
 from .types import Message
 
 
 class WorkerCommunicator:
-    def __init__(self, queue: mp.Queue):
+    def __init__(self, queue: SimpleQueue):
         self._queue = queue
         self._lock = Lock()
         self._terminate = False
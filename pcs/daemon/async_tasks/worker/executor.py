@@ -3,18 +3,22 @@ import inspect
 import multiprocessing as mp
 import os
 import signal
+from functools import lru_cache
 from logging import (
     Logger,
     getLogger,
 )
+from multiprocessing.queues import SimpleQueue
 from typing import (
     Any,
+    Callable,
     Tuple,
     Union,
 )
 
 import dacite
 
+from pcs import settings
 from pcs.common import reports
 from pcs.common.async_tasks.dto import CommandOptionsDto
 from pcs.common.async_tasks.types import TaskFinishType
@@ -26,9 +30,14 @@ from pcs.lib.auth.tools import (
 from pcs.lib.auth.types import AuthUser
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
+from pcs.lib.pacemaker.capabilities import PcmkCapabilityCache
+from pcs.lib.pacemaker.status_snapshot import ClusterStatusSnapshotService
 from pcs.lib.permissions.checker import PermissionsChecker
+from pcs.lib.resource_agent import ResourceAgentMetadataCache
+from pcs.lib.xml_schema import get_relaxng_registry
 from pcs.utils import read_known_hosts_file_not_cached
 
+from .cache import KnownHostsCache
 from .command_mapping import (
     COMMAND_MAP,
     LEGACY_API_COMMANDS,
@@ -47,6 +56,20 @@ from .types import (
 )
 
 worker_com: WorkerCommunicator
+# Known hosts are read only by some commands, they are kept in the worker and
+# read again only when the file changes
+_known_hosts_cache = KnownHostsCache(
+    settings.pcsd_known_hosts_location, read_known_hosts_file_not_cached
+)
+# Capabilities of pacemaker tools are kept in the worker and probed again only
+# when the tools change
+_pcmk_capability_cache = PcmkCapabilityCache()
+# Cluster status is shared by all workers and refreshed at most once per
+# interval, unless a task asks for a fresher status
+_cluster_status_snapshot = ClusterStatusSnapshotService(
+    settings.cluster_status_snapshot_file,
+    settings.cluster_status_snapshot_interval_ms,
+)
 
 
 def _sigterm_handler(sig_num: int, frame: Any) -> None:
@@ -57,7 +80,7 @@ def _sigterm_handler(sig_num: int, frame: Any) -> None:
         raise SystemExit(0)
 
 
-def worker_init(message_q: mp.Queue, logging_q: mp.Queue) -> None:
+def worker_init(message_q: SimpleQueue, logging_q: mp.Queue) -> None:
     """
     Runs in every new worker process after its creation
     :param message_q: Queue instance for sending messages to the scheduler
@@ -79,6 +102,18 @@ def worker_init(message_q: mp.Queue, logging_q: mp.Queue) -> None:
     signal.signal(signal.SIGINT, ignore_signals)
     signal.signal(signal.SIGTERM, _sigterm_handler)
 
+    # Prepare parameter classes of all commands now, so that the first task
+    # executed by the worker does not have to wait for them.
+    for command_name, cmd in COMMAND_MAP.items():
+        _get_params_class(command_name, cmd.cmd)
+    get_relaxng_registry().preload(
+        [
+            settings.pacemaker_api_result_schema,
+            settings.path.ocf_1_0_schema,
+            settings.path.ocf_1_1_schema,
+        ]
+    )
+
 
 def _pause_worker() -> None:
     logger = getLogger(WORKER_LOGGER)
@@ -142,10 +177,15 @@ def task_executor(task: WorkerCommand) -> None:
     env = LibraryEnvironment(  # type: ignore
         logger,
         WorkerReportProcessor(worker_com, task.task_ident),
-        known_hosts_getter=read_known_hosts_file_not_cached,
+        known_hosts_getter=_known_hosts_cache.get,
         user_login=auth_user.username,
         user_groups=auth_user.groups,
         request_timeout=request_timeout,
+        resource_agent_metadata_cache=ResourceAgentMetadataCache(
+            settings.resource_agent_metadata_cache_dir
+        ),
+        pcmk_capability_cache=_pcmk_capability_cache,
+        cluster_status_snapshot=_cluster_status_snapshot,
     )
 
     task_retval = None
@@ -168,19 +208,9 @@ def task_executor(task: WorkerCommand) -> None:
                 reports.ReportItem.error(reports.messages.NotAuthorized())
             )
         # Dacite will validate command.params against command signature.
-        # Dacite works only with dataclasses so we need to dynamically create
-        # one
         try:
             data = dto.from_dict(
-                dataclasses.make_dataclass(
-                    f"{command_name}_params",
-                    [
-                        _param_to_field_tuple(param)
-                        for param in list(
-                            inspect.signature(cmd.cmd).parameters.values()
-                        )[1:]
-                    ],
-                ),
+                _get_params_class(command_name, cmd.cmd),
                 command_dto.params,
                 strict=True,
             ).__dict__  # type: ignore
@@ -238,6 +268,23 @@ def task_executor(task: WorkerCommand) -> None:
     _pause_worker()
 
 
+@lru_cache(maxsize=None)
+def _get_params_class(command_name: str, cmd: Callable[..., Any]) -> type:
+    """
+    Return a dataclass describing parameters of a library command
+
+    Dacite works only with dataclasses so we need to dynamically create one.
+    The classes are kept for the whole life of a worker.
+    """
+    return dataclasses.make_dataclass(
+        f"{command_name}_params",
+        [
+            _param_to_field_tuple(param)
+            for param in list(inspect.signature(cmd).parameters.values())[1:]
+        ],
+    )
+
+
 def _param_to_field_tuple(
     param: inspect.Parameter,
 ) -> Union[Tuple[str, Any], Tuple[str, Any, dataclasses.Field]]:
@@ -28,6 +28,7 @@ SYNC_CONFIGS = "sync_configs"
 SINATRA = "sinatra"
 
 DEFAULT_SYNC_CONFIG_DELAY = 5
+RUBY_REQUEST_TIMEOUT = 0
 RUBY_LOG_LEVEL_MAP = {
     "UNKNOWN": logging.NOTSET,
     "FATAL": logging.CRITICAL,
@@ -157,7 +158,6 @@ class Wrapper:
 
     def prepare_curl_callback(self, curl):
         curl.setopt(pycurl.UNIX_SOCKET_PATH, self.__pcsd_ruby_socket)
-        curl.setopt(pycurl.TIMEOUT, 0)
 
     async def send_to_ruby(self, request: RubyDaemonRequest):
         try:
@@ -173,6 +173,10 @@ class Wrapper:
                     # clients from sending a body, it arguably disallows the
                     # server from doing anything with them.
                     body=(request.body if not request.is_get else None),
+                    # Ruby daemon requests may take long, e.g. when waiting
+                    # for pacemaker to start, so they are not limited here.
+                    # 0 overrides the tornado default of 20 seconds.
+                    request_timeout=RUBY_REQUEST_TIMEOUT,
                     prepare_curl_callback=self.prepare_curl_callback,
                 )
             ).body
@@ -167,11 +167,16 @@ def _print_version(argv: StringCollection) -> None:
 
 
 def main(argv=None) -> None:
+    # pylint: disable=too-many-statements
     # set the way how processes are started
     # https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
     # avoid deadlock in multiprocessing.pool.Pool on terminate
     # https://github.com/python/cpython/issues/73945
     mp.set_start_method(method="forkserver")
+    # Workers are forked from the forkserver process. Importing the worker
+    # modules in the forkserver once makes each new worker ready sooner, which
+    # matters as workers are restarted after worker_reset_limit tasks.
+    mp.set_forkserver_preload(["pcs.daemon.async_tasks.worker.executor"])
 
     argv = argv if argv is not None else sys.argv[1:]
     if "--version" in argv:
@@ -269,6 +274,7 @@ def main(argv=None) -> None:
         callback_time=env.PCSD_CHECK_INTERVAL_MS,
     ).start()
     ioloop = IOLoop.current()
+    async_scheduler.start_event_processing(ioloop)
     ioloop.add_callback(sign_ioloop_started)
     if systemd.is_systemd() and env.NOTIFY_SOCKET:
         ioloop.add_callback(systemd.notify, env.NOTIFY_SOCKET)
@@ -1,4 +1,5 @@
 import logging
+import time
 from contextlib import contextmanager
 from typing import (
     Iterator,
@@ -6,7 +7,9 @@ from typing import (
     cast,
 )
 
+from pcs import settings
 from pcs.common.file import RawFileError
+from pcs.lib.file.facade_cache import FileFacadeCache
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
@@ -30,12 +33,22 @@ class AuthProvider:
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
         self._config_file_instance = FileInstance.for_pcs_users_config()
+        self._facade_cache = FileFacadeCache()
+        # username -> (expiration time, groups)
+        self._user_groups_cache: dict[str, tuple[float, list[str]]] = {}
+        self._user_groups_cache_hits = 0
+        self._user_groups_cache_misses = 0
 
     def _get_facade(self) -> Facade:
         try:
             if not self._config_file_instance.raw_file.exists():
                 return Facade([])
-            return cast(Facade, self._config_file_instance.read_to_facade())
+            return cast(
+                Facade,
+                self._facade_cache.read_facade(
+                    self._config_file_instance, self._logger
+                ),
+            )
         except ParserError as e:
             self._logger.error(
                 "Unable to parse file '%s': %s",
@@ -103,9 +116,37 @@ class AuthProvider:
             )
             raise _UpdateFacadeError() from e
 
+    def _get_user_groups(self, username: str) -> list[str]:
+        # Group membership is resolved via NSS, which may be slow. Keep the
+        # result for a short time, so that repeated requests of a user do not
+        # resolve the groups again.
+        now = time.monotonic()
+        cached = self._user_groups_cache.get(username)
+        if cached is not None and cached[0] > now:
+            self._user_groups_cache_hits += 1
+            return cached[1]
+        self._user_groups_cache_misses += 1
+        groups = get_user_groups(username)
+        ttl = settings.pcsd_user_groups_cache_ttl_seconds
+        if ttl > 0:
+            # drop expired entries so that the cache does not grow forever
+            self._user_groups_cache = {
+                name: entry
+                for name, entry in self._user_groups_cache.items()
+                if entry[0] > now
+            }
+            self._user_groups_cache[username] = (now + ttl, groups)
+            self._logger.debug(
+                "Groups of user '%s' loaded, cache hits: %s, misses: %s",
+                username,
+                self._user_groups_cache_hits,
+                self._user_groups_cache_misses,
+            )
+        return groups
+
     def login_user(self, username: str) -> Optional[AuthUser]:
         try:
-            groups = get_user_groups(username)
+            groups = self._get_user_groups(username)
         except UserGroupsError:
             self._logger.error(
                 "Unable to determine groups of user '%s'", username
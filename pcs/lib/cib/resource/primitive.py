@@ -138,6 +138,7 @@ def create(
     # TODO remove this arg
     do_not_report_instance_attribute_server_exists: bool = False,
     enable_agent_self_validation: bool = False,
+    agent_self_validation_result: Optional[tuple[Optional[bool], str]] = None,
 ):
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-locals
@@ -162,6 +163,8 @@ def create(
         suboptimal architecture, TODO: fix the architecture and remove the param
     enable_agent_self_validation -- if True, use agent self-validation feature
         to validate instance attributes
+    agent_self_validation_result -- result of the agent self-validation if it
+        has been already run, the self-validation is run if None
     """
     if raw_operation_list is None:
         raw_operation_list = []
@@ -204,6 +207,7 @@ def create(
         resources_section,
         force=allow_invalid_instance_attributes,
         enable_agent_self_validation=enable_agent_self_validation,
+        agent_self_validation_result=agent_self_validation_result,
     )
     # TODO remove this "if", see pcs.lib.cib.remote_node.create for details
     if do_not_report_instance_attribute_server_exists:
@@ -362,6 +366,19 @@ def _is_ocf_or_stonith_agent(resource_agent_name: ResourceAgentName) -> bool:
     return resource_agent_name.standard in ("stonith", "ocf")
 
 
+def is_agent_self_validation_supported(
+    resource_agent: ResourceAgentFacade,
+) -> bool:
+    """
+    Check whether instance attributes of an agent can be validated by the agent
+    """
+    return (
+        _is_ocf_or_stonith_agent(resource_agent.metadata.name)
+        and resource_agent.metadata.agent_exists
+        and resource_agent.metadata.provides_self_validation
+    )
+
+
 def _get_report_from_agent_self_validation(
     is_valid: Optional[bool],
     reason: str,
@@ -394,6 +411,7 @@ def validate_resource_instance_attributes_create(
     resources_section: _Element,
     force: bool = False,
     enable_agent_self_validation: bool = False,
+    agent_self_validation_result: Optional[tuple[Optional[bool], str]] = None,
 ) -> reports.ReportItemList:
     report_items: reports.ReportItemList = []
     report_items += validate.ValidatorAll(
@@ -427,21 +445,20 @@ def validate_resource_instance_attributes_create(
             force=force,
         )
 
-    if (
-        _is_ocf_or_stonith_agent(agent_name)
-        and resource_agent.metadata.agent_exists
-        and resource_agent.metadata.provides_self_validation
-        and not any(
-            report_item.severity.level == reports.ReportItemSeverity.ERROR
-            for report_item in report_items
-        )
+    if is_agent_self_validation_supported(resource_agent) and not any(
+        report_item.severity.level == reports.ReportItemSeverity.ERROR
+        for report_item in report_items
     ):
+        if agent_self_validation_result is None:
+            agent_self_validation_result = (
+                validate_resource_instance_attributes_via_pcmk(
+                    cmd_runner,
+                    agent_name,
+                    instance_attributes,
+                )
+            )
         agent_reports = _get_report_from_agent_self_validation(
-            *validate_resource_instance_attributes_via_pcmk(
-                cmd_runner,
-                agent_name,
-                instance_attributes,
-            ),
+            *agent_self_validation_result,
             reports.get_severity(
                 reports.codes.FORCE,
                 force or not enable_agent_self_validation,
@@ -539,14 +556,9 @@ def validate_resource_instance_attributes_update(
             force=force,
         )
 
-    if (
-        _is_ocf_or_stonith_agent(agent_name)
-        and resource_agent.metadata.agent_exists
-        and resource_agent.metadata.provides_self_validation
-        and not any(
-            report_item.severity.level == reports.ReportItemSeverity.ERROR
-            for report_item in report_items
-        )
+    if is_agent_self_validation_supported(resource_agent) and not any(
+        report_item.severity.level == reports.ReportItemSeverity.ERROR
+        for report_item in report_items
     ):
         (
             original_is_valid,
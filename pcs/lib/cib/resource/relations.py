@@ -140,6 +140,9 @@ class ResourceRelationsFetcher:
         self._cib = cib
         self._resources_section = tools.get_resources(self._cib)
         self._constraints_section = tools.get_constraints(self._cib)
+        self._reference_index = tools.CibReferenceIndex(
+            self._constraints_section
+        )
 
     def get_relations(
         self, resource_id: str
@@ -215,28 +218,24 @@ class ResourceRelationsFetcher:
         return relations
 
     def _get_ordering_coinstraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                """
-                .//rsc_order[
-                    not (descendant::resource_set)
-                    and
-                    (@first=$resource_id or @then=$resource_id)
-                ]
-                """,
-                resource_id=resource_id,
-            ),
-        )
+        return [
+            element
+            for element in self._reference_index.get_referencing_elements(
+                resource_id,
+                (tools.REFERENCE_KIND_FIRST, tools.REFERENCE_KIND_THEN),
+            )
+            if element.tag == "rsc_order"
+        ]
 
     def _get_ordering_set_constraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                ".//rsc_order[./resource_set/resource_ref[@id=$resource_id]]",
-                resource_id=resource_id,
-            ),
-        )
+        return [
+            element
+            for element in self._reference_index.get_referencing_constraints(
+                resource_id
+            )
+            if element.tag == "rsc_order"
+            and element.find("./resource_set") is not None
+        ]
 
 
 def _get_resource_relation_type(res_el: _Element) -> ResourceRelationType:
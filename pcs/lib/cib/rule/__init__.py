@@ -4,6 +4,7 @@ from .cib_to_str import RuleToStr
 from .expression_part import BoolExpr as RuleRoot
 from .in_effect import (
     RuleInEffectEval,
+    RuleInEffectEvalAllAtOnce,
     RuleInEffectEvalDummy,
     RuleInEffectEvalOneByOne,
 )
@@ -1,3 +1,19 @@
+import re
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from dateutil import parser as dateutil_parser
+from dateutil import tz as dateutil_tz
+from dateutil.relativedelta import relativedelta
 from lxml.etree import _Element
 
 from pcs.common import reports
@@ -53,11 +69,226 @@ class RuleInEffectEvalOneByOne(RuleInEffectEval):
         return get_rule_in_effect_status(self._runner, self._cib_xml, rule_id)
 
 
-# TODO Implement this once the pacemaker tool is capable of evaluating more
-# than one rule per go. If we can eval all rules by running the tool once, it
-# would be a significant speedup comparing to running the tool for each rule.
-# class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
-#     pass
+class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
+    """
+    Evaluate rules natively where possible, run a pacemaker tool only for rules
+    which cannot be decided by pcs. Results are memoized, so that each rule is
+    evaluated once.
+
+    A rule is evaluated natively if it consists of one date expression. Rules
+    where the current time is close to a boundary of their date ranges are
+    left to pacemaker to prevent any differences in rounding, time zones and
+    date arithmetic.
+    """
+
+    def __init__(self, cib: _Element, runner: CommandRunner):
+        """
+        cib -- the whole cib containing the rule expressions
+        runner -- a class for running external processes
+        """
+        self._runner = runner
+        self._cib = cib
+        self._cib_xml: Optional[str] = None
+        self._rule_elements: Optional[Dict[str, List[_Element]]] = None
+        self._now = _get_now()
+        self._status_cache: Dict[str, CibRuleInEffectStatus] = {}
+
+    def get_rule_status(self, rule_id: str) -> CibRuleInEffectStatus:
+        if rule_id not in self._status_cache:
+            self._status_cache[rule_id] = self._eval_rule(rule_id)
+        return self._status_cache[rule_id]
+
+    def _eval_rule(self, rule_id: str) -> CibRuleInEffectStatus:
+        rule_el_list = self._get_rule_elements().get(rule_id, [])
+        if not rule_el_list:
+            # pacemaker cannot evaluate a rule which does not exist
+            return CibRuleInEffectStatus.UNKNOWN
+        if len(rule_el_list) == 1:
+            status = _eval_rule_natively(rule_el_list[0], self._now)
+            if status is not None:
+                return status
+        if self._cib_xml is None:
+            self._cib_xml = etree_to_str(self._cib)
+        return get_rule_in_effect_status(self._runner, self._cib_xml, rule_id)
+
+    def _get_rule_elements(self) -> Dict[str, List[_Element]]:
+        if self._rule_elements is None:
+            self._rule_elements = {}
+            for rule_el in cast(List[_Element], self._cib.xpath("//rule[@id]")):
+                self._rule_elements.setdefault(
+                    str(rule_el.attrib["id"]), []
+                ).append(rule_el)
+        return self._rule_elements
+
+
+# Differences between pcs and pacemaker in handling time zones, DST and date
+# arithmetic are well below these margins.
+_BOUNDARY_MARGIN = timedelta(days=1)
+_BOUNDARY_MARGIN_CALENDAR = timedelta(days=4)
+_DURATION_PARTS = (
+    "years",
+    "months",
+    "weeks",
+    "days",
+    "hours",
+    "minutes",
+    "seconds",
+)
+_YEARS_RANGE_RE = re.compile(r"^(\d+)(?:-(\d+))?$")
+
+
+def _get_now() -> datetime:
+    return datetime.now(tz=dateutil_tz.tzlocal()).replace(microsecond=0)
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        date = dateutil_parser.isoparse(value)
+    except (ValueError, OverflowError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=dateutil_tz.tzlocal())
+    return date
+
+
+def _parse_duration(duration_el: _Element) -> Optional[relativedelta]:
+    parts = dict.fromkeys(_DURATION_PARTS, 0)
+    for name, value in duration_el.attrib.items():
+        if name == "id":
+            continue
+        if name not in parts:
+            return None
+        try:
+            parts[str(name)] = int(value)
+        except ValueError:
+            return None
+    return relativedelta(
+        years=parts["years"],
+        months=parts["months"],
+        weeks=parts["weeks"],
+        days=parts["days"],
+        hours=parts["hours"],
+        minutes=parts["minutes"],
+        seconds=parts["seconds"],
+    )
+
+
+_DateRange = Tuple[Optional[datetime], Optional[datetime], timedelta]
+
+
+def _get_date_expression_range(expr_el: _Element) -> Optional[_DateRange]:
+    """
+    Return start and end of a date expression and a margin around them in which
+    the expression cannot be evaluated reliably, None if the range is unknown
+    """
+    # pylint: disable=too-many-return-statements
+    operation = expr_el.get("operation", "in_range")
+    children = [child for child in expr_el if isinstance(child.tag, str)]
+    if not set(expr_el.attrib) <= {"id", "operation", "start", "end"}:
+        return None
+    start = _parse_date(expr_el.get("start"))
+    end = _parse_date(expr_el.get("end"))
+
+    if operation == "gt":
+        if start is None or children:
+            return None
+        return start, None, _BOUNDARY_MARGIN
+    if operation == "lt":
+        if end is None or children:
+            return None
+        return None, end, _BOUNDARY_MARGIN
+    if operation == "in_range":
+        return _get_in_range_range(expr_el, children, start, end)
+    if operation == "date_spec":
+        if len(children) != 1 or children[0].tag != "date_spec":
+            return None
+        return _get_date_spec_range(children[0])
+    return None
+
+
+def _get_in_range_range(
+    expr_el: _Element,
+    children: List[_Element],
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> Optional[_DateRange]:
+    # pylint: disable=too-many-return-statements
+    if (start is None and "start" in expr_el.attrib) or (
+        end is None and "end" in expr_el.attrib
+    ):
+        return None
+    if not children:
+        if start is None and end is None:
+            return None
+        return start, end, _BOUNDARY_MARGIN
+    if len(children) > 1 or children[0].tag != "duration":
+        return None
+    duration = _parse_duration(children[0])
+    if duration is None or start is None or end is not None:
+        return None
+    try:
+        end = start + duration
+    except (ValueError, OverflowError):
+        return None
+    return (
+        start,
+        end,
+        (
+            _BOUNDARY_MARGIN_CALENDAR
+            if duration.years or duration.months
+            else _BOUNDARY_MARGIN
+        ),
+    )
+
+
+def _get_date_spec_range(date_spec_el: _Element) -> Optional[_DateRange]:
+    # Only date specs limiting years define a continuous range of time. Other
+    # date specs are periodic and are left to pacemaker.
+    if set(date_spec_el.attrib) != {"id", "years"}:
+        return None
+    match = _YEARS_RANGE_RE.match(str(date_spec_el.attrib["years"]))
+    if not match:
+        return None
+    year_low = int(match.group(1))
+    year_high = int(match.group(2)) if match.group(2) else year_low
+    if year_low > year_high or year_high >= datetime.max.year:
+        return None
+    local_tz = dateutil_tz.tzlocal()
+    return (
+        datetime(max(year_low, datetime.min.year), 1, 1, tzinfo=local_tz),
+        datetime(year_high + 1, 1, 1, tzinfo=local_tz),
+        _BOUNDARY_MARGIN,
+    )
+
+
+def _eval_rule_natively(
+    rule_el: _Element, now: datetime
+) -> Optional[CibRuleInEffectStatus]:
+    """
+    Evaluate a rule consisting of one date expression, None if it cannot be
+    decided by pcs
+    """
+    # pylint: disable=too-many-return-statements
+    children = [child for child in rule_el if isinstance(child.tag, str)]
+    if len(children) != 1 or children[0].tag != "date_expression":
+        return None
+    date_range = _get_date_expression_range(children[0])
+    if date_range is None:
+        return None
+    start, end, margin = date_range
+    try:
+        for boundary in (start, end):
+            if boundary is not None and abs(now - boundary) < margin:
+                return None
+        if start is not None and now < start:
+            return CibRuleInEffectStatus.NOT_YET_IN_EFFECT
+        if end is not None and now > end:
+            return CibRuleInEffectStatus.EXPIRED
+    except OverflowError:
+        return None
+    return CibRuleInEffectStatus.IN_EFFECT
 
 
 def get_rule_evaluator(
@@ -68,7 +299,7 @@ def get_rule_evaluator(
 ) -> RuleInEffectEval:
     if evaluate_expired:
         if has_rule_in_effect_status_tool():
-            return RuleInEffectEvalOneByOne(cib, runner)
+            return RuleInEffectEvalAllAtOnce(cib, runner)
         report_processor.report(
             reports.ReportItem.warning(
                 reports.messages.RuleInEffectStatusDetectionNotSupported()
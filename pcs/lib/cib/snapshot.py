@@ -0,0 +1,49 @@
+from copy import deepcopy
+from typing import Optional
+
+from lxml.etree import _Element
+
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.live import (
+    get_cib,
+    get_cib_xml,
+)
+
+
+class CibSnapshot:
+    """
+    CIB loaded and parsed once and shared by several library commands
+
+    Meant for views running several read-only commands in a row, e.g. pcs
+    config. Each command gets its own copy of the parsed CIB, so the commands
+    are free to modify it. Pushing a CIB through an environment using the
+    snapshot drops the snapshot, the next command loads the CIB again.
+    """
+
+    def __init__(self) -> None:
+        self._cib_xml: Optional[str] = None
+        self._cib: Optional[_Element] = None
+
+    def get_cib_xml(self, runner: CommandRunner) -> str:
+        """
+        Return the CIB as a string, load it on the first call
+
+        runner -- runner used to load the CIB
+        """
+        if self._cib_xml is None:
+            self._cib_xml = get_cib_xml(runner)
+        return self._cib_xml
+
+    def get_cib(self, runner: CommandRunner) -> _Element:
+        """
+        Return a copy of the parsed CIB, load and parse it on the first call
+
+        runner -- runner used to load the CIB
+        """
+        if self._cib is None:
+            self._cib = get_cib(self.get_cib_xml(runner))
+        return deepcopy(self._cib)
+
+    def invalidate(self) -> None:
+        self._cib_xml = None
+        self._cib = None
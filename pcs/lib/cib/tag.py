@@ -26,6 +26,7 @@ from pcs.common.types import (
 )
 from pcs.lib.cib.resource.common import find_resources
 from pcs.lib.cib.tools import (
+    CibReferenceIndex,
     ElementSearcher,
     IdProvider,
     get_configuration_elements_by_id,
@@ -177,10 +178,10 @@ def validate_remove_tag(
             )
         ]
     report_list = []
+    reference_index = CibReferenceIndex(constraint_section)
     for tag_id in to_remove_tag_list:
         constraint_list = find_constraints_referencing_tag(
-            constraint_section,
-            tag_id,
+            constraint_section, tag_id, reference_index
         )
         if constraint_list:
             report_list.append(
@@ -482,13 +483,17 @@ class ValidateTagUpdateByIds:
 def find_constraints_referencing_tag(
     constraints_section: _Element,
     tag_id: str,
+    reference_index: Optional[CibReferenceIndex] = None,
 ) -> List[_Element]:
     """
     Find constraint elements which are referencing specified tag.
 
     constraints_section -- element constraints
     tag_id -- tag id
+    reference_index -- index of the CIB to search in instead of the section
     """
+    if reference_index is not None:
+        return reference_index.get_referencing_constraints(tag_id)
     # TODO: replace by find_elements_referencing_id
     constraint_list = constraints_section.xpath(
         """
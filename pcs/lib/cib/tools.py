@@ -1,12 +1,17 @@
 import re
+import threading
+import weakref
 from typing import (
+    Dict,
     List,
+    Optional,
     Pattern,
     Set,
     Tuple,
     cast,
 )
 
+from lxml import etree
 from lxml.etree import (
     _Element,
     _ElementTree,
@@ -46,10 +51,396 @@ _ELEMENTS_WITH_IDREF_WITHOUT_ID_XPATH = """
 """
 
 
+# element names whose id attribute is a reference rather than an id
+_ID_IS_REFERENCE_TAGS = frozenset(
+    ("acl_target", "role", "obj_ref", "resource_ref")
+)
+
+
 class ElementNotFound(Exception):
     pass
 
 
+class CibIdIndex:
+    """
+    Map ids to configuration elements of a CIB tree
+
+    The index is built in one pass over the tree. Lookups are validated
+    against the current state of the tree, so elements removed or having their
+    id changed are detected and the tree is searched again for such ids. Ids
+    which have been reported as free are remembered, as callers typically go
+    on to create elements with them, and queries for those ids are answered by
+    searching the tree.
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- any element of the tree to index
+        """
+        self._cib = get_root(cib)
+        self._id_map: Dict[str, List[_Element]] = {}
+        self._claimed_ids: Set[str] = set()
+        for element in _xpath_configuration_elements_with_id(self._cib):
+            self._id_map.setdefault(str(element.attrib["id"]), []).append(
+                element
+            )
+        for element in _xpath_remote_node_primitives(self._cib):
+            for remote_node in cast(
+                List[str],
+                element.xpath(
+                    './meta_attributes/nvpair[@name="remote-node"]/@value'
+                ),
+            ):
+                self._id_map.setdefault(str(remote_node), []).append(element)
+
+    @property
+    def cib(self) -> _Element:
+        return self._cib
+
+    def get_elements(self, check_id: str) -> List[_Element]:
+        """
+        Return configuration elements with the specified id
+
+        check_id -- id to look for
+        """
+        element_list = self._id_map.get(check_id)
+        if element_list is None:
+            if check_id in self._claimed_ids:
+                return self._search(check_id)
+            return []
+        if all(
+            self._is_element_valid(element, check_id)
+            for element in element_list
+        ):
+            return list(element_list)
+        return self._search(check_id)
+
+    def does_id_exist(self, check_id: str) -> bool:
+        """
+        Check whether the id is used in the configuration, remember free ids
+
+        check_id -- id to check
+        """
+        if self.get_elements(check_id):
+            return True
+        self._claimed_ids.add(check_id)
+        return False
+
+    def find_unique_id(
+        self, check_id: str, reserved_ids: Optional[StringIterable] = None
+    ) -> str:
+        """
+        Return check_id if not used, otherwise the first free id created by
+        adding a numeric suffix to check_id
+
+        check_id -- id to check
+        reserved_ids -- ids to think about as already used
+        """
+        reserved = set(reserved_ids) if reserved_ids else set()
+        counter = 1
+        temp_id = check_id
+        while temp_id in reserved or self.get_elements(temp_id):
+            temp_id = f"{check_id}-{counter}"
+            counter += 1
+        self._claimed_ids.add(temp_id)
+        return temp_id
+
+    def claim_id(self, claimed_id: str) -> None:
+        """
+        Mark the id as being used by an element which is to be put to the tree
+
+        claimed_id -- the id being used
+        """
+        self._claimed_ids.add(claimed_id)
+
+    def _search(self, check_id: str) -> List[_Element]:
+        element_list = _xpath_configuration_elements_by_id(self._cib, check_id)
+        if element_list:
+            self._id_map[check_id] = list(element_list)
+        else:
+            self._id_map.pop(check_id, None)
+        return element_list
+
+    def _is_element_valid(self, element: _Element, check_id: str) -> bool:
+        if element.get("id") == check_id:
+            if element.tag in _ID_IS_REFERENCE_TAGS:
+                return False
+        elif element.tag != "primitive" or not element.xpath(
+            './meta_attributes/nvpair[@name="remote-node" and @value=$value]',
+            value=check_id,
+        ):
+            return False
+        # the element must not have been removed from the tree and must not
+        # have been moved to the status section
+        child = element
+        for ancestor in element.iterancestors():
+            if ancestor is self._cib:
+                return not (self._cib.tag == "cib" and child.tag == "status")
+            child = ancestor
+        return False
+
+
+class _IdIndexRegistry(threading.local):
+    """
+    Id indexes attached to CIB trees in the current thread
+
+    The registry only refers to the indexes weakly, an index is used as long
+    as its owner keeps it. Indexes are not shared among threads, other threads
+    search the trees without them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.index_map: Dict[int, "weakref.ref[CibIdIndex]"] = {}
+
+
+_id_index_registry = _IdIndexRegistry()
+
+
+def attach_id_index(cib: _Element) -> CibIdIndex:
+    """
+    Build an id index of a CIB tree and use it for id lookups in the tree
+
+    The index is used in the current thread as long as the returned object is
+    referenced by the caller, so its lifetime is bound to the caller's one.
+
+    cib -- any element of the tree to index
+    """
+    id_index = CibIdIndex(cib)
+    index_map = _id_index_registry.index_map
+    key = id(id_index.cib)
+
+    def _unregister(index_ref: "weakref.ref[CibIdIndex]") -> None:
+        if index_map.get(key) is index_ref:
+            del index_map[key]
+
+    index_map[key] = weakref.ref(id_index, _unregister)
+    return id_index
+
+
+def detach_id_index(cib: _Element) -> None:
+    """
+    Stop using an id index for id lookups in a CIB tree
+
+    cib -- any element of the indexed tree
+    """
+    if get_id_index(cib) is not None:
+        del _id_index_registry.index_map[id(get_root(cib))]
+
+
+def get_id_index(cib: _Element) -> Optional[CibIdIndex]:
+    """
+    Return an id index attached to a CIB tree in the current thread, None if
+    there is no such index
+
+    cib -- any element of the indexed tree
+    """
+    root = get_root(cib)
+    index_ref = _id_index_registry.index_map.get(id(root))
+    id_index = index_ref() if index_ref is not None else None
+    # a live index holds the root element, so its id cannot be reused by
+    # another element while the index is in use
+    if id_index is not None and id_index.cib is root:
+        return id_index
+    return None
+
+
+# kinds of references to ids, named after the referencing attributes
+REFERENCE_KIND_RSC = "rsc"
+REFERENCE_KIND_WITH_RSC = "with-rsc"
+REFERENCE_KIND_FIRST = "first"
+REFERENCE_KIND_THEN = "then"
+REFERENCE_KIND_RESOURCE_REF = "resource_ref"
+REFERENCE_KIND_OBJ_REF = "obj_ref"
+REFERENCE_KIND_ACL_ROLE = "role"
+REFERENCE_KIND_ACL_PERMISSION = "reference"
+REFERENCE_KIND_ID_REF = "id-ref"
+# references done by constraints without resource sets
+REFERENCE_KINDS_CONSTRAINT = (
+    REFERENCE_KIND_RSC,
+    REFERENCE_KIND_WITH_RSC,
+    REFERENCE_KIND_FIRST,
+    REFERENCE_KIND_THEN,
+)
+# references done by elements which have no id of their own
+REFERENCE_KINDS_WITHOUT_ID = (
+    REFERENCE_KIND_RESOURCE_REF,
+    REFERENCE_KIND_OBJ_REF,
+    REFERENCE_KIND_ACL_ROLE,
+)
+_CONSTRAINT_REFERENCE_ATTRS = {
+    "rsc_colocation": (REFERENCE_KIND_RSC, REFERENCE_KIND_WITH_RSC),
+    "rsc_location": (REFERENCE_KIND_RSC,),
+    "rsc_order": (REFERENCE_KIND_FIRST, REFERENCE_KIND_THEN),
+    "rsc_ticket": (REFERENCE_KIND_RSC,),
+}
+_ID_REFERENCE_TAGS = {
+    "resource_ref": REFERENCE_KIND_RESOURCE_REF,
+    "obj_ref": REFERENCE_KIND_OBJ_REF,
+    "role": REFERENCE_KIND_ACL_ROLE,
+}
+
+
+class CibReferenceIndex:
+    """
+    Map ids to configuration elements referencing them
+
+    The index is built in one pass over the tree. Lookups are validated
+    against the current state of the tree, so removed elements and changed
+    references are not returned. References created after the index has been
+    built are only known to the index if their elements are added by
+    add_element.
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- any element of the tree to index
+        """
+        root = get_root(cib)
+        self._root = root
+        self._references: Dict[str, List[Tuple[_Element, str]]] = {}
+        scope = root.find("./configuration") if root.tag == "cib" else root
+        if scope is not None:
+            self.add_element(scope)
+
+    def add_element(self, element: _Element) -> None:
+        """
+        Index references done by an element and its descendants
+
+        element -- an element put to the indexed tree
+        """
+        for descendant in element.iter(etree.Element):
+            self._index_element(descendant)
+
+    def get_referencing_elements(
+        self,
+        referenced_id: str,
+        kinds: Optional[StringIterable] = None,
+    ) -> List[_Element]:
+        """
+        Return elements referencing an id
+
+        Elements are returned in the order of the tree, elements added by
+        add_element follow the elements found when the index was built.
+
+        referenced_id -- id which references should be found
+        kinds -- limit the result to these REFERENCE_KIND_*, all if None
+        """
+        kind_set = None if kinds is None else frozenset(kinds)
+        result: List[_Element] = []
+        valid_references = []
+        for element, kind in self._references.get(referenced_id, []):
+            if not self._is_reference_valid(element, kind, referenced_id):
+                continue
+            valid_references.append((element, kind))
+            if (kind_set is None or kind in kind_set) and not any(
+                element is found for found in result
+            ):
+                result.append(element)
+        if valid_references:
+            self._references[referenced_id] = valid_references
+        else:
+            self._references.pop(referenced_id, None)
+        return result
+
+    def get_referencing_constraints(self, referenced_id: str) -> List[_Element]:
+        """
+        Return constraints referencing an id directly or in a resource set
+
+        referenced_id -- id which references should be found
+        """
+        result: List[_Element] = []
+        for element in self.get_referencing_elements(
+            referenced_id,
+            REFERENCE_KINDS_CONSTRAINT + (REFERENCE_KIND_RESOURCE_REF,),
+        ):
+            if element.tag == "resource_ref":
+                resource_set = element.getparent()
+                constraint = (
+                    None if resource_set is None else resource_set.getparent()
+                )
+                if constraint is None:
+                    continue
+                element = constraint
+            if not any(element is found for found in result):
+                result.append(element)
+        return result
+
+    def _add(
+        self, referenced_id: Optional[str], element: _Element, kind: str
+    ) -> None:
+        if not referenced_id:
+            return
+        self._references.setdefault(referenced_id, []).append((element, kind))
+
+    def _index_element(self, element: _Element) -> None:
+        tag = str(element.tag)
+        parent_tags = _get_ancestor_tags(element, 3)
+        if tag in _CONSTRAINT_REFERENCE_ATTRS:
+            if parent_tags[:1] == ["constraints"] and (
+                element.find("./resource_set") is None
+            ):
+                for kind in _CONSTRAINT_REFERENCE_ATTRS[tag]:
+                    self._add(element.get(kind), element, kind)
+        elif tag in _ID_REFERENCE_TAGS:
+            if _is_id_reference_position(tag, parent_tags):
+                self._add(element.get("id"), element, _ID_REFERENCE_TAGS[tag])
+        elif tag == "acl_permission":
+            if parent_tags[:2] == ["acl_role", "acls"]:
+                self._add(
+                    element.get(REFERENCE_KIND_ACL_PERMISSION),
+                    element,
+                    REFERENCE_KIND_ACL_PERMISSION,
+                )
+        self._add(
+            element.get(REFERENCE_KIND_ID_REF), element, REFERENCE_KIND_ID_REF
+        )
+
+    def _is_reference_valid(
+        self, element: _Element, kind: str, referenced_id: str
+    ) -> bool:
+        if kind in _ID_REFERENCE_TAGS.values():
+            value = element.get("id")
+        else:
+            value = element.get(kind)
+        if value != referenced_id:
+            return False
+        if kind in REFERENCE_KINDS_CONSTRAINT and (
+            element.find("./resource_set") is not None
+        ):
+            return False
+        # the element must not have been removed from the tree
+        return element is self._root or _is_descendant(element, self._root)
+
+
+def _is_id_reference_position(tag: str, parent_tags: List[str]) -> bool:
+    """
+    Check that a reference element without its own id is placed where the
+    CIB schema expects it
+    """
+    if tag == "resource_ref":
+        return parent_tags[:1] == ["resource_set"] and parent_tags[2:] == [
+            "constraints"
+        ]
+    if tag == "obj_ref":
+        return parent_tags[:2] == ["tag", "tags"]
+    if tag == "role":
+        return parent_tags[1:2] == ["acls"]
+    return False
+
+
+def _get_ancestor_tags(element: _Element, depth: int) -> List[str]:
+    """
+    Return tags of the parent, grandparent... of an element up to the depth
+    """
+    tags: List[str] = []
+    for ancestor in element.iterancestors():
+        if len(tags) == depth:
+            break
+        tags.append(str(ancestor.tag))
+    return tags
+
+
 class IdProvider:
     """
     Book ids for future use in the CIB and generate new ids accordingly
@@ -78,6 +469,7 @@ class IdProvider:
         """
         reported_ids = set()
         report_list = []
+        id_index = get_id_index(self._cib)
         for _id in id_list:
             if _id in reported_ids:
                 continue
@@ -88,6 +480,8 @@ class IdProvider:
                 reported_ids.add(_id)
                 continue
             self._booked_ids.add(_id)
+            if id_index is not None:
+                id_index.claim_id(_id)
         return report_list
 
 
@@ -209,6 +603,16 @@ class ElementSearcher:
 
     def _execute(self):
         self._executed = True
+        id_index = get_id_index(self._context_element)
+        if id_index is not None:
+            for element in id_index.get_elements(self._element_id):
+                if (
+                    element.tag in self._tag_list
+                    and element.get("id") == self._element_id
+                    and _is_descendant(element, self._context_element)
+                ):
+                    self._element = element
+                    return
         for tag in self._tag_list:
             element_list = self._context_element.xpath(
                 ".//*[local-name()=$tag_name and @id=$element_id]",
@@ -232,9 +636,29 @@ def get_configuration_elements_by_id(
         searched
     check_id -- id to find
     """
-    # do not search in /cib/status, it may contain references to previously
-    # existing and deleted resources and thus preventing creating them again
+    id_index = get_id_index(tree)
+    if id_index is not None:
+        return id_index.get_elements(check_id)
+    return _xpath_configuration_elements_by_id(tree, check_id)
+
+
+# do not search in /cib/status, it may contain references to previously
+# existing and deleted resources and thus preventing creating them again
+_CONFIGURATION_ELEMENTS_XPATH = """
+    (
+        /cib/*[name()!="status"]
+        |
+        /*[name()!="cib"]
+    )
+"""
+_ID_IS_ID_XPATH_PREDICATE = " and ".join(
+    f'name()!="{tag}"' for tag in sorted(_ID_IS_REFERENCE_TAGS)
+)
 
+
+def _xpath_configuration_elements_by_id(
+    tree: _Element, check_id: str
+) -> List[_Element]:
     # pacemaker creates an implicit resource for the pacemaker_remote
     # connection, which will be named the same as the value of the remote-node
     # attribute of the explicit resource. So the value of nvpair named
@@ -242,21 +666,11 @@ def get_configuration_elements_by_id(
     return cast(
         List[_Element],
         get_root(tree).xpath(
-            """
-            (
-                /cib/*[name()!="status"]
-                |
-                /*[name()!="cib"]
-            )
+            _CONFIGURATION_ELEMENTS_XPATH
+            + f"""
             //*[
                 (
-                    name()!="acl_target"
-                    and
-                    name()!="role"
-                    and
-                    name()!="obj_ref"
-                    and
-                    name()!="resource_ref"
+                    {_ID_IS_ID_XPATH_PREDICATE}
                     and
                     @id=$check_id
                 ) or (
@@ -277,6 +691,32 @@ def get_configuration_elements_by_id(
     )
 
 
+def _xpath_configuration_elements_with_id(tree: _Element) -> List[_Element]:
+    return cast(
+        List[_Element],
+        get_root(tree).xpath(
+            _CONFIGURATION_ELEMENTS_XPATH
+            + f"//*[{_ID_IS_ID_XPATH_PREDICATE} and @id]"
+        ),
+    )
+
+
+def _xpath_remote_node_primitives(tree: _Element) -> List[_Element]:
+    return cast(
+        List[_Element],
+        get_root(tree).xpath(
+            _CONFIGURATION_ELEMENTS_XPATH
+            + """
+            //primitive[meta_attributes/nvpair[@name="remote-node"]]
+            """
+        ),
+    )
+
+
+def _is_descendant(element: _Element, ancestor: _Element) -> bool:
+    return any(parent is ancestor for parent in element.iterancestors())
+
+
 def get_element_by_id(cib: _Element, element_id: str) -> _Element:
     """
     Returns an element from CIB with the given IDs
@@ -323,6 +763,9 @@ def does_id_exist(tree, check_id):
     tree cib -- etree node
     check_id -- id to check
     """
+    id_index = get_id_index(tree)
+    if id_index is not None:
+        return id_index.does_id_exist(check_id)
     return len(get_configuration_elements_by_id(tree, check_id)) > 0
 
 
@@ -346,6 +789,9 @@ def find_unique_id(tree, check_id, reserved_ids=None):
     string check_id -- id to check
     iterable reserved_ids -- ids to think about as already used
     """
+    id_index = get_id_index(tree)
+    if id_index is not None:
+        return id_index.find_unique_id(check_id, reserved_ids)
     if not reserved_ids:
         reserved_ids = set()
     counter = 1
@@ -562,13 +1008,19 @@ def _get_configuration(element: _Element) -> _Element:
 def _find_elements_without_id_referencing_id(
     element: _Element,
     referenced_id: str,
+    reference_index: Optional[CibReferenceIndex] = None,
 ) -> list[_Element]:
     """
     Find elements which are referencing specified id (resource or tag).
 
     element -- any element within CIB tree
     referenced_id -- id which references should be found
+    reference_index -- index of the CIB tree to search in instead of the tree
     """
+    if reference_index is not None:
+        return reference_index.get_referencing_elements(
+            referenced_id, REFERENCE_KINDS_WITHOUT_ID
+        )
     return cast(
         list[_Element],
         _get_configuration(element).xpath(
@@ -581,13 +1033,22 @@ def _find_elements_without_id_referencing_id(
 def find_elements_referencing_id(
     element: _Element,
     referenced_id: str,
+    reference_index: Optional[CibReferenceIndex] = None,
 ) -> list[_Element]:
     """
     Find elements which are referencing specified id (resource or tag).
 
     element -- any element within CIB tree
     referenced_id -- id which references should be found
+    reference_index -- index of the CIB tree to search in instead of the tree
     """
+    if reference_index is not None:
+        return reference_index.get_referencing_elements(
+            referenced_id,
+            REFERENCE_KINDS_CONSTRAINT
+            + REFERENCE_KINDS_WITHOUT_ID
+            + (REFERENCE_KIND_ACL_PERMISSION,),
+        )
     return cast(
         list[_Element],
         _get_configuration(element).xpath(
@@ -625,11 +1086,19 @@ def find_elements_referencing_id(
     )
 
 
-def remove_element_by_id(cib: _Element, element_id: str) -> None:
+def remove_element_by_id(
+    cib: _Element,
+    element_id: str,
+    reference_index: Optional[CibReferenceIndex] = None,
+) -> None:
     """
     Remove element with specified id from cib element.
+
+    reference_index -- index of the cib used to find references to the element
     """
-    for ref_el in _find_elements_without_id_referencing_id(cib, element_id):
+    for ref_el in _find_elements_without_id_referencing_id(
+        cib, element_id, reference_index
+    ):
         remove_one_element(ref_el)
 
     try:
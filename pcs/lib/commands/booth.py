@@ -491,7 +491,7 @@ def create_in_cluster(
         enable_agent_self_validation=False,
     )
     agent_factory = ResourceAgentFacadeFactory(
-        env.cmd_runner(), report_processor
+        env.cmd_runner(), report_processor, env.resource_agent_metadata_cache
     )
 
     # Group id validation is not needed since create_id creates a new unique
@@ -23,6 +23,7 @@ from pcs.lib.cib.resource.common import get_inner_resources
 from pcs.lib.cib.resource.group import is_group
 from pcs.lib.cib.tag import is_tag
 from pcs.lib.cib.tools import (
+    CibReferenceIndex,
     find_elements_referencing_id,
     get_elements_by_ids,
     remove_element_by_id,
@@ -78,7 +79,9 @@ def remove_elements(
     if report_processor.has_errors:
         raise LibraryError()
 
-    element_ids_to_remove = _get_dependencies_to_remove(elements_to_process)
+    element_ids_to_remove = _get_dependencies_to_remove(
+        elements_to_process, CibReferenceIndex(wip_cib)
+    )
     dependant_elements, _ = get_elements_by_ids(
         cib, element_ids_to_remove - id_set
     )
@@ -94,13 +97,16 @@ def remove_elements(
             )
         )
 
+    reference_index = CibReferenceIndex(cib)
     for element_id in element_ids_to_remove:
-        remove_element_by_id(cib, element_id)
+        remove_element_by_id(cib, element_id, reference_index)
 
     env.push_cib()
 
 
-def _get_dependencies_to_remove(elements: list[_Element]) -> set[str]:
+def _get_dependencies_to_remove(
+    elements: list[_Element], reference_index: CibReferenceIndex
+) -> set[str]:
     """
     Get ids of all elements that need to be removed (including specified
     elements) together with specified elements based on their relations.
@@ -108,6 +114,7 @@ def _get_dependencies_to_remove(elements: list[_Element]) -> set[str]:
     WARNING: this is a destructive operation for elements and their etree.
 
     elements -- list of elements that are planned to be removed
+    reference_index -- index of the etree the elements belong to
     """
     elements_to_process = list(elements)
     element_ids_to_remove: set[str] = set()
@@ -119,7 +126,9 @@ def _get_dependencies_to_remove(elements: list[_Element]) -> set[str]:
             if element_id in element_ids_to_remove:
                 continue
             element_ids_to_remove.add(element_id)
-            elements_to_process.extend(_get_element_references(el))
+            elements_to_process.extend(
+                _get_element_references(el, reference_index)
+            )
             elements_to_process.extend(_get_inner_references(el))
         parent_el = el.getparent()
         if parent_el is not None:
@@ -130,13 +139,18 @@ def _get_dependencies_to_remove(elements: list[_Element]) -> set[str]:
     return element_ids_to_remove
 
 
-def _get_element_references(element: _Element) -> Iterable[_Element]:
+def _get_element_references(
+    element: _Element, reference_index: CibReferenceIndex
+) -> Iterable[_Element]:
     """
     Return all CIB elements that are referencing specified element
 
     element -- references to this element will be
+    reference_index -- index of the CIB the element belongs to
     """
-    return find_elements_referencing_id(element, str(element.attrib["id"]))
+    return find_elements_referencing_id(
+        element, str(element.attrib["id"]), reference_index
+    )
 
 
 def _get_inner_references(element: _Element) -> Iterable[_Element]:
@@ -5,6 +5,7 @@ import time
 from typing import (
     Any,
     Collection,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -23,7 +24,10 @@ from pcs.common.corosync_conf import (
     CorosyncQuorumDeviceSettingsDto,
 )
 from pcs.common.file import RawFileError
-from pcs.common.node_communicator import HostNotFound
+from pcs.common.node_communicator import (
+    HostNotFound,
+    RequestTarget,
+)
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import (
@@ -56,6 +60,8 @@ from pcs.lib.communication.corosync import (
     ReloadCorosyncConf,
 )
 from pcs.lib.communication.nodes import (
+    PCSD_CAPABILITY_NODE_ACTIONS,
+    PCSD_CAPABILITY_NODE_STARTUP_WAIT,
     CheckPacemakerStarted,
     DistributeFilesWithoutForces,
     EnableCluster,
@@ -63,6 +69,7 @@ from pcs.lib.communication.nodes import (
     GetOnlineTargets,
     RemoveFilesWithoutForces,
     RemoveNodesFromCib,
+    RunNodeActions,
     SendPcsdSslCertAndKey,
     StartCluster,
     UpdateKnownHosts,
@@ -73,7 +80,10 @@ from pcs.lib.communication.sbd import (
     EnableSbdService,
     SetSbdConfig,
 )
-from pcs.lib.communication.tools import AllSameDataMixin
+from pcs.lib.communication.tools import (
+    AllSameDataMixin,
+    RunRemotelyBase,
+)
 from pcs.lib.communication.tools import run as run_com
 from pcs.lib.communication.tools import run_and_raise
 from pcs.lib.corosync import (
@@ -105,6 +115,10 @@ from pcs.lib.tools import (
     generate_binary_key,
     generate_uuid,
 )
+from pcs.lib.waiter import Backoff
+
+# nodes are not asked to wait for pacemaker longer than this in one request
+_NODE_STARTUP_WAIT_MAX_SECONDS = 15
 
 
 def node_clear(
@@ -323,10 +337,9 @@ def setup(
     # Validate the nodes
     com_cmd: AllSameDataMixin = GetHostInfo(report_processor)
     com_cmd.set_targets(target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
-        _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd), force
-        )
+        _host_check_cluster_setup(host_info_dict, force)
     )
 
     # If there is an error reading the file, this will report it and exit
@@ -339,10 +352,19 @@ def setup(
     # Validation done. If errors occurred, an exception has been raised and we
     # don't get below this line.
 
+    # If all nodes support it, send all actions preparing the nodes in one
+    # request to each node instead of waiting for all nodes after each action.
+    node_runner = _NodeCommandRunner(
+        env,
+        _is_pcsd_capability_supported(
+            host_info_dict, target_list, PCSD_CAPABILITY_NODE_ACTIONS
+        ),
+    )
+
     # Destroy cluster on all nodes.
     com_cmd = cluster.Destroy(env.report_processor)
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_runner.run(com_cmd)
 
     # Distribute auth tokens.
     com_cmd = UpdateKnownHosts(
@@ -353,7 +375,7 @@ def setup(
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_runner.run(com_cmd)
 
     # TODO This should be in the file distribution call but so far we don't
     # have a call which allows to save and delete files at the same time.
@@ -362,7 +384,7 @@ def setup(
         {"pcsd settings": {"type": "pcsd_settings"}},
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_runner.run(com_cmd)
 
     if not no_keys_sync:
         # Distribute configuration files except corosync.conf. Sending
@@ -383,7 +405,7 @@ def setup(
         )
         com_cmd = DistributeFilesWithoutForces(env.report_processor, actions)
         com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_runner.run(com_cmd)
 
         # Distribute and reload pcsd SSL certificate
         if sync_ssl_certs:
@@ -405,12 +427,14 @@ def setup(
                 env.report_processor, ssl_cert, ssl_key
             )
             com_cmd.set_targets(target_list)
-            run_and_raise(env.get_node_communicator(), com_cmd)
+            node_runner.run(com_cmd)
+
+    node_runner.flush()
 
     # Create and distribute corosync.conf. Once a node saves corosync.conf it
     # is considered to be in a cluster.
     # raises if corosync not valid
-    com_cmd = DistributeFilesWithoutForces(
+    corosync_com_cmd = DistributeFilesWithoutForces(
         env.report_processor,
         node_communication_format.corosync_conf_file(
             _create_corosync_conf(
@@ -427,8 +451,18 @@ def setup(
             ).config.export()
         ),
     )
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    corosync_com_cmd.set_targets(target_list)
+    node_runner.run(corosync_com_cmd)
+    # Optionally enable cluster services. Enabling is done in the same request
+    # as sending corosync.conf if possible, yet the cluster has been set up
+    # even if enabling fails.
+    enable_com_cmd = EnableCluster(env.report_processor)
+    enable_com_cmd.set_targets(target_list)
+    if enable and node_runner.use_node_actions:
+        node_runner.run(enable_com_cmd)
+    node_runner.flush(raise_on_errors=False)
+    if corosync_com_cmd.has_errors:
+        raise LibraryError()
 
     if env.report_processor.report(
         ReportItem.info(reports.messages.ClusterSetupSuccess())
@@ -436,16 +470,17 @@ def setup(
         raise LibraryError()
 
     # Optionally enable and start cluster services.
-    if enable:
-        com_cmd = EnableCluster(env.report_processor)
-        com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+    if enable and not node_runner.use_node_actions:
+        run_and_raise(env.get_node_communicator(), enable_com_cmd)
     if start:
         _start_cluster(
             env.communicator_factory,
             env.report_processor,
             target_list,
             wait_timeout=wait_timeout,
+            wait_on_nodes=_is_pcsd_capability_supported(
+                host_info_dict, target_list, PCSD_CAPABILITY_NODE_STARTUP_WAIT
+            ),
         )
 
 
@@ -1105,9 +1140,10 @@ def add_nodes(
     # Validate new nodes. All new nodes have to be online.
     com_cmd = GetHostInfo(report_processor)
     com_cmd.set_targets(new_nodes_target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
         _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd),
+            host_info_dict,
             force,
             # version of services may not be the same across the existing
             # cluster nodes, so it's not easy to make this check properly
@@ -1151,6 +1187,19 @@ def add_nodes(
     # command cannot be run again. So we need to minimize the amount of actions
     # (and therefore possible failures) after adding the nodes to corosync.
 
+    # If all new nodes support it, send all actions preparing the new nodes in
+    # one request to each node instead of waiting for all nodes after each
+    # action. Existing nodes only get one request at a time, so it works even
+    # if they run an older pcsd. The qdevice and booth setup do not go through
+    # node actions, so postponed actions are flushed before them to keep the
+    # order of the steps.
+    node_runner = _NodeCommandRunner(
+        env,
+        _is_pcsd_capability_supported(
+            host_info_dict, new_nodes_target_list, PCSD_CAPABILITY_NODE_ACTIONS
+        ),
+    )
+
     # distribute auth tokens of all cluster nodes (including the new ones) to
     # all new nodes
     com_cmd = UpdateKnownHosts(
@@ -1161,10 +1210,11 @@ def add_nodes(
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(new_nodes_target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    node_runner.run(com_cmd)
 
     # qdevice setup
     if corosync_conf.get_quorum_device_model() == "net":
+        node_runner.flush()
         qdevice_net.set_up_client_certificates(
             env.cmd_runner(),
             env.report_processor,
@@ -1194,17 +1244,18 @@ def add_nodes(
                     device_list=new_node["devices"],
                 ),
             )
-        run_and_raise(env.get_node_communicator(), com_cmd_sbd_cfg)
+        node_runner.run(com_cmd_sbd_cfg)
 
         com_cmd = EnableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_runner.run(com_cmd)
     else:
         com_cmd = DisableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_runner.run(com_cmd)
 
     # booth setup
+    node_runner.flush()
     booth_sync.send_all_config_to_node(
         env.get_node_communicator(),
         env.report_processor,
@@ -1320,7 +1371,7 @@ def add_nodes(
             env.report_processor, files_action
         )
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_runner.run(com_cmd)
 
     # Distribute and reload pcsd SSL certificate
     if sync_ssl_certs:
@@ -1365,7 +1416,9 @@ def add_nodes(
 
         com_cmd = SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        node_runner.run(com_cmd)
+
+    node_runner.flush()
 
     # When corosync >= 2 is in use, the procedure for adding a node is:
     # 1. add the new node to corosync.conf on all existing nodes
@@ -1379,29 +1432,46 @@ def add_nodes(
         corosync_conf.set_quorum_options(dict(auto_tie_breaker="1"))
 
     _verify_corosync_conf(corosync_conf)  # raises if corosync not valid
-    com_cmd = DistributeCorosyncConf(
+    corosync_com_cmd = DistributeCorosyncConf(
         env.report_processor,
         corosync_conf.config.export(),
         allow_skip_offline=False,
     )
-    com_cmd.set_targets(online_cluster_target_list + new_nodes_target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    corosync_com_cmd.set_targets(
+        online_cluster_target_list + new_nodes_target_list
+    )
+    node_runner.run(corosync_com_cmd)
+    # Optionally enable cluster services. Enabling is done in the same request
+    # as sending corosync.conf if possible, yet corosync.conf must be reloaded
+    # even if enabling fails.
+    enable_com_cmd = EnableCluster(env.report_processor)
+    enable_com_cmd.set_targets(new_nodes_target_list)
+    if enable and node_runner.use_node_actions:
+        node_runner.run(enable_com_cmd)
+    node_runner.flush(raise_on_errors=False)
+    if corosync_com_cmd.has_errors:
+        raise LibraryError()
 
     com_cmd = ReloadCorosyncConf(env.report_processor)
     com_cmd.set_targets(online_cluster_target_list)
     run_and_raise(env.get_node_communicator(), com_cmd)
+    if report_processor.has_errors:
+        raise LibraryError()
 
     # Optionally enable and start cluster services.
-    if enable:
-        com_cmd = EnableCluster(env.report_processor)
-        com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+    if enable and not node_runner.use_node_actions:
+        run_and_raise(env.get_node_communicator(), enable_com_cmd)
     if start:
         _start_cluster(
             env.communicator_factory,
             env.report_processor,
             new_nodes_target_list,
             wait_timeout=wait_timeout,
+            wait_on_nodes=_is_pcsd_capability_supported(
+                host_info_dict,
+                new_nodes_target_list,
+                PCSD_CAPABILITY_NODE_STARTUP_WAIT,
+            ),
         )
 
 
@@ -1422,6 +1492,7 @@ def _start_cluster(
     report_processor: ReportProcessor,
     target_list,
     wait_timeout=False,
+    wait_on_nodes=False,
 ):
     # Large clusters take longer time to start up. So we make the timeout
     # longer for each 8 nodes:
@@ -1447,6 +1518,8 @@ def _start_cluster(
                 target_list,
                 # wait_timeout is either None or a timeout
                 timeout=wait_timeout,
+                wait_on_nodes=wait_on_nodes,
+                request_timeout=communicator_factory.request_timeout,
             )
         ).has_errors:
             raise LibraryError()
@@ -1457,10 +1530,25 @@ def _wait_for_pacemaker_to_start(
     report_processor: ReportProcessor,
     target_list,
     timeout=None,
+    wait_on_nodes=False,
+    request_timeout=settings.default_request_timeout,
 ):
+    """
+    Wait for pacemaker to start on nodes, return error reports
+
+    timeout -- maximal time to wait in seconds, None for the default timeout
+    wait_on_nodes -- nodes support responding once pacemaker has started,
+        see PCSD_CAPABILITY_NODE_STARTUP_WAIT
+    request_timeout -- timeout of requests to the nodes in seconds
+    """
     timeout = 60 * 15 if timeout is None else timeout
-    interval = 2
-    stop_at = time.time() + timeout
+    # Nodes check pacemaker status once they stop waiting, leave them half of
+    # the request timeout for that. Poll the nodes if there is no time to wait.
+    node_wait_max = min(_NODE_STARTUP_WAIT_MAX_SECONDS, request_timeout // 2)
+    wait_on_nodes = wait_on_nodes and node_wait_max >= 1
+    started_at = time.time()
+    stop_at = started_at + timeout
+    backoff = Backoff()
     report_processor.report(
         ReportItem.info(
             reports.messages.WaitForNodeStartupStarted(
@@ -1471,13 +1559,22 @@ def _wait_for_pacemaker_to_start(
     error_report_list = []
     has_errors = False
     while target_list:
-        if time.time() > stop_at:
+        remaining = stop_at - time.time()
+        if remaining < 0:
             error_report_list.append(
                 ReportItem.error(reports.messages.WaitForNodeStartupTimedOut())
             )
             break
-        time.sleep(interval)
-        com_cmd = CheckPacemakerStarted(report_processor)
+        node_wait_timeout = None
+        if wait_on_nodes:
+            # Nodes hold the requests until pacemaker starts, so they may be
+            # asked again right after they responded.
+            backoff.reset()
+            node_wait_timeout = max(1, min(math.ceil(remaining), node_wait_max))
+        backoff.sleep(remaining)
+        com_cmd = CheckPacemakerStarted(
+            report_processor, wait_timeout=node_wait_timeout
+        )
         com_cmd.set_targets(target_list)
         target_list = run_com(node_communicator, com_cmd)
         has_errors = has_errors or com_cmd.has_errors
@@ -1486,9 +1583,74 @@ def _wait_for_pacemaker_to_start(
         error_report_list.append(
             ReportItem.error(reports.messages.WaitForNodeStartupError())
         )
+    else:
+        report_processor.report(
+            ReportItem.info(
+                reports.messages.WaitForNodeStartupFinished(
+                    round(time.time() - started_at, 1)
+                )
+            )
+        )
     return error_report_list
 
 
+class _NodeCommandRunner:
+    """
+    Run communication commands one by one or all at once in node actions
+
+    In the latter case, commands are postponed until flush is called. Then
+    requests of all the commands are sent to each node in one request, so that
+    nodes do not wait for each other after each command.
+    """
+
+    def __init__(self, env: LibraryEnvironment, use_node_actions: bool):
+        self._env = env
+        self.use_node_actions = use_node_actions
+        self._com_cmd_list: List[RunRemotelyBase] = []
+
+    def run(self, com_cmd: RunRemotelyBase) -> None:
+        """
+        Run or postpone a command, raise LibraryError if it failed
+        """
+        if self.use_node_actions:
+            self._com_cmd_list.append(com_cmd)
+            return
+        run_and_raise(self._env.get_node_communicator(), com_cmd)
+
+    def flush(self, raise_on_errors: bool = True) -> None:
+        """
+        Run all postponed commands
+
+        raise_on_errors -- raise LibraryError if any of the commands failed
+        """
+        if not self._com_cmd_list:
+            return
+        com_cmd = RunNodeActions(self._env.report_processor, self._com_cmd_list)
+        self._com_cmd_list = []
+        run_com(self._env.get_node_communicator(), com_cmd)
+        if raise_on_errors and com_cmd.has_errors:
+            raise LibraryError()
+
+
+def _is_pcsd_capability_supported(
+    host_info_dict: Mapping[str, Any],
+    target_list: Sequence[RequestTarget],
+    capability: str,
+) -> bool:
+    """
+    Check that pcsd on all targets has the specified capability
+
+    host_info_dict -- result of GetHostInfo, keys are target labels
+    target_list -- targets to check
+    capability -- pcsd capability id
+    """
+    return all(
+        capability
+        in host_info_dict.get(target.label, {}).get("pcsd_capabilities", [])
+        for target in target_list
+    )
+
+
 def _host_check_cluster_setup(
     host_info_dict, force, check_services_versions=True
 ):
@@ -109,7 +109,9 @@ def get_cluster_properties_definition_legacy(
     env -- provides communication with externals
     """
     facade_factory = ResourceAgentFacadeFactory(
-        env.cmd_runner(), env.report_processor
+        env.cmd_runner(),
+        env.report_processor,
+        env.resource_agent_metadata_cache,
     )
     property_dict = {}
     for facade in _get_property_facade_list(
@@ -146,7 +148,9 @@ def set_properties(
 
     property_facade_list = _get_property_facade_list(
         env.report_processor,
-        ResourceAgentFacadeFactory(runner, env.report_processor),
+        ResourceAgentFacadeFactory(
+            runner, env.report_processor, env.resource_agent_metadata_cache
+        ),
     )
 
     configured_properties = [
@@ -218,7 +222,11 @@ def get_properties_metadata(
     property_definition_list = []
     for facade in _get_property_facade_list(
         env.report_processor,
-        ResourceAgentFacadeFactory(env.cmd_runner(), env.report_processor),
+        ResourceAgentFacadeFactory(
+            env.cmd_runner(),
+            env.report_processor,
+            env.resource_agent_metadata_cache,
+        ),
     ):
         property_definition_list.extend(facade.metadata.parameters)
     return ClusterPropertyMetadataDto(
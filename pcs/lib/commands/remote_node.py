@@ -326,7 +326,9 @@ def node_add_remote(
 
     try:
         resource_agent_facade = ResourceAgentFacadeFactory(
-            env.cmd_runner(), report_processor
+            env.cmd_runner(),
+            report_processor,
+            env.resource_agent_metadata_cache,
         ).facade_from_parsed_name(remote_node.AGENT_NAME)
     except ResourceAgentError as e:
         report_processor.report(resource_agent_error_to_report_item(e))
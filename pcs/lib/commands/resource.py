@@ -11,6 +11,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -19,12 +20,14 @@ from typing import (
 
 from lxml.etree import _Element
 
+from pcs import settings
 from pcs.common import (
     const,
     file_type_codes,
     reports,
 )
 from pcs.common.interface import dto
+from pcs.common.pacemaker.resource.create import ResourceCreateDto
 from pcs.common.pacemaker.resource.list import CibResourcesDto
 from pcs.common.reports import ReportItemList
 from pcs.common.reports.item import ReportItem
@@ -40,6 +43,7 @@ from pcs.lib.cib.tag import expand_tag
 from pcs.lib.cib.tools import (
     ElementNotFound,
     IdProvider,
+    does_id_exist,
     find_element_by_tag_and_id,
     get_element_by_id,
     get_elements_by_ids,
@@ -68,6 +72,7 @@ from pcs.lib.pacemaker.live import (
     resource_move,
     resource_unmove_unban,
     simulate_cib,
+    validate_resource_instance_attributes_via_pcmk,
 )
 from pcs.lib.pacemaker.state import (
     ResourceNotFound,
@@ -91,7 +96,10 @@ from pcs.lib.resource_agent import (
     resource_agent_error_to_report_item,
     split_resource_agent_name,
 )
-from pcs.lib.tools import get_tmp_cib
+from pcs.lib.tools import (
+    TmpCibFiles,
+    get_tmp_cib,
+)
 from pcs.lib.validate import ValueTimeInterval
 from pcs.lib.xml_tools import (
     etree_to_str,
@@ -356,6 +364,43 @@ def _check_special_cases(
         raise LibraryError()
 
 
+def _validate_clone_meta_for_agent(
+    resource_agent: ResourceAgentFacade,
+    clone_meta_options: Mapping[str, str],
+    allow_incompatible_clone_meta_attributes: bool,
+) -> reports.ReportItemList:
+    report_list: reports.ReportItemList = []
+    if resource_agent.metadata.name.standard != "ocf":
+        for incompatible_attr in ("globally-unique", "promotable"):
+            if is_true(clone_meta_options.get(incompatible_attr, "0")):
+                report_list.append(
+                    reports.ReportItem.error(
+                        reports.messages.ResourceCloneIncompatibleMetaAttributes(
+                            incompatible_attr,
+                            resource_agent.metadata.name.to_dto(),
+                        )
+                    )
+                )
+    elif resource_agent.metadata.ocf_version == "1.1":
+        if (
+            is_true(clone_meta_options.get("promotable", "0"))
+            and not resource_agent.metadata.provides_promotability
+        ):
+            report_list.append(
+                reports.ReportItem(
+                    reports.get_severity(
+                        reports.codes.FORCE,
+                        allow_incompatible_clone_meta_attributes,
+                    ),
+                    reports.messages.ResourceCloneIncompatibleMetaAttributes(
+                        "promotable",
+                        resource_agent.metadata.name.to_dto(),
+                    ),
+                )
+            )
+    return report_list
+
+
 _find_bundle = partial(
     find_element_by_tag_and_id, cib_const.TAG_RESOURCE_BUNDLE
 )
@@ -422,7 +467,9 @@ def create(
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -536,7 +583,9 @@ def create_as_clone(
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -544,35 +593,13 @@ def create_as_clone(
         resource_agent_name,
         allow_absent_agent,
     )
-    if resource_agent.metadata.name.standard != "ocf":
-        for incompatible_attr in ("globally-unique", "promotable"):
-            if is_true(clone_meta_options.get(incompatible_attr, "0")):
-                env.report_processor.report(
-                    reports.ReportItem.error(
-                        reports.messages.ResourceCloneIncompatibleMetaAttributes(
-                            incompatible_attr,
-                            resource_agent.metadata.name.to_dto(),
-                        )
-                    )
-                )
-    elif resource_agent.metadata.ocf_version == "1.1":
-        if (
-            is_true(clone_meta_options.get("promotable", "0"))
-            and not resource_agent.metadata.provides_promotability
-        ):
-            env.report_processor.report(
-                reports.ReportItem(
-                    reports.get_severity(
-                        reports.codes.FORCE,
-                        allow_incompatible_clone_meta_attributes,
-                    ),
-                    reports.messages.ResourceCloneIncompatibleMetaAttributes(
-                        "promotable",
-                        resource_agent.metadata.name.to_dto(),
-                    ),
-                )
-            )
-    if env.report_processor.has_errors:
+    if env.report_processor.report_list(
+        _validate_clone_meta_for_agent(
+            resource_agent,
+            clone_meta_options,
+            allow_incompatible_clone_meta_attributes,
+        )
+    ).has_errors:
         raise LibraryError()
 
     with resource_environment(
@@ -691,7 +718,9 @@ def create_in_group(
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -786,6 +815,278 @@ def create_in_group(
         )
 
 
+class _ResourceReportProcessor(reports.ReportProcessor):
+    """
+    Pass reports to another processor, keep track of errors of one resource
+    """
+
+    def __init__(self, report_processor: reports.ReportProcessor):
+        super().__init__()
+        self._report_processor = report_processor
+
+    @property
+    def is_debug_enabled(self) -> bool:
+        return self._report_processor.is_debug_enabled
+
+    def _do_report(self, report_item: ReportItem) -> None:
+        self._report_processor.report(report_item)
+
+
+def create_bulk(
+    env: LibraryEnvironment,
+    resource_list: Sequence[ResourceCreateDto],
+    allow_absent_agent: bool = False,
+    allow_invalid_operation: bool = False,
+    allow_invalid_instance_attributes: bool = False,
+    use_default_operations: bool = True,
+    ensure_disabled: bool = False,
+    allow_not_suitable_command: bool = False,
+    allow_incompatible_clone_meta_attributes: bool = False,
+    enable_agent_self_validation: bool = False,
+) -> None:
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-statements
+    """
+    Create primitive resources, optionally in groups or clones, in one step
+
+    Metadata of each agent are loaded once, all resources are validated before
+    an error is raised and the CIB is pushed once for all the resources.
+
+    env -- provides all for communication with externals
+    resource_list -- definitions of the resources to be created
+    allow_absent_agent -- is a flag for allowing agent that is not installed
+        in a system
+    allow_invalid_operation -- is a flag for allowing to use operations that
+        are not listed in a resource agent metadata
+    allow_invalid_instance_attributes -- is a flag for allowing to use
+        instance attributes that are not listed in a resource agent metadata
+        or for allowing to not use the instance_attributes that are required in
+        resource agent metadata
+    use_default_operations -- is a flag for stopping stopping of adding
+        default cib operations (specified in a resource agent)
+    ensure_disabled -- is flag that keeps resources in target-role "Stopped"
+    allow_not_suitable_command -- turn forceable errors into warnings
+    allow_incompatible_clone_meta_attributes -- if True some incompatible clone
+        meta attributes are treated as a warning, or as a forceable error if
+        False
+    enable_agent_self_validation -- if True, use agent self-validation feature
+        to validate instance attributes
+    """
+    if not resource_list:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.RequiredOptionsAreMissing(
+                    ["resource_list"], "resource"
+                )
+            )
+        )
+
+    runner = env.cmd_runner()
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
+    agent_dict: Dict[str, ResourceAgentFacade] = {}
+    for agent_name in dict.fromkeys(
+        definition.agent_name for definition in resource_list
+    ):
+        try:
+            agent_dict[agent_name] = _get_agent_facade(
+                env.report_processor,
+                runner,
+                agent_factory,
+                agent_name,
+                allow_absent_agent,
+            )
+        except LibraryError as e:
+            # the reports have been already processed, validate the rest
+            env.report_processor.report_list(list(e.args))
+
+    required_cib_version_list = [
+        version
+        for version in (
+            get_required_cib_version_for_primitive(definition.operations)
+            for definition in resource_list
+        )
+        if version is not None
+    ]
+    with resource_environment(
+        env,
+        required_cib_version=(
+            max(required_cib_version_list)
+            if required_cib_version_list
+            else None
+        ),
+    ) as resources_section:
+        cib = get_root(resources_section)
+        id_provider = IdProvider(resources_section)
+
+        # validate ids and placement of all the resources first, so that
+        # generated ids of elements do not collide with them
+        valid_definition_list = []
+        new_group_id_set: Set[str] = set()
+        for definition in resource_list:
+            resource_report_processor = _ResourceReportProcessor(
+                env.report_processor
+            )
+            report_list: reports.ReportItemList = []
+            validate_id(
+                definition.resource_id,
+                description="resource name",
+                reporter=report_list,
+            )
+            report_list.extend(id_provider.book_ids(definition.resource_id))
+            if definition.clone is not None and definition.group_id:
+                report_list.append(
+                    ReportItem.error(
+                        reports.messages.MutuallyExclusiveOptions(
+                            ["clone", "group_id"], "resource"
+                        )
+                    )
+                )
+            if definition.clone is not None:
+                if definition.clone.clone_id is not None:
+                    report_list.extend(
+                        resource.clone.validate_clone_id(
+                            definition.clone.clone_id, id_provider
+                        )
+                    )
+                if definition.agent_name in agent_dict:
+                    report_list.extend(
+                        _validate_clone_meta_for_agent(
+                            agent_dict[definition.agent_name],
+                            definition.clone.meta_attributes,
+                            allow_incompatible_clone_meta_attributes,
+                        )
+                    )
+            if (
+                definition.group_id
+                and definition.group_id not in new_group_id_set
+                and not does_id_exist(cib, definition.group_id)
+            ):
+                validate_id(
+                    definition.group_id,
+                    description="group name",
+                    reporter=report_list,
+                )
+                report_list.extend(id_provider.book_ids(definition.group_id))
+                new_group_id_set.add(definition.group_id)
+            if (
+                not resource_report_processor.report_list(
+                    report_list
+                ).has_errors
+                and definition.agent_name in agent_dict
+            ):
+                valid_definition_list.append(definition)
+
+        # agents validate the resources in separate processes, run them
+        # concurrently rather than one by one
+        def self_validate(
+            agent_runner: CommandRunner, definition: ResourceCreateDto
+        ) -> tuple[Optional[bool], str]:
+            return validate_resource_instance_attributes_via_pcmk(
+                agent_runner,
+                agent_dict[definition.agent_name].metadata.name,
+                definition.instance_attributes,
+            )
+
+        self_validation_definition_list = [
+            definition
+            for definition in valid_definition_list
+            if resource.primitive.is_agent_self_validation_supported(
+                agent_dict[definition.agent_name]
+            )
+        ]
+        self_validation_result_dict = dict(
+            zip(
+                (
+                    definition.resource_id
+                    for definition in self_validation_definition_list
+                ),
+                runner.map_concurrently(
+                    self_validate,
+                    self_validation_definition_list,
+                    settings.resource_agent_self_validation_concurrency,
+                ),
+            )
+        )
+
+        group_element_dict: Dict[str, _Element] = {}
+        for definition in valid_definition_list:
+            resource_agent = agent_dict[definition.agent_name]
+            resource_report_processor = _ResourceReportProcessor(
+                env.report_processor
+            )
+            try:
+                _check_special_cases(
+                    env,
+                    resource_agent.metadata.name,
+                    resources_section,
+                    definition.resource_id,
+                    definition.meta_attributes,
+                    definition.instance_attributes,
+                    allow_not_suitable_command,
+                )
+                primitive_element = resource.primitive.create(
+                    resource_report_processor,
+                    runner,
+                    resources_section,
+                    id_provider,
+                    definition.resource_id,
+                    resource_agent,
+                    definition.operations,
+                    definition.meta_attributes,
+                    definition.instance_attributes,
+                    allow_invalid_operation,
+                    allow_invalid_instance_attributes,
+                    use_default_operations,
+                    enable_agent_self_validation=enable_agent_self_validation,
+                    agent_self_validation_result=(
+                        self_validation_result_dict.get(definition.resource_id)
+                    ),
+                )
+            except LibraryError as e:
+                # the reports have been already processed, validate the rest
+                env.report_processor.report_list(list(e.args))
+                continue
+
+            resource_element = primitive_element
+            if definition.clone is not None:
+                resource_element = resource.clone.append_new(
+                    resources_section,
+                    id_provider,
+                    primitive_element,
+                    definition.clone.meta_attributes,
+                    clone_id=definition.clone.clone_id,
+                )
+            if ensure_disabled:
+                resource.common.disable(resource_element, id_provider)
+
+            if not definition.group_id:
+                continue
+            if definition.group_id not in group_element_dict:
+                group_element_dict[definition.group_id] = (
+                    resource.group.append_new(
+                        resources_section, definition.group_id
+                    )
+                    if definition.group_id in new_group_id_set
+                    else get_element_by_id(cib, definition.group_id)
+                )
+            group_element = group_element_dict[definition.group_id]
+            if not env.report_processor.report_list(
+                resource.validations.validate_move_resources_to_group(
+                    group_element, [primitive_element], None
+                )
+            ).has_errors:
+                resource.hierarchy.move_resources_to_group(
+                    group_element, [primitive_element]
+                )
+
+        if env.report_processor.has_errors:
+            raise LibraryError()
+
+
 def create_into_bundle(
     env: LibraryEnvironment,
     resource_id: str,
@@ -843,7 +1144,9 @@ def create_into_bundle(
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -1876,33 +2179,39 @@ def move_autoclean(
             )
         )
 
-    # add a move constraint to a temporary cib and get a cib diff which adds
-    # the move constraint
-    with get_tmp_cib(env.report_processor, cib_xml) as rsc_moved_cib_file:
+    # Temporary cibs are shared, so that each cib is written only once. The cib
+    # with the move constraint, for example, is read back from the file
+    # crm_resource modified and the same file is used to compute both diffs.
+    with TmpCibFiles(env.report_processor) as tmp_cib_files:
+        # add a move constraint to a temporary cib and get a cib diff which
+        # adds the move constraint
+        rsc_moved_cib_file = tmp_cib_files.get_for_writing(cib_xml)
         stdout, stderr, retval = resource_move(
             env.cmd_runner(dict(CIB_file=rsc_moved_cib_file.name)),
             resource_id,
             node=node,
             promoted=master,
         )
-        rsc_moved_cib_file.seek(0)
-        rsc_moved_cib_xml = rsc_moved_cib_file.read()
-
-    if retval != 0:
-        raise LibraryError(
-            _move_ban_pcmk_error_report(
-                resource_id, stdout, stderr, is_ban=False
+        if retval != 0:
+            raise LibraryError(
+                _move_ban_pcmk_error_report(
+                    resource_id, stdout, stderr, is_ban=False
+                )
             )
+        rsc_moved_cib_xml = tmp_cib_files.read(rsc_moved_cib_file)
+        add_constraint_cib_diff = diff_cibs_xml(
+            env.cmd_runner(),
+            env.report_processor,
+            cib_xml,
+            rsc_moved_cib_xml,
+            tmp_cib_files,
         )
-    add_constraint_cib_diff = diff_cibs_xml(
-        env.cmd_runner(), env.report_processor, cib_xml, rsc_moved_cib_xml
-    )
 
-    # clear the move constraint from the temporary cib and get a cib diff which
-    # removes the move constraint
-    with get_tmp_cib(
-        env.report_processor, rsc_moved_cib_xml
-    ) as rsc_moved_constraint_cleared_cib_file:
+        # clear the move constraint from the temporary cib and get a cib diff
+        # which removes the move constraint
+        rsc_moved_constraint_cleared_cib_file = tmp_cib_files.get_for_writing(
+            rsc_moved_cib_xml
+        )
         stdout, stderr, retval = resource_unmove_unban(
             env.cmd_runner(
                 dict(CIB_file=rsc_moved_constraint_cleared_cib_file.name)
@@ -1919,14 +2228,16 @@ def move_autoclean(
                     )
                 )
             )
-        rsc_moved_constraint_cleared_cib_file.seek(0)
-        constraint_removed_cib = rsc_moved_constraint_cleared_cib_file.read()
-    remove_constraint_cib_diff = diff_cibs_xml(
-        env.cmd_runner(),
-        env.report_processor,
-        rsc_moved_cib_xml,
-        constraint_removed_cib,
-    )
+        constraint_removed_cib = tmp_cib_files.read(
+            rsc_moved_constraint_cleared_cib_file
+        )
+        remove_constraint_cib_diff = diff_cibs_xml(
+            env.cmd_runner(),
+            env.report_processor,
+            rsc_moved_cib_xml,
+            constraint_removed_cib,
+            tmp_cib_files,
+        )
 
     # if both the diffs are no-op, nothing needs to be done
     if not (add_constraint_cib_diff and remove_constraint_cib_diff):
@@ -2448,7 +2759,7 @@ def unmove_unban(
             resource.validations.validate_unmove_unban(resource_el, master)
         )
     if expired and not has_resource_unmove_unban_expired_support(
-        env.cmd_runner()
+        env.cmd_runner(), env.pcmk_capability_cache
     ):
         report_list.append(
             ReportItem.error(
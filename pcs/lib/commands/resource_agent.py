@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -7,6 +8,7 @@ from typing import (
     cast,
 )
 
+from pcs import settings
 from pcs.common.interface.dto import to_dict
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
@@ -96,6 +98,7 @@ def list_agents(
     lib_env: LibraryEnvironment,
     describe: bool = True,
     search: Optional[str] = None,
+    agent_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """
     List all resource agents on the local host, optionally filtered and
@@ -103,6 +106,8 @@ def list_agents(
 
     describe -- load and return agents' metadata as well
     search -- return only agents which name contains this string
+    agent_callback -- called with each agent as soon as it is loaded, before
+        the whole list is returned
     """
     runner = lib_env.cmd_runner()
 
@@ -113,11 +118,12 @@ def list_agents(
             continue
         agent_names.extend(_get_agent_names(runner, std_prov))
     return _complete_agent_list(
-        runner,
+        _get_agent_factory(lib_env),
         lib_env.report_processor,
         sorted(agent_names, key=lambda item: item.full_name),
         describe,
         search,
+        agent_callback,
     )
 
 
@@ -208,41 +214,64 @@ def _agent_metadata_to_dict(
     return agent_dict
 
 
+def _get_agent_factory(
+    lib_env: LibraryEnvironment,
+) -> ResourceAgentFacadeFactory:
+    return ResourceAgentFacadeFactory(
+        lib_env.cmd_runner(),
+        lib_env.report_processor,
+        lib_env.resource_agent_metadata_cache,
+    )
+
+
 def _complete_agent_list(
-    runner: CommandRunner,
+    agent_factory: ResourceAgentFacadeFactory,
     report_processor: ReportProcessor,
     agent_names: Iterable[ResourceAgentName],
     describe: bool,
     search: Optional[str],
+    agent_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[Dict[str, Any]]:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
     search_lower = search.lower() if search else None
+    filtered_names = [
+        name
+        for name in agent_names
+        if not search_lower or search_lower in name.full_name.lower()
+    ]
     agent_list = []
-    for name in agent_names:
-        if search_lower and search_lower not in name.full_name.lower():
-            continue
-        try:
-            metadata = (
-                agent_factory.facade_from_parsed_name(name).metadata
-                if describe
-                else name_to_void_metadata(name)
+
+    def add_agent(agent: Dict[str, Any]) -> None:
+        agent_list.append(agent)
+        if agent_callback:
+            agent_callback(agent)
+
+    if not describe:
+        for name in filtered_names:
+            add_agent(
+                _agent_metadata_to_dict(name_to_void_metadata(name), False)
             )
-            agent_list.append(_agent_metadata_to_dict(metadata, describe))
-        except ResourceAgentError as e:
+        return agent_list
+
+    # loading metadata means running an agent, run the agents concurrently
+    for result in agent_factory.iter_facades_from_parsed_names(
+        filtered_names, settings.resource_agent_metadata_load_concurrency
+    ):
+        if isinstance(result, ResourceAgentError):
             report_processor.report(
                 resource_agent_error_to_report_item(
-                    e, ReportItemSeverity.warning()
+                    result, ReportItemSeverity.warning()
                 )
             )
+        else:
+            add_agent(_agent_metadata_to_dict(result.metadata, True))
     return agent_list
 
 
 def _get_agent_metadata(
-    runner: CommandRunner,
+    agent_factory: ResourceAgentFacadeFactory,
     report_processor: ReportProcessor,
     agent_name: ResourceAgentNameDto,
 ) -> ResourceAgentMetadata:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
     try:
         return agent_factory.facade_from_parsed_name(
             ResourceAgentName.from_dto(agent_name)
@@ -261,7 +290,7 @@ def get_agent_metadata(
     agent_name -- name of the agent
     """
     return _get_agent_metadata(
-        lib_env.cmd_runner(),
+        _get_agent_factory(lib_env),
         lib_env.report_processor,
         agent_name,
     ).to_dto()
@@ -279,7 +308,7 @@ def describe_agent(
     """
     runner = lib_env.cmd_runner()
     report_processor = lib_env.report_processor
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    agent_factory = _get_agent_factory(lib_env)
     try:
         found_name = (
             split_resource_agent_name(agent_name)
@@ -305,7 +334,9 @@ def get_agent_default_operations(
     report_list, operation_list = uniquify_operations_intervals(
         get_default_operations(
             _get_agent_metadata(
-                lib_env.cmd_runner(), lib_env.report_processor, agent_name
+                _get_agent_factory(lib_env),
+                lib_env.report_processor,
+                agent_name,
             ),
             necessary_only,
         )
@@ -314,6 +345,15 @@ def get_agent_default_operations(
     return ListCibResourceOperationDto(operations=operation_list)
 
 
+def clear_metadata_cache(lib_env: LibraryEnvironment) -> None:
+    """
+    Drop cached metadata of all agents, they will be loaded from the agents
+    again when needed
+    """
+    if lib_env.resource_agent_metadata_cache is not None:
+        lib_env.resource_agent_metadata_cache.clear()
+
+
 def get_structured_agent_name(
     lib_env: LibraryEnvironment, agent_name: str
 ) -> ResourceAgentNameDto:
@@ -59,6 +59,11 @@ def get_services_info(
     for services not specified in `services`
     """
     service_set = set(services)
+    service_state_dict = (
+        env.service_manager.get_states(sorted(service_set))
+        if enabled or running
+        else {}
+    )
     return ServicesInfoResultDto(
         [
             ServiceStatusDto(
@@ -69,12 +74,12 @@ def get_services_info(
                     else None
                 ),
                 (
-                    env.service_manager.is_enabled(service)
+                    service_state_dict[service].enabled
                     if enabled and service in service_set
                     else None
                 ),
                 (
-                    env.service_manager.is_running(service)
+                    service_state_dict[service].running
                     if running and service in service_set
                     else None
                 ),
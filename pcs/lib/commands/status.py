@@ -1,9 +1,12 @@
 import os.path
 from typing import (
+    Any,
+    Callable,
     Iterable,
     List,
     Mapping,
     NamedTuple,
+    Optional,
 )
 
 from lxml.etree import _Element
@@ -17,7 +20,10 @@ from pcs.common.node_communicator import Communicator
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.common.services.interfaces import ServiceManagerInterface
-from pcs.common.status_dto import ResourcesStatusDto
+from pcs.common.status_dto import (
+    ResourcesStatusDto,
+    ResourcesStatusSnapshotDto,
+)
 from pcs.common.str_tools import (
     format_list,
     indent,
@@ -54,6 +60,7 @@ from pcs.lib.pacemaker.status import (
     ClusterStatusParsingError,
     cluster_status_parsing_error_to_report,
 )
+from pcs.lib.pacemaker.status_snapshot import ClusterStatusSnapshotService
 from pcs.lib.resource_agent.const import STONITH_ACTION_REPLACED_BY
 from pcs.lib.sbd import get_sbd_service_name
 
@@ -79,6 +86,9 @@ def resources_status(env: LibraryEnvironment) -> ResourcesStatusDto:
     """
     Return pacemaker status of configured resources as DTO
 
+    The status is always read from the cluster, use resources_status_snapshot
+    to get a status shared by pcsd workers.
+
     env -- LibraryEnvironment
     """
     status_xml = env.get_cluster_state()
@@ -94,6 +104,35 @@ def resources_status(env: LibraryEnvironment) -> ResourcesStatusDto:
     return dto
 
 
+def resources_status_snapshot(
+    env: LibraryEnvironment, max_age_ms: Optional[int] = None
+) -> ResourcesStatusSnapshotDto:
+    """
+    Return pacemaker status of configured resources with its generation and age
+
+    env -- LibraryEnvironment
+    max_age_ms -- the status must not be older than this many milliseconds
+    """
+    if max_age_ms is not None and max_age_ms < 0:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.InvalidOptionValue(
+                    "max_age_ms", str(max_age_ms), "a non-negative integer"
+                )
+            )
+        )
+    service = env.cluster_status_snapshot
+    if service is None:
+        service = ClusterStatusSnapshotService()
+    snapshot = service.get_resources_status(env.cmd_runner(), max_age_ms)
+    env.report_processor.report_list(snapshot.warnings)
+    return ResourcesStatusSnapshotDto(
+        generation=snapshot.generation,
+        age_ms=snapshot.get_age_ms(),
+        resources_status=snapshot.resources_status,
+    )
+
+
 def full_cluster_status_plaintext(
     env: LibraryEnvironment,
     hide_inactive_resources: bool = False,
@@ -136,32 +175,51 @@ def full_cluster_status_plaintext(
     live = env.is_cib_live and env.is_corosync_conf_live
     is_sbd_running = False
 
-    # load status, cib, corosync.conf
-    status_text, warning_list = get_cluster_status_text(
-        runner, hide_inactive_resources, verbose
+    # crm_mon and crm_ticket only run external processes, let them run while
+    # the rest of the data is loaded
+    capability_cache = env.pcmk_capability_cache
+    command_list: List[Callable[[CommandRunner], Any]] = [
+        lambda command_runner: get_cluster_status_text(
+            command_runner,
+            hide_inactive_resources,
+            verbose,
+            capability_cache,
+        )
+    ]
+    if verbose:
+        command_list.append(get_ticket_status_text)
+    command_result_iter = runner.map_concurrently(
+        lambda command_runner, command: command(command_runner),
+        command_list,
+        settings.status_probe_concurrency,
     )
+
+    # load cib, corosync.conf, status
     corosync_conf = None
     # If we are live on a remote node, we have no corosync.conf.
     # TODO Use the new file framework so the path is not exposed.
     if not live or os.path.exists(settings.corosync_conf_file):
         corosync_conf = env.get_corosync_conf()
     cib = env.get_cib()
+    status_text, warning_list = next(command_result_iter)
     if verbose:
         (
             ticket_status_text,
             ticket_status_stderr,
             ticket_status_retval,
-        ) = get_ticket_status_text(runner)
+        ) = next(command_result_iter)
     # get extra info if live
     if live:
         service_manager = env.service_manager
-        try:
-            is_sbd_running = service_manager.is_running(
-                get_sbd_service_name(service_manager)
-            )
-        except LibraryError:
-            pass
-        local_services_status = _get_local_services_status(service_manager)
+        sbd_service_name = get_sbd_service_name(service_manager)
+        local_services_status = _get_local_services_status(
+            service_manager, sbd_service_name
+        )
+        is_sbd_running = any(
+            service_status.service == sbd_service_name
+            and service_status.running
+            for service_status in local_services_status
+        )
         if verbose and corosync_conf:
             node_name_list, node_names_report_list = get_existing_nodes_names(
                 corosync_conf
@@ -331,7 +389,7 @@ def _booth_authfile_warning(
 
 
 def _get_local_services_status(
-    service_manager: ServiceManagerInterface,
+    service_manager: ServiceManagerInterface, sbd_service_name: str
 ) -> List[_ServiceStatus]:
     service_def = [
         # (service name, display even if not enabled nor running)
@@ -339,22 +397,39 @@ def _get_local_services_status(
         ("pacemaker", True),
         ("pacemaker_remote", False),
         ("pcsd", True),
-        (get_sbd_service_name(service_manager), False),
+        (sbd_service_name, False),
     ]
-    service_status_list = []
-    for service, display_always in service_def:
-        try:
-            service_status_list.append(
-                _ServiceStatus(
-                    service,
-                    display_always,
-                    service_manager.is_enabled(service),
-                    service_manager.is_running(service),
+    try:
+        service_state_dict = service_manager.get_states(
+            service for service, _ in service_def
+        )
+    except LibraryError:
+        # check the services one by one so that a failure of one of them
+        # does not hide the others
+        service_status_list = []
+        for service, display_always in service_def:
+            try:
+                service_status_list.append(
+                    _ServiceStatus(
+                        service,
+                        display_always,
+                        service_manager.is_enabled(service),
+                        service_manager.is_running(service),
+                    )
                 )
-            )
-        except LibraryError:
-            pass
-    return service_status_list
+            except LibraryError:
+                pass
+        return service_status_list
+    return [
+        _ServiceStatus(
+            service,
+            display_always,
+            service_state_dict[service].enabled,
+            service_state_dict[service].running,
+        )
+        for service, display_always in service_def
+        if service in service_state_dict
+    ]
 
 
 def _format_local_services_status(
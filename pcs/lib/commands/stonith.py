@@ -39,6 +39,7 @@ from pcs.lib.env import (
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.pacemaker.capabilities import PcmkCapabilityCache
 from pcs.lib.pacemaker.live import (
     FenceHistoryCommandErrorException,
     fence_history_cleanup,
@@ -145,7 +146,9 @@ def create(
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.resource_agent_metadata_cache
+    )
     stonith_agent = _get_agent_facade(
         env.report_processor,
         agent_factory,
@@ -193,7 +196,9 @@ def history_get_text(env: LibraryEnvironment, node: Optional[str] = None):
     node -- get history for the specified node or all nodes if None
     """
     runner = env.cmd_runner()
-    if not is_fence_history_supported_management(runner):
+    if not is_fence_history_supported_management(
+        runner, env.pcmk_capability_cache
+    ):
         raise LibraryError(
             ReportItem.error(reports.messages.FenceHistoryNotSupported())
         )
@@ -218,7 +223,9 @@ def history_cleanup(env: LibraryEnvironment, node: Optional[str] = None):
     node -- clear history for the specified node or all nodes if None
     """
     runner = env.cmd_runner()
-    if not is_fence_history_supported_management(runner):
+    if not is_fence_history_supported_management(
+        runner, env.pcmk_capability_cache
+    ):
         raise LibraryError(
             ReportItem.error(reports.messages.FenceHistoryNotSupported())
         )
@@ -242,7 +249,9 @@ def history_update(env: LibraryEnvironment):
     env
     """
     runner = env.cmd_runner()
-    if not is_fence_history_supported_management(runner):
+    if not is_fence_history_supported_management(
+        runner, env.pcmk_capability_cache
+    ):
         raise LibraryError(
             ReportItem.error(reports.messages.FenceHistoryNotSupported())
         )
@@ -264,6 +273,7 @@ def _update_scsi_devices_get_element_and_devices(
     report_processor: ReportProcessor,
     cib: _Element,
     stonith_id: str,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
 ) -> Tuple[_Element, List[str]]:
     """
     Do checks and return stonith element and list of current scsi devices.
@@ -273,8 +283,9 @@ def _update_scsi_devices_get_element_and_devices(
     report_processor -- tool for warning/info/error reporting
     cib -- cib element
     stonith_id -- id of stonith resource
+    capability_cache -- cache of pacemaker capabilities
     """
-    if not is_getting_resource_digest_supported(runner):
+    if not is_getting_resource_digest_supported(runner, capability_cache):
         raise LibraryError(
             ReportItem.error(
                 reports.messages.StonithRestartlessUpdateOfScsiDevicesNotSupported()
@@ -387,7 +398,11 @@ def update_scsi_devices(
         stonith_el,
         current_device_list,
     ) = _update_scsi_devices_get_element_and_devices(
-        runner, env.report_processor, env.get_cib(), stonith_id
+        runner,
+        env.report_processor,
+        env.get_cib(),
+        stonith_id,
+        env.pcmk_capability_cache,
     )
     if env.report_processor.has_errors:
         raise LibraryError()
@@ -427,7 +442,11 @@ def update_scsi_devices_add_remove(
         stonith_el,
         current_device_list,
     ) = _update_scsi_devices_get_element_and_devices(
-        runner, env.report_processor, env.get_cib(), stonith_id
+        runner,
+        env.report_processor,
+        env.get_cib(),
+        stonith_id,
+        env.pcmk_capability_cache,
     )
     if env.report_processor.report_list(
         validate_add_remove_items(
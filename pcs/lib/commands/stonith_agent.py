@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -8,6 +9,7 @@ from typing import (
 from pcs.lib.commands.resource_agent import (
     _agent_metadata_to_dict,
     _complete_agent_list,
+    _get_agent_factory,
     _get_agent_names,
 )
 from pcs.lib.env import LibraryEnvironment
@@ -15,7 +17,6 @@ from pcs.lib.errors import LibraryError
 from pcs.lib.resource_agent import (
     InvalidResourceAgentName,
     ResourceAgentError,
-    ResourceAgentFacadeFactory,
     ResourceAgentName,
     StandardProviderTuple,
     resource_agent_error_to_report_item,
@@ -28,16 +29,19 @@ def list_agents(
     lib_env: LibraryEnvironment,
     describe: bool = True,
     search: Optional[str] = None,
+    agent_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """
     List all stonith agents on the local host, optionally filtered and described
 
     describe -- load and return agents' description as well
     search -- return only agents which name contains this string
+    agent_callback -- called with each agent as soon as it is loaded, before
+        the whole list is returned
     """
     runner = lib_env.cmd_runner()
     return _complete_agent_list(
-        runner,
+        _get_agent_factory(lib_env),
         lib_env.report_processor,
         sorted(
             _get_agent_names(runner, StandardProviderTuple("stonith")),
@@ -45,6 +49,7 @@ def list_agents(
         ),
         describe,
         search,
+        agent_callback,
     )
 
 
@@ -58,8 +63,7 @@ def describe_agent(
 
     agent_name -- name of the agent (not containing "stonith:" prefix)
     """
-    runner = lib_env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, lib_env.report_processor)
+    agent_factory = _get_agent_factory(lib_env)
     try:
         if ":" in agent_name:
             raise InvalidResourceAgentName(agent_name)
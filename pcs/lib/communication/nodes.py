@@ -1,7 +1,11 @@
 import json
 
 from pcs.common import reports
-from pcs.common.node_communicator import RequestData
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    Response,
+)
 from pcs.common.reports import ReportItemSeverity
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import ReportItem
@@ -16,6 +20,11 @@ from pcs.lib.communication.tools import (
 )
 from pcs.lib.node_communication import response_to_report_item
 
+# pcsd capability of running several actions in one request
+PCSD_CAPABILITY_NODE_ACTIONS = "pcs.node-actions"
+# pcsd capability of holding a node status request until pacemaker starts
+PCSD_CAPABILITY_NODE_STARTUP_WAIT = "status.pcmk.local-node.wait"
+
 
 class GetOnlineTargets(
     AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
@@ -416,7 +425,21 @@ class CheckPacemakerStarted(
 ):
     _not_yet_started_target_list = None
 
+    def __init__(self, report_processor, wait_timeout=None):
+        """
+        wait_timeout -- ask nodes to respond once pacemaker has started but
+            not later than in the specified number of seconds, nodes must have
+            PCSD_CAPABILITY_NODE_STARTUP_WAIT
+        """
+        super().__init__(report_processor)
+        self._wait_timeout = wait_timeout
+
     def _get_request_data(self):
+        if self._wait_timeout:
+            return RequestData(
+                "remote/pacemaker_node_status",
+                [("wait", str(self._wait_timeout))],
+            )
         return RequestData("remote/pacemaker_node_status")
 
     def _process_response(self, response):
@@ -546,6 +569,113 @@ class SendPcsdSslCertAndKey(
         )
 
 
+class RunNodeActions(RunRemotelyBase):
+    """
+    Run several communication commands using one request per node
+
+    Each node runs requests of the commands in the order of the commands and
+    stops at the first failed one. Responses are processed by the commands
+    themselves, so they report the same as when run one after another. Only
+    commands sending at most one request to each target and no follow-up
+    requests are supported. Targets getting more than one request must have
+    PCSD_CAPABILITY_NODE_ACTIONS, a single request is sent as it is.
+    """
+
+    def __init__(self, report_processor, command_list):
+        super().__init__(report_processor)
+        self._command_list = command_list
+        self._target_requests = {}
+
+    def get_initial_request_list(self):
+        target_dict = {}
+        self._target_requests = {}
+        for command in self._command_list:
+            for request in command.get_initial_request_list():
+                label = request.target.label
+                target_dict.setdefault(label, request.target)
+                self._target_requests.setdefault(label, []).append(
+                    (command, request)
+                )
+        return [
+            (
+                command_requests[0][1]
+                if len(command_requests) == 1
+                else Request(
+                    target_dict[label],
+                    self._get_request_data(
+                        [request for dummy_command, request in command_requests]
+                    ),
+                )
+            )
+            for label, command_requests in self._target_requests.items()
+        ]
+
+    @staticmethod
+    def _get_request_data(request_list):
+        return RequestData(
+            "remote/node_actions",
+            [
+                (
+                    "data_json",
+                    json.dumps(
+                        [
+                            dict(command=request.action, data=request.data)
+                            for request in request_list
+                        ]
+                    ),
+                )
+            ],
+        )
+
+    def _process_response(self, response):
+        command_requests = self._target_requests[response.request.target.label]
+        if len(command_requests) == 1 or (
+            self._get_response_report(response) is not None
+        ):
+            # The request has not been wrapped or nothing has been run on the
+            # node, let the first command process the response.
+            command_requests[0][0].on_response(response)
+            return
+        try:
+            result_list = json.loads(response.data)["results"]
+            response_list = [
+                Response.detached_from_data(
+                    request, int(result["code"]), str(result["data"])
+                )
+                for (dummy_command, request), result in zip(
+                    command_requests, result_list
+                )
+            ]
+        except (ValueError, KeyError, TypeError):
+            self._report(
+                ReportItem.error(
+                    reports.messages.InvalidResponseFormat(
+                        response.request.target.label
+                    )
+                )
+            )
+            return
+        # Requests following a failed one have not been run, the node has not
+        # returned their responses.
+        for (command, dummy_request), command_response in zip(
+            command_requests, response_list
+        ):
+            command.on_response(command_response)
+
+    def before(self):
+        for command in self._command_list:
+            command.before()
+
+    def on_complete(self):
+        return [command.on_complete() for command in self._command_list]
+
+    @property
+    def has_errors(self):
+        return super().has_errors or any(
+            command.has_errors for command in self._command_list
+        )
+
+
 def _force(force_code, is_forced):
     if is_forced:
         return dict(
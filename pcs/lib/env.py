@@ -10,6 +10,7 @@ from typing import (
 
 from lxml.etree import _Element
 
+from pcs import settings
 from pcs.common import (
     file_type_codes,
     reports,
@@ -25,6 +26,12 @@ from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.tools import Version
 from pcs.common.types import StringIterable
 from pcs.lib.booth.env import BoothEnv
+from pcs.lib.cib.snapshot import CibSnapshot
+from pcs.lib.cib.tools import (
+    CibIdIndex,
+    attach_id_index,
+    detach_id_index,
+)
 from pcs.lib.communication import qdevice
 from pcs.lib.communication.corosync import (
     CheckCorosyncOffline,
@@ -50,6 +57,8 @@ from pcs.lib.node_communication import (
     LibCommunicatorLogger,
     NodeTargetLibFactory,
 )
+from pcs.lib.pacemaker import cib_diff
+from pcs.lib.pacemaker.capabilities import PcmkCapabilityCache
 from pcs.lib.pacemaker.live import (
     diff_cibs_xml,
     ensure_cib_version,
@@ -60,7 +69,9 @@ from pcs.lib.pacemaker.live import (
     replace_cib_configuration,
     wait_for_idle,
 )
+from pcs.lib.pacemaker.status_snapshot import ClusterStatusSnapshotService
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
+from pcs.lib.resource_agent import ResourceAgentMetadataCache
 from pcs.lib.services import get_service_manager
 from pcs.lib.tools import create_tmp_cib
 from pcs.lib.xml_tools import etree_to_str
@@ -103,6 +114,12 @@ class LibraryEnvironment:
             Callable[[], Mapping[str, PcsKnownHost]]
         ] = None,
         request_timeout: Optional[int] = None,
+        resource_agent_metadata_cache: Optional[
+            ResourceAgentMetadataCache
+        ] = None,
+        cib_snapshot: Optional[CibSnapshot] = None,
+        pcmk_capability_cache: Optional[PcmkCapabilityCache] = None,
+        cluster_status_snapshot: Optional[ClusterStatusSnapshotService] = None,
     ):
         # pylint: disable=too-many-arguments
         self._logger = logger
@@ -113,6 +130,10 @@ class LibraryEnvironment:
         self._corosync_conf_data = corosync_conf_data
         self._booth_files_data = booth_files_data or {}
         self._request_timeout = request_timeout
+        self._resource_agent_metadata_cache = resource_agent_metadata_cache
+        self._cib_snapshot = cib_snapshot
+        self._pcmk_capability_cache = pcmk_capability_cache
+        self._cluster_status_snapshot = cluster_status_snapshot
         # TODO tokens probably should not be inserted from outside, but we're
         # postponing dealing with them, because it's not that easy to move
         # related code currently - it's in pcsd
@@ -122,6 +143,7 @@ class LibraryEnvironment:
         self._cib_data_tmp_file: Optional[Any] = None  # TODO proper type hint
         self.__loaded_cib_diff_source: Optional[str] = None
         self.__loaded_cib_to_modify: Optional[_Element] = None
+        self._cib_id_index: Optional[CibIdIndex] = None
         self._communicator_factory = NodeCommunicatorFactory(
             LibCommunicatorLogger(self.logger, self.report_processor),
             self.user_login,
@@ -148,6 +170,23 @@ class LibraryEnvironment:
     def user_groups(self) -> Optional[list[str]]:
         return self._user_groups
 
+    @property
+    def resource_agent_metadata_cache(
+        self,
+    ) -> Optional[ResourceAgentMetadataCache]:
+        return self._resource_agent_metadata_cache
+
+    @property
+    def pcmk_capability_cache(self) -> Optional[PcmkCapabilityCache]:
+        return self._pcmk_capability_cache
+
+    @property
+    def cluster_status_snapshot(self) -> Optional[ClusterStatusSnapshotService]:
+        # the snapshot holds the status of the live cluster only
+        if not self.is_cib_live:
+            return None
+        return self._cluster_status_snapshot
+
     @property
     def ghost_file_codes(self) -> list[file_type_codes.FileTypeCode]:
         codes = set()
@@ -165,8 +204,16 @@ class LibraryEnvironment:
         if self.__loaded_cib_diff_source is not None:
             raise AssertionError("CIB has already been loaded")
 
-        self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
-        self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
+        if self._cib_snapshot is not None:
+            self.__loaded_cib_diff_source = self._cib_snapshot.get_cib_xml(
+                self.cmd_runner()
+            )
+            self.__loaded_cib_to_modify = self._cib_snapshot.get_cib(
+                self.cmd_runner()
+            )
+        else:
+            self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
+            self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
 
         if (
             nice_to_have_version is not None
@@ -197,6 +244,9 @@ class LibraryEnvironment:
                         )
                     self._cib_upgrade_reported = True
 
+        # the index is dropped together with the environment, so it does not
+        # outlive the command even if the command fails
+        self._cib_id_index = attach_id_index(self.__loaded_cib_to_modify)
         return self.__loaded_cib_to_modify
 
     @property
@@ -277,18 +327,51 @@ class LibraryEnvironment:
         )
 
     def __main_push_cib_diff(self, cmd_runner):
-        cib_diff_xml = diff_cibs_xml(
+        cib_diff_xml = self.__get_cib_diff_xml(cmd_runner)
+        if cib_diff_xml:
+            push_cib_diff_xml(cmd_runner, cib_diff_xml)
+
+    def __get_cib_diff_xml(self, cmd_runner: CommandRunner) -> str:
+        if settings.cib_diff_mode == cib_diff.DIFF_MODE_CRM_DIFF:
+            return self.__get_cib_diff_xml_crm_diff(cmd_runner)
+        try:
+            native_diff_xml = cib_diff.diff_cibs_xml(
+                str(self.__loaded_cib_diff_source),
+                cast(_Element, self.__loaded_cib_to_modify),
+            )
+        except cib_diff.CibDiffNotSupported as e:
+            self.logger.debug(
+                "Unable to compute CIB diff, running crm_diff: %s", e
+            )
+            return self.__get_cib_diff_xml_crm_diff(cmd_runner)
+        if settings.cib_diff_mode != cib_diff.DIFF_MODE_VERIFY:
+            return native_diff_xml
+        crm_diff_xml = self.__get_cib_diff_xml_crm_diff(cmd_runner)
+        if not cib_diff.are_patchsets_equivalent(native_diff_xml, crm_diff_xml):
+            self.logger.warning(
+                "CIB diff computed by pcs differs from crm_diff result\n"
+                "pcs:\n%s\ncrm_diff:\n%s",
+                native_diff_xml,
+                crm_diff_xml,
+            )
+        return crm_diff_xml
+
+    def __get_cib_diff_xml_crm_diff(self, cmd_runner: CommandRunner) -> str:
+        return diff_cibs_xml(
             cmd_runner,
             self.report_processor,
-            self.__loaded_cib_diff_source,
-            etree_to_str(self.__loaded_cib_to_modify),
+            str(self.__loaded_cib_diff_source),
+            etree_to_str(cast(_Element, self.__loaded_cib_to_modify)),
         )
-        if cib_diff_xml:
-            push_cib_diff_xml(cmd_runner, cib_diff_xml)
 
     def __do_push_cib(self, push_strategy, wait_timeout: int) -> None:
+        if self._cib_snapshot is not None:
+            self._cib_snapshot.invalidate()
         push_strategy()
         self._cib_upgrade_reported = False
+        if self.__loaded_cib_to_modify is not None:
+            detach_id_index(self.__loaded_cib_to_modify)
+        self._cib_id_index = None
         self.__loaded_cib_diff_source = None
         self.__loaded_cib_to_modify = None
         if self.is_cib_live:
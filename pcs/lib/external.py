@@ -1,22 +1,37 @@
-import signal
 import subprocess
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from logging import Logger
 from shlex import quote as shell_quote
 from typing import (
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
     Optional,
     Tuple,
+    TypeVar,
+    cast,
 )
 
 from pcs import settings
 from pcs.common import reports
 from pcs.common.reports import ReportProcessor
-from pcs.common.reports.item import ReportItem
+from pcs.common.reports.item import (
+    ReportItem,
+    ReportItemList,
+)
 from pcs.common.str_tools import join_multilines
 from pcs.common.types import StringSequence
 from pcs.lib.errors import LibraryError
 
+T = TypeVar("T")
+U = TypeVar("U")
+
 
 class KillServicesError(Exception):
     def __init__(self, service, message=None, instance=None):
@@ -96,8 +111,10 @@ class CommandRunner:
         )
 
         try:
-            # pylint: disable=subprocess-popen-preexec-fn, consider-using-with
-            # this is OK as pcs is only single-threaded application
+            # pylint: disable=consider-using-with
+            # SIGPIPE is reset to its default action in the process by
+            # restore_signals, preexec_fn is not used as it is not safe when
+            # processes are run from several threads
             process = subprocess.Popen(
                 args,
                 # Some commands react differently if they get anything via stdin
@@ -108,9 +125,7 @@ class CommandRunner:
                 ),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=(
-                    lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-                ),
+                restore_signals=True,
                 close_fds=True,
                 shell=False,
                 env=env_vars,
@@ -150,6 +165,71 @@ class CommandRunner:
         )
         return out_std, out_err, retval
 
+    def map_concurrently(
+        self,
+        func: Callable[["CommandRunner", T], U],
+        items: Iterable[T],
+        max_workers: int,
+    ) -> Iterator[U]:
+        """
+        Call func with a runner and each item in a pool of threads, return an
+        iterator of the results in the order of items
+
+        The calls are started right away, so the caller may do other work
+        before retrieving the results. func should only run external processes
+        by the runner it gets. Each call gets its own runner, reports of the
+        runners are processed by this runner's reporter in the calling thread
+        when the call's result is retrieved.
+
+        func -- function to call, exceptions raised by it are raised when
+            retrieving its result
+        items -- arguments to call func with
+        max_workers -- maximal number of concurrent calls, func is called with
+            this runner in the current thread one item after another when its
+            result is retrieved if lower than 2
+        """
+        if max_workers < 2:
+            return (func(self, item) for item in items)
+
+        def call(
+            item: T,
+        ) -> Tuple[ReportItemList, Optional[U], Optional[Exception]]:
+            collector = _ReportItemCollector()
+            runner = CommandRunner(self._logger, collector, self._env_vars)
+            try:
+                result = func(runner, item)
+            except Exception as e:  # pylint: disable=broad-except
+                return collector.item_list, None, e
+            return collector.item_list, result, None
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        future_list = [executor.submit(call, item) for item in items]
+        # threads of the pool exit once all the calls are done
+        executor.shutdown(wait=False)
+        return self._iter_call_results(future_list)
+
+    def _iter_call_results(
+        self,
+        future_list: List[
+            "Future[Tuple[ReportItemList, Optional[U], Optional[Exception]]]"
+        ],
+    ) -> Iterator[U]:
+        for future in future_list:
+            report_list, result, exception = future.result()
+            self._reporter.report_list(report_list)
+            if exception is not None:
+                raise exception
+            yield cast(U, result)
+
+
+class _ReportItemCollector(ReportProcessor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.item_list: List[ReportItem] = []
+
+    def _do_report(self, report_item: ReportItem) -> None:
+        self.item_list.append(report_item)
+
 
 def kill_services(runner, services):
     """
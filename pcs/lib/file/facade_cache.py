@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from pcs.lib.file.instance import FileInstance
+from pcs.lib.interface.config import FacadeInterface
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    inode: int
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+
+
+@dataclass(frozen=True)
+class FacadeCacheStats:
+    hits: int
+    misses: int
+
+
+def get_file_signature(path: str) -> Optional[FileSignature]:
+    """
+    Return data identifying a version of a file, None if the file is not
+    accessible
+
+    path -- path of the file
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return FileSignature(
+        inode=stat.st_ino,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        ctime_ns=stat.st_ctime_ns,
+    )
+
+
+class FileFacadeCache:
+    """
+    Keeps a facade parsed from a file until the file changes
+
+    Usage: get a signature of the file, ask the cache for a facade with the
+    signature, if there is none, read the file and store its facade with the
+    signature got before reading the file. This way, a change of the file
+    done while it is being read causes the facade to be loaded again next
+    time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signature: Optional[FileSignature] = None
+        self._facade: Optional[FacadeInterface] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> FacadeCacheStats:
+        with self._lock:
+            return FacadeCacheStats(hits=self._hits, misses=self._misses)
+
+    def get(
+        self, signature: Optional[FileSignature]
+    ) -> Optional[FacadeInterface]:
+        """
+        Return a cached facade if it has been loaded from the same version of
+        the file, None otherwise
+
+        signature -- signature of the current version of the file
+        """
+        with self._lock:
+            if signature is not None and signature == self._signature:
+                self._hits += 1
+                return self._facade
+            self._misses += 1
+            return None
+
+    def set(
+        self, signature: Optional[FileSignature], facade: FacadeInterface
+    ) -> None:
+        """
+        Store a facade loaded from the file
+
+        signature -- signature of the file got before the file was read
+        facade -- the loaded facade
+        """
+        if signature is None:
+            return
+        with self._lock:
+            self._signature = signature
+            self._facade = facade
+
+    def read_facade(
+        self, file_instance: FileInstance, logger: logging.Logger
+    ) -> FacadeInterface:
+        """
+        Return a cached facade of the file if the file has not changed, read
+        the file and cache its facade otherwise
+
+        Errors of reading and parsing the file are raised as they are raised by
+        the file instance.
+
+        file_instance -- the file the facade is loaded from
+        logger -- logger to log the cache stats to when the file is read
+        """
+        path = file_instance.raw_file.metadata.path
+        signature = get_file_signature(path)
+        cached_facade = self.get(signature)
+        if cached_facade is not None:
+            return cached_facade
+        facade = file_instance.read_to_facade()
+        if signature is not None:
+            self.set(signature, facade)
+            stats = self.stats
+            logger.debug(
+                "File '%s' loaded, cache hits: %s, misses: %s",
+                path,
+                stats.hits,
+                stats.misses,
+            )
+        return facade
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signature = None
+            self._facade = None
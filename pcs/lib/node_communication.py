@@ -25,6 +25,12 @@ class LibCommunicatorLogger(CommunicatorLoggerInterface):
         self._logger = logger
         self._reporter = reporter
 
+    @property
+    def is_debug_enabled(self):
+        # Python logger's level is not checked: pcsd workers always log debug
+        # messages and the daemon filters them.
+        return self._reporter.is_debug_enabled
+
     def log_request_start(self, request):
         msg = "Sending HTTP Request to: {url}"
         if request.data:
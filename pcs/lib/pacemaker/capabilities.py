@@ -0,0 +1,231 @@
+"""
+Cache of features supported by installed pacemaker tools
+
+Pcs detects features of pacemaker tools by looking for options in their help
+texts, which means running a process for each check. The cache keeps detected
+features until a tool's executable changes, e.g. on a pacemaker upgrade. When
+a feature is not cached, all tools with outdated entries are probed at once.
+"""
+
+import json
+import os
+import threading
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from typing import (
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from pcs import settings
+from pcs.common.types import StringCollection
+from pcs.lib.external import CommandRunner
+from pcs.lib.file.facade_cache import (
+    FileSignature,
+    get_file_signature,
+)
+from pcs.lib.tools import write_json_file_atomically
+
+CAPABILITY_CRM_MON_FENCE_HISTORY = "crm_mon.fence-history"
+CAPABILITY_CRM_RESOURCE_DIGESTS = "crm_resource.digests"
+CAPABILITY_CRM_RESOURCE_EXPIRED = "crm_resource.expired"
+CAPABILITY_STONITH_ADMIN_FENCE_HISTORY = "stonith_admin.fence-history"
+
+# bump when the structure of the stored data changes
+_CACHE_FORMAT_VERSION = 1
+
+
+def get_capability_definitions() -> Dict[str, Tuple[str, Tuple[str, ...]]]:
+    """
+    Return a tool and texts its help must contain for each known capability
+    """
+    return {
+        CAPABILITY_CRM_MON_FENCE_HISTORY: (
+            settings.crm_mon_exec,
+            ("--fence-history",),
+        ),
+        CAPABILITY_CRM_RESOURCE_DIGESTS: (
+            settings.crm_resource_exec,
+            ("--digests",),
+        ),
+        CAPABILITY_CRM_RESOURCE_EXPIRED: (
+            settings.crm_resource_exec,
+            ("--expired",),
+        ),
+        CAPABILITY_STONITH_ADMIN_FENCE_HISTORY: (
+            settings.stonith_admin_exec,
+            ("--history", "--broadcast", "--cleanup"),
+        ),
+    }
+
+
+def get_tool_help(runner: CommandRunner, tool: str) -> Tuple[str, str]:
+    """
+    Run a pacemaker tool to get its full help, return its stdout and stderr
+    """
+    stdout, stderr, dummy_retval = runner.run([tool, "--help-all"])
+    return stdout, stderr
+
+
+def is_in_tool_help(
+    stdout: str, stderr: str, text_list: StringCollection
+) -> bool:
+    """
+    Check that all texts are present in a help of a pacemaker tool
+    """
+    # Help goes to stderr but we check stdout as well if that gets changed. Use
+    # generators in all to return early.
+    return all(text in stderr for text in text_list) or all(
+        text in stdout for text in text_list
+    )
+
+
+@dataclass
+class _ToolEntry:
+    signature: FileSignature
+    capabilities: Dict[str, bool]
+
+
+class PcmkCapabilityCache:
+    """
+    Keeps capabilities of pacemaker tools until the tools' executables change
+
+    The cache lives in memory and optionally in a file shared by all pcs
+    processes. All errors of the file are silently ignored, capabilities are
+    probed again if the file cannot be read.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None) -> None:
+        """
+        cache_file -- file to persist the cache in, None for memory only
+        """
+        self._cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ToolEntry] = {}
+        self._is_file_loaded = False
+
+    def is_supported(self, runner: CommandRunner, capability: str) -> bool:
+        """
+        Check whether a capability is supported by installed pacemaker
+
+        runner -- runner used to probe the tools
+        capability -- one of CAPABILITY_* constants
+        """
+        with self._lock:
+            if not self._is_file_loaded:
+                self._is_file_loaded = True
+                self._load_file()
+            definitions = get_capability_definitions()
+            tool = definitions[capability][0]
+            entry = self._get_valid_entry(tool, definitions)
+            if entry is not None:
+                return entry.capabilities[capability]
+            return self._probe(runner, definitions)[capability]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def _get_valid_entry(
+        self,
+        tool: str,
+        definitions: Mapping[str, Tuple[str, Tuple[str, ...]]],
+    ) -> Optional[_ToolEntry]:
+        entry = self._entries.get(tool)
+        if entry is None or entry.signature != get_file_signature(tool):
+            return None
+        if any(
+            capability not in entry.capabilities
+            for capability, (capability_tool, _) in definitions.items()
+            if capability_tool == tool
+        ):
+            return None
+        return entry
+
+    def _probe(
+        self,
+        runner: CommandRunner,
+        definitions: Mapping[str, Tuple[str, Tuple[str, ...]]],
+    ) -> Dict[str, bool]:
+        """
+        Detect capabilities of all tools without a valid cache entry, return
+        all known capabilities
+        """
+        result: Dict[str, bool] = {}
+        tool_capabilities: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for capability, (tool, text_list) in definitions.items():
+            tool_capabilities.setdefault(tool, {})[capability] = text_list
+        is_changed = False
+        for tool, capability_texts in tool_capabilities.items():
+            entry = self._get_valid_entry(tool, definitions)
+            if entry is not None:
+                result.update(entry.capabilities)
+                continue
+            # Get the signature before running the tool, so that a change of
+            # the tool done in the meantime causes probing it again.
+            signature = get_file_signature(tool)
+            stdout, stderr = get_tool_help(runner, tool)
+            capabilities = {
+                capability: is_in_tool_help(stdout, stderr, text_list)
+                for capability, text_list in capability_texts.items()
+            }
+            result.update(capabilities)
+            if signature is not None:
+                self._entries[tool] = _ToolEntry(signature, capabilities)
+                is_changed = True
+        if is_changed:
+            self._save_file()
+        return result
+
+    def _load_file(self) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            with open(self._cache_file, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if (
+                data.get("format") != _CACHE_FORMAT_VERSION
+                or data.get("pcs_version") != settings.pcs_version
+            ):
+                return
+            entries = {
+                str(tool): _ToolEntry(
+                    FileSignature(**tool_data["signature"]),
+                    {
+                        str(capability): bool(value)
+                        for capability, value in tool_data[
+                            "capabilities"
+                        ].items()
+                    },
+                )
+                for tool, tool_data in data["tools"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return
+        self._entries = entries
+
+    def _save_file(self) -> None:
+        if self._cache_file is None:
+            return
+        data = {
+            "format": _CACHE_FORMAT_VERSION,
+            "pcs_version": settings.pcs_version,
+            "tools": {
+                tool: {
+                    "signature": asdict(entry.signature),
+                    "capabilities": entry.capabilities,
+                }
+                for tool, entry in self._entries.items()
+            },
+        }
+        try:
+            os.makedirs(
+                os.path.dirname(self._cache_file), mode=0o755, exist_ok=True
+            )
+            write_json_file_atomically(self._cache_file, data, file_mode=0o644)
+        except OSError:
+            pass
@@ -0,0 +1,415 @@
+"""
+Compute CIB diffs in the patchset format produced by 'crm_diff --no-version'
+and accepted by 'cibadmin --patch'.
+
+The algorithm follows the change tracking done by pacemaker, so that the same
+changes are produced as if crm_diff was run. Trees containing constructs which
+pacemaker matches in an ambiguous way (comments, elements without an id
+sharing a name with their siblings, ...) are not supported, crm_diff should be
+used to diff them instead.
+"""
+
+from bisect import (
+    bisect_left,
+    insort,
+)
+from copy import deepcopy
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.common.tools import xml_fromstring
+from pcs.lib.xml_tools import etree_to_str
+
+DIFF_MODE_NATIVE = "native"
+DIFF_MODE_CRM_DIFF = "crm_diff"
+DIFF_MODE_VERIFY = "verify"
+
+# crm_diff --no-version ignores changes of these attributes of the root element
+_VERSION_ATTRIBUTES = ("admin_epoch", "epoch", "num_updates")
+
+_AttrChangeList = List[Tuple[str, Optional[str]]]
+
+
+class CibDiffNotSupported(Exception):
+    """
+    The CIBs cannot be diffed natively, crm_diff should be used instead
+    """
+
+
+def diff_cibs(cib_old: _Element, cib_new: _Element) -> Optional[_Element]:
+    """
+    Return a patchset transforming cib_old to cib_new, None if there are no
+    differences
+
+    cib_old -- original CIB
+    cib_new -- modified CIB
+    """
+    if cib_old.tag != cib_new.tag:
+        raise CibDiffNotSupported(
+            f"Root elements differ: '{cib_old.tag}', '{cib_new.tag}'"
+        )
+    builder = _PatchsetBuilder()
+    return builder.build(cib_old, cib_new)
+
+
+def diff_cibs_xml(cib_old_xml: str, cib_new: _Element) -> str:
+    """
+    Return a patchset transforming cib_old_xml to cib_new as a string, an empty
+    string if there are no differences
+
+    cib_old_xml -- original CIB
+    cib_new -- modified CIB
+    """
+    try:
+        cib_old = xml_fromstring(cib_old_xml)
+    except etree.XMLSyntaxError as e:
+        raise CibDiffNotSupported(str(e)) from e
+    patchset = diff_cibs(cib_old, cib_new)
+    if patchset is None:
+        return ""
+    return etree_to_str(patchset)
+
+
+def are_patchsets_equivalent(patchset_a: str, patchset_b: str) -> bool:
+    """
+    Check whether two patchsets describe the same changes
+
+    Patchsets are compared regardless of formatting and order of attribute
+    changes.
+
+    patchset_a -- a patchset as a string
+    patchset_b -- a patchset as a string
+    """
+    if not patchset_a.strip() or not patchset_b.strip():
+        return patchset_a.strip() == patchset_b.strip()
+    return _normalize_patchset(patchset_a) == _normalize_patchset(patchset_b)
+
+
+def _normalize_patchset(patchset: str) -> List[Tuple[str, str, str, str, str]]:
+    normalized = []
+    for change in cast(
+        List[_Element], xml_fromstring(patchset).xpath("./change")
+    ):
+        attr_changes = sorted(
+            "{0}:{1}:{2}".format(
+                attr.get("name"), attr.get("operation"), attr.get("value")
+            )
+            for attr in cast(
+                List[_Element], change.xpath("./change-list/change-attr")
+            )
+        )
+        content = [
+            etree.tostring(element, method="c14n")
+            for element in cast(
+                List[_Element], change.xpath("./*[not(self::change-list)]")
+            )
+        ]
+        normalized.append(
+            (
+                str(change.get("operation")),
+                str(change.get("path")),
+                str(change.get("position", "")),
+                ",".join(attr_changes),
+                b"".join(content).decode(),
+            )
+        )
+    return normalized
+
+
+def _element_children(element: _Element) -> List[_Element]:
+    if element.text and element.text.strip():
+        raise CibDiffNotSupported(f"Element '{element.tag}' contains text")
+    children = []
+    for child in element:
+        if not isinstance(child.tag, str):
+            raise CibDiffNotSupported(
+                f"Element '{element.tag}' contains a comment or a processing "
+                "instruction"
+            )
+        if child.tail and child.tail.strip():
+            raise CibDiffNotSupported(f"Element '{element.tag}' contains text")
+        children.append(child)
+    return children
+
+
+def _element_path(parent_path: str, element: _Element) -> str:
+    element_id = element.get("id")
+    if element_id is None:
+        return f"{parent_path}/{element.tag}"
+    if "'" in element_id:
+        raise CibDiffNotSupported(
+            f"Id '{element_id}' cannot be used in a patchset path"
+        )
+    return f"{parent_path}/{element.tag}[@id='{element_id}']"
+
+
+class _ChildLookup:
+    """
+    Find a sibling matching an element the same way pacemaker does: by its
+    name and id, or by its name only if the element has no id
+    """
+
+    def __init__(self, children: List[_Element]):
+        self._by_name: Dict[str, _Element] = {}
+        self._by_name_id: Dict[Tuple[str, str], _Element] = {}
+        for child in children:
+            self._by_name.setdefault(str(child.tag), child)
+            child_id = child.get("id")
+            if child_id is not None:
+                self._by_name_id.setdefault((str(child.tag), child_id), child)
+
+    def match(self, element: _Element) -> Optional[_Element]:
+        element_id = element.get("id")
+        if element_id is None:
+            return self._by_name.get(str(element.tag))
+        return self._by_name_id.get((str(element.tag), element_id))
+
+
+def _check_children_unambiguous(
+    old_children: List[_Element], new_children: List[_Element]
+) -> None:
+    names_without_id = set()
+    names_with_id = set()
+    for children in (old_children, new_children):
+        seen_keys = set()
+        seen_names_without_id = set()
+        for child in children:
+            child_id = child.get("id")
+            if child_id is None:
+                if child.tag in seen_names_without_id:
+                    raise CibDiffNotSupported(
+                        f"Multiple elements '{child.tag}' without an id"
+                    )
+                seen_names_without_id.add(child.tag)
+                names_without_id.add(child.tag)
+            else:
+                key = (child.tag, child_id)
+                if key in seen_keys:
+                    raise CibDiffNotSupported(
+                        f"Multiple elements '{child.tag}' with id '{child_id}'"
+                    )
+                seen_keys.add(key)
+                names_with_id.add(child.tag)
+    ambiguous = names_without_id & names_with_id
+    if ambiguous:
+        raise CibDiffNotSupported(
+            "Elements '{0}' both with and without an id".format(
+                "', '".join(sorted(str(name) for name in ambiguous))
+            )
+        )
+
+
+def _copy_without_blanks(element: _Element) -> _Element:
+    element_copy = deepcopy(element)
+    element_copy.tail = None
+    for descendant in element_copy.iter():
+        if descendant.text is not None and not descendant.text.strip():
+            descendant.text = None
+        if descendant is not element_copy and (
+            descendant.tail is not None and not descendant.tail.strip()
+        ):
+            descendant.tail = None
+    return element_copy
+
+
+class _PatchsetBuilder:
+    def __init__(self) -> None:
+        self._deleted_paths: List[str] = []
+        # elements of the new tree, lxml proxies are kept alive by the keys
+        self._created: set[_Element] = set()
+        self._moved: set[_Element] = set()
+        self._attr_changes: Dict[
+            _Element, Tuple[_AttrChangeList, Dict[str, str]]
+        ] = {}
+
+    def build(self, cib_old: _Element, cib_new: _Element) -> Optional[_Element]:
+        root_path = f"/{cib_new.tag}"
+        self._mark_changes(cib_old, cib_new, root_path, is_root=True)
+
+        patchset = etree.Element("diff", format="2")
+        for path in self._deleted_paths:
+            etree.SubElement(patchset, "change", operation="delete", path=path)
+        self._add_changes(patchset, cib_new, "", root_path)
+        if len(patchset) == 0:
+            return None
+        return patchset
+
+    def _mark_changes(
+        self,
+        old_element: _Element,
+        new_element: _Element,
+        path: str,
+        is_root: bool = False,
+    ) -> None:
+        self._mark_attr_changes(old_element, new_element, is_root)
+
+        old_children = _element_children(old_element)
+        new_children = _element_children(new_element)
+        _check_children_unambiguous(old_children, new_children)
+        deleted_before = self._mark_original_children(
+            old_children, _ChildLookup(new_children), path
+        )
+        self._mark_new_children(
+            old_children,
+            new_children,
+            _ChildLookup(old_children),
+            deleted_before,
+        )
+
+    def _mark_original_children(
+        self,
+        old_children: List[_Element],
+        new_lookup: _ChildLookup,
+        path: str,
+    ) -> List[int]:
+        """
+        Look for changes and deleted children, return a list of numbers of
+        deleted children preceding each child
+        """
+        deleted_before: List[int] = []
+        deleted_count = 0
+        for old_child in old_children:
+            deleted_before.append(deleted_count)
+            new_child = new_lookup.match(old_child)
+            if new_child is None:
+                self._deleted_paths.append(_element_path(path, old_child))
+                deleted_count += 1
+            else:
+                self._mark_changes(
+                    old_child, new_child, _element_path(path, new_child)
+                )
+        return deleted_before
+
+    def _mark_new_children(
+        self,
+        old_children: List[_Element],
+        new_children: List[_Element],
+        old_lookup: _ChildLookup,
+        deleted_before: List[int],
+    ) -> None:
+        """
+        Look for created and moved children
+
+        Children which pacemaker skips when computing positions of the
+        following siblings are tracked the same way pacemaker does it.
+        """
+        old_index = {child: index for index, child in enumerate(old_children)}
+        old_skipped: List[int] = []
+        new_skipped_count = 0
+        for new_index, new_child in enumerate(new_children):
+            matched_old_child = old_lookup.match(new_child)
+            if matched_old_child is None:
+                self._created.add(new_child)
+                new_skipped_count += 1
+                continue
+            old_child_index = old_index[matched_old_child]
+            position_old = (
+                old_child_index
+                - deleted_before[old_child_index]
+                - bisect_left(old_skipped, old_child_index)
+            )
+            position_new = new_index - new_skipped_count
+            if position_old != position_new:
+                self._moved.add(new_child)
+                if position_old > position_new:
+                    insort(old_skipped, old_child_index)
+                else:
+                    new_skipped_count += 1
+
+    def _mark_attr_changes(
+        self, old_element: _Element, new_element: _Element, is_root: bool
+    ) -> None:
+        old_attrs = {
+            str(name): str(value) for name, value in old_element.attrib.items()
+        }
+        new_attrs = {
+            str(name): str(value) for name, value in new_element.attrib.items()
+        }
+        if any(
+            name.startswith("{") for name in list(old_attrs) + list(new_attrs)
+        ):
+            raise CibDiffNotSupported(
+                f"Element '{new_element.tag}' has a namespaced attribute"
+            )
+        if is_root:
+            for name in _VERSION_ATTRIBUTES:
+                if name in old_attrs:
+                    new_attrs[name] = old_attrs[name]
+        change_list: _AttrChangeList = [
+            (name, value)
+            for name, value in new_attrs.items()
+            if old_attrs.get(name) != value
+        ]
+        change_list.extend(
+            (name, None) for name in old_attrs if name not in new_attrs
+        )
+        if change_list:
+            self._attr_changes[new_element] = (change_list, new_attrs)
+
+    def _add_changes(
+        self,
+        patchset: _Element,
+        element: _Element,
+        parent_path: str,
+        path: str,
+    ) -> None:
+        if element in self._created:
+            change = etree.SubElement(
+                patchset,
+                "change",
+                operation="create",
+                path=parent_path,
+                position=str(self._position(element)),
+            )
+            change.append(_copy_without_blanks(element))
+            return
+
+        if element in self._attr_changes:
+            change_list, result_attrs = self._attr_changes[element]
+            change = etree.SubElement(
+                patchset, "change", operation="modify", path=path
+            )
+            change_list_el = etree.SubElement(change, "change-list")
+            for name, value in change_list:
+                if value is None:
+                    etree.SubElement(
+                        change_list_el,
+                        "change-attr",
+                        name=name,
+                        operation="unset",
+                    )
+                else:
+                    etree.SubElement(
+                        change_list_el,
+                        "change-attr",
+                        name=name,
+                        operation="set",
+                        value=value,
+                    )
+            change_result = etree.SubElement(change, "change-result")
+            etree.SubElement(change_result, str(element.tag), result_attrs)
+
+        for child in element:
+            self._add_changes(patchset, child, path, _element_path(path, child))
+
+        if element in self._moved:
+            etree.SubElement(
+                patchset,
+                "change",
+                operation="move",
+                path=path,
+                position=str(self._position(element)),
+            )
+
+    @staticmethod
+    def _position(element: _Element) -> int:
+        parent = element.getparent()
+        return 0 if parent is None else parent.index(element)
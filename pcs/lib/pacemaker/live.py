@@ -1,5 +1,7 @@
 import os.path
 import re
+import time
+from contextlib import ExitStack
 from typing import (
     Dict,
     List,
@@ -32,8 +34,20 @@ from pcs.lib.cib.tools import get_pacemaker_version_by_which_cib_was_validated
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 from pcs.lib.pacemaker import api_result
+from pcs.lib.pacemaker.capabilities import (
+    CAPABILITY_CRM_MON_FENCE_HISTORY,
+    CAPABILITY_CRM_RESOURCE_DIGESTS,
+    CAPABILITY_CRM_RESOURCE_EXPIRED,
+    CAPABILITY_STONITH_ADMIN_FENCE_HISTORY,
+    PcmkCapabilityCache,
+    get_capability_definitions,
+    get_tool_help,
+    is_in_tool_help,
+)
 from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.resource_agent import ResourceAgentName
+from pcs.lib.waiter import Backoff
+from pcs.lib.xml_schema import get_relaxng_registry
 from pcs.lib.xml_tools import etree_to_str
 
 __EXITCODE_NOT_CONNECTED = 102
@@ -71,9 +85,10 @@ def get_cluster_status_xml_raw(runner: CommandRunner) -> Tuple[str, str, int]:
     )
 
 
-def _get_cluster_status_xml(runner: CommandRunner) -> str:
+def get_cluster_status_xml(runner: CommandRunner) -> str:
     """
     Get pacemaker XML status. Using get_cluster_status_dom is preferred instead.
+    The status is not validated, use parse_cluster_status_xml to validate it.
 
     runner -- a class for running external processes
     """
@@ -102,8 +117,17 @@ def _get_cluster_status_xml(runner: CommandRunner) -> str:
 
 
 def get_cluster_status_dom(runner: CommandRunner) -> _Element:
+    return parse_cluster_status_xml(get_cluster_status_xml(runner))
+
+
+def parse_cluster_status_xml(status_xml: str) -> _Element:
+    """
+    Parse and validate pacemaker XML status
+
+    status_xml -- status as returned by get_cluster_status_xml
+    """
     try:
-        return _get_api_result_dom(_get_cluster_status_xml(runner))
+        return _get_api_result_dom(status_xml)
     except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
         raise LibraryError(
             ReportItem.error(reports.messages.BadClusterStateFormat())
@@ -114,6 +138,7 @@ def get_cluster_status_text(
     runner: CommandRunner,
     hide_inactive_resources: bool,
     verbose: bool,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
 ) -> Tuple[str, List[str]]:
     cmd = [settings.crm_mon_exec, "--one-shot"]
     if not hide_inactive_resources:
@@ -122,7 +147,7 @@ def get_cluster_status_text(
         cmd.extend(["--show-detail", "--show-node-attributes", "--failcounts"])
         # by default, pending and failed actions are displayed
         # with verbose==True, we display the whole history
-        if is_fence_history_supported_status(runner):
+        if is_fence_history_supported_status(runner, capability_cache):
             cmd.append("--fence-history=3")
     stdout, stderr, retval = runner.run(cmd)
 
@@ -272,6 +297,7 @@ def diff_cibs_xml(
     reporter: ReportProcessor,
     cib_old_xml: str,
     cib_new_xml: str,
+    tmp_cib_files: Optional[tools.TmpCibFiles] = None,
 ) -> str:
     """
     Return xml diff of two CIBs
@@ -280,11 +306,13 @@ def diff_cibs_xml(
     reporter
     cib_old_xml -- original CIB
     cib_new_xml -- modified CIB
+    tmp_cib_files -- temporary CIB files of the running command to be reused
     """
-    with (
-        tools.get_tmp_cib(reporter, cib_old_xml) as cib_old_tmp_file,
-        tools.get_tmp_cib(reporter, cib_new_xml) as cib_new_tmp_file,
-    ):
+    with ExitStack() as stack:
+        if tmp_cib_files is None:
+            tmp_cib_files = stack.enter_context(tools.TmpCibFiles(reporter))
+        cib_old_tmp_file = tmp_cib_files.get_for_reading(cib_old_xml)
+        cib_new_tmp_file = tmp_cib_files.get_for_reading(cib_new_xml)
         stdout, stderr, retval = runner.run(
             [
                 settings.crm_diff_exec,
@@ -539,6 +567,39 @@ def get_local_node_status(runner):
     )
 
 
+def is_node_status_started(node_status: Mapping[str, object]) -> bool:
+    """
+    Check that a node is fully started according to get_local_node_status
+
+    node_status -- status of a node as returned by get_local_node_status
+    """
+    # If the node is offline, its status only contains the "offline" key.
+    return bool(node_status.get("online", False)) and not node_status.get(
+        "pending", True
+    )
+
+
+def wait_for_local_node_started(
+    runner: CommandRunner, timeout: int
+) -> Dict[str, object]:
+    """
+    Wait for pacemaker on the local node to start, return the node's status
+
+    The status is returned once the node has started or the timeout elapsed,
+    whichever comes first.
+
+    timeout -- maximal time to wait in seconds
+    """
+    stop_at = time.time() + timeout
+    backoff = Backoff()
+    while True:
+        node_status = get_local_node_status(runner)
+        remaining = stop_at - time.time()
+        if is_node_status_started(node_status) or remaining <= 0:
+            return node_status
+        backoff.sleep(remaining)
+
+
 def remove_node(runner, node_name):
     stdout, stderr, retval = runner.run(
         [
@@ -689,9 +750,12 @@ def resource_unmove_unban(
     )
 
 
-def has_resource_unmove_unban_expired_support(runner):
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_resource_exec, ["--expired"]
+def has_resource_unmove_unban_expired_support(
+    runner: CommandRunner,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
+) -> bool:
+    return _is_pcmk_capability_supported(
+        runner, CAPABILITY_CRM_RESOURCE_EXPIRED, capability_cache
     )
 
 
@@ -725,17 +789,21 @@ def _resource_move_ban_clear(
 ### fence history
 
 
-def is_fence_history_supported_status(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_mon_exec, ["--fence-history"]
+def is_fence_history_supported_status(
+    runner: CommandRunner,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
+) -> bool:
+    return _is_pcmk_capability_supported(
+        runner, CAPABILITY_CRM_MON_FENCE_HISTORY, capability_cache
     )
 
 
-def is_fence_history_supported_management(runner: CommandRunner) -> bool:
-    return _is_in_pcmk_tool_help(
-        runner,
-        settings.stonith_admin_exec,
-        ["--history", "--broadcast", "--cleanup"],
+def is_fence_history_supported_management(
+    runner: CommandRunner,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
+) -> bool:
+    return _is_pcmk_capability_supported(
+        runner, CAPABILITY_STONITH_ADMIN_FENCE_HISTORY, capability_cache
     )
 
 
@@ -816,7 +884,9 @@ def _get_api_result_dom(xml: str) -> _Element:
     rng = settings.pacemaker_api_result_schema
     dom = xml_fromstring(xml)
     if os.path.isfile(rng):
-        etree.RelaxNG(file=rng).assertValid(dom)
+        get_relaxng_registry().assert_valid(
+            rng, dom, settings.pacemaker_api_result_validation_mode
+        )
     return dom
 
 
@@ -839,17 +909,27 @@ def _get_status_from_api_result(dom: _Element) -> api_result.Status:
 def _is_in_pcmk_tool_help(
     runner: CommandRunner, tool: str, text_list: StringCollection
 ) -> bool:
-    stdout, stderr, dummy_retval = runner.run([tool, "--help-all"])
-    # Help goes to stderr but we check stdout as well if that gets changed. Use
-    # generators in all to return early.
-    return all(text in stderr for text in text_list) or all(
-        text in stdout for text in text_list
-    )
+    stdout, stderr = get_tool_help(runner, tool)
+    return is_in_tool_help(stdout, stderr, text_list)
+
+
+def _is_pcmk_capability_supported(
+    runner: CommandRunner,
+    capability: str,
+    capability_cache: Optional[PcmkCapabilityCache],
+) -> bool:
+    if capability_cache is not None:
+        return capability_cache.is_supported(runner, capability)
+    tool, text_list = get_capability_definitions()[capability]
+    return _is_in_pcmk_tool_help(runner, tool, text_list)
 
 
-def is_getting_resource_digest_supported(runner):
-    return _is_in_pcmk_tool_help(
-        runner, settings.crm_resource_exec, "--digests"
+def is_getting_resource_digest_supported(
+    runner: CommandRunner,
+    capability_cache: Optional[PcmkCapabilityCache] = None,
+) -> bool:
+    return _is_pcmk_capability_supported(
+        runner, CAPABILITY_CRM_RESOURCE_DIGESTS, capability_cache
     )
 
 
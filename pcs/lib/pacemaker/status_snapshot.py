@@ -0,0 +1,198 @@
+"""
+Snapshot of cluster status shared by pcsd workers
+
+Getting cluster status means running crm_mon, validating its output and
+parsing it. The snapshot keeps the parsed status and is refreshed only when it
+gets older than an interval or when a caller asks for a fresher status. When
+backed by a file, the snapshot is shared by all processes using the file.
+Processes needing a refresh at the same time wait for the one refreshing the
+snapshot instead of running crm_mon as well.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from pcs.common import reports
+from pcs.common.status_dto import ResourcesStatusDto
+from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.live import (
+    get_cluster_status_xml,
+    parse_cluster_status_xml,
+)
+from pcs.lib.pacemaker.status import (
+    ClusterStatusParser,
+    ClusterStatusParsingError,
+    cluster_status_parsing_error_to_report,
+)
+from pcs.lib.tools import write_json_file_atomically
+
+# bump when the structure of the stored data changes
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ResourcesStatusSnapshot:
+    # increased on each refresh of the snapshot
+    generation: int
+    # time when getting the status started, as returned by time.time
+    timestamp: float
+    resources_status: ResourcesStatusDto
+    warnings: reports.ReportItemList
+
+    def get_age_ms(self) -> int:
+        return max(0, int((time.time() - self.timestamp) * 1000))
+
+
+def _is_fresh(timestamp: float, min_timestamp: float) -> bool:
+    # a snapshot from the future means the clock has been moved back
+    return min_timestamp <= timestamp <= time.time()
+
+
+class ClusterStatusSnapshotService:
+    """
+    Keeps the latest cluster status and refreshes it once per an interval
+    """
+
+    def __init__(
+        self,
+        snapshot_file: Optional[str] = None,
+        refresh_interval_ms: int = 0,
+    ) -> None:
+        """
+        snapshot_file -- file to share the snapshot in, None for memory only
+        refresh_interval_ms -- the snapshot is refreshed when it is older
+        """
+        self._snapshot_file = snapshot_file
+        self._refresh_interval_ms = refresh_interval_ms
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ResourcesStatusSnapshot] = None
+
+    def get_resources_status(
+        self, runner: CommandRunner, max_age_ms: Optional[int] = None
+    ) -> ResourcesStatusSnapshot:
+        """
+        Return a snapshot of resources status, refresh it if it is too old
+
+        runner -- runner used to get the cluster status
+        max_age_ms -- the snapshot must not be older than this, it is never
+            older than the refresh interval
+        """
+        requested_at = time.time()
+        max_age_ms = (
+            self._refresh_interval_ms
+            if max_age_ms is None
+            else min(max_age_ms, self._refresh_interval_ms)
+        )
+        min_timestamp = requested_at - max_age_ms / 1000
+        with self._lock:
+            if self._snapshot is not None and _is_fresh(
+                self._snapshot.timestamp, min_timestamp
+            ):
+                return self._snapshot
+            if self._snapshot_file is None:
+                return self._refresh(runner, self._get_generation())
+            try:
+                lock_fd = os.open(
+                    f"{self._snapshot_file}.lock", os.O_RDWR | os.O_CREAT, 0o600
+                )
+            except OSError:
+                return self._refresh(runner, self._get_generation())
+            try:
+                # Wait for a refresh running in another process. Its result is
+                # used if it started after the requested time limit.
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                generation = self._get_generation()
+                stored = self._load_file()
+                if stored is not None:
+                    stored_generation, stored_timestamp, status_xml = stored
+                    if _is_fresh(stored_timestamp, min_timestamp):
+                        return self._set_snapshot(
+                            stored_generation, stored_timestamp, status_xml
+                        )
+                    generation = max(generation, stored_generation)
+                return self._refresh(runner, generation, save_file=True)
+            finally:
+                os.close(lock_fd)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def _get_generation(self) -> int:
+        return 0 if self._snapshot is None else self._snapshot.generation
+
+    def _refresh(
+        self, runner: CommandRunner, generation: int, save_file: bool = False
+    ) -> ResourcesStatusSnapshot:
+        """
+        Get cluster status and store it as the next generation of the snapshot
+        """
+        timestamp = time.time()
+        status_xml = get_cluster_status_xml(runner)
+        snapshot = self._set_snapshot(generation + 1, timestamp, status_xml)
+        if save_file:
+            self._save_file(snapshot.generation, timestamp, status_xml)
+        return snapshot
+
+    def _set_snapshot(
+        self, generation: int, timestamp: float, status_xml: str
+    ) -> ResourcesStatusSnapshot:
+        """
+        Parse cluster status and make it the current snapshot
+        """
+        if (
+            self._snapshot is not None
+            and self._snapshot.generation == generation
+            and self._snapshot.timestamp == timestamp
+        ):
+            return self._snapshot
+        parser = ClusterStatusParser(parse_cluster_status_xml(status_xml))
+        try:
+            resources_status = parser.status_xml_to_dto()
+        except ClusterStatusParsingError as e:
+            raise LibraryError(cluster_status_parsing_error_to_report(e)) from e
+        self._snapshot = ResourcesStatusSnapshot(
+            generation, timestamp, resources_status, parser.get_warnings()
+        )
+        return self._snapshot
+
+    def _load_file(self) -> Optional[Tuple[int, float, str]]:
+        if self._snapshot_file is None:
+            return None
+        try:
+            with open(self._snapshot_file, encoding="utf-8") as snapshot_file:
+                data = json.load(snapshot_file)
+            if data.get("format") != _SNAPSHOT_FORMAT_VERSION:
+                return None
+            return (
+                int(data["generation"]),
+                float(data["timestamp"]),
+                str(data["status_xml"]),
+            )
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _save_file(
+        self, generation: int, timestamp: float, status_xml: str
+    ) -> None:
+        if self._snapshot_file is None:
+            return
+        data = {
+            "format": _SNAPSHOT_FORMAT_VERSION,
+            "generation": generation,
+            "timestamp": timestamp,
+            "status_xml": status_xml,
+        }
+        try:
+            write_json_file_atomically(self._snapshot_file, data)
+        except OSError:
+            pass
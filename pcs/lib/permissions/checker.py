@@ -12,6 +12,7 @@ from pcs.lib.auth.const import (
     SUPERUSER,
 )
 from pcs.lib.auth.types import AuthUser
+from pcs.lib.file.facade_cache import FileFacadeCache
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
@@ -26,6 +27,10 @@ from .config.types import (
     PermissionTargetType,
 )
 
+# A new checker is created for each task, so the cache is shared by all the
+# checkers in a process.
+_facade_cache = FileFacadeCache()
+
 
 def _get_empty_facade(permissions: Sequence[PermissionEntry]) -> FacadeV2:
     return FacadeV2(
@@ -82,7 +87,12 @@ class PermissionsChecker:
                 )
             )
         try:
-            return cast(FacadeV2, self._config_file_instance.read_to_facade())
+            return cast(
+                FacadeV2,
+                _facade_cache.read_facade(
+                    self._config_file_instance, self._logger
+                ),
+            )
         except ParserError as e:
             self._logger.error(
                 "Unable to parse file '%s': %s",
@@ -26,6 +26,7 @@ from .list import (
     list_resource_agents_standards,
     list_resource_agents_standards_and_providers,
 )
+from .metadata_cache import ResourceAgentMetadataCache
 from .name import split_resource_agent_name
 from .types import (
     ResourceAgentAction,
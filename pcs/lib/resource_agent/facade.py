@@ -1,13 +1,19 @@
 from collections import defaultdict
 from dataclasses import replace as dc_replace
 from typing import (
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
+    Union,
 )
 
+from lxml.etree import _Element
+
 from pcs.common import reports
 from pcs.common.types import StringIterable
 from pcs.lib import validate
@@ -18,6 +24,7 @@ from .error import (
     ResourceAgentError,
     resource_agent_error_to_report_item,
 )
+from .metadata_cache import ResourceAgentMetadataCache
 from .name import name_to_void_metadata
 from .ocf_transform import ocf_version_to_ocf_unified
 from .pcs_transform import (
@@ -199,10 +206,19 @@ class ResourceAgentFacadeFactory:
     """
 
     def __init__(
-        self, runner: CommandRunner, report_processor: reports.ReportProcessor
+        self,
+        runner: CommandRunner,
+        report_processor: reports.ReportProcessor,
+        metadata_cache: Optional[ResourceAgentMetadataCache] = None,
     ) -> None:
+        """
+        runner -- external processes runner
+        report_processor -- tool for warning reporting
+        metadata_cache -- persistent cache of agents' metadata, not used if None
+        """
         self._runner = runner
         self._report_processor = report_processor
+        self._metadata_cache = metadata_cache
         self._fenced_metadata: Optional[ResourceAgentMetadata] = None
 
     def facade_from_parsed_name(
@@ -214,11 +230,72 @@ class ResourceAgentFacadeFactory:
         name -- agent name to get a facade for
         """
         return self._facade_from_metadata(
-            ocf_version_to_ocf_unified(
-                parse_metadata(name, load_metadata(self._runner, name))
+            self._get_metadata(
+                name,
+                lambda: ocf_version_to_ocf_unified(
+                    parse_metadata(name, load_metadata(self._runner, name))
+                ),
             )
         )
 
+    def iter_facades_from_parsed_names(
+        self, name_list: Sequence[ResourceAgentName], max_workers: int
+    ) -> Iterator[Union[ResourceAgentFacade, ResourceAgentError]]:
+        """
+        Create ResourceAgentFacade for each of the specified agents, yield an
+        error for each agent whose metadata cannot be loaded
+
+        The facades are yielded in the order of name_list as soon as their
+        agents finish.
+
+        Only the agents are run concurrently, the metadata are parsed and
+        cached and the facades are created in the calling thread.
+
+        name_list -- agent names to get facades for
+        max_workers -- maximal number of agents run at the same time
+        """
+        cached_list = [
+            self._metadata_cache.get(name) if self._metadata_cache else None
+            for name in name_list
+        ]
+
+        def run_agent(
+            runner: CommandRunner, name: ResourceAgentName
+        ) -> Union[_Element, ResourceAgentError]:
+            try:
+                return load_metadata(runner, name)
+            except ResourceAgentError as e:
+                return e
+
+        # results are yielded in order, process them as soon as they are ready
+        loaded_iter = self._runner.map_concurrently(
+            run_agent,
+            [
+                name
+                for name, cached in zip(name_list, cached_list)
+                if cached is None
+            ],
+            max_workers,
+        )
+        for name, metadata in zip(name_list, cached_list):
+            if metadata is None:
+                # there is exactly one result for each agent which is not cached
+                # pylint: disable=stop-iteration-return
+                metadata_xml = next(loaded_iter)
+                if isinstance(metadata_xml, ResourceAgentError):
+                    yield metadata_xml
+                    continue
+                try:
+                    metadata = ocf_version_to_ocf_unified(
+                        parse_metadata(name, metadata_xml)
+                    )
+                except ResourceAgentError as e:
+                    yield e
+                    continue
+                if self._metadata_cache is not None:
+                    self._metadata_cache.put(metadata)
+            yield self._facade_from_metadata(metadata)
+
     def void_facade_from_parsed_name(
         self, name: ResourceAgentName
     ) -> ResourceAgentFacade:
@@ -252,13 +329,35 @@ class ResourceAgentFacadeFactory:
     def _get_fake_agent_metadata(
         self, agent_name: FakeAgentName
     ) -> ResourceAgentMetadata:
-        return ocf_version_to_ocf_unified(
-            parse_metadata(
-                ResourceAgentName(const.FAKE_AGENT_STANDARD, None, agent_name),
-                load_fake_agent_metadata(self._runner, agent_name),
-            )
+        name = ResourceAgentName(const.FAKE_AGENT_STANDARD, None, agent_name)
+        return self._get_metadata(
+            name,
+            lambda: ocf_version_to_ocf_unified(
+                parse_metadata(
+                    name, load_fake_agent_metadata(self._runner, agent_name)
+                )
+            ),
         )
 
+    def _get_metadata(
+        self,
+        name: ResourceAgentName,
+        loader: Callable[[], ResourceAgentMetadata],
+    ) -> ResourceAgentMetadata:
+        """
+        Get agent's metadata from the cache, load them if not cached
+
+        name -- name of the agent
+        loader -- function loading metadata from the agent
+        """
+        if self._metadata_cache is None:
+            return loader()
+        metadata = self._metadata_cache.get(name)
+        if metadata is None:
+            metadata = loader()
+            self._metadata_cache.put(metadata)
+        return metadata
+
     def _get_fenced_parameters(self) -> List[ResourceAgentParameter]:
         if self._fenced_metadata is None:
             agent_name = const.PACEMAKER_FENCED
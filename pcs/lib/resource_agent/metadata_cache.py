@@ -0,0 +1,184 @@
+"""
+Persistent cache of parsed resource / stonith agent metadata
+
+Getting metadata of an agent means running the agent, which is slow. The cache
+stores parsed metadata on a disk, so that they are shared by all pcs processes.
+An entry is valid as long as the agent's executable, pacemaker and pcs have not
+changed since the entry was stored. Agents without a well known executable
+(systemd, lsb, service, nagios) are not cached.
+"""
+
+import dataclasses
+import json
+import os
+import os.path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+from urllib.parse import quote
+
+import dacite
+
+from pcs import settings
+from pcs.lib.tools import write_json_file_atomically
+
+from . import const
+from .types import (
+    FakeAgentName,
+    ResourceAgentMetadata,
+    ResourceAgentName,
+)
+
+# bump when the structure of the stored data changes
+_CACHE_FORMAT_VERSION = 1
+_CACHE_FILE_SUFFIX = ".json"
+
+
+def _get_agent_executable(agent_name: ResourceAgentName) -> Optional[str]:
+    """
+    Return a path to an executable providing metadata of an agent
+
+    agent_name -- name of the agent
+    """
+    if agent_name.standard == "ocf" and agent_name.provider:
+        return os.path.join(
+            settings.ocf_root,
+            "resource.d",
+            agent_name.provider,
+            agent_name.type,
+        )
+    if agent_name.is_stonith:
+        return os.path.join(settings.fence_agent_execs, agent_name.type)
+    if agent_name.is_pcmk_fake_agent:
+        return {
+            const.PACEMAKER_BASED: settings.pacemaker_based_exec,
+            const.PACEMAKER_CONTROLD: settings.pacemaker_controld_exec,
+            const.PACEMAKER_FENCED: settings.pacemaker_fenced_exec,
+            const.PACEMAKER_SCHEDULERD: settings.pacemaker_schedulerd_exec,
+        }.get(FakeAgentName(agent_name.type))
+    return None
+
+
+def _get_file_stamp(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Return data identifying a version of a file, None if it does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class ResourceAgentMetadataCache:
+    """
+    Stores parsed agents' metadata in a directory, one file per agent
+
+    All errors are silently ignored, the cache falls back to loading metadata
+    from agents if it cannot be read or written.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """
+        cache_dir -- directory to store cached metadata in
+        """
+        self._cache_dir = cache_dir
+
+    def get(
+        self, agent_name: ResourceAgentName
+    ) -> Optional[ResourceAgentMetadata]:
+        """
+        Return cached metadata of an agent, None if they are not cached or the
+        cached metadata are outdated
+
+        agent_name -- name of the agent
+        """
+        stamp = self._get_stamp(agent_name)
+        if stamp is None:
+            return None
+        try:
+            with open(
+                self._get_entry_path(agent_name), encoding="utf-8"
+            ) as entry_file:
+                entry = json.load(entry_file)
+            if entry.get("stamp") != stamp:
+                return None
+            metadata = dacite.from_dict(
+                ResourceAgentMetadata,
+                entry["metadata"],
+                config=dacite.Config(strict=True),
+            )
+        except (OSError, ValueError, TypeError, KeyError, dacite.DaciteError):
+            return None
+        if metadata.name != agent_name:
+            return None
+        return metadata
+
+    def put(self, metadata: ResourceAgentMetadata) -> None:
+        """
+        Store metadata of an agent
+
+        metadata -- parsed metadata of an existing agent
+        """
+        if not metadata.agent_exists:
+            return
+        stamp = self._get_stamp(metadata.name)
+        if stamp is None:
+            return
+        entry = {"stamp": stamp, "metadata": dataclasses.asdict(metadata)}
+        try:
+            os.makedirs(self._cache_dir, mode=0o755, exist_ok=True)
+            write_json_file_atomically(
+                self._get_entry_path(metadata.name),
+                entry,
+                file_mode=0o644,
+                tmp_suffix=_CACHE_FILE_SUFFIX,
+            )
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove all cached metadata
+        """
+        try:
+            file_names = os.listdir(self._cache_dir)
+        except OSError:
+            return
+        for file_name in file_names:
+            if not file_name.endswith(_CACHE_FILE_SUFFIX):
+                continue
+            try:
+                os.remove(os.path.join(self._cache_dir, file_name))
+            except OSError:
+                pass
+
+    def _get_entry_path(self, agent_name: ResourceAgentName) -> str:
+        return os.path.join(
+            self._cache_dir,
+            quote(agent_name.full_name, safe="") + _CACHE_FILE_SUFFIX,
+        )
+
+    @staticmethod
+    def _get_stamp(agent_name: ResourceAgentName) -> Optional[Dict[str, Any]]:
+        """
+        Return data a cache entry is valid for, None if the agent is not
+        cacheable
+        """
+        agent_executable = _get_agent_executable(agent_name)
+        if agent_executable is None:
+            return None
+        agent_stamp = _get_file_stamp(agent_executable)
+        # crm_resource gets replaced on every pacemaker upgrade, its stamp
+        # identifies pacemaker version without running a process
+        pacemaker_stamp = _get_file_stamp(settings.crm_resource_exec)
+        if agent_stamp is None or pacemaker_stamp is None:
+            return None
+        return {
+            "format": _CACHE_FORMAT_VERSION,
+            "pcs_version": settings.pcs_version,
+            "agent": agent_stamp,
+            "pacemaker": pacemaker_stamp,
+        }
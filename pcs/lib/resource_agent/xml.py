@@ -11,6 +11,7 @@ from lxml.etree import _Element
 from pcs import settings
 from pcs.common.tools import xml_fromstring
 from pcs.lib.external import CommandRunner
+from pcs.lib.xml_schema import get_relaxng_registry
 
 from . import const
 from .error import (
@@ -105,9 +106,9 @@ def _metadata_xml_to_dom(metadata: str) -> _Element:
     dom = xml_fromstring(metadata)
     ocf_version = _get_ocf_version(dom)
     if ocf_version == const.OCF_1_0:
-        etree.RelaxNG(file=settings.path.ocf_1_0_schema).assertValid(dom)
+        get_relaxng_registry().assert_valid(settings.path.ocf_1_0_schema, dom)
     elif ocf_version == const.OCF_1_1:
-        etree.RelaxNG(file=settings.path.ocf_1_1_schema).assertValid(dom)
+        get_relaxng_registry().assert_valid(settings.path.ocf_1_1_schema, dom)
     return dom
 
 
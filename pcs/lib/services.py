@@ -1,4 +1,5 @@
 from typing import (
+    Dict,
     List,
     Optional,
 )
@@ -8,7 +9,11 @@ from pcs.common import (
     reports,
     services,
 )
-from pcs.common.types import StringSequence
+from pcs.common.services.types import ServiceState
+from pcs.common.types import (
+    StringIterable,
+    StringSequence,
+)
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 
@@ -64,6 +69,13 @@ class _NoOpDriver(services.interfaces.ServiceManagerInterface):
     def is_running(self, service: str, instance: Optional[str] = None) -> bool:
         return False
 
+    def get_states(self, services: StringIterable) -> Dict[str, ServiceState]:
+        # pylint: disable=redefined-outer-name
+        return {
+            service: ServiceState(enabled=False, running=False)
+            for service in services
+        }
+
     def is_installed(self, service: str) -> bool:
         return True
 
@@ -1,9 +1,15 @@
+import hashlib
+import json
 import os
 import tempfile
 import uuid
-from contextlib import contextmanager
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
 from typing import (
     IO,
+    Any,
     Callable,
     ContextManager,
     Generator,
@@ -15,6 +21,7 @@ from typing import (
     overload,
 )
 
+from pcs import settings
 from pcs.common import reports
 from pcs.lib.errors import LibraryError
 
@@ -80,6 +87,56 @@ def dict_to_environment_file(config_dict: Mapping[str, str]) -> str:
     return "".join(lines)
 
 
+def write_json_file_atomically(
+    path: str,
+    data: Any,
+    file_mode: Optional[int] = None,
+    tmp_suffix: str = "",
+) -> None:
+    """
+    Write data to a json file so that other processes never read a partially
+    written file, raise OSError on failure
+
+    path -- path of the file, its directory must exist
+    data -- data to store in the file
+    file_mode -- permissions of the file, None for the tempfile default
+    tmp_suffix -- suffix of the temporary file written next to the file
+    """
+    tmp_path = None
+    try:
+        # write to a temporary file and rename it, the rename is atomic
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=os.path.dirname(path),
+            prefix=".",
+            suffix=tmp_suffix,
+            delete=False,
+        ) as tmp_file:
+            tmp_path = tmp_file.name
+            json.dump(data, tmp_file)
+        if file_mode is not None:
+            os.chmod(tmp_path, file_mode)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def get_tmp_dir() -> Optional[str]:
+    """
+    Return a directory for temporary files, None for the system default
+    """
+    for tmp_dir in settings.tmp_file_dir_list:
+        if os.path.isdir(tmp_dir) and os.access(tmp_dir, os.W_OK | os.X_OK):
+            return tmp_dir
+    return None
+
+
 @overload
 def get_tmp_file(
     data: Optional[bytes], binary: Literal[True]
@@ -105,7 +162,9 @@ def get_tmp_file(  # type: ignore
     mode = "w+b" if binary else "w+"
     tmpfile = None
     try:
-        with tempfile.NamedTemporaryFile(mode=mode, suffix=".pcs") as tmpfile:
+        with tempfile.NamedTemporaryFile(
+            mode=mode, suffix=".pcs", dir=get_tmp_dir()
+        ) as tmpfile:
             if data is not None:
                 tmpfile.write(data)
                 tmpfile.flush()
@@ -138,7 +197,9 @@ def create_tmp_cib(
 ) -> IO[str]:
     try:
         # pylint: disable=consider-using-with
-        tmp_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".pcs")
+        tmp_file = tempfile.NamedTemporaryFile(
+            mode="w+", suffix=".pcs", dir=get_tmp_dir()
+        )
         if data is not None:
             tmp_file.write(data)
             tmp_file.flush()
@@ -152,3 +213,69 @@ def create_tmp_cib(
         raise LibraryError(
             reports.ReportItem.error(reports.messages.CibSaveTmpError(str(e)))
         ) from e
+
+
+class TmpCibFiles:
+    """
+    Temporary CIB files of one command
+
+    A file is shared by all pacemaker tools reading the same CIB, so the CIB is
+    written only once. A file modified by a pacemaker tool is shared once its
+    new content has been read back. All files are removed on close.
+    """
+
+    def __init__(self, report_processor: reports.ReportProcessor):
+        self._report_processor = report_processor
+        self._exit_stack = ExitStack()
+        self._shared_files: dict[str, IO[str]] = {}
+
+    def __enter__(self) -> "TmpCibFiles":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._shared_files = {}
+        self._exit_stack.close()
+
+    def get_for_reading(self, data: str) -> IO[str]:
+        """
+        Return a file containing the CIB, the file must not be modified
+
+        data -- CIB to put into the file
+        """
+        digest = _get_digest(data)
+        if digest not in self._shared_files:
+            self._shared_files[digest] = self._exit_stack.enter_context(
+                get_tmp_cib(self._report_processor, data)
+            )
+        return self._shared_files[digest]
+
+    def get_for_writing(self, data: str) -> IO[str]:
+        """
+        Return a new file containing the CIB for a pacemaker tool to modify
+
+        data -- CIB to put into the file
+        """
+        return self._exit_stack.enter_context(
+            get_tmp_cib(self._report_processor, data)
+        )
+
+    def read(self, tmp_file: IO[str]) -> str:
+        """
+        Return the current content of a file and share the file for reading
+
+        tmp_file -- a file returned by get_for_writing
+        """
+        tmp_file.seek(0)
+        data = tmp_file.read()
+        for digest, shared_file in list(self._shared_files.items()):
+            if shared_file is tmp_file:
+                del self._shared_files[digest]
+        self._shared_files.setdefault(_get_digest(data), tmp_file)
+        return data
+
+
+def _get_digest(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -0,0 +1,58 @@
+"""
+Tools for waiting for a cluster to get to a requested state
+"""
+
+import time
+from typing import Optional
+
+
+class Backoff:
+    """
+    Provides growing intervals between checks of a cluster state
+
+    Short intervals at the beginning make waiting finish soon after the state
+    has been reached, longer intervals later on prevent overloading a cluster
+    which takes long to get to the state.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.1,
+        max_interval: float = 2.0,
+        factor: float = 2.0,
+    ) -> None:
+        """
+        initial_interval -- the first interval in seconds
+        max_interval -- intervals never get longer than this, in seconds
+        factor -- each interval is this times longer than the previous one
+        """
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._factor = factor
+        self._interval = initial_interval
+
+    def next_interval(self) -> float:
+        """
+        Return an interval to wait for and make the next one longer
+        """
+        interval = self._interval
+        self._interval = min(self._interval * self._factor, self._max_interval)
+        return interval
+
+    def reset(self) -> None:
+        """
+        Start with the initial interval again
+        """
+        self._interval = self._initial_interval
+
+    def sleep(self, remaining: Optional[float] = None) -> None:
+        """
+        Sleep for the next interval
+
+        remaining -- do not sleep longer than this many seconds
+        """
+        interval = self.next_interval()
+        if remaining is not None:
+            interval = min(interval, remaining)
+        if interval > 0:
+            time.sleep(interval)
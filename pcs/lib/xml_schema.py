@@ -0,0 +1,121 @@
+import threading
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Optional,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.common.types import StringIterable
+from pcs.lib.file.facade_cache import (
+    FileSignature,
+    get_file_signature,
+)
+
+# validate each document
+VALIDATION_MODE_ALWAYS = "always"
+# validate documents until one is valid, then skip validation until the schema
+# file changes, e.g. because pacemaker has been upgraded
+VALIDATION_MODE_ON_SCHEMA_CHANGE = "on-schema-change"
+
+
+@dataclass
+class _SchemaEntry:
+    signature: Optional[FileSignature]
+    schema: etree.RelaxNG
+    # RelaxNG objects keep their error log, so one schema must not validate
+    # documents in several threads at once
+    lock: threading.Lock
+    has_validated_document: bool = False
+
+
+class RelaxNgRegistry:
+    """
+    Keeps compiled RelaxNG schemas until their files change
+
+    Compiling a schema is expensive, especially for schemas including many
+    other schema files.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _SchemaEntry] = {}
+
+    def _get_entry(self, path: str) -> _SchemaEntry:
+        # raises etree.RelaxNGParseError and OSError
+        signature = get_file_signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if (
+                entry is not None
+                and signature is not None
+                and signature == entry.signature
+            ):
+                return entry
+        entry = _SchemaEntry(
+            signature=signature,
+            schema=etree.RelaxNG(file=path),
+            lock=threading.Lock(),
+        )
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def get_schema(self, path: str) -> etree.RelaxNG:
+        """
+        Return a compiled schema, compile it if needed
+
+        path -- path of the schema file
+        """
+        return self._get_entry(path).schema
+
+    def assert_valid(
+        self,
+        path: str,
+        dom: _Element,
+        mode: str = VALIDATION_MODE_ALWAYS,
+    ) -> None:
+        """
+        Validate a document, raise etree.DocumentInvalid if it is not valid
+
+        path -- path of the schema file
+        dom -- document to validate
+        mode -- one of VALIDATION_MODE_* constants
+        """
+        entry = self._get_entry(path)
+        if (
+            mode == VALIDATION_MODE_ON_SCHEMA_CHANGE
+            and entry.has_validated_document
+        ):
+            return
+        with entry.lock:
+            entry.schema.assertValid(dom)
+        entry.has_validated_document = True
+
+    def preload(self, paths: StringIterable) -> None:
+        """
+        Compile schemas in advance, skip schemas which cannot be compiled
+
+        paths -- paths of schema files
+        """
+        for path in paths:
+            try:
+                self._get_entry(path)
+            except (OSError, etree.RelaxNGParseError):
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+
+_registry = RelaxNgRegistry()
+
+
+def get_relaxng_registry() -> RelaxNgRegistry:
+    """
+    Return the registry shared by the whole process
+    """
+    return _registry
@@ -16,6 +16,7 @@ from pcs.cli.common.parse_args import (
     InputModifiers,
     KeyValueParser,
     ModifierValueType,
+    wait_to_timeout,
 )
 
 
@@ -202,11 +203,22 @@ def node_pacemaker_status(
 ) -> None:
     """
     Internal pcs-pcsd command
+
+    Options:
+      * --wait - wait for the local node to start for up to the specified
+        number of seconds
     """
     del lib
     del argv
-    del modifiers
-    print(json.dumps(lib_pacemaker.get_local_node_status(utils.cmd_runner())))
+    modifiers.ensure_only_supported("--wait")
+    wait_timeout = wait_to_timeout(modifiers.get("--wait"))
+    if wait_timeout > 0:
+        node_status = lib_pacemaker.wait_for_local_node_started(
+            utils.cmd_runner(), wait_timeout
+        )
+    else:
+        node_status = lib_pacemaker.get_local_node_status(utils.cmd_runner())
+    print(json.dumps(node_status))
 
 
 def attribute_show_cmd(
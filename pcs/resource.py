@@ -13,6 +13,8 @@ from typing import (
 )
 from xml.dom.minidom import parseString
 
+from dacite import DaciteError
+
 import pcs.lib.cib.acl as lib_acl
 import pcs.lib.pacemaker.live as lib_pacemaker
 import pcs.lib.resource_agent as lib_ra
@@ -76,6 +78,7 @@ from pcs.common import (
 )
 from pcs.common.interface import dto
 from pcs.common.pacemaker.defaults import CibDefaultsDto
+from pcs.common.pacemaker.resource.create import ResourceCreateDto
 from pcs.common.pacemaker.resource.list import CibResourcesDto
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
@@ -86,6 +89,7 @@ from pcs.common.str_tools import (
     format_list_custom_last_separator,
     format_optional,
 )
+from pcs.common.tools import format_os_error
 from pcs.lib.cib.resource import (
     guest_node,
     primitive,
@@ -538,6 +542,28 @@ def parse_resource_options(
     return ra_values, op_values, meta_values
 
 
+def _print_agent(name_key: str, agent_info: Mapping[str, Any]) -> None:
+    """
+    Print an agent with its short description
+
+    name_key -- key of the agent's name to be printed
+    agent_info -- the agent, printed as soon as it is loaded since loading all
+        the agents takes time
+    """
+    name = agent_info[name_key]
+    shortdesc = agent_info["shortdesc"]
+    if shortdesc:
+        print(
+            "{0} - {1}".format(
+                name,
+                _format_desc(len(name + " - "), shortdesc.replace("\n", " ")),
+            ),
+            flush=True,
+        )
+    else:
+        print(name, flush=True)
+
+
 def resource_list_available(
     lib: Any, argv: Argv, modifiers: InputModifiers
 ) -> None:
@@ -551,7 +577,9 @@ def resource_list_available(
 
     search = argv[0] if argv else None
     agent_list = lib.resource_agent.list_agents(
-        not modifiers.get("--nodesc"), search
+        not modifiers.get("--nodesc"),
+        search,
+        agent_callback=partial(_print_agent, "name"),
     )
 
     if not agent_list:
@@ -562,21 +590,6 @@ def resource_list_available(
             "Do you have resource agents installed?"
         )
 
-    for agent_info in agent_list:
-        name = agent_info["name"]
-        shortdesc = agent_info["shortdesc"]
-        if shortdesc:
-            print(
-                "{0} - {1}".format(
-                    name,
-                    _format_desc(
-                        len(name + " - "), shortdesc.replace("\n", " ")
-                    ),
-                )
-            )
-        else:
-            print(name)
-
 
 def resource_list_options(
     lib: Any, argv: Argv, modifiers: InputModifiers
@@ -798,6 +811,66 @@ def resource_create(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         )
 
 
+def resource_create_bulk(
+    lib: Any, argv: Argv, modifiers: InputModifiers
+) -> None:
+    """
+    Options:
+      * --agent-validation - use agent self validation of instance attributes
+      * --force - allow not existing agents, invalid operations or invalid
+        instance attributes, allow not suitable command, allow incompatible
+        clone meta attributes
+      * --disabled - created resources will be disabled
+      * --no-default-ops - do not add default operations
+      * -f - CIB file
+    """
+    modifiers.ensure_only_supported(
+        "--agent-validation", "--force", "--disabled", "--no-default-ops", "-f"
+    )
+    if len(argv) > 1:
+        raise CmdLineInputError()
+
+    try:
+        if not argv or argv[0] == "-":
+            resources_raw = json.load(sys.stdin)
+        else:
+            with open(argv[0], encoding="utf-8") as resources_file:
+                resources_raw = json.load(resources_file)
+    except OSError as e:
+        raise error(
+            f"Unable to read resource definitions: {format_os_error(e)}"
+        ) from e
+    except json.JSONDecodeError as e:
+        raise error(f"Unable to parse resource definitions: {e}") from e
+    if not isinstance(resources_raw, list) or not resources_raw:
+        raise error("Resource definitions must be a non-empty JSON list")
+    try:
+        resource_list = [
+            dto.from_dict(ResourceCreateDto, resource_raw, strict=True)
+            for resource_raw in resources_raw
+        ]
+    except (
+        KeyError,
+        TypeError,
+        ValueError,
+        DaciteError,
+        dto.PayloadConversionError,
+    ) as e:
+        raise error(f"Invalid resource definition: {e}") from e
+
+    lib.resource.create_bulk(
+        resource_list,
+        allow_absent_agent=modifiers.get("--force"),
+        allow_invalid_operation=modifiers.get("--force"),
+        allow_invalid_instance_attributes=modifiers.get("--force"),
+        use_default_operations=not modifiers.get("--no-default-ops"),
+        ensure_disabled=modifiers.get("--disabled"),
+        allow_not_suitable_command=modifiers.get("--force"),
+        allow_incompatible_clone_meta_attributes=modifiers.get("--force"),
+        enable_agent_self_validation=modifiers.get("--agent-validation"),
+    )
+
+
 def _parse_resource_move_ban(
     argv: Argv,
 ) -> tuple[str, Optional[str], Optional[str]]:
@@ -965,12 +1038,16 @@ def resource_providers(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
 
 def resource_agents(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
-    Options: no options
+    Options:
+      * --refresh-cache - drop cached metadata of agents
     """
-    modifiers.ensure_only_supported()
+    modifiers.ensure_only_supported("--refresh-cache")
     if len(argv) > 1:
         raise CmdLineInputError()
 
+    if modifiers.get("--refresh-cache"):
+        lib.resource_agent.clear_metadata_cache()
+
     standard = argv[0] if argv else None
 
     agents = lib.resource_agent.list_agents_for_standard_and_provider(standard)
@@ -1760,7 +1837,9 @@ def _get_resource_agent_facade(
     resource_agent: lib_ra.ResourceAgentName,
 ) -> lib_ra.ResourceAgentFacade:
     return lib_ra.ResourceAgentFacadeFactory(
-        utils.cmd_runner(), utils.get_report_processor()
+        utils.cmd_runner(),
+        utils.get_report_processor(),
+        utils.get_resource_agent_metadata_cache(),
     ).facade_from_parsed_name(resource_agent)
 
 
@@ -0,0 +1,241 @@
+import os.path
+
+# generic system paths
+chkconfig_exec = "/sbin/chkconfig"
+find_exec = "/usr/bin/x"
+killall_exec = "/usr/bin/x"
+rm_exec = "/usr/bin/x"
+ruby_exec = "/usr/bin/x"
+service_exec = "/usr/bin/x"
+systemctl_exec = "/bin/systemctl"
+systemd_unit_path = "/usr/lib/systemd/system".split(":")
+certutil_exec = "/usr/bin/x"
+
+
+# pcs
+pcs_version = "0.12.0"
+pcs_bundled_packages_dir = os.path.join("/usr/bin/x", "packages")
+pcs_data_dir = "/usr/lib/pcs/data/"
+
+
+# pcsd
+pcsd_exec_location = "/usr/lib/pcsd"
+pcsd_public_dir = "/usr/bin/x"
+pcsd_webui_dir = "/usr/bin/x"
+pcs_capabilities = os.path.join(pcsd_exec_location, "capabilities.xml")
+# Set pcsd_gem_path to None if there are no bundled ruby gems and the path does
+# not exists.
+pcsd_gem_path = "/usr/bin/x" or None
+pcsd_unix_socket = "/usr/bin/x"
+pcsd_ruby_socket = "/var/run/pcsd-ruby.socket"
+pcsd_log_location = "/var/log/pcsd/pcsd.log"
+pcsd_default_port = 2224
+pcsd_config = "/etc/sysconfig/pcsd"
+
+pcsd_var_location = "/var/lib/pcsd"
+pcsd_cert_location = os.path.join(pcsd_var_location, "pcsd.crt")
+pcsd_dr_config_location = os.path.join(pcsd_var_location, "disaster-recovery")
+pcsd_key_location = os.path.join(pcsd_var_location, "pcsd.key")
+pcsd_known_hosts_location = os.path.join(pcsd_var_location, "known-hosts")
+pcsd_settings_conf_location = os.path.join(
+    pcsd_var_location, "pcs_settings.conf"
+)
+pcsd_users_conf_location = os.path.join(pcsd_var_location, "pcs_users.conf")
+resource_agent_metadata_cache_dir = os.path.join(
+    pcsd_var_location, "agent-metadata-cache"
+)
+pacemaker_capabilities_cache_file = os.path.join(
+    pcsd_var_location, "pacemaker-capabilities.json"
+)
+
+default_ssl_ciphers = "/usr/bin/x"
+# Ssl options are based on default options in python (maybe with some extra
+# options). Format here is the same as the PCSD_SSL_OPTIONS environment
+# variable format (string with coma as a delimiter).
+default_ssl_options = ",".join(
+    [
+        "OP_NO_COMPRESSION",
+        "OP_CIPHER_SERVER_PREFERENCE",
+        "OP_SINGLE_DH_USE",
+        "OP_SINGLE_ECDH_USE",
+        "OP_NO_SSLv2",
+        "OP_NO_SSLv3",
+        "OP_NO_TLSv1",
+        "OP_NO_TLSv1_1",
+        "OP_NO_RENEGOTIATION",
+    ]
+)
+default_request_timeout = 60
+gui_session_lifetime_seconds = 60 * 60
+# how long pcsd remembers groups of a logged in user, 0 disables the cache
+pcsd_user_groups_cache_ttl_seconds = 30
+pcsd_token_max_bytes = 256
+
+# pcsd task scheduler settings
+async_api_scheduler_interval_ms = 100
+pcsd_worker_count = 10
+# workers dedicated to read-only commands, 0 disables the fast lane
+pcsd_fast_lane_worker_count = 2
+pcsd_temporary_workers = 10
+pcsd_worker_reset_limit = 100
+# max number of long running tasks dispatched at once, 0 means no limit
+pcsd_max_long_running_tasks = 5
+# max number of tasks of one user dispatched at once, 0 means no limit
+pcsd_max_tasks_per_user = 0
+pcsd_deadlock_threshold_timeout = 5
+task_unresponsive_timeout_seconds = 60 * 60
+task_abandoned_timeout_seconds = 1 * 60
+task_deletion_timeout_seconds = 1 * 60
+# interval of heartbeats sent to clients streaming progress of a task
+task_progress_heartbeat_seconds = 15
+
+
+# corosync
+# Used only in settings.py and utils.py. Make it private once utils.py is removed.
+corosync_execs = "/usr/sbin"
+corosync_conf_dir = "/usr/bin/x/corosync"
+corosync_exec = os.path.join(corosync_execs, "corosync")
+corosync_cfgtool_exec = os.path.join(corosync_execs, "corosync-cfgtool")
+corosync_quorumtool_exec = os.path.join(corosync_execs, "corosync-quorumtool")
+corosync_conf_file = os.path.join(corosync_conf_dir, "corosync.conf")
+corosync_uidgid_dir = os.path.join(corosync_conf_dir, "uidgid.d")
+corosync_authkey_file = os.path.join(corosync_conf_dir, "authkey")
+# Must be set to 256 for corosync to work in FIPS environment.
+corosync_authkey_bytes = 256
+corosync_log_file = "/usr/bin/x/corosync.log"
+
+
+# corosync qnetd and qdevice
+corosync_qnet_execs = "/usr/bin"
+corosync_qnetd_certutil_exec = os.path.join(
+    corosync_qnet_execs, "corosync-qnetd-certutil"
+)
+corosync_qnetd_tool_exec = os.path.join(
+    corosync_qnet_execs, "corosync-qnetd-tool"
+)
+corosync_qdevice_execs = "/usr/sbin"
+corosync_qdevice_conf_dir = "/usr/bin/x"
+corosync_qdevice_net_server_certs_dir = os.path.join(
+    corosync_qdevice_conf_dir, "qnetd/nssdb"
+)
+corosync_qdevice_net_server_ca_file_name = "qnetd-cacert.crt"
+corosync_qdevice_net_client_certs_dir = os.path.join(
+    corosync_qdevice_conf_dir, "qdevice/net/nssdb"
+)
+corosync_qdevice_net_client_ca_file_name = "qnetd-cacert.crt"
+corosync_qdevice_tool_exec = os.path.join(
+    corosync_qdevice_execs, "corosync-qdevice-tool"
+)
+corosync_qdevice_net_certutil_exec = os.path.join(
+    corosync_qdevice_execs, "corosync-qdevice-net-certutil"
+)
+
+
+# pacemaker
+# Used only in settings.py and utils.py. Make it private once utils.py is removed.
+pacemaker_execs = "/usr/sbin"
+pacemaker_authkey_file = "/usr/bin/x/pacemaker/authkey"
+# Using the same value as for corosync. Higher values MAY work in FIPS.
+pacemaker_authkey_bytes = 256
+pacemaker_local_state_dir = os.path.join("/", "/usr/bin/x", "lib/pacemaker")
+pacemaker_daemon_dir = "/usr/bin/x"
+pacemaker_schedulerd_exec = os.path.join(
+    pacemaker_daemon_dir, "pacemaker-schedulerd"
+)
+pacemakerd_exec = os.path.join(pacemaker_execs, "pacemakerd")
+iso8601_exec = os.path.join(pacemaker_execs, "iso8601")
+pacemaker_controld_exec = os.path.join(
+    pacemaker_daemon_dir, "pacemaker-controld"
+)
+pacemaker_based_exec = os.path.join(pacemaker_daemon_dir, "pacemaker-based")
+pacemaker_fenced_exec = os.path.join(pacemaker_daemon_dir, "pacemaker-fenced")
+crm_resource_exec = os.path.join(pacemaker_execs, "crm_resource")
+crm_mon_exec = os.path.join(pacemaker_execs, "crm_mon")
+crm_report_exec = os.path.join(pacemaker_execs, "crm_report")
+crm_rule_exec = os.path.join(pacemaker_execs, "crm_rule")
+crm_diff_exec = os.path.join(pacemaker_execs, "crm_diff")
+crm_simulate_exec = os.path.join(pacemaker_execs, "crm_simulate")
+crm_ticket_exec = os.path.join(pacemaker_execs, "crm_ticket")
+crm_verify_exec = os.path.join(pacemaker_execs, "crm_verify")
+crm_node_exec = os.path.join(pacemaker_execs, "crm_node")
+cibadmin_exec = os.path.join(pacemaker_execs, "cibadmin")
+stonith_admin_exec = os.path.join(pacemaker_execs, "stonith_admin")
+pacemaker_api_result_schema = "/usr/share/pacemaker/api/api-result.rng"
+cib_dir = "/usr/bin/x"
+pacemaker_uname = "/usr/bin/x"
+pacemaker_gname = "/usr/bin/x"
+pacemaker_wait_timeout_status = 124
+# How to compute CIB diffs pushed to the cluster:
+# "crm_diff" - always use crm_diff
+# "verify" - compute diffs both ways, log differences, push the crm_diff result
+# "native" - compute diffs in pcs, use crm_diff only for CIBs pcs cannot diff
+cib_diff_mode = "crm_diff"
+# How to validate pacemaker API results against their schema:
+# "always" - validate each result
+# "on-schema-change" - validate until a result is valid, then skip validation
+#   until the schema file changes, e.g. on pacemaker upgrade
+pacemaker_api_result_validation_mode = "always"
+# maximal number of external processes run concurrently when gathering full
+# cluster status
+status_probe_concurrency = 2
+# Temporary files passed to external tools, e.g. CIBs for pacemaker tools, are
+# created in the first writable directory of the list. The list should contain
+# tmpfs locations. The system temporary directory is used if none is writable.
+tmp_file_dir_list = ["/dev/shm"]
+# pcsd workers share the latest cluster status in this file and run crm_mon
+# again only when the status is older than the interval or when a caller asks
+# for a fresher status
+cluster_status_snapshot_file = "/var/run/pcsd-cluster-status.json"
+cluster_status_snapshot_interval_ms = 1000
+
+
+# resource / stonith agents
+ocf_root = "/usr/lib/ocf"
+fence_agent_execs = "/usr/sbin"
+# maximal number of agents whose metadata are loaded concurrently
+resource_agent_metadata_load_concurrency = 8
+# maximal number of agent self-validations run concurrently when creating
+# several resources at once
+resource_agent_self_validation_concurrency = 8
+
+
+# sbd
+sbd_exec = "/usr/sbin/sbd"
+sbd_config = "/usr/bin/x/sbd"
+# this limit is also mentioned in docs, change there as well
+sbd_max_device_num = 3
+# message types are also mentioned in docs, change there as well
+sbd_message_types = ["test", "reset", "off", "crashdump", "exit", "clear"]
+sbd_watchdog_default = "/dev/watchdog"
+
+
+# booth
+# Booth does not support keys longer than 64 bytes.
+booth_authkey_bytes = 64
+booth_authkey_file_mode = 0o600
+booth_exec = "/usr/sbin/booth"
+booth_config_dir = "/usr/bin/x"
+booth_enable_authfile_set_enabled = False
+booth_enable_authfile_unset_enabled = False or booth_enable_authfile_set_enabled
+
+
+# path manager
+_ocf_1_0_schema_filename = "ocf-1.0.rng"
+_ocf_1_1_schema_filename = "ocf-1.1.rng"
+
+
+class _PathManager:
+    @property
+    def ocf_1_0_schema(self):
+        return os.path.join(pcs_data_dir, _ocf_1_0_schema_filename)
+
+    @property
+    def ocf_1_1_schema(self):
+        return os.path.join(pcs_data_dir, _ocf_1_1_schema_filename)
+
+    @property
+    def pcs_data_dir(self):
+        return pcs_data_dir
+
+
+path = _PathManager()
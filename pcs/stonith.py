@@ -1,4 +1,5 @@
 import json
+from functools import partial
 from typing import (
     Any,
     Optional,
@@ -68,6 +69,8 @@ def stonith_list_available(
     agent_list = lib.stonith_agent.list_agents(
         describe=not modifiers.get("--nodesc"),
         search=search,
+        # pylint: disable=protected-access
+        agent_callback=partial(resource._print_agent, "type"),
     )
 
     if not agent_list:
@@ -78,22 +81,6 @@ def stonith_list_available(
             "Do you have fence agents installed?"
         )
 
-    for agent_info in agent_list:
-        name = agent_info["type"]
-        shortdesc = agent_info["shortdesc"]
-        if shortdesc:
-            print(
-                "{0} - {1}".format(
-                    name,
-                    # pylint: disable=protected-access
-                    resource._format_desc(
-                        len(name + " - "), shortdesc.replace("\n", " ")
-                    ),
-                )
-            )
-        else:
-            print(name)
-
 
 def stonith_list_options(
     lib: Any, argv: Argv, modifiers: InputModifiers
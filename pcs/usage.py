@@ -856,6 +856,23 @@ Commands:
                 ip=192.168.0.99 cidr_netmask=32 nic=eth2 \\
                 op monitor interval=30s
 
+    create-bulk [<filename>] [--disabled] [--agent-validation]
+            [--no-default-ops]
+        Create several resources at once. Resource definitions are read as a
+        JSON list from the specified file or from stdin if no file is
+        specified. Each definition is an object with keys "resource_id",
+        "agent_name" and optionally "instance_attributes", "meta_attributes",
+        "operations" (a list of objects with key "name" and operation
+        options), "group_id" and "clone" (an object with optional keys
+        "clone_id" and "meta_attributes"). All definitions are validated
+        together and the resources are created in one CIB update. If any of
+        them is not valid, no resources are created.
+        Options --disabled, --agent-validation and --no-default-ops have the
+        same meaning as in 'pcs resource create'.
+        Example:
+            echo '[{{"resource_id": "R1", "agent_name": "ocf:pacemaker:Dummy",
+                "group_id": "G1"}}]' | pcs resource create-bulk
+
 {delete_syntax}
 {delete_desc}
 
@@ -1049,8 +1066,11 @@ Commands:
     providers
         List available OCF resource agent providers.
 
-    agents [standard[:provider]]
+    agents [standard[:provider]] [--refresh-cache]
         List available agents optionally filtered by standard and provider.
+        If --refresh-cache is specified, cached metadata of all resource and
+        stonith agents are dropped and loaded from the agents again when
+        needed.
 
 {update_syntax}
 {update_desc}
@@ -1705,6 +1725,22 @@ Commands:
             pcs -f new.xml constraint location apache prefers node2
             pcs cluster cib-push new.xml diff-against=original.xml
 
+    cib-batch [<filename>] [--wait[=<n>]]
+        Run pcs commands from <filename>, or from stdin if no filename is
+        specified, against one copy of the CIB and push all their changes to
+        the CIB at once. Each line contains one command, the leading 'pcs' is
+        optional. Lines starting with '#' and empty lines are ignored. Only
+        commands which support the -f option can be used. Running the commands
+        stops at the first failed command and the CIB is not changed in that
+        case. If -f is specified, the commands modify the specified CIB file
+        instead of the CIB of the running cluster.
+        If --wait is specified wait up to 'n' seconds for changes to be applied.
+        Example:
+            pcs cluster cib-batch <<EOF
+            resource create apache ocf:heartbeat:apache
+            constraint location apache prefers node2
+            EOF
+
     cib-upgrade
         Upgrade the CIB to conform to the latest version of the document schema.
 
@@ -2891,6 +2927,27 @@ Commands:
     query resource <resource-id> get-index-in-group
         Get an index of the resource in a group. The first resource in a group
         has an index of 0. Usable only for resources that are in a group.
+
+    query batch [file <path> | <query>...] [--quiet]
+        Evaluate several resource queries on one status of the cluster. Each
+        query has the form 'resource <resource-id> <query> [<query options>]',
+        where the query and its options are the same as in the 'query
+        resource' commands, e.g. 'resource R1 is-state started on-node node1'.
+        Queries are read from lines of the specified file, from command line
+        arguments, each query being one argument, or from lines of the
+        standard input if neither is specified. Empty lines and lines starting
+        with '#' are ignored.
+
+        Print a JSON list with an item for each query containing the query,
+        its 'result' (true or false for 'is-' queries and 'exists'), 'value'
+        (output of 'get-' queries, id of a container for 'is-in-' queries)
+        and 'error'. Exit with 0 if all queries evaluate to true, exit with 1
+        if an error occurs while performing any of the queries, exit with 2
+        otherwise.
+        {quiet_flag}
+        Example:
+            pcs status query batch 'resource R1 is-state started' \\
+                'resource R2 get-nodes'
 """.format(
         query_return=_QUERY_RETURN_VALUE,
         quiet_flag=_QUERY_QUIET_FLAG,
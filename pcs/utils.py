@@ -80,6 +80,7 @@ from pcs.lib.pacemaker.live import get_cluster_status_dom
 from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.pacemaker.values import is_score as is_score_value
 from pcs.lib.pacemaker.values import validate_id
+from pcs.lib.resource_agent import ResourceAgentMetadataCache
 from pcs.lib.services import get_service_manager as _get_service_manager
 from pcs.lib.services import service_exception_to_report
 
@@ -2732,6 +2733,12 @@ def get_report_processor() -> ReportProcessor:
     return ReportProcessorToConsole(debug="--debug" in pcs_options)
 
 
+def get_resource_agent_metadata_cache() -> ResourceAgentMetadataCache:
+    return ResourceAgentMetadataCache(
+        settings.resource_agent_metadata_cache_dir
+    )
+
+
 def get_user_and_pass():
     """
     Commandline options:
@@ -0,0 +1 @@
+pacemaker_version_rng = "/usr/share/pacemaker/versions.rng"
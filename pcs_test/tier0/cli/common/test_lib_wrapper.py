@@ -3,7 +3,13 @@ from unittest import (
     mock,
 )
 
-from pcs.cli.common.lib_wrapper import Library
+from pcs.cli.common.env_cli import Env
+from pcs.cli.common.lib_wrapper import (
+    Library,
+    cli_env_to_lib_env,
+    shared_cib_snapshot,
+)
+from pcs.lib.cib.snapshot import CibSnapshot
 
 
 class LibraryWrapperTest(TestCase):
@@ -12,7 +18,7 @@ class LibraryWrapperTest(TestCase):
         lib = Library("env", mock_middleware_factory)
         self.assertRaises(Exception, lambda: lib.no_valid_library_part)
 
-    @mock.patch("pcs.cli.common.lib_wrapper.constraint_order.create_with_set")
+    @mock.patch("pcs.lib.commands.constraint.order.create_with_set")
     @mock.patch("pcs.cli.common.lib_wrapper.cli_env_to_lib_env")
     def test_bind_to_library(self, mock_cli_env_to_lib_env, mock_order_set):
         # pylint: disable=no-self-use
@@ -33,3 +39,32 @@ class LibraryWrapperTest(TestCase):
         ).constraint_order.create_with_set("first", second="third")
 
         mock_order_set.assert_called_once_with(lib_env, "first", second="third")
+
+
+class SharedCibSnapshot(TestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        self.cli_env = Env()
+
+    def test_snapshot_set_in_block(self):
+        with shared_cib_snapshot(self.cli_env):
+            snapshot = self.cli_env.cib_snapshot
+            self.assertIsInstance(snapshot, CibSnapshot)
+            self.assertIs(
+                cli_env_to_lib_env(self.cli_env)._cib_snapshot, snapshot
+            )
+        self.assertIsNone(self.cli_env.cib_snapshot)
+
+    def test_nested(self):
+        with shared_cib_snapshot(self.cli_env):
+            snapshot = self.cli_env.cib_snapshot
+            with shared_cib_snapshot(self.cli_env):
+                self.assertIs(self.cli_env.cib_snapshot, snapshot)
+            self.assertIs(self.cli_env.cib_snapshot, snapshot)
+        self.assertIsNone(self.cli_env.cib_snapshot)
+
+    def test_dropped_on_exception(self):
+        with self.assertRaises(ValueError):
+            with shared_cib_snapshot(self.cli_env):
+                raise ValueError()
+        self.assertIsNone(self.cli_env.cib_snapshot)
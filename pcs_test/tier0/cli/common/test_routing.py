@@ -0,0 +1,71 @@
+import os.path
+import subprocess
+import sys
+from unittest import (
+    TestCase,
+    mock,
+)
+
+import pcs
+from pcs.cli.common import routing
+from pcs.cli.common.errors import CmdLineInputError
+
+
+class CreateLazyCmd(TestCase):
+    @mock.patch("pcs.cli.common.routing.importlib.import_module")
+    def test_module_imported_when_run(self, mock_import):
+        # pylint: disable=no-self-use
+        cmd = routing.create_lazy_cmd("pcs.module", "cmd_name")
+        mock_import.assert_not_called()
+        cmd("lib", ["arg"], "modifiers")
+        mock_import.assert_called_once_with("pcs.module")
+        mock_import.return_value.cmd_name.assert_called_once_with(
+            "lib", ["arg"], "modifiers"
+        )
+
+    def test_routed(self):
+        # pylint: disable=no-self-use
+        router = routing.create_router(
+            {
+                "stonith": routing.create_lazy_cmd(
+                    "pcs.cli.routing.stonith", "stonith_cmd"
+                )
+            },
+            [],
+        )
+        with mock.patch("pcs.cli.routing.stonith.stonith_cmd") as mock_cmd:
+            router("lib", ["stonith", "config"], "modifiers")
+        mock_cmd.assert_called_once_with("lib", ["config"], "modifiers")
+
+    def test_unknown_cmd(self):
+        router = routing.create_router(
+            {"cmd": routing.create_lazy_cmd("pcs.module", "cmd_name")}, []
+        )
+        self.assertRaises(
+            CmdLineInputError, lambda: router("lib", ["other"], "modifiers")
+        )
+
+
+class AppStartupTest(TestCase):
+    def test_command_modules_not_imported(self):
+        # Guards the startup time of pcs: command modules and library commands
+        # must be imported only when a command using them is run.
+        code = "import sys, pcs.app; print('\\n'.join(sorted(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(pcs.__file__)),
+            text=True,
+        )
+        imported_modules = result.stdout.splitlines()
+        self.assertIn("pcs.app", imported_modules)
+        self.assertEqual(
+            [],
+            [
+                module
+                for module in imported_modules
+                if module.startswith(("pcs.cli.routing.", "pcs.lib.commands."))
+                or module in ("pcs.cluster", "pcs.resource", "pcs.stonith")
+            ],
+        )
@@ -1,3 +1,4 @@
+import json
 from typing import (
     Optional,
     Sequence,
@@ -27,7 +28,11 @@ from pcs.common.status_dto import (
     ResourcesStatusDto,
 )
 
-from pcs_test.tools.misc import dict_to_modifiers
+from pcs_test.tools.misc import (
+    dict_to_modifiers,
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
 
 
 def fixture_primitive_dto(
@@ -1139,3 +1144,183 @@ class TestQueryGetIndexInGroup(QueryBaseMixin, TestCase):
         )
         self.lib_command.assert_called_once_with()
         mock_print.assert_not_called()
+
+
+@mock.patch("pcs.cli.query.resource.print")
+class TestQueryBatch(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["status"])
+        self.lib.status = mock.Mock(spec_set=["resources_status"])
+        self.lib_command: mock.Mock = self.lib.status.resources_status
+        self.lib_command.return_value = ResourcesStatusDto(
+            [
+                fixture_group_dto(
+                    "G",
+                    None,
+                    [
+                        fixture_primitive_dto("R1", None),
+                        fixture_primitive_dto("R2", None),
+                    ],
+                )
+            ]
+        )
+
+    def _call_cmd(self, argv, modifiers=None) -> int:
+        with self.assertRaises(SystemExit) as cm:
+            resource.batch(self.lib, argv, dict_to_modifiers(modifiers or {}))
+        return cm.exception.code
+
+    @staticmethod
+    def _get_output(mock_print: mock.Mock):
+        mock_print.assert_called_once()
+        return json.loads(mock_print.call_args.args[0])
+
+    def test_all_true(self, mock_print):
+        self.assertEqual(
+            self._call_cmd(
+                [
+                    "resource R1 exists",
+                    "resource R1 is-in-group G",
+                    "resource 'R1' is-state started on-node node1",
+                    "resource G get-members",
+                    "resource R2 get-index-in-group",
+                    "resource G get-type",
+                ]
+            ),
+            0,
+        )
+        self.lib_command.assert_called_once_with()
+        self.assertEqual(
+            self._get_output(mock_print),
+            [
+                {
+                    "query": "resource R1 exists",
+                    "result": True,
+                    "value": None,
+                    "error": None,
+                },
+                {
+                    "query": "resource R1 is-in-group G",
+                    "result": True,
+                    "value": "G",
+                    "error": None,
+                },
+                {
+                    "query": "resource 'R1' is-state started on-node node1",
+                    "result": True,
+                    "value": None,
+                    "error": None,
+                },
+                {
+                    "query": "resource G get-members",
+                    "result": None,
+                    "value": ["R1", "R2"],
+                    "error": None,
+                },
+                {
+                    "query": "resource R2 get-index-in-group",
+                    "result": None,
+                    "value": 1,
+                    "error": None,
+                },
+                {
+                    "query": "resource G get-type",
+                    "result": None,
+                    "value": "group",
+                    "error": None,
+                },
+            ],
+        )
+
+    def test_false(self, mock_print):
+        self.assertEqual(
+            self._call_cmd(
+                ["resource R1 exists", "resource R2 is-state stopped"]
+            ),
+            2,
+        )
+        self.assertEqual(
+            [item["result"] for item in self._get_output(mock_print)],
+            [True, False],
+        )
+
+    def test_errors(self, mock_print):
+        self.assertEqual(
+            self._call_cmd(
+                [
+                    "resource R1 is-state started",
+                    "resource R3 get-nodes",
+                    "resource R1 is-fine",
+                    "resource R1 is-state",
+                    "node N1 exists",
+                    "resource 'R1 exists",
+                ]
+            ),
+            1,
+        )
+        self.lib_command.assert_called_once_with()
+        self.assertEqual(
+            [
+                (item["result"], item["error"])
+                for item in self._get_output(mock_print)
+            ],
+            [
+                (True, None),
+                (None, "Resource 'R3' does not exist"),
+                (None, "Unknown query 'is-fine'"),
+                (None, "Invalid query"),
+                (None, "Invalid query"),
+                (None, "Unable to parse the query: No closing quotation"),
+            ],
+        )
+
+    def test_quiet(self, mock_print):
+        self.assertEqual(
+            self._call_cmd(["resource R2 is-state stopped"], {"quiet": True}),
+            2,
+        )
+        mock_print.assert_not_called()
+
+    @mock.patch("pcs.cli.query.resource.sys.stdin")
+    def test_stdin(self, mock_stdin, mock_print):
+        mock_stdin.read.return_value = (
+            "# comment\n\nresource R1 exists\n  resource R2 exists  \n"
+        )
+        self.assertEqual(self._call_cmd([]), 0)
+        self.assertEqual(
+            [item["query"] for item in self._get_output(mock_print)],
+            ["resource R1 exists", "resource R2 exists"],
+        )
+
+    def test_file(self, mock_print):
+        with get_tmp_file("query_batch") as query_file:
+            write_data_to_tmpfile(
+                "resource R1 exists\nresource R3 exists\n", query_file
+            )
+            self.assertEqual(self._call_cmd(["file", query_file.name]), 2)
+        self.assertEqual(
+            [item["result"] for item in self._get_output(mock_print)],
+            [True, False],
+        )
+
+    def test_file_error(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            resource.batch(
+                self.lib,
+                ["file", "/non/existing/file"],
+                dict_to_modifiers({}),
+            )
+        self.assertEqual(
+            cm.exception.message,
+            "Unable to read queries: No such file or directory: "
+            "'/non/existing/file'",
+        )
+        self.lib_command.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_no_queries(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            resource.batch(self.lib, ["# nothing"], dict_to_modifiers({}))
+        self.assertEqual(cm.exception.message, "No queries specified")
+        self.lib_command.assert_not_called()
+        mock_print.assert_not_called()
@@ -6,7 +6,10 @@ from unittest import (
     mock,
 )
 
-from pcs import cluster
+from pcs import (
+    cluster,
+    utils,
+)
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.common.corosync_conf import (
     CorosyncConfDto,
@@ -1728,3 +1731,197 @@ class ClusterAuthkeyCorosync(TestCase):
             cm.exception.message,
         )
         self.lib_call.assert_not_called()
+
+
+class ClusterCibBatch(TestCase):
+    # pylint: disable=too-many-instance-attributes
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=[])
+        self.batch_file = get_tmp_file("tier0_cluster_cib_batch")
+        self.addCleanup(self.batch_file.close)
+        self.dispatched = []
+        self.pushed = []
+
+        patcher = mock.patch("pcs.cluster.app.run_command")
+        self.mock_run_command = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_run_command.side_effect = self._run_command
+
+        patcher = mock.patch("pcs.cluster.utils.get_cib", return_value="<cib/>")
+        self.mock_get_cib = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_runner = mock.Mock(spec_set=["run"])
+        self.mock_runner.run.side_effect = self._run_external
+        patcher = mock.patch("pcs.cluster.utils.cmd_runner")
+        self.mock_cmd_runner = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_cmd_runner.return_value = self.mock_runner
+
+        patcher = mock.patch("pcs.cluster.utils.run", return_value=("", 0))
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("pcs.cluster.utils.err", side_effect=SystemExit(1))
+        self.mock_err = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("pcs.cluster.print_to_stderr")
+        self.mock_print = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_command(self, argv):
+        self.dispatched.append(
+            (argv, dict(utils.pcs_options), utils.usefile, utils.filename)
+        )
+        if argv[0] == "fail":
+            raise SystemExit(1)
+        with open(utils.filename, "a", encoding="utf-8") as cib_file:
+            cib_file.write(f"<!-- {' '.join(argv)} -->")
+
+    def _run_external(self, command, stdin_string=None):
+        if command[1] == "--original":
+            with (
+                open(command[2], encoding="utf-8") as original,
+                open(command[4], encoding="utf-8") as new,
+            ):
+                self.pushed.append((original.read(), new.read()))
+            return (
+                "patch",
+                "",
+                0 if self.pushed[-1][0] == self.pushed[-1][1] else 1,
+            )
+        self.pushed.append(stdin_string)
+        return ("", "", 0)
+
+    def call_cmd(self, commands, modifiers=None):
+        self.batch_file.write(commands)
+        self.batch_file.flush()
+        cluster.cluster_cib_batch(
+            self.lib, [self.batch_file.name], dict_to_modifiers(modifiers or {})
+        )
+
+    def assert_cib_pushed(self, new_cib):
+        self.assertEqual(self.pushed, [("<cib/>", new_cib), "patch"])
+        self.mock_runner.run.assert_has_calls(
+            [
+                mock.call(
+                    [
+                        mock.ANY,
+                        "--original",
+                        mock.ANY,
+                        "--new",
+                        mock.ANY,
+                        "--no-version",
+                    ]
+                ),
+                mock.call([mock.ANY, "--patch", "--xml-pipe"], "patch"),
+            ]
+        )
+
+    def test_each_line_dispatched(self):
+        saved_state = (utils.pcs_options, utils.usefile, utils.filename)
+        self.call_cmd(
+            dedent(
+                """\
+                # a comment
+                pcs resource create R ocf:pacemaker:Dummy --no-default-ops
+
+                tag create T R  # another comment
+                constraint location R prefers node1 --force --wait=10
+                """
+            )
+        )
+        self.assertEqual(
+            [argv for argv, _, _, _ in self.dispatched],
+            [
+                ["resource", "create", "R", "ocf:pacemaker:Dummy"],
+                ["tag", "create", "T", "R"],
+                ["constraint", "location", "R", "prefers", "node1"],
+            ],
+        )
+        cib_filename = self.dispatched[0][3]
+        self.assertEqual(
+            [options for _, options, _, _ in self.dispatched],
+            [
+                {"--no-default-ops": "", "-f": cib_filename},
+                {"-f": cib_filename},
+                {"--force": "", "--wait": "10", "-f": cib_filename},
+            ],
+        )
+        for _, _, usefile, filename in self.dispatched:
+            self.assertTrue(usefile)
+            self.assertEqual(filename, cib_filename)
+        self.assertEqual(
+            (utils.pcs_options, utils.usefile, utils.filename), saved_state
+        )
+        self.assert_cib_pushed(
+            "<cib/>"
+            "<!-- resource create R ocf:pacemaker:Dummy -->"
+            "<!-- tag create T R -->"
+            "<!-- constraint location R prefers node1 -->"
+        )
+        self.mock_print.assert_called_once_with("CIB updated")
+        self.mock_run.assert_not_called()
+        self.mock_err.assert_not_called()
+
+    def test_nothing_to_push(self):
+        self.mock_run_command.side_effect = None
+        self.call_cmd("resource update R\n")
+        self.assertEqual(self.pushed, [("<cib/>", "<cib/>")])
+        self.mock_print.assert_called_once_with(
+            "The commands made no changes, nothing to push."
+        )
+        self.mock_run.assert_not_called()
+
+    @mock.patch("pcs.cluster.utils.validate_wait_get_timeout", return_value=30)
+    def test_wait(self, mock_validate_wait):
+        self.call_cmd("tag create T R\n", {"wait": "30"})
+        self.assert_cib_pushed("<cib/><!-- tag create T R -->")
+        mock_validate_wait.assert_called_once_with()
+        self.mock_run.assert_called_once_with(
+            ["crm_resource", "--wait", "--timeout", "30"]
+        )
+
+    def test_stop_on_failed_line(self):
+        with self.assertRaises(SystemExit):
+            self.call_cmd("tag create T R\nfail\ntag create T2 R\n")
+        self.assertEqual(
+            [argv for argv, _, _, _ in self.dispatched],
+            [["tag", "create", "T", "R"], ["fail"]],
+        )
+        self.mock_err.assert_called_once_with(
+            "Command on line 2 failed, no changes have been made to the CIB"
+        )
+        self.mock_runner.run.assert_not_called()
+        self.mock_run.assert_not_called()
+
+    def test_nested_batch(self):
+        with self.assertRaises(SystemExit):
+            self.call_cmd("tag create T R\npcs cluster cib-batch file\n")
+        self.mock_err.assert_called_once_with(
+            "Nested batches are not allowed, line 2"
+        )
+        self.mock_run_command.assert_not_called()
+
+    def test_forbidden_option(self):
+        with self.assertRaises(SystemExit):
+            self.call_cmd("tag create T R -f other.xml\n")
+        self.mock_err.assert_called_once_with(
+            "Option '-f' is not allowed in a batch, line 1"
+        )
+        self.mock_run_command.assert_not_called()
+
+    def test_duplicate_option(self):
+        with self.assertRaises(SystemExit):
+            self.call_cmd("\nresource delete R --force --force\n")
+        self.mock_err.assert_called_once_with(
+            "--force can only be used once, line 2"
+        )
+        self.mock_run_command.assert_not_called()
+
+    def test_no_commands(self):
+        with self.assertRaises(SystemExit):
+            self.call_cmd("# nothing here\n\n")
+        self.mock_err.assert_called_once_with("No commands specified")
+        self.mock_run_command.assert_not_called()
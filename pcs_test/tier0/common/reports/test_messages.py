@@ -4040,6 +4040,14 @@ class WaitForNodeStartupStarted(NameBuildTest):
         )
 
 
+class WaitForNodeStartupFinished(NameBuildTest):
+    def test_all(self):
+        self.assert_message_from_report(
+            "Node(s) started in 2.5 seconds",
+            reports.WaitForNodeStartupFinished(2.5),
+        )
+
+
 class WaitForNodeStartupTimedOut(NameBuildTest):
     def test_all(self):
         self.assert_message_from_report(
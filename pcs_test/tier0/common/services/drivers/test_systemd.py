@@ -6,7 +6,10 @@ from unittest import (
 from pcs.common.services import errors
 from pcs.common.services.drivers import SystemdDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import (
+    ExecutorResult,
+    ServiceState,
+)
 
 
 def service_name(service, instance=None):
@@ -190,6 +193,78 @@ class IsRunningTest(Base):
         )
 
 
+class GetStatesTest(Base):
+    def test_no_services(self):
+        self.assertEqual(self.driver.get_states([]), {})
+        self.mock_executor.run.assert_not_called()
+
+    def test_success(self):
+        output = (
+            "ActiveState=active\n"
+            "UnitFileState=enabled\n"
+            "\n"
+            "UnitFileState=disabled\n"
+            "ActiveState=reloading\n"
+            "\n"
+            "ActiveState=inactive\n"
+            "UnitFileState=static\n"
+            "\n"
+            "ActiveState=inactive\n"
+            "UnitFileState=\n"
+        )
+        self.mock_executor.run.return_value = ExecutorResult(0, output, "")
+        self.assertEqual(
+            self.driver.get_states(["a", "b", "c", "a", "d"]),
+            {
+                "a": ServiceState(enabled=True, running=True),
+                "b": ServiceState(enabled=False, running=True),
+                "c": ServiceState(enabled=True, running=False),
+                "d": ServiceState(enabled=False, running=False),
+            },
+        )
+        self.mock_executor.run.assert_called_once_with(
+            [
+                self.binary,
+                "show",
+                "--property=ActiveState,UnitFileState",
+                service_name("a"),
+                service_name("b"),
+                service_name("c"),
+                service_name("d"),
+            ]
+        )
+
+    def test_failure_fallback(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(1, "", "error"),
+            ExecutorResult(0, "enabled", ""),
+            ExecutorResult(3, "inactive", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_states([self.service]),
+            {self.service: ServiceState(enabled=True, running=False)},
+        )
+        self.mock_executor.run.assert_has_calls(
+            [
+                mock.call(
+                    [
+                        self.binary,
+                        "show",
+                        "--property=ActiveState,UnitFileState",
+                        service_name(self.service),
+                    ]
+                ),
+                mock.call(
+                    [self.binary, "is-enabled", service_name(self.service)]
+                ),
+                mock.call(
+                    [self.binary, "is-active", service_name(self.service)]
+                ),
+            ]
+        )
+        self.assertEqual(self.mock_executor.run.call_count, 3)
+
+
 class IsInstalledTest(Base):
     def test_installed(self):
         output = (
@@ -6,7 +6,10 @@ from unittest import (
 from pcs.common.services import errors
 from pcs.common.services.drivers import SysVInitRhelDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import (
+    ExecutorResult,
+    ServiceState,
+)
 
 
 class Base(TestCase):
@@ -182,6 +185,32 @@ class IsRunningTest(Base):
         )
 
 
+class GetStatesTest(Base):
+    def test_success(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(0, "", ""),
+            ExecutorResult(3, "is stopped", ""),
+            ExecutorResult(1, "", ""),
+            ExecutorResult(0, "is running", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_states(["a", "b"]),
+            {
+                "a": ServiceState(enabled=True, running=False),
+                "b": ServiceState(enabled=False, running=True),
+            },
+        )
+        self.mock_executor.run.assert_has_calls(
+            [
+                mock.call([self.chkconfig_bin, "a"]),
+                mock.call([self.service_bin, "a", "status"]),
+                mock.call([self.chkconfig_bin, "b"]),
+                mock.call([self.service_bin, "b", "status"]),
+            ]
+        )
+        self.assertEqual(self.mock_executor.run.call_count, 4)
+
+
 class IsInstalledTest(Base):
     def test_installed(self):
         output = (
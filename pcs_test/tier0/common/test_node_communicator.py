@@ -347,6 +347,92 @@ class CreateRequestHandleTest(TestCase):
         self.assertEqual("", handle.output_buffer.getvalue().decode("utf-8"))
         self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
 
+    def test_debug_disabled(self, mock_curl):
+        mock_curl.return_value = MockCurl(
+            None, b"output", [(pycurl.DEBUG_TEXT, b"debug")]
+        )
+        request = lib.Request(
+            lib.RequestTarget("label"), lib.RequestData("action")
+        )
+        # pylint: disable=protected-access
+        handle = lib._create_request_handle(request, {}, 10, debug=False)
+        self.assertFalse(pycurl.VERBOSE in handle.opts)
+        self.assertFalse(pycurl.DEBUGFUNCTION in handle.opts)
+        handle.perform()
+        self.assertEqual(
+            "output", handle.output_buffer.getvalue().decode("utf-8")
+        )
+        self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
+
+    def test_handle_from_pool(self, mock_curl):
+        pooled_handle = MockCurl(None)
+        pool = lib.CurlHandlePool()
+        request = lib.Request(
+            lib.RequestTarget(
+                "label", dest_list=_addr_list_to_dest(["host1"], port=123)
+            ),
+            lib.RequestData("action"),
+        )
+        pool.put(Destination("host1", 123), pooled_handle)
+        # pylint: disable=protected-access
+        handle = lib._create_request_handle(request, {}, 10, handle_pool=pool)
+        mock_curl.assert_not_called()
+        self.assertIs(pooled_handle, handle)
+        self.assertIs(pool.share, handle.opts[pycurl.SHARE])
+        self.assertEqual(Destination("host1", 123), handle.pool_dest)
+        self.assertEqual(
+            lib.CurlHandlePoolStats(hits=1, misses=0, idle=0), pool.stats
+        )
+
+
+@mock.patch("pcs.common.node_communicator.pycurl.Curl")
+class CurlHandlePoolTest(TestCase):
+    def setUp(self):
+        self.pool = lib.CurlHandlePool()
+        self.dest1 = Destination("host1", 2224)
+        self.dest2 = Destination("host2", 2224)
+
+    def test_new_handle(self, mock_curl):
+        mock_curl.side_effect = MockCurl
+        handle1 = self.pool.get(self.dest1)
+        handle2 = self.pool.get(self.dest1)
+        self.assertIsNot(handle1, handle2)
+        self.assertEqual(
+            lib.CurlHandlePoolStats(hits=0, misses=2, idle=0), self.pool.stats
+        )
+
+    def test_reuse_handle(self, mock_curl):
+        mock_curl.side_effect = MockCurl
+        handle = self.pool.get(self.dest1)
+        handle.setopt(pycurl.TIMEOUT, 10)
+        self.pool.put(self.dest1, handle)
+        self.assertEqual(
+            lib.CurlHandlePoolStats(hits=0, misses=1, idle=1), self.pool.stats
+        )
+        self.assertIsNot(handle, self.pool.get(self.dest2))
+        reused_handle = self.pool.get(self.dest1)
+        self.assertIs(handle, reused_handle)
+        self.assertEqual({}, reused_handle.opts)
+        self.assertEqual(
+            lib.CurlHandlePoolStats(hits=1, misses=2, idle=0), self.pool.stats
+        )
+
+    def test_idle_limit(self, mock_curl):
+        for _ in range(lib.CurlHandlePool.max_idle_per_dest + 2):
+            self.pool.put(self.dest1, MockCurl())
+        self.pool.put(self.dest2, MockCurl())
+        self.assertEqual(
+            lib.CurlHandlePoolStats(
+                hits=0,
+                misses=0,
+                idle=lib.CurlHandlePool.max_idle_per_dest + 1,
+            ),
+            self.pool.stats,
+        )
+        self.pool.clear()
+        self.assertEqual(0, self.pool.stats.idle)
+        mock_curl.assert_not_called()
+
 
 def fixture_request(host_id=1, action="action"):
     return lib.Request(
@@ -386,7 +472,11 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         self.assertIs(handle, response.handle)
         self.assertIs(request, response.request)
         mock_create_handle.assert_called_once_with(
-            request, {}, settings.default_request_timeout
+            request,
+            {},
+            settings.default_request_timeout,
+            debug=True,
+            handle_pool=None,
         )
         return response
 
@@ -418,6 +508,62 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         self.assertEqual(expected_reason, response.error_msg)
 
 
+@mock.patch(
+    "pcs.common.node_communicator.pycurl.CurlMulti",
+    side_effect=lambda: MockCurlMulti([1]),
+)
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class CommunicatorHandlePoolTest(CommunicatorBaseTest):
+    @staticmethod
+    def fixture_handle(request):
+        handle = MockCurl(info={pycurl.RESPONSE_CODE: 200}, request=request)
+        handle.output_buffer = io.BytesIO(b"output")
+        handle.debug_buffer = io.BytesIO(b"debug")
+        handle.pool_dest = request.dest
+        return handle
+
+    def test_handle_returned_to_pool(self, mock_create_handle, _):
+        pool = mock.Mock(spec_set=lib.CurlHandlePool)
+        request = fixture_request(0, "action")
+        handle = self.fixture_handle(request)
+        mock_create_handle.return_value = handle
+        com = lib.Communicator(
+            self.mock_com_log, None, None, debug=False, handle_pool=pool
+        )
+        com.add_requests([request])
+        mock_create_handle.assert_called_once_with(
+            request,
+            {},
+            settings.default_request_timeout,
+            debug=False,
+            handle_pool=pool,
+        )
+        response_list = []
+        for response in com.start_loop():
+            pool.put.assert_not_called()
+            response_list.append(response)
+        pool.put.assert_called_once_with(request.dest, handle)
+
+    def test_response_detached(self, mock_create_handle, _):
+        request = fixture_request(0, "action")
+        handle = self.fixture_handle(request)
+        mock_create_handle.return_value = handle
+        pool = lib.CurlHandlePool()
+        com = lib.Communicator(self.mock_com_log, None, None, handle_pool=pool)
+        com.add_requests([request])
+        response_list = list(com.start_loop())
+        self.assertEqual(1, pool.stats.idle)
+        # the handle has been reset and may serve another request now
+        self.assertEqual({}, handle.opts)
+        handle.output_buffer = io.BytesIO(b"another output")
+        handle.request_obj = None
+        response = response_list[0]
+        self.assertIs(request, response.request)
+        self.assertEqual("output", response.data)
+        self.assertEqual("debug", response.debug)
+        self.assertEqual(200, response.response_code)
+
+
 class CommunicatorMultiTest(CommunicatorBaseTest):
     @mock.patch("pcs.common.node_communicator._create_request_handle")
     @mock.patch(
@@ -426,7 +572,7 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
     )
     def test_call_start_loop_multiple_times(self, _, mock_create_handle):
         com = self.get_communicator()
-        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+        mock_create_handle.side_effect = lambda request, _, __, **___: MockCurl(
             request=request
         )
         com.add_requests([fixture_request(i) for i in range(2)])
@@ -521,7 +667,7 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
             expected_response_list.append(response)
             return response
 
-        def _mock_create_request_handle(request, _, __):
+        def _mock_create_request_handle(request, _, __, **___):
             counter["counter"] += 1
             return (
                 MockCurl(request=request)
@@ -556,7 +702,13 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(3, len(expected_response_list))
         mock_create_handle.assert_has_calls(
             [
-                mock.call(request, {}, settings.default_request_timeout)
+                mock.call(
+                    request,
+                    {},
+                    settings.default_request_timeout,
+                    debug=True,
+                    handle_pool=None,
+                )
                 for _ in range(3)
             ]
         )
@@ -588,7 +740,7 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
 
         mock_con_failure.side_effect = _con_failure
         com = self.get_multiaddress_communicator()
-        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+        mock_create_handle.side_effect = lambda request, _, __, **___: MockCurl(
             error=(pycurl.E_SEND_ERROR, "reason"),
             request=request,
         )
@@ -613,7 +765,13 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(4, len(expected_response_list))
         mock_create_handle.assert_has_calls(
             [
-                mock.call(request, {}, settings.default_request_timeout)
+                mock.call(
+                    request,
+                    {},
+                    settings.default_request_timeout,
+                    debug=True,
+                    handle_pool=None,
+                )
                 for _ in range(3)
             ]
         )
@@ -636,3 +794,23 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(logger_calls, self.mock_com_log.mock_calls)
         # pylint: disable=no-member, protected-access
         com._multi_handle.assert_no_handle_left()
+
+
+class NodeCommunicatorFactoryRequestTimeout(TestCase):
+    @staticmethod
+    def _get_factory(request_timeout):
+        return lib.NodeCommunicatorFactory(
+            mock.MagicMock(spec_set=lib.CommunicatorLoggerInterface),
+            "user",
+            ["group"],
+            request_timeout,
+        )
+
+    def test_default(self):
+        self.assertEqual(
+            self._get_factory(None).request_timeout,
+            settings.default_request_timeout,
+        )
+
+    def test_specified(self):
+        self.assertEqual(self._get_factory(10).request_timeout, 10)
@@ -1,3 +1,4 @@
+import json
 import logging
 from unittest import mock
 from urllib.parse import urlencode
@@ -73,6 +74,57 @@ class SetCerts(AppTest):
         self.https_server_manage.reload_certs.assert_not_called()
 
 
+class NodeActions(AppTest):
+    def setUp(self):
+        super().setUp()
+        self._mock_auth_provider_method(
+            "auth_by_token", AuthUser(username="user", groups=("group1",))
+        )
+        self.headers = {"Cookie": "token=1234"}
+
+    def _post_node_actions(self, status_code, results):
+        self.wrapper.status_code = status_code
+        self.wrapper.body = json.dumps({"results": results}).encode()
+        # body is irelevant
+        self.assert_wrappers_response(
+            self.post("/remote/node_actions", body={}, headers=self.headers)
+        )
+
+    def test_it_asks_for_cert_reload_if_certs_set(self):
+        self._post_node_actions(
+            200,
+            [
+                {"command": "cluster_destroy", "code": 200, "data": ""},
+                {"command": "set_certs", "code": 200, "data": "success"},
+            ],
+        )
+        self.https_server_manage.reload_certs.assert_called_once()
+
+    def test_it_not_asks_for_cert_reload_if_certs_not_set(self):
+        self._post_node_actions(
+            200,
+            [
+                {"command": "cluster_destroy", "code": 200, "data": ""},
+                {"command": "set_certs", "code": 400, "data": "error"},
+            ],
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
+
+    def test_it_not_asks_for_cert_reload_if_no_certs_action(self):
+        self._post_node_actions(
+            200, [{"command": "cluster_enable", "code": 200, "data": ""}]
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
+
+    def test_it_not_asks_for_cert_reload_if_ruby_fail(self):
+        self.wrapper.status_code = 400
+        self.wrapper.body = b"Invalid input data format"
+        self.assert_wrappers_response(
+            self.post("/remote/node_actions", body={}, headers=self.headers)
+        )
+        self.https_server_manage.reload_certs.assert_not_called()
+
+
 class SinatraRemote(AppTest):
     def setUp(self):
         super().setUp()
@@ -72,16 +72,14 @@ class SchedulerTestWrapper:
         # self.worker_com = mp.Queue()
         self.worker_com = Queue()
         self.logging_queue = Queue()
-        # Manager has to be mocked because it creates a new process
-        # There are two queue calls, first is for worker message queue, second
-        # is for the logging queue
+        # Manager has to be mocked because it creates a new process, it is
+        # used for the logging queue
         mock.patch(
             "multiprocessing.Manager"
-        ).start().return_value.Queue.side_effect = [
-            self.worker_com,
-            self.logging_queue,
-            # mp.Queue(),
-        ]
+        ).start().return_value.Queue.return_value = self.logging_queue
+        mock.patch("multiprocessing.SimpleQueue").start().return_value = (
+            self.worker_com
+        )
         self.mp_pool_mock = (
             mock.patch("multiprocessing.Pool", spec=mp.Pool)
             .start()
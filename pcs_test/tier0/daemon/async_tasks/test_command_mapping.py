@@ -11,6 +11,7 @@ from typing import (
 )
 from unittest import TestCase
 
+from pcs.common.async_tasks.types import TaskLane
 from pcs.daemon.async_tasks.worker.command_mapping import COMMAND_MAP
 
 
@@ -54,3 +55,18 @@ class DaciteTypingCompatibilityTest(TestCase):
                         ),
                         f"Prohibited type used in command: {cmd_name}; argument: {param}; prohibited_types: {prohibited_types}",
                     )
+
+
+class CommandLaneTest(TestCase):
+    def test_lanes(self):
+        self.assertEqual(
+            COMMAND_MAP["status.resources_status"].lane, TaskLane.READ_ONLY
+        )
+        self.assertEqual(COMMAND_MAP["resource.create"].lane, TaskLane.MUTATING)
+        self.assertEqual(
+            COMMAND_MAP["cluster.setup"].lane, TaskLane.LONG_RUNNING
+        )
+        self.assertEqual(
+            COMMAND_MAP["cluster.wait_for_pcmk_idle"].lane,
+            TaskLane.LONG_RUNNING,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 import signal
 from datetime import timedelta
@@ -7,15 +8,24 @@ from multiprocessing.pool import worker as mp_worker_init  # type: ignore
 from queue import Queue
 from unittest import mock
 
+from tornado.ioloop import IOLoop
+
 from pcs import settings
 from pcs.common.async_tasks.dto import (
     CommandDto,
+    CommandMetricsDto,
     CommandOptionsDto,
+    LaneMetricsDto,
+    SchedulerMetricsDto,
+    TaskStateDto,
 )
 from pcs.common.async_tasks.types import (
     TaskFinishType,
     TaskKillReason,
+    TaskLane,
+    TaskState,
 )
+from pcs.common.reports import ReportItem
 from pcs.daemon.async_tasks.scheduler import TaskNotFoundError
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.async_tasks.worker import executor
@@ -31,6 +41,7 @@ from .dummy_commands import (
     test_command_map,
 )
 from .helpers import (
+    ANOTHER_AUTH_USER,
     AUTH_USER,
     DATETIME_NOW,
     AssertTaskStatesMixin,
@@ -38,6 +49,7 @@ from .helpers import (
     MockOsKillMixin,
     PermissionsCheckerMock,
     SchedulerBaseAsyncTestCase,
+    StubReportItem,
 )
 
 COMMAND_OPTIONS = CommandOptionsDto(request_timeout=None)
@@ -548,3 +560,331 @@ class DeadlockTests(
         self.process_cls_mock.assert_not_called()
         self.process_obj_mock.assert_not_called()
         mock_kill.assert_not_called()
+
+
+class EventProcessingTest(AssertTaskStatesMixin, IntegrationBaseTestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        super().setUp()
+        self.io_loop = mock.Mock(spec_set=IOLoop)
+        self.worker_com._reader = mock.Mock()
+        self.scheduler.start_event_processing(self.io_loop)
+        self.io_loop.add_handler.assert_called_once_with(
+            self.worker_com._reader.fileno.return_value,
+            mock.ANY,
+            IOLoop.READ,
+        )
+        self.message_handler = self.io_loop.add_handler.call_args[0][1]
+
+    async def run_scheduled_callback(self):
+        self.io_loop.add_callback.assert_called_once_with(mock.ANY)
+        callback = self.io_loop.add_callback.call_args[0][0]
+        self.io_loop.add_callback.reset_mock()
+        await callback()
+
+    async def test_new_tasks_scheduled(self):
+        self._create_tasks(3)
+        self.assert_task_state_counts_equal(3, 0, 0, 0)
+        await self.run_scheduled_callback()
+        self.assert_task_state_counts_equal(0, 3, 0, 0)
+
+    async def test_messages_received(self):
+        self._create_tasks(2)
+        await self.run_scheduled_callback()
+        self.execute_tasks(["id0", "id1"])
+        self.message_handler(None, IOLoop.READ)
+        self.message_handler(None, IOLoop.READ)
+        await self.run_scheduled_callback()
+        self.assert_task_state_counts_equal(0, 0, 2, 0)
+        self.finish_tasks(["id1"])
+        self.message_handler(None, IOLoop.READ)
+        await self.run_scheduled_callback()
+        self.assert_task_state_counts_equal(0, 0, 1, 1)
+
+    async def test_only_changed_tasks_processed(self):
+        self._create_tasks(2)
+        await self.run_scheduled_callback()
+        self.execute_tasks(["id0"])
+        self.message_handler(None, IOLoop.READ)
+        with mock.patch.object(
+            self.scheduler, "_process_task", mock.AsyncMock()
+        ) as mock_process:
+            await self.run_scheduled_callback()
+        mock_process.assert_awaited_once_with(
+            self.scheduler._task_register["id0"]
+        )
+
+    def test_terminate(self):
+        self.scheduler.terminate_nowait()
+        self.io_loop.remove_handler.assert_called_once_with(
+            self.worker_com._reader.fileno.return_value
+        )
+
+
+class LanesTest(AssertTaskStatesMixin, IntegrationBaseTestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        super().setUp()
+        self.fast_lane_pool_mock = mock.Mock()
+        self.scheduler._fast_lane_pool = self.fast_lane_pool_mock
+
+    def _set_config(self, **kwargs):
+        self.scheduler._config = dataclasses.replace(
+            self.scheduler._config, **kwargs
+        )
+
+    def _create_command_task(self, task_ident, command_name, auth_user=None):
+        with mock.patch(
+            "pcs.daemon.async_tasks.scheduler.get_unique_uuid"
+        ) as mock_uuid:
+            mock_uuid.return_value = task_ident
+            self.scheduler.new_task(
+                Command(CommandDto(command_name, {}, COMMAND_OPTIONS)),
+                auth_user or AUTH_USER,
+            )
+
+    def assert_dispatched(self, pool_mock, task_ident_list):
+        self.assertEqual(
+            [
+                call.kwargs["args"][0].task_ident
+                for call in pool_mock.apply_async.call_args_list
+            ],
+            task_ident_list,
+        )
+
+    async def test_read_only_in_fast_lane(self):
+        self._create_command_task("id0", "resource.create")
+        self._create_command_task("id1", "status.resources_status")
+        self._create_command_task("id2", "unknown.command")
+        self._create_command_task("id3", "cluster.setup")
+        await self.perform_actions(0)
+        self.assert_task_state_counts_equal(0, 4, 0, 0)
+        self.assert_dispatched(self.mp_pool_mock, ["id0", "id2", "id3"])
+        self.assert_dispatched(self.fast_lane_pool_mock, ["id1"])
+
+    async def test_fast_lane_disabled(self):
+        self.scheduler._fast_lane_pool = None
+        self._create_command_task("id0", "status.resources_status")
+        await self.perform_actions(0)
+        self.assert_dispatched(self.mp_pool_mock, ["id0"])
+
+    async def test_fast_lane_tasks_ignored_in_deadlock_detection(self):
+        self._create_command_task("id0", "status.resources_status")
+        self._create_command_task("id1", "resource.create")
+        await self.perform_actions(0)
+        self.execute_tasks(["id0"])
+        await self.perform_actions(1)
+        self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+    async def test_long_running_limit(self):
+        self._set_config(max_long_running_tasks=1)
+        self._create_command_task("id0", "cluster.setup")
+        self._create_command_task("id1", "cluster.add_nodes")
+        self._create_command_task("id2", "resource.create")
+        await self.perform_actions(0)
+        self.assert_task_state_counts_equal(1, 2, 0, 0)
+        self.assert_dispatched(self.mp_pool_mock, ["id0", "id2"])
+        self.execute_tasks(["id0"])
+        await self.perform_actions(1)
+        self.assert_task_state_counts_equal(1, 1, 1, 0)
+        self.finish_tasks(["id0"])
+        await self.perform_actions(1)
+        self.assert_task_state_counts_equal(0, 2, 0, 1)
+        self.assert_dispatched(self.mp_pool_mock, ["id0", "id2", "id1"])
+
+    async def test_user_limit(self):
+        self._set_config(max_tasks_per_user=1)
+        self._create_command_task("id0", "resource.create")
+        self._create_command_task("id1", "resource.create")
+        self._create_command_task(
+            "id2", "resource.create", auth_user=ANOTHER_AUTH_USER
+        )
+        await self.perform_actions(0)
+        self.assert_task_state_counts_equal(1, 2, 0, 0)
+        self.assert_dispatched(self.mp_pool_mock, ["id0", "id2"])
+
+    async def test_held_task_killed(self):
+        self._set_config(max_tasks_per_user=1)
+        self._create_command_task("id0", "resource.create")
+        self._create_command_task("id1", "resource.create")
+        await self.perform_actions(0)
+        self.assertEqual(list(self.scheduler._held_task_idents), ["id1"])
+        self.scheduler.kill_task("id1", AUTH_USER)
+        await self.perform_actions(0)
+        self.assert_task_state_counts_equal(0, 1, 0, 1)
+        self.assertEqual(list(self.scheduler._held_task_idents), [])
+        self.assert_dispatched(self.mp_pool_mock, ["id0"])
+
+    async def test_held_task_dispatched_by_event(self):
+        self._set_config(max_long_running_tasks=1)
+        io_loop = mock.Mock(spec_set=IOLoop)
+        self.worker_com._reader = mock.Mock()
+        self.scheduler.start_event_processing(io_loop)
+        self._create_command_task("id0", "cluster.setup")
+        self._create_command_task("id1", "cluster.setup")
+        await self.scheduler._perform_event_actions()
+        self.assert_task_state_counts_equal(1, 1, 0, 0)
+        self.execute_tasks(["id0"])
+        self.finish_tasks(["id0"])
+        await self.scheduler._perform_event_actions()
+        self.assert_task_state_counts_equal(0, 1, 0, 1)
+        self.assert_dispatched(self.mp_pool_mock, ["id0", "id1"])
+
+    @mock.patch("pcs.daemon.async_tasks.task.time.monotonic")
+    async def test_metrics(self, mock_monotonic):
+        mock_monotonic.side_effect = [10.0, 10.0, 10.0, 11.0, 12.0, 20.0]
+        self._create_command_task("id0", "resource.create")
+        self._create_command_task("id1", "status.resources_status")
+        self._create_command_task("id2", "unknown.command")
+        self.scheduler.kill_task("id1", AUTH_USER)
+        await self.perform_actions(0)
+        self.execute_tasks(["id0"])
+        await self.perform_actions(1)
+        self.finish_tasks(["id0"])
+        await self.perform_actions(1)
+        self.assertEqual(
+            self.scheduler.get_metrics(),
+            SchedulerMetricsDto(
+                lanes=[
+                    LaneMetricsDto(TaskLane.READ_ONLY, 0, 0, 0),
+                    LaneMetricsDto(TaskLane.MUTATING, 0, 1, 0),
+                    LaneMetricsDto(TaskLane.LONG_RUNNING, 0, 0, 0),
+                ],
+                commands=[
+                    CommandMetricsDto(
+                        "resource.create",
+                        TaskLane.MUTATING,
+                        finished_count=1,
+                        executed_count=1,
+                        wait_time_avg=2.0,
+                        wait_time_max=2.0,
+                        run_time_avg=8.0,
+                        run_time_max=8.0,
+                    ),
+                    CommandMetricsDto(
+                        "status.resources_status",
+                        TaskLane.READ_ONLY,
+                        finished_count=1,
+                        executed_count=0,
+                        wait_time_avg=0.0,
+                        wait_time_max=0.0,
+                        run_time_avg=0.0,
+                        run_time_max=0.0,
+                    ),
+                ],
+            ),
+        )
+
+
+class TaskProgressTest(MockOsKillMixin, IntegrationBaseTestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        super().setUp()
+        self._init_mock_os_kill()
+        self.report = ReportItem.info(StubReportItem()).to_dto()
+
+    def send_reports(self, task_ident, count):
+        for _ in range(count):
+            self.worker_com.put_nowait(Message(task_ident, self.report))
+
+    async def collect_progress(self, task_ident, report_offset=0):
+        return [
+            (offset, item)
+            async for offset, item in self.scheduler.iter_task_progress(
+                task_ident, AUTH_USER, report_offset
+            )
+        ]
+
+    def assert_states(self, progress, expected_states):
+        self.assertEqual(
+            [
+                (offset, item.state)
+                for offset, item in progress
+                if isinstance(item, TaskStateDto)
+            ],
+            expected_states,
+        )
+
+    async def test_progress_streamed(self):
+        self._create_tasks(1)
+        await self.perform_actions(0)
+        consumer = asyncio.create_task(self.collect_progress("id0"))
+        await asyncio.sleep(0)
+        self.execute_tasks(["id0"])
+        await self.perform_actions(1)
+        await asyncio.sleep(0)
+        self.send_reports("id0", 2)
+        await self.perform_actions(2)
+        await asyncio.sleep(0)
+        self.finish_tasks(["id0"], result=RESULT)
+        await self.perform_actions(1)
+        progress = await consumer
+        self.assertEqual(
+            [
+                (offset, item)
+                for offset, item in progress
+                if not isinstance(item, TaskStateDto)
+            ],
+            [(1, self.report), (2, self.report)],
+        )
+        self.assert_states(
+            progress,
+            [
+                (0, TaskState.QUEUED),
+                (0, TaskState.EXECUTED),
+                (2, TaskState.FINISHED),
+            ],
+        )
+        self.assertEqual(progress[-1][1].result, RESULT)
+        self.assertEqual(
+            progress[-1][1].task_finish_type, TaskFinishType.SUCCESS
+        )
+        # the result is kept for other clients
+        self.assertIsNone(
+            self.scheduler._task_register["id0"]._to_delete_timestamp
+        )
+
+    async def test_resume_from_offset(self):
+        self._create_tasks(1)
+        await self.perform_actions(0)
+        self.execute_tasks(["id0"])
+        self.send_reports("id0", 3)
+        self.finish_tasks(["id0"])
+        await self.perform_actions(5)
+        progress = await self.collect_progress("id0", report_offset=2)
+        self.assertEqual(
+            progress,
+            [
+                (3, self.report),
+                (3, self.scheduler._task_register["id0"].to_state_dto()),
+            ],
+        )
+
+    async def test_heartbeat(self):
+        self._create_tasks(1)
+        await self.perform_actions(0)
+        progress = self.scheduler.iter_task_progress(
+            "id0", AUTH_USER, heartbeat_interval=0.01
+        )
+        first_item = await progress.__anext__()
+        self.assertEqual(first_item[1].state, TaskState.QUEUED)
+        self.assertEqual(await progress.__anext__(), (0, None))
+        self.assertEqual(await progress.__anext__(), (0, None))
+        self.execute_tasks(["id0"])
+        await self.perform_actions(1)
+        offset, item = await progress.__anext__()
+        self.assertEqual((offset, item.state), (0, TaskState.EXECUTED))
+        await progress.aclose()
+
+    async def test_task_not_found(self):
+        self._create_tasks(1)
+        with self.assertRaises(TaskNotFoundError):
+            await self.collect_progress("nonexistent")
+
+    async def test_different_user(self):
+        self._create_tasks(1)
+        with self.assertRaises(TaskNotFoundError):
+            async for _ in self.scheduler.iter_task_progress(
+                "id0", ANOTHER_AUTH_USER
+            ):
+                pass
@@ -1,4 +1,5 @@
 # pylint: disable=protected-access
+import asyncio
 from datetime import timedelta
 from unittest import (
     IsolatedAsyncioTestCase,
@@ -285,3 +286,44 @@ class TestAbandoned(TaskBaseTestCase):
         mock_is_timed_out.assert_called_once_with(
             task_abandoned_timeout_seconds
         )
+
+
+class TestWaitForChange(TaskBaseTestCase):
+    async def test_changed_before_waiting(self):
+        change_count = self.task.change_count
+        self.task.receive_message(
+            Message(TASK_IDENT, mock.MagicMock(ReportItemDto))
+        )
+        await self.task.wait_for_change(change_count)
+        self.assertEqual(change_count + 1, self.task.change_count)
+
+    async def test_changed_while_waiting(self):
+        change_count = self.task.change_count
+        waiter = asyncio.create_task(self.task.wait_for_change(change_count))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self.task.state = types.TaskState.QUEUED
+        await waiter
+        self.assertEqual(change_count + 1, self.task.change_count)
+
+    async def test_changed_before_timeout(self):
+        change_count = self.task.change_count
+        waiter = asyncio.create_task(
+            self.task.wait_for_change(change_count, 10)
+        )
+        await asyncio.sleep(0)
+        self.task.state = types.TaskState.QUEUED
+        self.assertTrue(await waiter)
+
+    async def test_timeout(self):
+        change_count = self.task.change_count
+        self.assertFalse(await self.task.wait_for_change(change_count, 0.01))
+        self.assertEqual(change_count, self.task.change_count)
+
+    def test_get_reports(self):
+        reports = [mock.MagicMock(ReportItemDto) for _ in range(3)]
+        for report in reports:
+            self.task.receive_message(Message(TASK_IDENT, report))
+        self.assertEqual(reports, self.task.get_reports())
+        self.assertEqual(reports[2:], self.task.get_reports(2))
+        self.assertEqual([], self.task.get_reports(3))
@@ -1,4 +1,10 @@
+import dataclasses
+import multiprocessing as mp
+import os
+import signal
+import time
 from multiprocessing import Queue
+from typing import Any
 from unittest import (
     TestCase,
     mock,
@@ -12,6 +18,7 @@ from pcs.common.async_tasks.dto import (
 )
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.async_tasks.worker import executor
+from pcs.daemon.async_tasks.worker.communicator import WorkerCommunicator
 from pcs.daemon.async_tasks.worker.types import (
     Message,
     TaskExecuted,
@@ -200,3 +207,84 @@ class TestExecutor(MockOsKillMixin, TestCase):
         self.assertIsInstance(payload, TaskFinished)
         self.assertEqual(types.TaskFinishType.SUCCESS, payload.task_finish_type)
         self.assertEqual(RESULT, payload.result)
+
+
+def _dummy_command(lib_env, required, optional: int = 1):
+    del lib_env
+    return required, optional
+
+
+class GetParamsClass(TestCase):
+    # pylint: disable=protected-access
+    def test_fields(self):
+        params_class = executor._get_params_class("dummy", _dummy_command)
+        self.assertEqual(
+            [
+                (field.name, field.type, field.default)
+                for field in dataclasses.fields(params_class)
+            ],
+            [
+                ("required", Any, dataclasses.MISSING),
+                ("optional", int, 1),
+            ],
+        )
+
+    def test_cached(self):
+        self.assertIs(
+            executor._get_params_class("dummy", _dummy_command),
+            executor._get_params_class("dummy", _dummy_command),
+        )
+
+    @mock.patch(
+        "pcs.daemon.async_tasks.worker.executor.COMMAND_MAP", test_command_map
+    )
+    @mock.patch("pcs.daemon.async_tasks.worker.executor.signal.signal")
+    @mock.patch("pcs.daemon.async_tasks.worker.executor.setup_worker_logger")
+    @mock.patch("pcs.daemon.async_tasks.worker.executor._get_params_class")
+    def test_prepared_in_worker_init(
+        self, mock_get_params_class, mock_logger, mock_signal
+    ):
+        del mock_logger, mock_signal
+        worker_com = executor.worker_com
+        self.addCleanup(setattr, executor, "worker_com", worker_com)
+        executor.worker_init(Queue(), Queue())
+        self.assertEqual(
+            mock_get_params_class.call_args_list,
+            [
+                mock.call(name, cmd.cmd)
+                for name, cmd in test_command_map.items()
+            ],
+        )
+
+
+def _send_message_and_pause(message_q):
+    WorkerCommunicator(message_q).put(
+        Message(TASK_IDENT, TaskFinished(types.TaskFinishType.SUCCESS, RESULT))
+    )
+    executor._pause_worker()  # pylint: disable=protected-access
+
+
+class WorkerMessageSentBeforePause(TestCase):
+    def test_message_received_from_paused_worker(self):
+        message_q = mp.SimpleQueue()
+        # tests may run in daemonic processes, which cannot use mp.Process
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _send_message_and_pause(message_q)
+            finally:
+                os._exit(0)  # pylint: disable=protected-access
+        self.addCleanup(os.waitpid, pid, 0)
+        self.addCleanup(os.kill, pid, signal.SIGKILL)
+        # the worker stays paused until killed, its message must not wait
+        # for the worker to be resumed
+        for _ in range(500):
+            if not message_q.empty():
+                break
+            time.sleep(0.01)
+        self.assertEqual(
+            message_q.get() if not message_q.empty() else None,
+            Message(
+                TASK_IDENT, TaskFinished(types.TaskFinishType.SUCCESS, RESULT)
+            ),
+        )
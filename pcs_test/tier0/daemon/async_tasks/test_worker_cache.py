@@ -0,0 +1,55 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.common.host import (
+    Destination,
+    PcsKnownHost,
+)
+from pcs.daemon.async_tasks.worker.cache import KnownHostsCache
+
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
+KNOWN_HOSTS = {
+    "node1": PcsKnownHost("node1", "token1", [Destination("addr1", 2224)]),
+}
+
+
+class KnownHostsCacheTest(TestCase):
+    def setUp(self):
+        self.reader = mock.Mock(return_value=KNOWN_HOSTS)
+
+    def test_file_missing(self):
+        cache = KnownHostsCache("/non/existing/file", self.reader)
+        self.assertEqual(cache.get(), KNOWN_HOSTS)
+        self.assertEqual(cache.get(), KNOWN_HOSTS)
+        self.assertEqual(self.reader.call_count, 2)
+
+    def test_file_not_changed(self):
+        with get_tmp_file("known_hosts_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            cache = KnownHostsCache(tmp_file.name, self.reader)
+            self.assertEqual(cache.get(), KNOWN_HOSTS)
+            self.assertEqual(cache.get(), KNOWN_HOSTS)
+        self.reader.assert_called_once_with()
+
+    def test_file_changed(self):
+        with get_tmp_file("known_hosts_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            cache = KnownHostsCache(tmp_file.name, self.reader)
+            self.assertEqual(cache.get(), KNOWN_HOSTS)
+            write_data_to_tmpfile("other data", tmp_file)
+            self.reader.return_value = {}
+            self.assertEqual(cache.get(), {})
+        self.assertEqual(self.reader.call_count, 2)
+
+    def test_returned_dict_is_a_copy(self):
+        with get_tmp_file("known_hosts_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            cache = KnownHostsCache(tmp_file.name, self.reader)
+            cache.get().clear()
+            self.assertEqual(cache.get(), KNOWN_HOSTS)
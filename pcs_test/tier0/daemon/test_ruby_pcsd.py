@@ -123,6 +123,20 @@ class RunRuby(AsyncTestCase):
         self.assert_sinatra_result(result, headers, status, body)
 
 
+class SendToRuby(AsyncTestCase):
+    @gen_test
+    def test_request_not_limited_by_default_timeout(self):
+        wrapper = create_wrapper()
+        fetch = mock.AsyncMock(return_value=mock.Mock(body="ruby response"))
+        request = ruby_pcsd.RubyDaemonRequest(ruby_pcsd.SYNC_CONFIGS)
+        with mock.patch.object(
+            wrapper, "_Wrapper__client", mock.Mock(fetch=fetch)
+        ):
+            result = yield wrapper.send_to_ruby(request)
+        self.assertEqual(result, "ruby response")
+        self.assertEqual(fetch.call_args.kwargs["request_timeout"], 0)
+
+
 class ProcessResponseLog(TestCase):
     @patch_ruby_pcsd("log.from_external_source")
     @patch_ruby_pcsd("next", mock.Mock(return_value=1))
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from io import BytesIO
 from logging import Logger
 from unittest import (
@@ -19,11 +20,17 @@ from pcs.lib.auth.provider import (
     AuthProvider,
     _UpdateFacadeError,
 )
+from pcs.lib.auth.tools import UserGroupsError
 from pcs.lib.auth.types import AuthUser
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
 
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
 _FILE_PATH = "file path"
 _FILE_METADATA = FileMetadata(
     file_type_code=PCS_USERS_CONF,
@@ -98,6 +105,54 @@ class AuthProviderGetFacadeTest(TestCase):
         self.logger.error.assert_not_called()
 
 
+class AuthProviderGetFacadeCacheTest(TestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_file = get_tmp_file("pcs_users_conf")
+        self.addCleanup(self.tmp_file.close)
+        write_data_to_tmpfile("data", self.tmp_file)
+        self.file_instance_mock = mock.Mock(spec_set=FileInstance)
+        self.file_instance_mock.raw_file.metadata = replace(
+            _FILE_METADATA, path=self.tmp_file.name
+        )
+        self.logger = mock.Mock(spec_set=Logger)
+        with mock.patch.object(
+            FileInstance,
+            "for_pcs_users_config",
+            lambda *_args, **_kwargs: self.file_instance_mock,
+        ):
+            self.provider = AuthProvider(self.logger)
+
+    def test_file_not_changed(self):
+        self.file_instance_mock.read_to_facade.return_value = _FACADE
+        self.assertIs(_FACADE, self.provider._get_facade())
+        self.assertIs(_FACADE, self.provider._get_facade())
+        self.file_instance_mock.read_to_facade.assert_called_once_with()
+        self.logger.debug.assert_called_once_with(
+            "File '%s' loaded, cache hits: %s, misses: %s",
+            self.tmp_file.name,
+            0,
+            1,
+        )
+
+    def test_file_changed(self):
+        facade = Facade([])
+        self.file_instance_mock.read_to_facade.side_effect = [_FACADE, facade]
+        self.assertIs(_FACADE, self.provider._get_facade())
+        write_data_to_tmpfile("new data", self.tmp_file)
+        self.assertIs(facade, self.provider._get_facade())
+        self.assertEqual(2, self.file_instance_mock.read_to_facade.call_count)
+
+    def test_error_not_cached(self):
+        self.file_instance_mock.read_to_facade.side_effect = [
+            ParserErrorException(),
+            _FACADE,
+        ]
+        self.assertEqual(tuple(), self.provider._get_facade().config)
+        self.assertIs(_FACADE, self.provider._get_facade())
+
+
 class AuthProviderUpdateFacadeTest(TestCase):
     # pylint: disable=protected-access
     def setUp(self):
@@ -280,6 +335,56 @@ class AuthProviderLoginByUsernamePasswordTest(TestCase):
         groups_mock.assert_called_once_with(self.username)
 
 
+@mock.patch("pcs.lib.auth.provider.time.monotonic")
+@mock.patch("pcs.lib.auth.provider.get_user_groups")
+class AuthProviderUserGroupsCacheTest(TestCase):
+    def setUp(self):
+        self.logger = mock.Mock(spec_set=Logger)
+        self.provider = AuthProvider(self.logger)
+        self.groups = ["group1", const.ADMIN_GROUP]
+        self.user = AuthUser(username="user1", groups=tuple(self.groups))
+
+    def test_cached(self, groups_mock, time_mock):
+        groups_mock.return_value = self.groups
+        time_mock.return_value = 100
+        self.assertEqual(self.user, self.provider.login_user("user1"))
+        time_mock.return_value = 129
+        self.assertEqual(self.user, self.provider.login_user("user1"))
+        groups_mock.assert_called_once_with("user1")
+
+    def test_expired(self, groups_mock, time_mock):
+        groups_mock.return_value = self.groups
+        time_mock.return_value = 100
+        self.assertEqual(self.user, self.provider.login_user("user1"))
+        time_mock.return_value = 130
+        self.assertEqual(self.user, self.provider.login_user("user1"))
+        self.assertEqual(2, groups_mock.call_count)
+
+    def test_other_user(self, groups_mock, time_mock):
+        groups_mock.return_value = self.groups
+        time_mock.return_value = 100
+        self.provider.login_user("user1")
+        self.provider.login_user("user2")
+        groups_mock.assert_has_calls([mock.call("user1"), mock.call("user2")])
+
+    def test_error_not_cached(self, groups_mock, time_mock):
+        groups_mock.side_effect = [UserGroupsError(), self.groups]
+        time_mock.return_value = 100
+        self.assertIsNone(self.provider.login_user("user1"))
+        self.assertEqual(self.user, self.provider.login_user("user1"))
+        self.assertEqual(2, groups_mock.call_count)
+
+    @mock.patch(
+        "pcs.lib.auth.provider.settings.pcsd_user_groups_cache_ttl_seconds", 0
+    )
+    def test_cache_disabled(self, groups_mock, time_mock):
+        groups_mock.return_value = self.groups
+        time_mock.return_value = 100
+        self.provider.login_user("user1")
+        self.provider.login_user("user1")
+        self.assertEqual(2, groups_mock.call_count)
+
+
 @mock.patch.object(AuthProvider, "_update_facade")
 class AuthProviderCreateTokenTest(TestCase):
     def setUp(self):
@@ -0,0 +1,214 @@
+from datetime import datetime
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from dateutil import tz as dateutil_tz
+from lxml import etree
+
+from pcs import settings
+from pcs.common.types import CibRuleInEffectStatus
+from pcs.lib.cib.rule import RuleInEffectEvalAllAtOnce
+from pcs.lib.xml_tools import etree_to_str
+
+from pcs_test.tools.custom_mock import get_runner_mock
+
+NOW = datetime(2023, 6, 15, 12, 0, 0, tzinfo=dateutil_tz.tzlocal())
+
+
+def _fixture_cib(rules):
+    return etree.fromstring(
+        f"""
+        <cib>
+            <configuration>
+                <rsc_defaults>
+                    <meta_attributes id="meta">{rules}</meta_attributes>
+                </rsc_defaults>
+            </configuration>
+        </cib>
+        """
+    )
+
+
+def _fixture_date_rule(rule_id, expression):
+    return f"""
+        <rule id="{rule_id}">
+            <date_expression id="{rule_id}-expr" {expression}
+        </rule>
+    """
+
+
+@mock.patch("pcs.lib.cib.rule.in_effect._get_now", lambda: NOW)
+class RuleInEffectEvalAllAtOnceTest(TestCase):
+    def assert_native_status(self, expression, expected_status):
+        runner = get_runner_mock()
+        evaluator = RuleInEffectEvalAllAtOnce(
+            _fixture_cib(_fixture_date_rule("r", expression)), runner
+        )
+        self.assertEqual(evaluator.get_rule_status("r"), expected_status)
+        runner.run.assert_not_called()
+
+    def assert_crm_rule_used(self, expression):
+        runner = get_runner_mock(returncode=110)
+        evaluator = RuleInEffectEvalAllAtOnce(
+            _fixture_cib(_fixture_date_rule("r", expression)), runner
+        )
+        self.assertEqual(
+            evaluator.get_rule_status("r"), CibRuleInEffectStatus.EXPIRED
+        )
+        runner.run.assert_called_once()
+
+    def test_gt(self):
+        self.assert_native_status(
+            'operation="gt" start="2023-01-01"/>',
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_native_status(
+            'operation="gt" start="2024-01-01"/>',
+            CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+        )
+
+    def test_lt(self):
+        self.assert_native_status(
+            'operation="lt" end="2023-01-01"/>',
+            CibRuleInEffectStatus.EXPIRED,
+        )
+        self.assert_native_status(
+            'operation="lt" end="2024-01-01T10:00:00+02:00"/>',
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+
+    def test_in_range(self):
+        self.assert_native_status(
+            'operation="in_range" start="2023-01-01" end="2023-12-31"/>',
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_native_status(
+            'operation="in_range" start="2023-07-01" end="2023-12-31"/>',
+            CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+        )
+        self.assert_native_status(
+            'operation="in_range" end="2023-06-01"/>',
+            CibRuleInEffectStatus.EXPIRED,
+        )
+
+    def test_in_range_duration(self):
+        self.assert_native_status(
+            """operation="in_range" start="2023-06-01">
+                <duration id="d" weeks="1"/>
+            </date_expression>""",
+            CibRuleInEffectStatus.EXPIRED,
+        )
+        self.assert_native_status(
+            """operation="in_range" start="2023-01-01">
+                <duration id="d" months="6" days="10"/>
+            </date_expression>""",
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+
+    def test_date_spec_years(self):
+        self.assert_native_status(
+            """operation="date_spec">
+                <date_spec id="ds" years="2020-2023"/>
+            </date_expression>""",
+            CibRuleInEffectStatus.IN_EFFECT,
+        )
+        self.assert_native_status(
+            """operation="date_spec">
+                <date_spec id="ds" years="2022"/>
+            </date_expression>""",
+            CibRuleInEffectStatus.EXPIRED,
+        )
+        self.assert_native_status(
+            """operation="date_spec">
+                <date_spec id="ds" years="2024-2025"/>
+            </date_expression>""",
+            CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+        )
+
+    def test_close_to_boundary(self):
+        self.assert_crm_rule_used('operation="lt" end="2023-06-15"/>')
+        self.assert_crm_rule_used(
+            """operation="in_range" start="2023-05-15">
+                <duration id="d" months="1"/>
+            </date_expression>"""
+        )
+
+    def test_periodic_date_spec(self):
+        self.assert_crm_rule_used(
+            """operation="date_spec">
+                <date_spec id="ds" weekdays="1-5"/>
+            </date_expression>"""
+        )
+
+    def test_invalid_date(self):
+        self.assert_crm_rule_used('operation="gt" start="yesterday"/>')
+
+    def test_unknown_duration(self):
+        self.assert_crm_rule_used(
+            """operation="in_range" start="2023-01-01">
+                <duration id="d" moon="1"/>
+            </date_expression>"""
+        )
+
+    def test_complex_rule(self):
+        runner = get_runner_mock(returncode=0)
+        cib = _fixture_cib(
+            """
+            <rule id="r" boolean-op="and">
+                <date_expression id="r-expr" operation="lt" end="2023-01-01"/>
+                <rsc_expression id="r-rsc" type="Dummy"/>
+            </rule>
+            """
+        )
+        evaluator = RuleInEffectEvalAllAtOnce(cib, runner)
+        self.assertEqual(
+            evaluator.get_rule_status("r"), CibRuleInEffectStatus.IN_EFFECT
+        )
+        runner.run.assert_called_once_with(
+            [
+                settings.crm_rule_exec,
+                "--check",
+                "--rule",
+                "r",
+                "--xml-text",
+                "-",
+            ],
+            stdin_string=etree_to_str(cib),
+        )
+
+    def test_missing_rule(self):
+        runner = get_runner_mock()
+        evaluator = RuleInEffectEvalAllAtOnce(
+            _fixture_cib(
+                _fixture_date_rule("r", 'operation="gt" start="2023"/>')
+            ),
+            runner,
+        )
+        self.assertEqual(
+            evaluator.get_rule_status("missing"), CibRuleInEffectStatus.UNKNOWN
+        )
+        runner.run.assert_not_called()
+
+    def test_memoized(self):
+        runner = get_runner_mock(returncode=111)
+        evaluator = RuleInEffectEvalAllAtOnce(
+            _fixture_cib(
+                _fixture_date_rule("r1", 'operation="gt" start="2023-06-15"/>')
+                + _fixture_date_rule(
+                    "r2", 'operation="gt" start="2022-01-01"/>'
+                )
+            ),
+            runner,
+        )
+        for _ in range(2):
+            self.assertEqual(
+                evaluator.get_rule_status("r1"),
+                CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+            )
+            self.assertEqual(
+                evaluator.get_rule_status("r2"),
+                CibRuleInEffectStatus.IN_EFFECT,
+            )
+        runner.run.assert_called_once()
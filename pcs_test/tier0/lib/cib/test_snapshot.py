@@ -0,0 +1,49 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import settings
+from pcs.lib.cib.snapshot import CibSnapshot
+
+from pcs_test.tools.assertions import assert_xml_equal
+from pcs_test.tools.custom_mock import get_runner_mock
+from pcs_test.tools.xml import etree_to_str
+
+CIB_XML = '<cib epoch="1"><configuration/></cib>'
+
+
+class CibSnapshotTest(TestCase):
+    def setUp(self):
+        self.runner = get_runner_mock(stdout=CIB_XML)
+        self.snapshot = CibSnapshot()
+
+    def assert_loaded_times(self, count):
+        self.assertEqual(
+            self.runner.run.call_args_list,
+            count * [mock.call([settings.cibadmin_exec, "--local", "--query"])],
+        )
+
+    def test_loaded_once(self):
+        self.assertEqual(self.snapshot.get_cib_xml(self.runner), CIB_XML)
+        assert_xml_equal(
+            CIB_XML, etree_to_str(self.snapshot.get_cib(self.runner))
+        )
+        assert_xml_equal(
+            CIB_XML, etree_to_str(self.snapshot.get_cib(self.runner))
+        )
+        self.assertEqual(self.snapshot.get_cib_xml(self.runner), CIB_XML)
+        self.assert_loaded_times(1)
+
+    def test_returns_copies(self):
+        cib1 = self.snapshot.get_cib(self.runner)
+        cib1.set("epoch", "2")
+        cib2 = self.snapshot.get_cib(self.runner)
+        self.assertIsNot(cib1, cib2)
+        self.assertEqual(cib2.get("epoch"), "1")
+
+    def test_invalidate(self):
+        self.snapshot.get_cib(self.runner)
+        self.snapshot.invalidate()
+        self.snapshot.get_cib(self.runner)
+        self.assert_loaded_times(2)
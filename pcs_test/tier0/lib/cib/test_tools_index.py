@@ -0,0 +1,302 @@
+import threading
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib import tools as lib
+
+from pcs_test.tier0.lib.cib.test_tools import (
+    FIXTURE_ALL_SECTIONS_WITH_REFERENCES,
+    FIXTURE_REFERENCES_IN_ACLS,
+    FIXTURE_REFERENCES_IN_CONSTRAINTS,
+    FIXTURE_REFERENCES_IN_TAGS,
+    _configuration_fixture,
+)
+from pcs_test.tools.assertions import assert_report_item_list_equal
+
+
+class CibIdIndexTest(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources>
+                        <primitive id="R1" />
+                        <primitive id="R2">
+                            <meta_attributes id="R2-meta">
+                                <nvpair id="R2-meta-remote" name="remote-node"
+                                    value="node-R2"
+                                />
+                            </meta_attributes>
+                        </primitive>
+                        <primitive id="R3" />
+                        <primitive id="R3-1" />
+                    </resources>
+                    <acls>
+                        <acl_target id="target1">
+                            <role id="role1"/>
+                        </acl_target>
+                    </acls>
+                </configuration>
+                <status>
+                    <lrm_resource id="S1" />
+                </status>
+            </cib>
+            """
+        )
+        self.index = lib.CibIdIndex(self.cib)
+
+    def test_get_elements(self):
+        self.assertEqual(
+            self.index.get_elements("R1"), [self.cib.find(".//*[@id='R1']")]
+        )
+        self.assertEqual(
+            self.index.get_elements("node-R2"),
+            [self.cib.find(".//*[@id='R2']")],
+        )
+        self.assertEqual(self.index.get_elements("S1"), [])
+        self.assertEqual(self.index.get_elements("target1"), [])
+        self.assertEqual(self.index.get_elements("role1"), [])
+        self.assertEqual(self.index.get_elements("X"), [])
+
+    def test_removed_element(self):
+        element = self.cib.find(".//*[@id='R1']")
+        element.getparent().remove(element)
+        self.assertEqual(self.index.get_elements("R1"), [])
+        self.assertFalse(self.index.does_id_exist("R1"))
+
+    def test_changed_id(self):
+        self.cib.find(".//*[@id='R1']").set("id", "R1-new")
+        self.assertEqual(self.index.get_elements("R1"), [])
+
+    def test_moved_to_status(self):
+        element = self.cib.find(".//*[@id='R1']")
+        self.cib.find("./status").append(element)
+        self.assertEqual(self.index.get_elements("R1"), [])
+
+    def test_removed_remote_node(self):
+        nvpair = self.cib.find(".//*[@id='R2-meta-remote']")
+        nvpair.getparent().remove(nvpair)
+        self.assertEqual(self.index.get_elements("node-R2"), [])
+
+    def test_id_reused_by_another_element(self):
+        element = self.cib.find(".//*[@id='R1']")
+        element.getparent().remove(element)
+        new_element = etree.SubElement(
+            self.cib.find(".//resources"), "group", id="R1"
+        )
+        self.assertEqual(self.index.get_elements("R1"), [new_element])
+
+    def test_claimed_id_searched(self):
+        self.assertFalse(self.index.does_id_exist("R4"))
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R4")
+        self.assertTrue(self.index.does_id_exist("R4"))
+
+    def test_claim_id(self):
+        self.index.claim_id("R4")
+        self.assertFalse(self.index.does_id_exist("R4"))
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R4")
+        self.assertTrue(self.index.does_id_exist("R4"))
+
+    def test_find_unique_id(self):
+        self.assertEqual(self.index.find_unique_id("R1"), "R1-1")
+        self.assertEqual(self.index.find_unique_id("R3"), "R3-2")
+        self.assertEqual(
+            self.index.find_unique_id("R3", ["R3-2", "R3-3"]), "R3-4"
+        )
+        self.assertEqual(self.index.find_unique_id("X"), "X")
+
+    def test_found_unique_id_claimed(self):
+        self.assertEqual(self.index.find_unique_id("R3"), "R3-2")
+        etree.SubElement(self.cib.find(".//resources"), "primitive", id="R3-2")
+        self.assertEqual(self.index.find_unique_id("R3"), "R3-3")
+
+
+class IdIndexRegistry(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources>
+                        <primitive id="R1" />
+                        <primitive id="R1-1" />
+                    </resources>
+                </configuration>
+            </cib>
+            """
+        )
+        self.resources = self.cib.find(".//resources")
+        self.addCleanup(lib.detach_id_index, self.cib)
+
+    def test_no_index_attached(self):
+        self.assertIsNone(lib.get_id_index(self.cib))
+
+    def test_attach_detach(self):
+        id_index = lib.attach_id_index(self.resources)
+        self.assertIs(lib.get_id_index(self.cib), id_index)
+        self.assertIs(lib.get_id_index(self.resources), id_index)
+        lib.detach_id_index(self.cib)
+        self.assertIsNone(lib.get_id_index(self.cib))
+
+    def test_detached_when_index_dropped(self):
+        lib.attach_id_index(self.cib)
+        self.assertIsNone(lib.get_id_index(self.cib))
+
+    def test_reattached(self):
+        lib.attach_id_index(self.cib)
+        id_index = lib.attach_id_index(self.cib)
+        self.assertIs(lib.get_id_index(self.cib), id_index)
+
+    def test_not_used_in_other_threads(self):
+        id_index = lib.attach_id_index(self.cib)
+        index_in_thread = []
+        thread = threading.Thread(
+            target=lambda: index_in_thread.append(lib.get_id_index(self.cib))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(index_in_thread, [None])
+        self.assertIs(lib.get_id_index(self.cib), id_index)
+
+    def test_used_by_lookups(self):
+        # pylint: disable=unused-variable
+        id_index = lib.attach_id_index(self.cib)
+        provider = lib.IdProvider(self.cib)
+        self.assertEqual(provider.allocate_id("R1"), "R1-2")
+        assert_report_item_list_equal(provider.book_ids("R2"), [])
+        etree.SubElement(self.resources, "primitive", id="R1-2")
+        etree.SubElement(self.resources, "primitive", id="R2")
+        self.assertEqual(lib.find_unique_id(self.cib, "R1"), "R1-3")
+        self.assertTrue(lib.does_id_exist(self.cib, "R2"))
+        self.assertEqual(lib.get_element_by_id(self.cib, "R2").get("id"), "R2")
+        searcher = lib.ElementSearcher("primitive", "R1-2", self.resources)
+        self.assertTrue(searcher.element_found())
+
+
+class CibReferenceIndexTest(TestCase):
+    # pylint: disable=protected-access
+    def test_same_as_find_elements_referencing_id(self):
+        for fixture_content in (
+            FIXTURE_REFERENCES_IN_CONSTRAINTS,
+            FIXTURE_REFERENCES_IN_TAGS,
+            FIXTURE_REFERENCES_IN_ACLS,
+            FIXTURE_ALL_SECTIONS_WITH_REFERENCES,
+        ):
+            cib = etree.fromstring(_configuration_fixture(fixture_content))
+            index = lib.CibReferenceIndex(cib)
+            for referenced_id in ("A", "B", "C", "D", "N"):
+                with self.subTest(
+                    fixture=fixture_content, referenced_id=referenced_id
+                ):
+                    self.assertEqual(
+                        lib.find_elements_referencing_id(cib, referenced_id),
+                        lib.find_elements_referencing_id(
+                            cib, referenced_id, index
+                        ),
+                    )
+                    self.assertEqual(
+                        lib._find_elements_without_id_referencing_id(
+                            cib, referenced_id
+                        ),
+                        lib._find_elements_without_id_referencing_id(
+                            cib, referenced_id, index
+                        ),
+                    )
+
+    def test_removed_element(self):
+        cib = etree.fromstring(
+            _configuration_fixture(FIXTURE_REFERENCES_IN_TAGS)
+        )
+        index = lib.CibReferenceIndex(cib)
+        tag_y = cib.find("./configuration/tags/tag[@id='Y']")
+        tag_y.getparent().remove(tag_y)
+        self.assertEqual(
+            [cib.find("./configuration/tags/tag[@id='Z']/obj_ref[@id='C']")],
+            index.get_referencing_elements("C"),
+        )
+        self.assertEqual([], index.get_referencing_elements("D"))
+
+    def test_changed_reference(self):
+        cib = etree.fromstring(
+            """
+            <cib><configuration><constraints>
+                <rsc_order id="O1" first="A" then="B"/>
+                <rsc_order id="O2" first="A" then="C"/>
+            </constraints></configuration></cib>
+            """
+        )
+        index = lib.CibReferenceIndex(cib)
+        cib.find(".//rsc_order[@id='O1']").set("first", "C")
+        self.assertEqual(
+            [cib.find(".//rsc_order[@id='O2']")],
+            index.get_referencing_elements("A"),
+        )
+
+    def test_added_element(self):
+        cib = etree.fromstring(
+            _configuration_fixture(FIXTURE_REFERENCES_IN_TAGS)
+        )
+        index = lib.CibReferenceIndex(cib)
+        tag = etree.SubElement(cib.find("./configuration/tags"), "tag", id="W")
+        obj_ref = etree.SubElement(tag, "obj_ref", id="D")
+        index.add_element(tag)
+        self.assertEqual(
+            [
+                cib.find("./configuration/tags/tag[@id='Y']/obj_ref[@id='D']"),
+                obj_ref,
+            ],
+            index.get_referencing_elements("D"),
+        )
+
+    def test_kinds(self):
+        cib = etree.fromstring(
+            """
+            <cib><configuration>
+                <constraints>
+                    <rsc_location id="L1" rsc="A" rsc-role="Promoted">
+                        <rule id="L1-rule" boolean-op="and">
+                            <expression id-ref="E"/>
+                        </rule>
+                    </rsc_location>
+                </constraints>
+                <fencing-topology>
+                    <fencing-level id="F1" index="1" target="n1"
+                        devices="S1,S2"
+                    />
+                    <fencing-level id="F2" index="2" target="n1"
+                        devices="S2"
+                    />
+                </fencing-topology>
+            </configuration></cib>
+            """
+        )
+        index = lib.CibReferenceIndex(cib)
+        # fencing levels are not indexed
+        self.assertEqual([], index.get_referencing_elements("S2"))
+        self.assertEqual(
+            [cib.find(".//expression")],
+            index.get_referencing_elements("E", [lib.REFERENCE_KIND_ID_REF]),
+        )
+        self.assertEqual(
+            [],
+            index.get_referencing_elements("A", [lib.REFERENCE_KIND_ID_REF]),
+        )
+        self.assertEqual(
+            [cib.find(".//rsc_location")],
+            index.get_referencing_elements("A", [lib.REFERENCE_KIND_RSC]),
+        )
+
+    def test_referencing_constraints(self):
+        cib = etree.fromstring(
+            _configuration_fixture(FIXTURE_REFERENCES_IN_CONSTRAINTS)
+        )
+        index = lib.CibReferenceIndex(cib)
+        self.assertEqual(
+            [
+                cib.find("./configuration/constraints/rsc_colocation"),
+                cib.find("./configuration/constraints/rsc_ticket[@rsc='C']"),
+            ],
+            index.get_referencing_constraints("C"),
+        )
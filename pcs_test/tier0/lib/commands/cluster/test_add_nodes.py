@@ -391,16 +391,19 @@ class LocalConfig:
             ]
         )
 
-    def get_host_info(self, node_labels):
+    def get_host_info(self, node_labels, pcsd_capabilities=None):
+        output_data = dict(
+            services={
+                service: dict(installed=True, enabled=False, running=False)
+                for service in ("corosync", "pacemaker", "pcsd")
+            },
+            cluster_configuration_exists=False,
+        )
+        if pcsd_capabilities is not None:
+            output_data["pcsd_capabilities"] = pcsd_capabilities
         self.config.http.host.get_host_info(
             node_labels=node_labels,
-            output_data=dict(
-                services={
-                    service: dict(installed=True, enabled=False, running=False)
-                    for service in ("corosync", "pacemaker", "pcsd")
-                },
-                cluster_configuration_exists=False,
-            ),
+            output_data=output_data,
             name="local.get_host_info.http.host.get_host_info",
         )
 
@@ -642,7 +645,7 @@ class AddNodesSuccessMinimal(TestCase):
         self.new_nodes = ()
         self.expected_reports = []
 
-    def set_up(self, existing_nodes_num, new_nodes_num):
+    def set_up(self, existing_nodes_num, new_nodes_num, node_actions=False):
         self.existing_nodes, self.new_nodes = generate_nodes(
             existing_nodes_num, new_nodes_num
         )
@@ -666,14 +669,23 @@ class AddNodesSuccessMinimal(TestCase):
             .services.is_installed(
                 "sbd", return_value=False, name=is_sbd_installed_name
             )
-            .local.get_host_info(self.new_nodes)
+            .local.get_host_info(
+                self.new_nodes,
+                pcsd_capabilities=(
+                    ["pcs.node-actions"] if node_actions else None
+                ),
+            )
             .local.pcsd_ssl_cert_sync_disabled()
             .http.host.update_known_hosts(
                 node_labels=self.new_nodes,
                 to_add_hosts=self.existing_nodes + self.new_nodes,
             )
             .local.disable_sbd(self.new_nodes)
-            .fs.isdir(settings.booth_config_dir, return_value=False)
+            .fs.isdir(
+                settings.booth_config_dir,
+                return_value=False,
+                name="fs.isdir.booth_config_dir",
+            )
             .local.no_file_sync()
             .local.distribute_and_reload_corosync_conf(
                 corosync_conf_fixture(
@@ -770,6 +782,56 @@ class AddNodesSuccessMinimal(TestCase):
             ]
         )
 
+    def _fold_node_actions(self, enable=False):
+        local_prefix = "local.distribute_and_reload_corosync_conf."
+        self.config.http.node_actions(
+            [
+                "http.host.update_known_hosts",
+                "local.disable_sbd.http.sbd.disable_sbd",
+            ],
+            name="http.node_actions.prepare",
+            # the requests are sent before booth configs are distributed
+            before="fs.isdir.booth_config_dir",
+        )
+        self.config.http.node_actions(
+            [f"{local_prefix}http.corosync.set_corosync_conf"]
+            + (["http.host.enable_cluster"] if enable else []),
+            name="http.node_actions.commit",
+            before=f"{local_prefix}http.corosync.reload_corosync_conf_requests",
+        )
+
+    def test_node_actions(self):
+        self.set_up(2, 2, node_actions=True)
+        self._fold_node_actions()
+        cluster.add_nodes(
+            self.env_assist.get_env(),
+            [{"name": node} for node in self.new_nodes],
+        )
+        self.env_assist.assert_reports(self.expected_reports)
+
+    def test_node_actions_enable(self):
+        self.set_up(2, 2, node_actions=True)
+        self.config.http.host.enable_cluster(node_labels=self.new_nodes)
+        self._fold_node_actions(enable=True)
+        cluster.add_nodes(
+            self.env_assist.get_env(),
+            [{"name": node} for node in self.new_nodes],
+            enable=True,
+        )
+        self.env_assist.assert_reports(
+            self.expected_reports
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(self.new_nodes),
+                )
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in self.new_nodes
+            ]
+        )
+
     def test_enable_1_existing_1_new(self):
         self._test_enable(1, 1)
 
@@ -852,7 +914,10 @@ class AddNodesSuccessMinimal(TestCase):
             ).http.host.check_pacemaker_started(self.new_nodes)
         )
 
-        with mock.patch("time.sleep", lambda secs: None):
+        with (
+            mock.patch("time.sleep", lambda secs: None),
+            mock.patch("time.time", lambda: 0),
+        ):
             cluster.add_nodes(
                 self.env_assist.get_env(),
                 # [{"name": "node4"}],
@@ -880,6 +945,12 @@ class AddNodesSuccessMinimal(TestCase):
                 )
                 for node in self.new_nodes
             ]
+            + [
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=0,
+                )
+            ]
         )
 
     def test_start_wait_1_existing_1_new(self):
@@ -978,7 +1049,10 @@ class AddNodesSuccessMinimal(TestCase):
             .http.host.start_cluster(node_labels=self.new_nodes)
             .http.host.check_pacemaker_started(self.new_nodes)
         )
-        with mock.patch("time.sleep", lambda secs: None):
+        with (
+            mock.patch("time.sleep", lambda secs: None),
+            mock.patch("time.time", lambda: 0),
+        ):
             cluster.add_nodes(
                 self.env_assist.get_env(),
                 [{"name": node} for node in self.new_nodes],
@@ -1016,6 +1090,12 @@ class AddNodesSuccessMinimal(TestCase):
                 )
                 for node in self.new_nodes
             ]
+            + [
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=0,
+                )
+            ]
         )
 
     def test_enable_start_wait_1_existing_1_new(self):
@@ -1218,8 +1298,7 @@ class AddNodeFull(TestCase):
             .services.is_enabled("sbd", return_value=True)
         )
 
-    @mock.patch("pcs.lib.corosync.qdevice_net.get_tmp_file")
-    def test_with_qdevice(self, mock_get_tmp_file):
+    def _set_up_with_qdevice(self, mock_get_tmp_file, node_actions=False):
         sbd_config = "SBD_DEVICE=/device\n"
         (
             self.config.corosync_conf.load_content(
@@ -1231,7 +1310,12 @@ class AddNodeFull(TestCase):
             .runner.cib.load()
             .local.read_sbd_config(sbd_config)
             .http.host.check_auth(node_labels=self.existing_nodes)
-            .local.get_host_info(self.new_nodes)
+            .local.get_host_info(
+                self.new_nodes,
+                pcsd_capabilities=(
+                    ["pcs.node-actions"] if node_actions else None
+                ),
+            )
             .local.check_sbd(self.new_nodes)
             .local.pcsd_ssl_cert_sync_enabled()
             .http.host.update_known_hosts(
@@ -1259,6 +1343,7 @@ class AddNodeFull(TestCase):
             )
         )
 
+    def _add_nodes(self):
         cluster.add_nodes(
             self.env_assist.get_env(),
             [
@@ -1272,6 +1357,42 @@ class AddNodeFull(TestCase):
             ],
         )
 
+    @mock.patch("pcs.lib.corosync.qdevice_net.get_tmp_file")
+    def test_with_qdevice(self, mock_get_tmp_file):
+        self._set_up_with_qdevice(mock_get_tmp_file)
+        self._add_nodes()
+        self.env_assist.assert_reports(self.expected_reports)
+
+    @mock.patch("pcs.lib.corosync.qdevice_net.get_tmp_file")
+    def test_with_qdevice_node_actions(self, mock_get_tmp_file):
+        # postponed node actions are sent before the qdevice and booth setup,
+        # so the steps run in the same order as without node actions
+        self._set_up_with_qdevice(mock_get_tmp_file, node_actions=True)
+        self.config.http.node_actions(
+            ["http.host.update_known_hosts"],
+            name="http.node_actions.known_hosts",
+            before="local.setup_qdevice.http.corosync.qdevice_ca_cert_requests",
+        )
+        self.config.http.node_actions(
+            [
+                "local.setup_sbd.http.sbd.set_sbd_config",
+                "http.sbd.enable_sbd",
+            ],
+            name="http.node_actions.sbd",
+            before="local.setup_booth.fs.isdir.booth_config_dir",
+        )
+        self.config.http.node_actions(
+            [
+                "local.files_sync.http.files.put_files",
+                "http.host.send_pcsd_cert",
+            ],
+            name="http.node_actions.files",
+            before=(
+                "local.distribute_and_reload_corosync_conf"
+                ".http.corosync.set_corosync_conf_requests"
+            ),
+        )
+        self._add_nodes()
         self.env_assist.assert_reports(self.expected_reports)
 
     def test_watchdog_not_supported(self):
@@ -216,6 +216,7 @@ def config_success_minimal_fixture(
     node_labels=None,
     communication_list=None,
     known_hosts=None,
+    pcsd_capabilities=None,
 ):
     if node_labels is None and communication_list is None:
         node_labels = NODE_LIST
@@ -237,13 +238,16 @@ def config_success_minimal_fixture(
         )
         for service in SERVICE_LIST
     }
+    host_info = dict(
+        services=services_status,
+        cluster_configuration_exists=False,
+    )
+    if pcsd_capabilities is not None:
+        host_info["pcsd_capabilities"] = pcsd_capabilities
     (
         config.http.host.get_host_info(
             node_labels=node_labels,
-            output_data=dict(
-                services=services_status,
-                cluster_configuration_exists=False,
-            ),
+            output_data=host_info,
             communication_list=communication_list,
         )
         .fs.isfile(settings.pcsd_config, name="fs.isfile.pcsd_config")
@@ -478,6 +482,7 @@ class SetupSuccessMinimal(TestCase):
         )
 
     @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", lambda: 0)
     def test_start_wait(self):
         (
             self.config.http.host.start_cluster(
@@ -510,6 +515,12 @@ class SetupSuccessMinimal(TestCase):
                 )
                 for node in NODE_LIST
             ]
+            + [
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=0,
+                )
+            ]
         )
 
     def test_enable_start(self):
@@ -546,6 +557,7 @@ class SetupSuccessMinimal(TestCase):
         )
 
     @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", lambda: 0)
     def test_enable_start_wait(self):
         (
             self.config.http.host.enable_cluster(NODE_LIST)
@@ -589,6 +601,12 @@ class SetupSuccessMinimal(TestCase):
                 )
                 for node in NODE_LIST
             ]
+            + [
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=0,
+                )
+            ]
         )
 
     def test_no_keys_sync(self):
@@ -606,6 +624,201 @@ class SetupSuccessMinimal(TestCase):
         )
 
 
+@mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
+@mock.patch(
+    "pcs.lib.commands.cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+class SetupSuccessNodeActions(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST)
+        patch_getaddrinfo(self, NODE_LIST)
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+            pcsd_capabilities=["pcs.node-actions"],
+        )
+        self.config.http.node_actions(
+            [
+                "http.host.cluster_destroy",
+                "http.host.update_known_hosts",
+                "http.files.remove_files",
+                "http.files.put_files",
+            ],
+            name="http.node_actions.prepare",
+        )
+
+    def test_minimal(self):
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+        )
+        self.env_assist.assert_reports(reports_success_minimal_fixture())
+
+    def test_enable(self):
+        self.config.http.host.enable_cluster(NODE_LIST)
+        self.config.http.node_actions(
+            ["distribute_corosync_conf", "http.host.enable_cluster"],
+            name="http.node_actions.commit",
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            enable=True,
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                )
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    def test_enable_failed(self):
+        self.config.http.host.enable_cluster(
+            communication_list=[
+                dict(label="node1"),
+                dict(
+                    label="node2",
+                    response_code=400,
+                    output="enable error",
+                ),
+                dict(label="node3"),
+            ]
+        )
+        self.config.http.node_actions(
+            ["distribute_corosync_conf", "http.host.enable_cluster"],
+            name="http.node_actions.commit",
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                COMMAND_NODE_LIST,
+                enable=True,
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                )
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in ["node1", "node3"]
+            ]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node="node2",
+                    command="remote/cluster_enable",
+                    reason="enable error",
+                )
+            ]
+        )
+
+    def test_prepare_failed(self):
+        self.config.calls.trim_before("http.node_actions.prepare_requests")
+        self.config.http.host.cluster_destroy(
+            communication_list=[
+                dict(label="node1"),
+                dict(
+                    label="node2",
+                    response_code=400,
+                    output="destroy error",
+                ),
+                dict(label="node3"),
+            ]
+        )
+        self.config.http.host.update_known_hosts(
+            node_labels=NODE_LIST, to_add_hosts=NODE_LIST
+        )
+        self.config.http.files.remove_files(
+            node_labels=NODE_LIST, pcsd_settings=True
+        )
+        self.config.http.files.put_files(
+            node_labels=NODE_LIST,
+            pcmk_authkey=RANDOM_KEY,
+            corosync_authkey=RANDOM_KEY,
+        )
+        self.config.http.node_actions(
+            [
+                "http.host.cluster_destroy",
+                "http.host.update_known_hosts",
+                "http.files.remove_files",
+                "http.files.put_files",
+            ],
+            name="http.node_actions.prepare",
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                COMMAND_NODE_LIST,
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            [
+                report
+                for report in reports_success_minimal_fixture()
+                if report[1]
+                not in (
+                    reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    reports.codes.CLUSTER_DESTROY_SUCCESS,
+                    reports.codes.CLUSTER_SETUP_SUCCESS,
+                )
+                and not (
+                    report[1] == reports.codes.FILES_DISTRIBUTION_STARTED
+                    and report[2]["file_list"] == ["corosync.conf"]
+                )
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_DESTROY_SUCCESS, node=node)
+                for node in ["node1", "node3"]
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    node=node,
+                    file_description="pcsd settings",
+                )
+                for node in ["node1", "node3"]
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    node=node,
+                    file_description=file,
+                )
+                for node in ["node1", "node3"]
+                for file in ["corosync authkey", "pacemaker authkey"]
+            ]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node="node2",
+                    command="remote/cluster_destroy",
+                    reason="destroy error",
+                )
+            ]
+        )
+
+
 @mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
 @mock.patch(
     "pcs.lib.commands.cluster.generate_binary_key",
@@ -2412,6 +2625,12 @@ class SetupWithWait(TestCase):
                 )
                 for node in NODE_LIST
             ]
+            + [
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=5,
+                )
+            ]
         )
 
     @mock.patch("time.sleep", lambda secs: None)
@@ -2577,6 +2796,140 @@ class SetupWithWait(TestCase):
 REASON = "error msg"
 
 
+@mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
+@mock.patch(
+    "pcs.lib.commands.cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+class SetupWithWaitOnNodes(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST)
+        patch_getaddrinfo(self, NODE_LIST)
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+            pcsd_capabilities=["status.pcmk.local-node.wait"],
+        )
+        self.config.http.host.start_cluster(NODE_LIST)
+
+    @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", get_time_mock())
+    def test_success(self):
+        (
+            self.config.http.host.check_pacemaker_started(
+                pacemaker_started_node_list=NODE_LIST[:1],
+                pacemaker_not_started_node_list=NODE_LIST[1:],
+                wait=4,
+            ).http.host.check_pacemaker_started(
+                pacemaker_started_node_list=NODE_LIST[1:],
+                wait=3,
+                name="pcmk_status_check_1",
+            )
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            start=True,
+            wait=5,
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_STARTED,
+                    node_name_list=NODE_LIST,
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=3,
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_START_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", get_time_mock())
+    def test_wait_limited(self):
+        self.config.http.host.check_pacemaker_started(
+            pacemaker_started_node_list=NODE_LIST, wait=15
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            start=True,
+            wait=60,
+        )
+        self.env_assist.assert_reports(self._fixture_reports(duration=2))
+
+    @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", get_time_mock())
+    def test_wait_limited_by_request_timeout(self):
+        self.config.http.host.check_pacemaker_started(
+            pacemaker_started_node_list=NODE_LIST, wait=5
+        )
+        env = self.env_assist.get_env()
+        env.communicator_factory.request_timeout = 10
+        cluster.setup(
+            env,
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            start=True,
+            wait=60,
+        )
+        self.env_assist.assert_reports(self._fixture_reports(duration=2))
+
+    @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", get_time_mock())
+    def test_no_wait_with_short_request_timeout(self):
+        self.config.http.host.check_pacemaker_started(
+            pacemaker_started_node_list=NODE_LIST
+        )
+        env = self.env_assist.get_env()
+        env.communicator_factory.request_timeout = 1
+        cluster.setup(
+            env,
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            start=True,
+            wait=60,
+        )
+        self.env_assist.assert_reports(self._fixture_reports(duration=2))
+
+    @staticmethod
+    def _fixture_reports(duration):
+        return (
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_STARTED,
+                    node_name_list=NODE_LIST,
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_FINISHED,
+                    duration=duration,
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_START_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+
 @mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
 @mock.patch(
     "pcs.lib.commands.cluster.generate_binary_key",
@@ -9,6 +9,10 @@ from pcs.common import (
     const,
     reports,
 )
+from pcs.common.pacemaker.resource.create import (
+    ResourceCreateCloneDto,
+    ResourceCreateDto,
+)
 from pcs.lib.commands import resource
 from pcs.lib.errors import LibraryError
 from pcs.lib.resource_agent import ResourceAgentName
@@ -3020,3 +3024,149 @@ class StonithIsForbiddenInGroup(StonithIsForbiddenMixin, TestCase):
         return create_group(
             self.env_assist.get_env(), wait=False, agent="stonith:fence_simple"
         )
+
+
+class CreateBulk(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.config.runner.pcmk.load_agent()
+        self.config.runner.cib.load()
+
+    def test_success(self):
+        self.config.runner.pcmk.resource_agent_self_validation(
+            {}, name="runner.pcmk.resource_agent_self_validation.A"
+        )
+        self.config.runner.pcmk.resource_agent_self_validation(
+            {"fake": "value"},
+            name="runner.pcmk.resource_agent_self_validation.B",
+        )
+        self.config.runner.pcmk.resource_agent_self_validation(
+            {}, name="runner.pcmk.resource_agent_self_validation.C"
+        )
+        self.config.env.push_cib(
+            resources="""
+                <resources>
+                    <group id="G">
+                        <primitive class="ocf" id="A" provider="heartbeat"
+                            type="Dummy"
+                        >
+                            <operations>
+                                <op id="A-monitor-interval-10" interval="10"
+                                    name="monitor" timeout="20"
+                                />
+                            </operations>
+                        </primitive>
+                        <primitive class="ocf" id="B" provider="heartbeat"
+                            type="Dummy"
+                        >
+                            <instance_attributes id="B-instance_attributes">
+                                <nvpair id="B-instance_attributes-fake"
+                                    name="fake" value="value"
+                                />
+                            </instance_attributes>
+                            <operations>
+                                <op id="B-monitor-interval-20" interval="20"
+                                    name="monitor"
+                                />
+                            </operations>
+                        </primitive>
+                    </group>
+                    <clone id="C-clone">
+                        <primitive class="ocf" id="C" provider="heartbeat"
+                            type="Dummy"
+                        >
+                            <meta_attributes id="C-meta_attributes">
+                                <nvpair id="C-meta_attributes-target-role"
+                                    name="target-role" value="Stopped"
+                                />
+                            </meta_attributes>
+                            <operations>
+                                <op id="C-monitor-interval-10" interval="10"
+                                    name="monitor" timeout="20"
+                                />
+                            </operations>
+                        </primitive>
+                        <meta_attributes id="C-clone-meta_attributes">
+                            <nvpair id="C-clone-meta_attributes-clone-max"
+                                name="clone-max" value="2"
+                            />
+                        </meta_attributes>
+                    </clone>
+                </resources>
+            """
+        )
+        resource.create_bulk(
+            self.env_assist.get_env(),
+            [
+                ResourceCreateDto("A", "ocf:heartbeat:Dummy", group_id="G"),
+                ResourceCreateDto(
+                    "B",
+                    "ocf:heartbeat:Dummy",
+                    instance_attributes={"fake": "value"},
+                    operations=[{"name": "monitor", "interval": "20"}],
+                    group_id="G",
+                ),
+                ResourceCreateDto(
+                    "C",
+                    "ocf:heartbeat:Dummy",
+                    meta_attributes={"target-role": "Stopped"},
+                    clone=ResourceCreateCloneDto(
+                        meta_attributes={"clone-max": "2"}
+                    ),
+                ),
+            ],
+            use_default_operations=False,
+        )
+
+    def test_no_resources(self):
+        self.config.remove("runner.pcmk.load_agent")
+        self.config.remove("runner.cib.load")
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.create_bulk(self.env_assist.get_env(), []),
+            [
+                fixture.error(
+                    reports.codes.REQUIRED_OPTIONS_ARE_MISSING,
+                    option_names=["resource_list"],
+                    option_type="resource",
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_errors_reported_together(self):
+        # definitions without errors are still validated by their agents
+        self.config.runner.pcmk.resource_agent_self_validation({})
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.create_bulk(
+                self.env_assist.get_env(),
+                [
+                    ResourceCreateDto("A", "ocf:heartbeat:Dummy"),
+                    ResourceCreateDto("A", "ocf:heartbeat:Dummy"),
+                    ResourceCreateDto(
+                        "B",
+                        "ocf:heartbeat:Dummy",
+                        group_id="G",
+                        clone=ResourceCreateCloneDto(),
+                    ),
+                    ResourceCreateDto("1C", "ocf:heartbeat:Dummy"),
+                ],
+                use_default_operations=False,
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="A"),
+                fixture.error(
+                    reports.codes.MUTUALLY_EXCLUSIVE_OPTIONS,
+                    option_names=["clone", "group_id"],
+                    option_type="resource",
+                ),
+                fixture.error(
+                    reports.codes.INVALID_ID_BAD_CHAR,
+                    id="1C",
+                    id_description="resource name",
+                    invalid_character="1",
+                    is_first_char=True,
+                ),
+            ]
+        )
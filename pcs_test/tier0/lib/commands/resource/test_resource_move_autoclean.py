@@ -189,17 +189,18 @@ class MoveAutocleanSuccess(MoveAutocleanCommonSetup):
         self.cib_diff_add_constraint_orig_tmp_file_name = (
             "cib_diff_add_constraint_orig"
         )
+        # diffs reuse temporary files of cibs read back from crm_resource
         self.cib_diff_add_constraint_updated_tmp_file_name = (
-            "cib_diff_add_constraint_updated"
+            self.cib_rsc_move_tmp_file_name
         )
         self.cib_constraint_removed_by_unmove_file_name = (
             "cib_constraint_removed_by_unmove"
         )
         self.cib_diff_remove_constraint_orig_tmp_file_name = (
-            "cib_diff_remove_constraint_orig"
+            self.cib_rsc_move_tmp_file_name
         )
         self.cib_diff_remove_constraint_updated_tmp_file_name = (
-            "cib_diff_remove_constraint_updated"
+            self.cib_constraint_removed_by_unmove_file_name
         )
         self.simulated_cib_add_constraint_tmp_file_name = (
             "pcmk_simulate_move_new_cib"
@@ -251,23 +252,11 @@ class MoveAutocleanSuccess(MoveAutocleanCommonSetup):
                 self.cib_diff_add_constraint_orig_tmp_file_name,
                 orig_content=self.orig_cib,
             ),
-            TmpFileCall(
-                self.cib_diff_add_constraint_updated_tmp_file_name,
-                orig_content=self.cib_with_constraint,
-            ),
             TmpFileCall(
                 self.cib_constraint_removed_by_unmove_file_name,
                 orig_content=self.cib_with_constraint,
                 new_content=self.cib_without_constraint,
             ),
-            TmpFileCall(
-                self.cib_diff_remove_constraint_orig_tmp_file_name,
-                orig_content=self.cib_with_constraint,
-            ),
-            TmpFileCall(
-                self.cib_diff_remove_constraint_updated_tmp_file_name,
-                orig_content=self.cib_without_constraint,
-            ),
             TmpFileCall(
                 self.simulated_cib_add_constraint_tmp_file_name,
                 new_content=self.cib_simulate_constraint,
@@ -834,17 +823,18 @@ class MoveAutocleanValidations(MoveAutocleanCommonSetup):
         cib_diff_add_constraint_orig_tmp_file_name = (
             "cib_diff_add_constraint_orig"
         )
+        # diffs reuse temporary files of cibs read back from crm_resource
         cib_diff_add_constraint_updated_tmp_file_name = (
-            "cib_diff_add_constraint_updated"
+            cib_rsc_move_tmp_file_name
+        )
+        cib_constraint_removed_by_unmove_file_name = (
+            "cib_constraint_removed_by_unmove"
         )
         cib_diff_remove_constraint_orig_tmp_file_name = (
-            "cib_diff_remove_constraint_orig"
+            cib_rsc_move_tmp_file_name
         )
         cib_diff_remove_constraint_updated_tmp_file_name = (
-            "cib_diff_remove_constraint_updated"
-        )
-        cib_constraint_removed_by_unmove_file_name = (
-            "cib_constraint_removed_by_unmove"
+            cib_constraint_removed_by_unmove_file_name
         )
         self.config.runner.cib.load(
             resources=_resources_tag(_rsc_primitive_fixture(resource_id)),
@@ -870,23 +860,11 @@ class MoveAutocleanValidations(MoveAutocleanCommonSetup):
                     cib_diff_add_constraint_orig_tmp_file_name,
                     orig_content=orig_cib,
                 ),
-                TmpFileCall(
-                    cib_diff_add_constraint_updated_tmp_file_name,
-                    orig_content=cib_with_constraint,
-                ),
                 TmpFileCall(
                     cib_constraint_removed_by_unmove_file_name,
                     orig_content=cib_with_constraint,
                     new_content=cib_without_constraint,
                 ),
-                TmpFileCall(
-                    cib_diff_remove_constraint_orig_tmp_file_name,
-                    orig_content=cib_with_constraint,
-                ),
-                TmpFileCall(
-                    cib_diff_remove_constraint_updated_tmp_file_name,
-                    orig_content=cib_without_constraint,
-                ),
             ]
         )
         self.config.runner.pcmk.load_state(
@@ -970,17 +948,18 @@ class MoveAutocleanFailures(MoveAutocleanCommonSetup):
         self.cib_diff_add_constraint_orig_tmp_file_name = (
             "cib_diff_add_constraint_orig"
         )
+        # diffs reuse temporary files of cibs read back from crm_resource
         self.cib_diff_add_constraint_updated_tmp_file_name = (
-            "cib_diff_add_constraint_updated"
+            self.cib_rsc_move_tmp_file_name
         )
         self.cib_constraint_removed_by_unmove_file_name = (
             "cib_constraint_removed_by_unmove"
         )
         self.cib_diff_remove_constraint_orig_tmp_file_name = (
-            "cib_diff_remove_constraint_orig"
+            self.cib_rsc_move_tmp_file_name
         )
         self.cib_diff_remove_constraint_updated_tmp_file_name = (
-            "cib_diff_remove_constraint_updated"
+            self.cib_constraint_removed_by_unmove_file_name
         )
         self.simulated_cib_add_constraint_tmp_file_name = (
             "pcmk_simulate_move_new_cib"
@@ -1051,23 +1030,11 @@ class MoveAutocleanFailures(MoveAutocleanCommonSetup):
                 self.cib_diff_add_constraint_orig_tmp_file_name,
                 orig_content=self.orig_cib,
             ),
-            TmpFileCall(
-                self.cib_diff_add_constraint_updated_tmp_file_name,
-                orig_content=self.cib_with_constraint,
-            ),
             TmpFileCall(
                 self.cib_constraint_removed_by_unmove_file_name,
                 orig_content=self.cib_with_constraint,
                 new_content=self.cib_without_constraint,
             ),
-            TmpFileCall(
-                self.cib_diff_remove_constraint_orig_tmp_file_name,
-                orig_content=self.cib_with_constraint,
-            ),
-            TmpFileCall(
-                self.cib_diff_remove_constraint_updated_tmp_file_name,
-                orig_content=self.cib_without_constraint,
-            ),
             TmpFileCall(
                 self.simulated_cib_add_constraint_tmp_file_name,
                 new_content=self.cib_simulate_constraint,
@@ -1,5 +1,9 @@
 # coding=utf-8
-from unittest import TestCase
+import threading
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from pcs.common import const
 from pcs.common.interface.dto import from_dict
@@ -16,7 +20,10 @@ from pcs.common.resource_agent.dto import (
     ResourceAgentParameterDto,
 )
 from pcs.lib.commands import resource_agent as lib
-from pcs.lib.resource_agent import ResourceAgentName
+from pcs.lib.resource_agent import (
+    ResourceAgentMetadataCache,
+    ResourceAgentName,
+)
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
@@ -248,8 +255,21 @@ class ListAgents(TestCase):
                 }
             ],
         }
+        callback_list = []
+        agent_list = lib.list_agents(
+            self.env_assist.get_env(),
+            True,
+            None,
+            agent_callback=lambda agent: callback_list.append(
+                (agent, threading.get_ident())
+            ),
+        )
         self.assertEqual(
-            lib.list_agents(self.env_assist.get_env(), True, None),
+            callback_list,
+            [(agent, threading.get_ident()) for agent in agent_list],
+        )
+        self.assertEqual(
+            agent_list,
             [
                 dict(
                     name="ocf:test:Delay",
@@ -1205,3 +1225,21 @@ class GetAgentDefaultOperations(TestCase):
 
     def test_stonith_only_necessary(self):
         self._test_stonith(True)
+
+
+class ClearMetadataCache(TestCase):
+    def test_clear(self):
+        cache = mock.Mock(spec_set=ResourceAgentMetadataCache)
+        self.assertIsNone(
+            lib.clear_metadata_cache(
+                mock.Mock(resource_agent_metadata_cache=cache)
+            )
+        )
+        cache.clear.assert_called_once_with()
+
+    def test_no_cache(self):
+        self.assertIsNone(
+            lib.clear_metadata_cache(
+                mock.Mock(resource_agent_metadata_cache=None)
+            )
+        )
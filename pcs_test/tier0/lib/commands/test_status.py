@@ -1,5 +1,7 @@
 # pylint: disable=too-many-lines
+import logging
 import os
+import threading
 from textwrap import dedent
 from typing import Optional
 from unittest import (
@@ -7,6 +9,8 @@ from unittest import (
     mock,
 )
 
+from lxml import etree
+
 from pcs import settings
 from pcs.common import file_type_codes
 from pcs.common.const import (
@@ -22,11 +26,18 @@ from pcs.common.status_dto import (
     GroupStatusDto,
     PrimitiveStatusDto,
     ResourcesStatusDto,
+    ResourcesStatusSnapshotDto,
 )
 from pcs.lib.booth import constants
 from pcs.lib.commands import status
+from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfigFacade
+from pcs.lib.corosync.config_parser import Parser as CorosyncParser
+from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.status_snapshot import ClusterStatusSnapshotService
 
+from pcs_test.tier0.lib.test_external import ThreadRecordingReportProcessor
 from pcs_test.tools import (
     fixture,
     fixture_crm_mon,
@@ -106,10 +117,9 @@ class FullClusterStatusPlaintextBase(TestCase):
 
     def _fixture_config_live_minimal(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load(
                 resources="""
@@ -118,17 +128,16 @@ class FullClusterStatusPlaintextBase(TestCase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
             )
         )
 
     def _fixture_config_live_remote_minimal(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=False
             )
-            .fs.exists(settings.corosync_conf_file, return_value=False)
             .runner.cib.load(
                 optional_in_conf=self._fixture_xml_clustername("test-cib"),
                 resources="""
@@ -137,8 +146,8 @@ class FullClusterStatusPlaintextBase(TestCase):
                 </resources>
             """,
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
             )
         )
 
@@ -156,57 +165,17 @@ class FullClusterStatusPlaintextBase(TestCase):
         sbd_active=False,
     ):
         # pylint: disable=too-many-arguments
-        (
-            self.config.services.is_enabled(
-                "corosync",
-                name="services.is_enabled.corosync",
-                return_value=corosync_enabled,
-            )
-            .services.is_running(
-                "corosync",
-                name="services.is_running.corosync",
-                return_value=corosync_active,
-            )
-            .services.is_enabled(
-                "pacemaker",
-                name="services.is_enabled.pacemaker",
-                return_value=pacemaker_enabled,
-            )
-            .services.is_running(
-                "pacemaker",
-                name="services.is_running.pacemaker",
-                return_value=pacemaker_active,
-            )
-            .services.is_enabled(
-                "pacemaker_remote",
-                name="services.is_enabled.pacemaker_remote",
-                return_value=pacemaker_remote_enabled,
-            )
-            .services.is_running(
-                "pacemaker_remote",
-                name="services.is_running.pacemaker_remote",
-                return_value=pacemaker_remote_active,
-            )
-            .services.is_enabled(
-                "pcsd",
-                name="services.is_enabled.pcsd",
-                return_value=pcsd_enabled,
-            )
-            .services.is_running(
-                "pcsd",
-                name="services.is_running.pcsd",
-                return_value=pcsd_active,
-            )
-            .services.is_enabled(
-                "sbd",
-                name="services.is_enabled.sbd_2",
-                return_value=sbd_enabled,
-            )
-            .services.is_running(
-                "sbd",
-                name="services.is_running.sbd_2",
-                return_value=sbd_active,
-            )
+        self.config.services.get_states(
+            {
+                "corosync": (corosync_enabled, corosync_active),
+                "pacemaker": (pacemaker_enabled, pacemaker_active),
+                "pacemaker_remote": (
+                    pacemaker_remote_enabled,
+                    pacemaker_remote_active,
+                ),
+                "pcsd": (pcsd_enabled, pcsd_active),
+                "sbd": (sbd_enabled, sbd_active),
+            }
         )
 
 
@@ -248,7 +217,12 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_fail_getting_cluster_status(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            )
+            .corosync_conf.load()
+            .runner.cib.load()
+            .runner.pcmk.load_state_plaintext(
                 stdout="some stdout",
                 stderr="some stderr",
                 returncode=1,
@@ -269,11 +243,9 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_fail_getting_corosync_conf(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
-            )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
-            .corosync_conf.load_content("invalid corosync conf")
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            ).corosync_conf.load_content("invalid corosync conf")
         )
         self.env_assist.assert_raise_library_error(
             lambda: status.full_cluster_status_plaintext(
@@ -290,10 +262,9 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_fail_getting_cib(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load_content(
                 "some stdout", stderr="cib load error", returncode=1
@@ -333,11 +304,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
     def test_success_live_verbose(self):
         (
             self.config.env.set_known_nodes(self.node_name_list)
-            .runner.pcmk.can_fence_history_status(stderr="not supported")
-            .runner.pcmk.load_state_plaintext(
-                verbose=True,
-                stdout="crm_mon cluster status",
-            )
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load(node_name_list=self.node_name_list)
             .runner.cib.load(
@@ -347,10 +313,12 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.can_fence_history_status(stderr="not supported")
+            .runner.pcmk.load_state_plaintext(
+                verbose=True,
+                stdout="crm_mon cluster status",
             )
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
         )
         self._fixture_config_local_daemons()
         (
@@ -412,14 +380,9 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_success_live_remote_node_verbose(self):
         (
-            self.config.runner.pcmk.can_fence_history_status(
-                stderr="not supported"
-            )
-            .runner.pcmk.load_state_plaintext(
-                verbose=True,
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=False
             )
-            .fs.exists(settings.corosync_conf_file, return_value=False)
             .runner.cib.load(
                 optional_in_conf=self._fixture_xml_clustername("test-cib"),
                 resources="""
@@ -428,10 +391,12 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """,
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.can_fence_history_status(stderr="not supported")
+            .runner.pcmk.load_state_plaintext(
+                verbose=True,
+                stdout="crm_mon cluster status",
             )
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
         )
         self._fixture_config_local_daemons(
             corosync_enabled=False,
@@ -469,10 +434,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         (
             self.config.env.set_corosync_conf_data(rc_read("corosync.conf"))
             .env.set_cib_data("<cib/>", cib_tempfile=tmp_file)
-            .runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
-                env=env,
-            )
             .runner.cib.load(
                 resources="""
                 <resources>
@@ -481,6 +442,10 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             """,
                 env=env,
             )
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
+                env=env,
+            )
             .fs.isfile(settings.crm_rule_exec, return_value=True)
         )
         self.assertEqual(
@@ -498,6 +463,14 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         (
             self.config.env.set_corosync_conf_data(rc_read("corosync.conf"))
             .env.set_cib_data("<cib/>", cib_tempfile=tmp_file)
+            .runner.cib.load(
+                resources="""
+                <resources>
+                    <primitive id="S" class="stonith" type="fence_dummy" />
+                </resources>
+            """,
+                env=env,
+            )
             .runner.pcmk.can_fence_history_status(
                 stderr="not supported",
                 env=env,
@@ -507,14 +480,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 stdout="crm_mon cluster status",
                 env=env,
             )
-            .runner.cib.load(
-                resources="""
-                <resources>
-                    <primitive id="S" class="stonith" type="fence_dummy" />
-                </resources>
-            """,
-                env=env,
-            )
             .runner.pcmk.load_ticket_state_plaintext(
                 stdout="ticket status", env=env
             )
@@ -537,13 +502,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
     def test_success_verbose_inactive_and_fence_history(self):
         (
             self.config.env.set_known_nodes(self.node_name_list)
-            .runner.pcmk.can_fence_history_status()
-            .runner.pcmk.load_state_plaintext(
-                verbose=True,
-                inactive=False,
-                fence_history=True,
-                stdout="crm_mon cluster status",
-            )
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load(node_name_list=self.node_name_list)
             .runner.cib.load(
@@ -553,10 +511,14 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.can_fence_history_status()
+            .runner.pcmk.load_state_plaintext(
+                verbose=True,
+                inactive=False,
+                fence_history=True,
+                stdout="crm_mon cluster status",
             )
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
         )
         self._fixture_config_local_daemons()
         (
@@ -595,11 +557,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
     def _assert_success_with_ticket_status_failure(self, stderr="", msg=""):
         (
             self.config.env.set_known_nodes(self.node_name_list)
-            .runner.pcmk.can_fence_history_status(stderr="not supported")
-            .runner.pcmk.load_state_plaintext(
-                verbose=True,
-                stdout="crm_mon cluster status",
-            )
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load(node_name_list=self.node_name_list)
             .runner.cib.load(
@@ -609,12 +566,14 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
+            .runner.pcmk.can_fence_history_status(stderr="not supported")
+            .runner.pcmk.load_state_plaintext(
+                verbose=True,
+                stdout="crm_mon cluster status",
+            )
             .runner.pcmk.load_ticket_state_plaintext(
                 stdout="ticket stdout", stderr=stderr, returncode=1
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
@@ -659,14 +618,13 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_stonith_warning_no_devices(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
             )
         )
         self._fixture_config_local_daemons()
@@ -692,17 +650,16 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_stonith_warning_no_devices_sbd_enabled(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=True, name="services.is_running.sbd"
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
             )
         )
-        self._fixture_config_local_daemons()
+        self._fixture_config_local_daemons(sbd_active=True)
         self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
 
         self.assertEqual(
@@ -715,16 +672,16 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 Daemon Status:
                   corosync: active/enabled
                   pacemaker: active/enabled
-                  pcsd: active/enabled"""
+                  pcsd: active/enabled
+                  sbd: active/disabled"""
             ),
         )
 
     def test_stonith_warnings_regarding_devices_configuration(self):
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load(
                 resources="""
@@ -749,8 +706,8 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.load_state_plaintext(
+                stdout="crm_mon cluster status",
             )
         )
         self._fixture_config_local_daemons()
@@ -780,11 +737,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
         (
             self.config.env.set_known_nodes(self.node_name_list[1:])
-            .runner.pcmk.can_fence_history_status(stderr="not supported")
-            .runner.pcmk.load_state_plaintext(
-                verbose=True,
-                stdout="crm_mon cluster status",
-            )
             .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load(node_name_list=self.node_name_list)
             .runner.cib.load(
@@ -794,10 +746,12 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
+            .runner.pcmk.can_fence_history_status(stderr="not supported")
+            .runner.pcmk.load_state_plaintext(
+                verbose=True,
+                stdout="crm_mon cluster status",
             )
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
         )
         self._fixture_config_local_daemons()
         (
@@ -914,10 +868,59 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             ),
         )
 
-    def test_move_constrains_warnings(self):
-        self.config.runner.pcmk.load_state_plaintext(
-            stdout="crm_mon cluster status",
+    def test_daemon_status_one_by_one(self):
+        self._fixture_config_live_minimal()
+        self.config.services.get_states(
+            {
+                service: (False, False)
+                for service in [
+                    "corosync",
+                    "pacemaker",
+                    "pacemaker_remote",
+                    "pcsd",
+                    "sbd",
+                ]
+            },
+            exception=LibraryError(),
+        )
+        (
+            self.config.services.is_enabled(
+                "corosync", name="is_enabled.corosync", exception=LibraryError()
+            )
+            .services.is_enabled("pacemaker", name="is_enabled.pacemaker")
+            .services.is_running("pacemaker", name="is_running.pacemaker")
+            .services.is_enabled(
+                "pacemaker_remote",
+                return_value=False,
+                name="is_enabled.pacemaker_remote",
+            )
+            .services.is_running(
+                "pacemaker_remote",
+                return_value=False,
+                name="is_running.pacemaker_remote",
+            )
+            .services.is_enabled("pcsd", name="is_enabled.pcsd")
+            .services.is_running(
+                "pcsd", name="is_running.pcsd", exception=LibraryError()
+            )
+            .services.is_enabled("sbd", name="is_enabled.sbd")
+            .services.is_running("sbd", name="is_running.sbd")
+        )
+        self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
+        self.assertEqual(
+            status.full_cluster_status_plaintext(self.env_assist.get_env()),
+            dedent(
+                """\
+                Cluster name: test99
+                crm_mon cluster status
+
+                Daemon Status:
+                  pacemaker: active/enabled
+                  sbd: active/enabled"""
+            ),
         )
+
+    def test_move_constrains_warnings(self):
         self.config.fs.exists(settings.corosync_conf_file, return_value=True)
         self.config.corosync_conf.load()
         self.config.runner.cib.load(
@@ -946,8 +949,8 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             </resources>
         """,
         )
-        self.config.services.is_running(
-            "sbd", return_value=True, name="services.is_running.sbd"
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
         )
         self._fixture_config_local_daemons(sbd_enabled=True, sbd_active=True)
         self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
@@ -973,9 +976,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_expired_move_constraints_warnings(self):
-        self.config.runner.pcmk.load_state_plaintext(
-            stdout="crm_mon cluster status",
-        )
         self.config.fs.exists(settings.corosync_conf_file, return_value=True)
         self.config.corosync_conf.load()
         self.config.runner.cib.load(
@@ -1005,8 +1005,8 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             </resources>
         """,
         )
-        self.config.services.is_running(
-            "sbd", return_value=True, name="services.is_running.sbd"
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
         )
         self._fixture_config_local_daemons(sbd_enabled=True, sbd_active=True)
         self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
@@ -1035,9 +1035,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_expired_and_in_effect_move_constraints_warnings(self):
-        self.config.runner.pcmk.load_state_plaintext(
-            stdout="crm_mon cluster status",
-        )
         self.config.fs.exists(settings.corosync_conf_file, return_value=True)
         self.config.corosync_conf.load()
         self.config.runner.cib.load(
@@ -1074,8 +1071,8 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             </resources>
         """,
         )
-        self.config.services.is_running(
-            "sbd", return_value=True, name="services.is_running.sbd"
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
         )
         self._fixture_config_local_daemons(sbd_enabled=True, sbd_active=True)
         self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
@@ -1111,6 +1108,102 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
 
+@mock.patch("pcs.settings.booth_enable_authfile_set_enabled", False)
+@mock.patch("pcs.settings.booth_enable_authfile_unset_enabled", False)
+@mock.patch.object(settings, "status_probe_concurrency", 2)
+@mock.patch(
+    "pcs.lib.cib.rule.in_effect.has_rule_in_effect_status_tool",
+    lambda: False,
+)
+@mock.patch("subprocess.Popen", autospec=True)
+class FullClusterStatusPlaintextConcurrently(TestCase):
+    def setUp(self):
+        self.thread_ident = threading.get_ident()
+        self.cib_loaded = threading.Event()
+        self.env_thread_idents = set()
+        self.popen_call_list = []
+        self.report_processor = ThreadRecordingReportProcessor()
+
+        def record_env_call(return_value, event=None):
+            def call(*args):
+                del args
+                self.env_thread_idents.add(threading.get_ident())
+                if event:
+                    event.set()
+                return return_value
+
+            return call
+
+        self.env = mock.Mock(spec_set=LibraryEnvironment)
+        self.env.is_cib_live = False
+        self.env.is_corosync_conf_live = False
+        self.env.pcmk_capability_cache = None
+        self.env.report_processor = self.report_processor
+        self.env.cmd_runner.return_value = CommandRunner(
+            mock.Mock(logging.Logger), self.report_processor, {}
+        )
+        self.env.get_corosync_conf.side_effect = record_env_call(
+            CorosyncConfigFacade(
+                CorosyncParser.parse(rc_read("corosync.conf").encode("utf-8"))
+            )
+        )
+        self.env.get_cib.side_effect = record_env_call(
+            etree.fromstring(rc_read("cib-empty.xml")), self.cib_loaded
+        )
+        self.env.get_booth_env.side_effect = record_env_call(mock.Mock())
+
+    def _fixture_popen(self, mock_popen):
+        def popen(args, **kwargs):
+            del kwargs
+            # crm_mon finishes only if the CIB is loaded meanwhile
+            self.popen_call_list.append(
+                (threading.get_ident(), self.cib_loaded.wait(5))
+            )
+            process = mock.MagicMock(spec_set=["communicate", "returncode"])
+            process.communicate.return_value = (
+                f"{os.path.basename(args[0])} cluster status",
+                "",
+            )
+            process.returncode = 0
+            return process
+
+        mock_popen.side_effect = popen
+
+    def test_status_loaded_while_env_is_accessed(self, mock_popen):
+        self._fixture_popen(mock_popen)
+        self.assertEqual(
+            status.full_cluster_status_plaintext(self.env),
+            dedent(
+                """\
+                Cluster name: test99
+
+                WARNINGS:
+                No stonith devices and stonith-enabled is not false
+
+                crm_mon cluster status"""
+            ),
+        )
+        self.assertEqual(len(self.popen_call_list), 1)
+        popen_thread_ident, cib_loaded_while_running = self.popen_call_list[0]
+        self.assertNotEqual(popen_thread_ident, self.thread_ident)
+        self.assertTrue(cib_loaded_while_running)
+        self.assertEqual(self.env_thread_idents, {self.thread_ident})
+        self.assertEqual(
+            self.report_processor.thread_idents, {self.thread_ident}
+        )
+        self.assertEqual(
+            [
+                report_item.message.code
+                for report_item in self.report_processor.report_item_list
+            ],
+            [
+                report_codes.RUN_EXTERNAL_PROCESS_STARTED,
+                report_codes.RUN_EXTERNAL_PROCESS_FINISHED,
+                report_codes.RULE_IN_EFFECT_STATUS_DETECTION_NOT_SUPPORTED,
+            ],
+        )
+
+
 class FullClusterStatusPlaintextBoothWarning(FullClusterStatusPlaintextBase):
     def setUp(self):
         super().setUp()
@@ -1313,6 +1406,20 @@ class ResourcesStatus(TestCase):
         result = status.resources_status(self.env_assist.get_env())
         self.assertEqual(result, ResourcesStatusDto([]))
 
+    def test_shared_snapshot_not_used(self):
+        self.config.runner.pcmk.load_state()
+        snapshot_service = mock.Mock(spec_set=ClusterStatusSnapshotService)
+
+        with mock.patch.object(
+            LibraryEnvironment,
+            "cluster_status_snapshot",
+            new_callable=mock.PropertyMock,
+            return_value=snapshot_service,
+        ):
+            result = status.resources_status(self.env_assist.get_env())
+        self.assertEqual(result, ResourcesStatusDto([]))
+        snapshot_service.get_resources_status.assert_not_called()
+
     def test_bad_xml_format(self):
         self.config.runner.pcmk.load_state(
             resources="""
@@ -1543,3 +1650,47 @@ class ResourcesStatus(TestCase):
                 )
             ]
         )
+
+
+@mock.patch.object(
+    settings,
+    "pacemaker_api_result_schema",
+    rc("pcmk_api_rng/api-result.rng"),
+)
+@mock.patch("pcs.lib.pacemaker.status_snapshot.time.time", lambda: 100)
+class ResourcesStatusSnapshot(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def test_success(self):
+        self.config.runner.pcmk.load_state()
+
+        result = status.resources_status_snapshot(
+            self.env_assist.get_env(), max_age_ms=0
+        )
+        self.assertEqual(
+            result,
+            ResourcesStatusSnapshotDto(
+                generation=1,
+                age_ms=0,
+                resources_status=ResourcesStatusDto([]),
+            ),
+        )
+
+    def test_invalid_max_age(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: status.resources_status_snapshot(
+                self.env_assist.get_env(), max_age_ms=-1
+            ),
+            [
+                fixture.error(
+                    report_codes.INVALID_OPTION_VALUE,
+                    option_name="max_age_ms",
+                    option_value="-1",
+                    allowed_values="a non-negative integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                )
+            ],
+            expected_in_processor=False,
+        )
@@ -1,4 +1,7 @@
-from unittest import TestCase
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from pcs.common.reports import codes as report_codes
 from pcs.lib.commands import stonith_agent as lib
@@ -108,6 +111,19 @@ class ListAgents(TestCase):
             ],
         )
 
+    def test_agent_callback(self):
+        agent_callback = mock.Mock()
+        lib.list_agents(
+            self.env_assist.get_env(), False, "M", agent_callback=agent_callback
+        )
+        agent_callback.assert_has_calls(
+            [
+                mock.call(self._fixture_agent_struct("fence_dummy")),
+                mock.call(self._fixture_agent_struct("fence_xvm")),
+            ]
+        )
+        self.assertEqual(agent_callback.call_count, 2)
+
     def test_describe(self):
         self.config.runner.pcmk.load_agent(
             agent_name="stonith:fence_apc",
@@ -31,3 +31,11 @@ class RemoveNodesFromCib(TestCase):
             RemoveNodesSuccessMinimal
         }
     """
+
+
+class RunNodeActions(TestCase):
+    """
+    tested in:
+        pcs_test.tier0.lib.commands.cluster.test_add_nodes.AddNodesSuccessMinimal
+        pcs_test.tier0.lib.commands.cluster.test_setup.SetupSuccessNodeActions
+    """
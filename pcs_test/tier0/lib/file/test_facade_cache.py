@@ -0,0 +1,119 @@
+import logging
+import os
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.common.file import RawFileError
+from pcs.lib.auth.config.facade import Facade
+from pcs.lib.file.facade_cache import (
+    FacadeCacheStats,
+    FileFacadeCache,
+    get_file_signature,
+)
+from pcs.lib.file.instance import FileInstance
+
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
+
+class GetFileSignature(TestCase):
+    def test_missing_file(self):
+        self.assertIsNone(get_file_signature("/non/existing/file"))
+
+    def test_file_changed(self):
+        with get_tmp_file("facade_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            signature = get_file_signature(tmp_file.name)
+            self.assertEqual(signature, get_file_signature(tmp_file.name))
+            write_data_to_tmpfile("other data", tmp_file)
+            self.assertNotEqual(signature, get_file_signature(tmp_file.name))
+
+    def test_file_touched(self):
+        with get_tmp_file("facade_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            signature = get_file_signature(tmp_file.name)
+            os.utime(tmp_file.name, ns=(0, signature.mtime_ns + 1))
+            self.assertNotEqual(signature, get_file_signature(tmp_file.name))
+
+
+class FileFacadeCacheTest(TestCase):
+    def setUp(self):
+        self.cache = FileFacadeCache()
+        self.facade = Facade([])
+        with get_tmp_file("facade_cache") as tmp_file:
+            write_data_to_tmpfile("data", tmp_file)
+            self.signature = get_file_signature(tmp_file.name)
+            write_data_to_tmpfile("other data", tmp_file)
+            self.other_signature = get_file_signature(tmp_file.name)
+
+    def test_empty(self):
+        self.assertIsNone(self.cache.get(self.signature))
+        self.assertEqual(FacadeCacheStats(hits=0, misses=1), self.cache.stats)
+
+    def test_hit(self):
+        self.cache.set(self.signature, self.facade)
+        self.assertIs(self.facade, self.cache.get(self.signature))
+        self.assertEqual(FacadeCacheStats(hits=1, misses=0), self.cache.stats)
+
+    def test_file_changed(self):
+        self.cache.set(self.signature, self.facade)
+        self.assertIsNone(self.cache.get(self.other_signature))
+        self.assertEqual(FacadeCacheStats(hits=0, misses=1), self.cache.stats)
+
+    def test_no_signature(self):
+        self.cache.set(None, self.facade)
+        self.assertIsNone(self.cache.get(None))
+        self.assertEqual(FacadeCacheStats(hits=0, misses=1), self.cache.stats)
+
+    def test_clear(self):
+        self.cache.set(self.signature, self.facade)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.signature))
+
+
+class FileFacadeCacheReadFacade(TestCase):
+    def setUp(self):
+        self.cache = FileFacadeCache()
+        self.logger = mock.Mock(spec_set=logging.Logger)
+        self.tmp_file = get_tmp_file("facade_cache")
+        self.addCleanup(self.tmp_file.close)
+        write_data_to_tmpfile("data", self.tmp_file)
+        self.file_instance = mock.Mock(spec_set=FileInstance)
+        self.file_instance.raw_file.metadata.path = self.tmp_file.name
+        self.file_instance.read_to_facade.side_effect = lambda: Facade([])
+
+    def test_read_once(self):
+        facade = self.cache.read_facade(self.file_instance, self.logger)
+        self.assertIs(
+            facade, self.cache.read_facade(self.file_instance, self.logger)
+        )
+        self.file_instance.read_to_facade.assert_called_once_with()
+        self.logger.debug.assert_called_once_with(
+            "File '%s' loaded, cache hits: %s, misses: %s",
+            self.tmp_file.name,
+            0,
+            1,
+        )
+
+    def test_file_changed(self):
+        facade = self.cache.read_facade(self.file_instance, self.logger)
+        write_data_to_tmpfile("other data", self.tmp_file)
+        self.assertIsNot(
+            facade, self.cache.read_facade(self.file_instance, self.logger)
+        )
+        self.assertEqual(self.file_instance.read_to_facade.call_count, 2)
+
+    def test_read_error(self):
+        self.file_instance.read_to_facade.side_effect = RawFileError(
+            mock.Mock(), RawFileError.ACTION_READ, "reason"
+        )
+        with self.assertRaises(RawFileError):
+            self.cache.read_facade(self.file_instance, self.logger)
+        self.assertIsNone(
+            self.cache.get(get_file_signature(self.tmp_file.name))
+        )
+        self.logger.debug.assert_not_called()
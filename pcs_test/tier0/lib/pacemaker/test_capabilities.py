@@ -0,0 +1,168 @@
+import json
+import os
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.lib.pacemaker import capabilities as lib
+
+from pcs_test.tools.misc import (
+    get_tmp_dir,
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
+CRM_MON_HELP = "--fence-history"
+CRM_RESOURCE_HELP = "--digests"
+STONITH_ADMIN_HELP = "--history --broadcast --cleanup"
+
+
+class PcmkCapabilityCacheTest(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.crm_mon = get_tmp_file("capabilities_crm_mon")
+        self.crm_resource = get_tmp_file("capabilities_crm_resource")
+        self.stonith_admin = get_tmp_file("capabilities_stonith_admin")
+        self.help_texts = {}
+        for tool, help_text in (
+            (self.crm_mon, CRM_MON_HELP),
+            (self.crm_resource, CRM_RESOURCE_HELP),
+            (self.stonith_admin, STONITH_ADMIN_HELP),
+        ):
+            write_data_to_tmpfile("binary", tool)
+            self.help_texts[tool.name] = help_text
+        settings_patcher = mock.patch.multiple(
+            "pcs.lib.pacemaker.capabilities.settings",
+            crm_mon_exec=self.crm_mon.name,
+            crm_resource_exec=self.crm_resource.name,
+            stonith_admin_exec=self.stonith_admin.name,
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+        self.runner = mock.Mock(spec_set=["run"])
+        self.runner.run.side_effect = lambda cmd: (
+            "",
+            self.help_texts[cmd[0]],
+            0,
+        )
+
+    def tearDown(self):
+        self.crm_mon.close()
+        self.crm_resource.close()
+        self.stonith_admin.close()
+
+    def _probed_tools(self):
+        return [call.args[0][0] for call in self.runner.run.call_args_list]
+
+    def test_single_probe_pass(self):
+        cache = lib.PcmkCapabilityCache()
+        self.assertTrue(
+            cache.is_supported(self.runner, lib.CAPABILITY_CRM_RESOURCE_DIGESTS)
+        )
+        self.assertEqual(
+            sorted(self._probed_tools()),
+            sorted(
+                [
+                    self.crm_mon.name,
+                    self.crm_resource.name,
+                    self.stonith_admin.name,
+                ]
+            ),
+        )
+        self.runner.run.reset_mock()
+        self.assertFalse(
+            cache.is_supported(self.runner, lib.CAPABILITY_CRM_RESOURCE_EXPIRED)
+        )
+        self.assertTrue(
+            cache.is_supported(
+                self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+            )
+        )
+        self.assertTrue(
+            cache.is_supported(
+                self.runner, lib.CAPABILITY_STONITH_ADMIN_FENCE_HISTORY
+            )
+        )
+        self.runner.run.assert_not_called()
+
+    def test_tool_changed(self):
+        cache = lib.PcmkCapabilityCache()
+        self.assertFalse(
+            cache.is_supported(self.runner, lib.CAPABILITY_CRM_RESOURCE_EXPIRED)
+        )
+        self.runner.run.reset_mock()
+        write_data_to_tmpfile("upgraded binary", self.crm_resource)
+        self.help_texts[self.crm_resource.name] = "--digests --expired"
+        self.assertTrue(
+            cache.is_supported(self.runner, lib.CAPABILITY_CRM_RESOURCE_EXPIRED)
+        )
+        self.assertEqual(self._probed_tools(), [self.crm_resource.name])
+
+    def test_tool_missing(self):
+        self.help_texts["/non/existing/crm_mon"] = CRM_MON_HELP
+        with mock.patch(
+            "pcs.lib.pacemaker.capabilities.settings.crm_mon_exec",
+            "/non/existing/crm_mon",
+        ):
+            cache = lib.PcmkCapabilityCache()
+            for _ in range(2):
+                self.assertTrue(
+                    cache.is_supported(
+                        self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+                    )
+                )
+        self.assertEqual(self._probed_tools().count("/non/existing/crm_mon"), 2)
+
+    def test_persisted(self):
+        with get_tmp_dir("capabilities_cache") as cache_dir:
+            cache_file = os.path.join(cache_dir, "cache.json")
+            self.assertTrue(
+                lib.PcmkCapabilityCache(cache_file).is_supported(
+                    self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+                )
+            )
+            self.runner.run.reset_mock()
+            self.assertTrue(
+                lib.PcmkCapabilityCache(cache_file).is_supported(
+                    self.runner, lib.CAPABILITY_STONITH_ADMIN_FENCE_HISTORY
+                )
+            )
+            self.runner.run.assert_not_called()
+
+    def test_persisted_broken_file(self):
+        with get_tmp_file("capabilities_cache") as cache_file:
+            write_data_to_tmpfile("not a json", cache_file)
+            cache = lib.PcmkCapabilityCache(cache_file.name)
+            self.assertTrue(
+                cache.is_supported(
+                    self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+                )
+            )
+            self.assertEqual(self.runner.run.call_count, 3)
+            with open(cache_file.name, encoding="utf-8") as saved_file:
+                self.assertEqual(
+                    sorted(json.load(saved_file)["tools"]),
+                    sorted(
+                        [
+                            self.crm_mon.name,
+                            self.crm_resource.name,
+                            self.stonith_admin.name,
+                        ]
+                    ),
+                )
+
+    def test_persisted_other_pcs_version(self):
+        with get_tmp_dir("capabilities_cache") as cache_dir:
+            cache_file = os.path.join(cache_dir, "cache.json")
+            lib.PcmkCapabilityCache(cache_file).is_supported(
+                self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+            )
+            self.runner.run.reset_mock()
+            with mock.patch(
+                "pcs.lib.pacemaker.capabilities.settings.pcs_version", "0.0"
+            ):
+                lib.PcmkCapabilityCache(cache_file).is_supported(
+                    self.runner, lib.CAPABILITY_CRM_MON_FENCE_HISTORY
+                )
+            self.assertEqual(self.runner.run.call_count, 3)
@@ -0,0 +1,229 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.pacemaker import cib_diff as lib
+
+from pcs_test.tools.assertions import assert_xml_equal
+
+FIXTURE_CIB = """
+    <cib epoch="10" num_updates="2" admin_epoch="0">
+        <configuration>
+            <crm_config/>
+            <resources>
+                <primitive id="A" class="ocf" type="Dummy"/>
+                <primitive id="B" class="ocf" type="Dummy">
+                    <meta_attributes id="B-meta">
+                        <nvpair id="B-meta-a" name="a" value="1"/>
+                    </meta_attributes>
+                </primitive>
+                <primitive id="C" class="ocf" type="Dummy"/>
+            </resources>
+            <constraints/>
+        </configuration>
+        <status/>
+    </cib>
+"""
+
+
+class DiffCibsXml(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(FIXTURE_CIB)
+
+    def assert_diff(self, expected_changes):
+        assert_xml_equal(
+            f'<diff format="2">{expected_changes}</diff>',
+            lib.diff_cibs_xml(FIXTURE_CIB, self.cib),
+        )
+
+    def test_no_changes(self):
+        self.assertEqual("", lib.diff_cibs_xml(FIXTURE_CIB, self.cib))
+
+    def test_version_changes_ignored(self):
+        self.cib.set("epoch", "11")
+        self.cib.set("num_updates", "0")
+        self.assertEqual("", lib.diff_cibs_xml(FIXTURE_CIB, self.cib))
+
+    def test_attributes_changed(self):
+        primitive = self.cib.find(".//primitive[@id='B']")
+        primitive.set("type", "Stateful")
+        primitive.set("provider", "pacemaker")
+        del primitive.attrib["class"]
+        self.assert_diff(
+            """
+            <change operation="modify"
+                path="/cib/configuration/resources/primitive[@id='B']"
+            >
+                <change-list>
+                    <change-attr name="type" operation="set"
+                        value="Stateful"
+                    />
+                    <change-attr name="provider" operation="set"
+                        value="pacemaker"
+                    />
+                    <change-attr name="class" operation="unset"/>
+                </change-list>
+                <change-result>
+                    <primitive id="B" type="Stateful" provider="pacemaker"/>
+                </change-result>
+            </change>
+            """
+        )
+
+    def test_element_created(self):
+        etree.SubElement(
+            self.cib.find(".//constraints"),
+            "rsc_order",
+            {"id": "o", "first": "A", "then": "B"},
+        )
+        self.cib.find(".//resources").insert(
+            1, etree.fromstring('<group id="G"><primitive id="D"/></group>')
+        )
+        self.assert_diff(
+            """
+            <change operation="create" path="/cib/configuration/resources"
+                position="1"
+            >
+                <group id="G"><primitive id="D"/></group>
+            </change>
+            <change operation="create" path="/cib/configuration/constraints"
+                position="0"
+            >
+                <rsc_order id="o" first="A" then="B"/>
+            </change>
+            """
+        )
+
+    def test_element_deleted(self):
+        nvpair = self.cib.find(".//nvpair")
+        nvpair.getparent().remove(nvpair)
+        resources = self.cib.find(".//resources")
+        resources.remove(resources.find("./primitive[@id='A']"))
+        self.assert_diff(
+            """
+            <change operation="delete"
+                path="/cib/configuration/resources/primitive[@id='A']"
+            />
+            <change operation="delete"
+                path="/cib/configuration/resources/primitive[@id='B']/meta_attributes[@id='B-meta']/nvpair[@id='B-meta-a']"
+            />
+            """
+        )
+
+    def test_element_moved(self):
+        resources = self.cib.find(".//resources")
+        resources.append(resources.find("./primitive[@id='A']"))
+        self.assert_diff(
+            """
+            <change operation="move"
+                path="/cib/configuration/resources/primitive[@id='B']"
+                position="0"
+            />
+            <change operation="move"
+                path="/cib/configuration/resources/primitive[@id='A']"
+                position="2"
+            />
+            """
+        )
+
+    def test_element_moved_back(self):
+        resources = self.cib.find(".//resources")
+        resources.insert(0, resources.find("./primitive[@id='C']"))
+        self.assert_diff(
+            """
+            <change operation="move"
+                path="/cib/configuration/resources/primitive[@id='C']"
+                position="0"
+            />
+            <change operation="move"
+                path="/cib/configuration/resources/primitive[@id='A']"
+                position="1"
+            />
+            """
+        )
+
+    def test_element_without_id(self):
+        self.cib.find("./configuration/crm_config").set("x", "y")
+        self.assert_diff(
+            """
+            <change operation="modify" path="/cib/configuration/crm_config">
+                <change-list>
+                    <change-attr name="x" operation="set" value="y"/>
+                </change-list>
+                <change-result>
+                    <crm_config x="y"/>
+                </change-result>
+            </change>
+            """
+        )
+
+
+class DiffCibsNotSupported(TestCase):
+    def assert_not_supported(self, cib_old, cib_new):
+        with self.assertRaises(lib.CibDiffNotSupported):
+            lib.diff_cibs(etree.fromstring(cib_old), etree.fromstring(cib_new))
+
+    def test_different_root(self):
+        self.assert_not_supported("<cib/>", "<diff/>")
+
+    def test_comment(self):
+        self.assert_not_supported("<cib><!-- comment --></cib>", "<cib/>")
+
+    def test_text(self):
+        self.assert_not_supported("<cib>text</cib>", "<cib/>")
+
+    def test_elements_without_id(self):
+        self.assert_not_supported("<cib><a/><a/></cib>", "<cib><a/></cib>")
+
+    def test_elements_with_and_without_id(self):
+        self.assert_not_supported("<cib><a id='a'/></cib>", "<cib><a/></cib>")
+
+    def test_duplicate_id(self):
+        self.assert_not_supported("<cib><a id='a'/><a id='a'/></cib>", "<cib/>")
+
+    def test_id_with_quote(self):
+        self.assert_not_supported("<cib/>", """<cib><a id="a'"/></cib>""")
+
+
+class ArePatchsetsEquivalent(TestCase):
+    def test_empty(self):
+        self.assertTrue(lib.are_patchsets_equivalent("", "\n"))
+        self.assertFalse(lib.are_patchsets_equivalent("", '<diff format="2"/>'))
+
+    def test_equivalent(self):
+        self.assertTrue(
+            lib.are_patchsets_equivalent(
+                """
+                <diff format="2">
+                    <change operation="modify" path="/cib">
+                        <change-list>
+                            <change-attr name="a" operation="set" value="1"/>
+                            <change-attr name="b" operation="unset"/>
+                        </change-list>
+                        <change-result><cib a="1"/></change-result>
+                    </change>
+                </diff>
+                """,
+                """<diff format="2"><change operation="modify" path="/cib">"""
+                """<change-list><change-attr name="b" operation="unset"/>"""
+                """<change-attr name="a" operation="set" value="1"/>"""
+                """</change-list><change-result><cib a="1"/></change-result>"""
+                """</change></diff>""",
+            )
+        )
+
+    def test_not_equivalent(self):
+        self.assertFalse(
+            lib.are_patchsets_equivalent(
+                """
+                <diff format="2">
+                    <change operation="move" path="/cib/a" position="1"/>
+                </diff>
+                """,
+                """
+                <diff format="2">
+                    <change operation="move" path="/cib/a" position="2"/>
+                </diff>
+                """,
+            )
+        )
@@ -14,6 +14,7 @@ from pcs.common.tools import Version
 from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.external import CommandRunner
 from pcs.lib.pacemaker import api_result
+from pcs.lib.pacemaker.capabilities import CAPABILITY_CRM_RESOURCE_DIGESTS
 from pcs.lib.resource_agent import ResourceAgentName
 
 from pcs_test.tools import (
@@ -89,12 +90,11 @@ class GetClusterStatusMixin(TestCase):
     settings, "pacemaker_api_result_schema", rc("pcmk_api_rng/api-result.rng")
 )
 class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
-    # pylint: disable=protected-access
     def test_success(self):
         self.config.runner.pcmk.load_state(stdout=self.fixture_xml())
         env = self.env_assist.get_env()
         assert_xml_equal(
-            self.fixture_xml(), lib._get_cluster_status_xml(env.cmd_runner())
+            self.fixture_xml(), lib.get_cluster_status_xml(env.cmd_runner())
         )
 
     def test_error(self):
@@ -106,7 +106,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(
                 report_codes.CRM_MON_ERROR,
                 reason="an error\nThis is an error message\nAnd one more",
@@ -121,7 +121,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(
                 report_codes.CRM_MON_ERROR,
                 reason="stderr text\nstdout text",
@@ -132,7 +132,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         self.config.runner.pcmk.load_state(stdout="<xml/>", returncode=1)
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(report_codes.BAD_CLUSTER_STATE_FORMAT),
         )
 
@@ -143,7 +143,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         with self.assertRaises(lib.PacemakerNotConnectedException) as cm:
-            lib._get_cluster_status_xml(env.cmd_runner())
+            lib.get_cluster_status_xml(env.cmd_runner())
         assert_report_item_list_equal(
             cm.exception.args,
             [
@@ -1149,6 +1149,47 @@ class GetLocalNodeStatusTest(TestCase):
         )
 
 
+@mock.patch("pcs.lib.pacemaker.live.time.sleep")
+@mock.patch("pcs.lib.pacemaker.live.time.time")
+@mock.patch("pcs.lib.pacemaker.live.get_local_node_status")
+class WaitForLocalNodeStarted(TestCase):
+    started = dict(online=True, pending=False)
+    pending = dict(online=True, pending=True)
+    offline = dict(offline=True)
+
+    def setUp(self):
+        self.runner = mock.Mock(spec_set=CommandRunner)
+
+    def test_started(self, mock_status, mock_time, mock_sleep):
+        mock_status.return_value = self.started
+        mock_time.side_effect = [0, 0]
+        self.assertEqual(
+            self.started, lib.wait_for_local_node_started(self.runner, 10)
+        )
+        mock_status.assert_called_once_with(self.runner)
+        mock_sleep.assert_not_called()
+
+    def test_started_later(self, mock_status, mock_time, mock_sleep):
+        mock_status.side_effect = [self.offline, self.pending, self.started]
+        mock_time.side_effect = [0, 0.5, 1, 2]
+        self.assertEqual(
+            self.started, lib.wait_for_local_node_started(self.runner, 10)
+        )
+        self.assertEqual(
+            mock_sleep.call_args_list, [mock.call(0.1), mock.call(0.2)]
+        )
+
+    def test_timeout(self, mock_status, mock_time, mock_sleep):
+        mock_status.return_value = self.pending
+        mock_time.side_effect = [0, 2.95, 3]
+        self.assertEqual(
+            self.pending, lib.wait_for_local_node_started(self.runner, 3)
+        )
+        self.assertEqual(mock_status.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.05)
+
+
 class RemoveNode(TestCase):
     # pylint: disable=no-self-use
     def test_success(self):
@@ -1511,6 +1552,27 @@ class IsInPcmkToolHelp(TestCase):
         )
 
 
+class IsPcmkCapabilitySupported(TestCase):
+    def test_no_cache(self):
+        mock_runner = get_runner("", "--digests", 0)
+        self.assertTrue(lib.is_getting_resource_digest_supported(mock_runner))
+        mock_runner.run.assert_called_once_with(
+            [settings.crm_resource_exec, "--help-all"]
+        )
+
+    def test_cache(self):
+        mock_runner = get_runner("", "", 0)
+        mock_cache = mock.Mock(spec_set=["is_supported"])
+        mock_cache.is_supported.return_value = True
+        self.assertTrue(
+            lib.is_getting_resource_digest_supported(mock_runner, mock_cache)
+        )
+        mock_cache.is_supported.assert_called_once_with(
+            mock_runner, CAPABILITY_CRM_RESOURCE_DIGESTS
+        )
+        mock_runner.run.assert_not_called()
+
+
 class GetRulesInEffectStatus(TestCase):
     def test_success(self):
         test_data = [
@@ -0,0 +1,168 @@
+import json
+import os
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import settings
+from pcs.common.reports import codes as report_codes
+from pcs.common.status_dto import ResourcesStatusDto
+from pcs.lib.pacemaker import status_snapshot as lib
+
+from pcs_test.tools import fixture
+from pcs_test.tools.assertions import assert_raise_library_error
+from pcs_test.tools.fixture_crm_mon import error_xml_not_connected
+from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.misc import (
+    get_tmp_dir,
+    read_test_resource,
+)
+
+STATUS_MINIMAL = read_test_resource("crm_mon.minimal.xml")
+STATUS_ALL_RESOURCES = read_test_resource("crm_mon.all_resources.xml")
+
+
+@mock.patch.object(
+    settings,
+    "pacemaker_api_result_schema",
+    rc("pcmk_api_rng/api-result.rng"),
+)
+@mock.patch("pcs.lib.pacemaker.status_snapshot.time.time")
+class ClusterStatusSnapshotServiceTest(TestCase):
+    def setUp(self):
+        self.runner = mock.Mock(spec_set=["run"])
+        self.runner.run.return_value = (STATUS_MINIMAL, "", 0)
+
+    def test_refresh_once_per_interval(self, mock_time):
+        service = lib.ClusterStatusSnapshotService(None, 1000)
+        mock_time.return_value = 100
+        snapshot = service.get_resources_status(self.runner)
+        self.assertEqual(snapshot.generation, 1)
+        self.assertEqual(snapshot.resources_status, ResourcesStatusDto([]))
+        self.assertEqual(snapshot.warnings, [])
+
+        mock_time.return_value = 100.9
+        self.assertIs(service.get_resources_status(self.runner), snapshot)
+        self.assertEqual(snapshot.get_age_ms(), 900)
+        self.runner.run.assert_called_once()
+
+        mock_time.return_value = 101.5
+        self.assertEqual(
+            service.get_resources_status(self.runner).generation, 2
+        )
+        self.assertEqual(self.runner.run.call_count, 2)
+
+    def test_max_age(self, mock_time):
+        service = lib.ClusterStatusSnapshotService(None, 1000)
+        mock_time.return_value = 100
+        service.get_resources_status(self.runner)
+        mock_time.return_value = 100.5
+        self.assertEqual(
+            service.get_resources_status(self.runner, 600).generation, 1
+        )
+        self.assertEqual(
+            service.get_resources_status(self.runner, 0).generation, 2
+        )
+        # the status is never older than the refresh interval
+        mock_time.return_value = 102
+        self.assertEqual(
+            service.get_resources_status(self.runner, 5000).generation, 3
+        )
+        self.assertEqual(self.runner.run.call_count, 3)
+
+    def test_clock_moved_back(self, mock_time):
+        service = lib.ClusterStatusSnapshotService(None, 1000)
+        mock_time.return_value = 100
+        service.get_resources_status(self.runner)
+        mock_time.return_value = 50
+        self.assertEqual(
+            service.get_resources_status(self.runner).generation, 2
+        )
+
+    def test_status_error(self, mock_time):
+        mock_time.return_value = 100
+        service = lib.ClusterStatusSnapshotService(None, 1000)
+        self.runner.run.return_value = (error_xml_not_connected(), "", 102)
+        assert_raise_library_error(
+            lambda: service.get_resources_status(self.runner),
+            fixture.error(
+                report_codes.CRM_MON_ERROR,
+                reason="Not connected\n"
+                "crm_mon: Error: cluster is not available on this node",
+            ),
+        )
+        self.runner.run.return_value = (STATUS_MINIMAL, "", 0)
+        self.assertEqual(
+            service.get_resources_status(self.runner).generation, 1
+        )
+        self.assertEqual(self.runner.run.call_count, 2)
+
+    def test_shared_in_file(self, mock_time):
+        mock_time.return_value = 100
+        self.runner.run.return_value = (STATUS_ALL_RESOURCES, "", 0)
+        with get_tmp_dir("status_snapshot") as snapshot_dir:
+            snapshot_file = os.path.join(snapshot_dir, "status.json")
+            snapshot = lib.ClusterStatusSnapshotService(
+                snapshot_file, 1000
+            ).get_resources_status(self.runner)
+            mock_time.return_value = 100.5
+            other_snapshot = lib.ClusterStatusSnapshotService(
+                snapshot_file, 1000
+            ).get_resources_status(self.runner)
+        self.runner.run.assert_called_once()
+        self.assertEqual(other_snapshot.generation, 1)
+        self.assertEqual(other_snapshot.timestamp, 100)
+        self.assertEqual(
+            other_snapshot.resources_status, snapshot.resources_status
+        )
+        self.assertNotEqual(other_snapshot.resources_status.resources, [])
+
+    def test_file_refreshed(self, mock_time):
+        with get_tmp_dir("status_snapshot") as snapshot_dir:
+            snapshot_file = os.path.join(snapshot_dir, "status.json")
+            service = lib.ClusterStatusSnapshotService(snapshot_file, 1000)
+            other_service = lib.ClusterStatusSnapshotService(
+                snapshot_file, 1000
+            )
+            mock_time.return_value = 100
+            service.get_resources_status(self.runner)
+            mock_time.return_value = 101.5
+            self.assertEqual(
+                other_service.get_resources_status(self.runner).generation, 2
+            )
+            mock_time.return_value = 101.6
+            self.assertEqual(
+                service.get_resources_status(self.runner).generation, 2
+            )
+            with open(snapshot_file, encoding="utf-8") as stored_file:
+                self.assertEqual(json.load(stored_file)["generation"], 2)
+        self.assertEqual(self.runner.run.call_count, 2)
+
+    def test_broken_file(self, mock_time):
+        mock_time.return_value = 100
+        with get_tmp_dir("status_snapshot") as snapshot_dir:
+            snapshot_file = os.path.join(snapshot_dir, "status.json")
+            with open(snapshot_file, "w", encoding="utf-8") as stored_file:
+                stored_file.write("not a json")
+            service = lib.ClusterStatusSnapshotService(snapshot_file, 1000)
+            self.assertEqual(
+                service.get_resources_status(self.runner).generation, 1
+            )
+            with open(snapshot_file, encoding="utf-8") as stored_file:
+                self.assertEqual(json.load(stored_file)["timestamp"], 100)
+        self.runner.run.assert_called_once()
+
+    def test_file_not_accessible(self, mock_time):
+        mock_time.return_value = 100
+        service = lib.ClusterStatusSnapshotService(
+            "/non/existing/dir/status.json", 1000
+        )
+        self.assertEqual(
+            service.get_resources_status(self.runner).generation, 1
+        )
+        mock_time.return_value = 100.5
+        self.assertEqual(
+            service.get_resources_status(self.runner).generation, 1
+        )
+        self.runner.run.assert_called_once()
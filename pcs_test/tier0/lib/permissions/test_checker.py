@@ -1,3 +1,4 @@
+from dataclasses import replace
 from logging import Logger
 from unittest import (
     TestCase,
@@ -17,6 +18,7 @@ from pcs.lib.auth.types import AuthUser
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
+from pcs.lib.permissions import checker
 from pcs.lib.permissions.checker import PermissionsChecker
 from pcs.lib.permissions.config.facade import FacadeV2
 from pcs.lib.permissions.config.parser import ParserError
@@ -28,6 +30,11 @@ from pcs.lib.permissions.config.types import (
     PermissionTargetType,
 )
 
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
 _FILE_PATH = "file path"
 _FILE_METADATA = FileMetadata(
     file_type_code=PCS_SETTINGS_CONF,
@@ -179,6 +186,43 @@ class PermissionCheckerGetFacadeTest(TestCase):
         self.logger.error.assert_not_called()
 
 
+class PermissionCheckerGetFacadeCacheTest(TestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_file = get_tmp_file("pcs_settings_conf")
+        self.addCleanup(self.tmp_file.close)
+        write_data_to_tmpfile("data", self.tmp_file)
+        checker._facade_cache.clear()
+        self.addCleanup(checker._facade_cache.clear)
+        self.file_instance_mock = mock.Mock(spec_set=FileInstance)
+        self.file_instance_mock.raw_file.metadata = replace(
+            _FILE_METADATA, path=self.tmp_file.name
+        )
+        self.file_instance_mock.raw_file.exists.return_value = True
+        self.file_instance_mock.read_to_facade.return_value = _FACADE_FIXTURE
+        self.logger = mock.Mock(spec_set=Logger)
+
+    def get_checker(self):
+        with mock.patch.object(
+            FileInstance,
+            "for_pcs_settings_config",
+            lambda *_args, **_kwargs: self.file_instance_mock,
+        ):
+            return PermissionsChecker(self.logger)
+
+    def test_cache_shared_by_checkers(self):
+        self.assertIs(_FACADE_FIXTURE, self.get_checker()._get_facade())
+        self.assertIs(_FACADE_FIXTURE, self.get_checker()._get_facade())
+        self.file_instance_mock.read_to_facade.assert_called_once_with()
+
+    def test_file_changed(self):
+        self.assertIs(_FACADE_FIXTURE, self.get_checker()._get_facade())
+        write_data_to_tmpfile("new data", self.tmp_file)
+        self.assertIs(_FACADE_FIXTURE, self.get_checker()._get_facade())
+        self.assertEqual(2, self.file_instance_mock.read_to_facade.call_count)
+
+
 @mock.patch.object(
     PermissionsChecker, "_get_facade", lambda _self: _FACADE_FIXTURE
 )
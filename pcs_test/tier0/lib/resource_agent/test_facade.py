@@ -1,13 +1,20 @@
+import logging
+import threading
+import time
 from unittest import (
     TestCase,
     mock,
 )
 
+from lxml import etree
+
 from pcs.common import reports
 from pcs.lib import resource_agent as ra
+from pcs.lib.external import CommandRunner
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
 
 
 @mock.patch("pcs.lib.resource_agent.facade.ocf_unified_to_pcs")
@@ -399,3 +406,152 @@ class ResourceAgentFacadeFactory(TestCase):
             [param.name for param in facade.metadata.parameters],
             ["agent-param"],
         )
+
+
+class ResourceAgentFacadeFactoryMetadataCache(TestCase):
+    _fixture_agent_xml = """
+        <resource-agent name="agent">
+            <parameters>
+                <parameter name="agent-param"/>
+            </parameters>
+        </resource-agent>
+    """
+
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.cache = mock.Mock(spec_set=ra.ResourceAgentMetadataCache)
+        self.name = ra.ResourceAgentName("ocf", "custom", "Dummy")
+
+    def get_facade(self):
+        env = self.env_assist.get_env()
+        return ra.ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor, self.cache
+        ).facade_from_parsed_name(self.name)
+
+    def test_not_cached(self):
+        self.cache.get.return_value = None
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:custom:Dummy", stdout=self._fixture_agent_xml
+        )
+        facade = self.get_facade()
+        self.assertEqual(
+            [param.name for param in facade.metadata.parameters],
+            ["agent-param"],
+        )
+        self.cache.get.assert_called_once_with(self.name)
+        self.cache.put.assert_called_once_with(facade.metadata)
+
+    def test_cached(self):
+        metadata = ra.ResourceAgentMetadata(
+            self.name,
+            agent_exists=True,
+            ocf_version=ra.const.OCF_1_1,
+            shortdesc=None,
+            longdesc=None,
+            parameters=[],
+            actions=[],
+        )
+        self.cache.get.return_value = metadata
+        facade = self.get_facade()
+        self.assertEqual(facade.metadata, metadata)
+        self.cache.get.assert_called_once_with(self.name)
+        self.cache.put.assert_not_called()
+
+    def test_load_error_not_cached(self):
+        self.cache.get.return_value = None
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:custom:Dummy",
+            agent_is_missing=True,
+        )
+        with self.assertRaises(ra.UnableToGetAgentMetadata):
+            self.get_facade()
+        self.cache.put.assert_not_called()
+
+
+class ResourceAgentFacadeFactoryMetadataList(TestCase):
+    def setUp(self):
+        self.cache = mock.Mock(spec_set=ra.ResourceAgentMetadataCache)
+        self.cache_thread_idents = set()
+        self.names = [
+            ra.ResourceAgentName("ocf", "test", f"Agent{i}") for i in range(6)
+        ]
+        self.cached_metadata = ra.ResourceAgentMetadata(
+            self.names[2],
+            agent_exists=True,
+            ocf_version=ra.const.OCF_1_1,
+            shortdesc="cached",
+            longdesc=None,
+            parameters=[],
+            actions=[],
+        )
+
+        def cache_get(name):
+            self.cache_thread_idents.add(threading.get_ident())
+            return self.cached_metadata if name == self.names[2] else None
+
+        def cache_put(metadata):
+            del metadata
+            self.cache_thread_idents.add(threading.get_ident())
+
+        self.cache.get.side_effect = cache_get
+        self.cache.put.side_effect = cache_put
+        self.report_processor = MockLibraryReportProcessor()
+        self.factory = ra.ResourceAgentFacadeFactory(
+            CommandRunner(mock.Mock(logging.Logger), self.report_processor),
+            self.report_processor,
+            self.cache,
+        )
+
+    @staticmethod
+    def _load_metadata(runner, name):
+        del runner
+        # make agents finish in a different order than started
+        time.sleep(0.01 * (6 - int(name.type[-1])))
+        if name.type == "Agent3":
+            raise ra.UnableToGetAgentMetadata(name.full_name, "reason")
+        version = "2.0" if name.type == "Agent4" else "1.0"
+        return etree.fromstring(
+            f"""
+            <resource-agent name="{name.type}">
+                <version>{version}</version>
+                <shortdesc>{name.full_name}</shortdesc>
+            </resource-agent>
+            """
+        )
+
+    @mock.patch("pcs.lib.resource_agent.facade.load_metadata")
+    def test_success(self, mock_load_metadata):
+        mock_load_metadata.side_effect = self._load_metadata
+        result_list = list(
+            self.factory.iter_facades_from_parsed_names(self.names, 4)
+        )
+        self.assertEqual(
+            [
+                (
+                    result.metadata.shortdesc
+                    if isinstance(result, ra.ResourceAgentFacade)
+                    else type(result)
+                )
+                for result in result_list
+            ],
+            [
+                "ocf:test:Agent0",
+                "ocf:test:Agent1",
+                "cached",
+                ra.UnableToGetAgentMetadata,
+                ra.UnsupportedOcfVersion,
+                "ocf:test:Agent5",
+            ],
+        )
+        self.assertEqual(
+            sorted(
+                (call.args[1] for call in mock_load_metadata.call_args_list),
+                key=lambda name: name.full_name,
+            ),
+            [name for name in self.names if name != self.names[2]],
+        )
+        self.assertEqual(
+            [call.args[0].name for call in self.cache.put.call_args_list],
+            [self.names[0], self.names[1], self.names[5]],
+        )
+        self.assertEqual(self.cache_thread_idents, {threading.get_ident()})
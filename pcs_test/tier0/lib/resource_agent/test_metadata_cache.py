@@ -0,0 +1,157 @@
+import os
+import os.path
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.lib import resource_agent as ra
+from pcs.lib.resource_agent.metadata_cache import ResourceAgentMetadataCache
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def _fixture_metadata(name, agent_exists=True):
+    return ra.ResourceAgentMetadata(
+        name,
+        agent_exists=agent_exists,
+        ocf_version=ra.const.OCF_1_1,
+        shortdesc="short",
+        longdesc=None,
+        parameters=[
+            ra.ResourceAgentParameter(
+                name="param",
+                shortdesc=None,
+                longdesc=None,
+                type="select",
+                default="a",
+                enum_values=["a", "b"],
+                required=True,
+                advanced=False,
+                deprecated=False,
+                deprecated_by=["new-param"],
+                deprecated_desc=None,
+                unique_group=None,
+                reloadable=True,
+            )
+        ],
+        actions=[
+            ra.ResourceAgentAction(
+                name="start",
+                timeout="20s",
+                interval=None,
+                role=None,
+                start_delay=None,
+                depth=None,
+                automatic=False,
+                on_target=False,
+            )
+        ],
+    )
+
+
+class ResourceAgentMetadataCacheTest(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = get_tmp_dir("tier0_lib_resource_agent_metadata_cache")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.ocf_root = os.path.join(self.tmp_dir.name, "ocf")
+        fence_dir = os.path.join(self.tmp_dir.name, "sbin")
+        self.crm_resource = os.path.join(self.tmp_dir.name, "crm_resource")
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.agent_path = os.path.join(
+            self.ocf_root, "resource.d", "pacemaker", "Dummy"
+        )
+        self.write_file(self.agent_path, "agent")
+        self.write_file(os.path.join(fence_dir, "fence_xvm"), "fence")
+        self.write_file(self.crm_resource, "pacemaker")
+
+        patcher = mock.patch.multiple(
+            "pcs.settings",
+            ocf_root=self.ocf_root,
+            fence_agent_execs=fence_dir,
+            crm_resource_exec=self.crm_resource,
+            pcs_version="1.0",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.name = ra.ResourceAgentName("ocf", "pacemaker", "Dummy")
+        self.cache = ResourceAgentMetadataCache(self.cache_dir)
+
+    @staticmethod
+    def write_file(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as a_file:
+            a_file.write(content)
+
+    def test_not_cached(self):
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_put_get(self):
+        metadata = _fixture_metadata(self.name)
+        self.cache.put(metadata)
+        self.assertEqual(self.cache.get(self.name), metadata)
+        self.assertEqual(
+            ResourceAgentMetadataCache(self.cache_dir).get(self.name), metadata
+        )
+
+    def test_stonith(self):
+        name = ra.ResourceAgentName("stonith", None, "fence_xvm")
+        metadata = _fixture_metadata(name)
+        self.cache.put(metadata)
+        self.assertEqual(self.cache.get(name), metadata)
+
+    def test_agent_changed(self):
+        self.cache.put(_fixture_metadata(self.name))
+        self.write_file(self.agent_path, "agent version 2")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_pacemaker_changed(self):
+        self.cache.put(_fixture_metadata(self.name))
+        self.write_file(self.crm_resource, "pacemaker version 2")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_pcs_changed(self):
+        self.cache.put(_fixture_metadata(self.name))
+        with mock.patch("pcs.settings.pcs_version", "2.0"):
+            self.assertIsNone(self.cache.get(self.name))
+
+    def test_agent_removed(self):
+        self.cache.put(_fixture_metadata(self.name))
+        os.remove(self.agent_path)
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_missing_agent_not_cached(self):
+        self.cache.put(_fixture_metadata(self.name, agent_exists=False))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_not_cacheable_agent(self):
+        name = ra.ResourceAgentName("systemd", None, "pcsd")
+        self.cache.put(_fixture_metadata(name))
+        self.assertIsNone(self.cache.get(name))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_broken_entry(self):
+        self.cache.put(_fixture_metadata(self.name))
+        (entry_file,) = os.listdir(self.cache_dir)
+        self.write_file(os.path.join(self.cache_dir, entry_file), "{")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_unwritable_cache_dir(self):
+        self.write_file(self.cache_dir, "not a directory")
+        self.cache.put(_fixture_metadata(self.name))
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_clear(self):
+        stonith_name = ra.ResourceAgentName("stonith", None, "fence_xvm")
+        self.cache.put(_fixture_metadata(self.name))
+        self.cache.put(_fixture_metadata(stonith_name))
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.name))
+        self.assertIsNone(self.cache.get(stonith_name))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_clear_no_cache_dir(self):
+        self.cache.clear()
+        self.assertFalse(os.path.exists(self.cache_dir))
@@ -1,3 +1,4 @@
+import logging
 from functools import partial
 from unittest import (
     TestCase,
@@ -8,12 +9,15 @@ from lxml import etree
 
 from pcs.common.reports import codes as report_codes
 from pcs.common.tools import Version
+from pcs.lib.cib.snapshot import CibSnapshot
 from pcs.lib.env import LibraryEnvironment
+from pcs.lib.pacemaker import cib_diff
 
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import assert_xml_equal
 from pcs_test.tools.command_env import get_env_tools
 from pcs_test.tools.custom_mock import (
+    MockLibraryReportProcessor,
     TmpFileCall,
     TmpFileMock,
 )
@@ -213,6 +217,11 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
     wait_timeout = 10
 
     def setUp(self):
+        settings_patcher = mock.patch(
+            "pcs.settings.cib_diff_mode", cib_diff.DIFF_MODE_CRM_DIFF
+        )
+        self.addCleanup(settings_patcher.stop)
+        settings_patcher.start()
         self.tmpfile_old = "old.cib"
         self.tmpfile_new = "new.cib"
         self.load_cib_name = "load_cib"
@@ -386,6 +395,141 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
         )
 
 
+class PushLoadedCibNativeDiff(TestCase):
+    fixture_cib_diff = """
+        <diff format="2">
+            <change operation="create" path="/cib/configuration/resources"
+                position="0"
+            >
+                <primitive id="R" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                />
+            </change>
+        </diff>
+    """
+
+    def setUp(self):
+        settings_patcher = mock.patch(
+            "pcs.settings.cib_diff_mode", cib_diff.DIFF_MODE_NATIVE
+        )
+        self.addCleanup(settings_patcher.stop)
+        settings_patcher.start()
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    @staticmethod
+    def add_primitive(cib):
+        etree.SubElement(
+            cib.find(".//resources"),
+            "primitive",
+            {
+                "id": "R",
+                "class": "ocf",
+                "provider": "pacemaker",
+                "type": "Dummy",
+            },
+        )
+
+    def test_push_diff(self):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(cib_diff=self.fixture_cib_diff)
+        env = self.env_assist.get_env()
+        self.add_primitive(env.get_cib())
+        env.push_cib()
+
+    def test_no_changes(self):
+        self.config.runner.cib.load()
+        env = self.env_assist.get_env()
+        env.get_cib()
+        env.push_cib()
+
+    def test_version_changes_ignored(self):
+        self.config.runner.cib.load()
+        env = self.env_assist.get_env()
+        cib = env.get_cib()
+        cib.set("epoch", "1000")
+        cib.set("num_updates", "0")
+        env.push_cib()
+
+    @mock.patch("pcs.lib.tools.get_tmp_file")
+    def test_fallback_to_crm_diff(self, mock_get_tmp_file):
+        tmp_file_mock_obj = TmpFileMock(
+            file_content_checker=assert_xml_equal,
+        )
+        self.addCleanup(tmp_file_mock_obj.assert_all_done)
+        mock_get_tmp_file.side_effect = tmp_file_mock_obj.get_mock_side_effect()
+        self.config.runner.cib.load(
+            resources="<resources><!-- comment --></resources>"
+        )
+        self.config.runner.cib.diff("old.cib", "new.cib")
+        self.config.runner.cib.push_diff()
+        loaded_cib = self.config.calls.get("runner.cib.load").stdout
+        env = self.env_assist.get_env()
+        cib = env.get_cib()
+        self.add_primitive(cib)
+        tmp_file_mock_obj.set_calls(
+            [
+                TmpFileCall("old.cib", orig_content=loaded_cib),
+                TmpFileCall("new.cib", orig_content=etree_to_str(cib)),
+            ]
+        )
+        env.push_cib()
+        env.logger.debug.assert_called_once()
+        self.env_assist.assert_reports(
+            [
+                fixture.debug(
+                    report_codes.TMP_FILE_WRITE,
+                    file_path="old.cib",
+                    content=loaded_cib,
+                ),
+                fixture.debug(
+                    report_codes.TMP_FILE_WRITE,
+                    file_path="new.cib",
+                    content=etree_to_str(cib).strip(),
+                ),
+            ]
+        )
+
+    @mock.patch("pcs.settings.cib_diff_mode", cib_diff.DIFF_MODE_VERIFY)
+    @mock.patch("pcs.lib.tools.get_tmp_file")
+    def test_verify(self, mock_get_tmp_file):
+        tmp_file_mock_obj = TmpFileMock(
+            file_content_checker=assert_xml_equal,
+        )
+        self.addCleanup(tmp_file_mock_obj.assert_all_done)
+        mock_get_tmp_file.side_effect = tmp_file_mock_obj.get_mock_side_effect()
+        self.config.runner.cib.load()
+        self.config.runner.cib.diff(
+            "old.cib", "new.cib", stdout=self.fixture_cib_diff
+        )
+        self.config.runner.cib.push_diff(cib_diff=self.fixture_cib_diff)
+        loaded_cib = self.config.calls.get("runner.cib.load").stdout
+        env = self.env_assist.get_env()
+        cib = env.get_cib()
+        self.add_primitive(cib)
+        tmp_file_mock_obj.set_calls(
+            [
+                TmpFileCall("old.cib", orig_content=loaded_cib),
+                TmpFileCall("new.cib", orig_content=etree_to_str(cib)),
+            ]
+        )
+        env.push_cib()
+        env.logger.warning.assert_not_called()
+        self.env_assist.assert_reports(
+            [
+                fixture.debug(
+                    report_codes.TMP_FILE_WRITE,
+                    file_path="old.cib",
+                    content=loaded_cib,
+                ),
+                fixture.debug(
+                    report_codes.TMP_FILE_WRITE,
+                    file_path="new.cib",
+                    content=etree_to_str(cib).strip(),
+                ),
+            ]
+        )
+
+
 class PushCustomCib(TestCase, ManageCibAssertionMixin):
     custom_cib = "<custom_cib />"
     wait_timeout = 10
@@ -446,3 +590,31 @@ class PushCibMockedWithWait(TestCase):
             ],
             expected_in_processor=False,
         )
+
+
+class GetCibFromSnapshot(TestCase):
+    def setUp(self):
+        self.snapshot = mock.Mock(spec_set=CibSnapshot)
+        self.snapshot.get_cib_xml.return_value = "<cib/>"
+        self.cib = etree.fromstring("<cib/>")
+        self.snapshot.get_cib.return_value = self.cib
+        self.env = LibraryEnvironment(
+            mock.MagicMock(logging.Logger),
+            MockLibraryReportProcessor(),
+            cib_snapshot=self.snapshot,
+        )
+        patcher = mock.patch.object(LibraryEnvironment, "cmd_runner")
+        self.runner = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_get_cib(self):
+        self.assertIs(self.env.get_cib(), self.cib)
+        self.snapshot.get_cib_xml.assert_called_once_with(self.runner)
+        self.snapshot.get_cib.assert_called_once_with(self.runner)
+
+    @mock.patch("pcs.lib.env.replace_cib_configuration")
+    def test_push_invalidates_snapshot(self, mock_replace):
+        custom_cib = etree.fromstring("<cib/>")
+        self.env.push_cib(custom_cib)
+        mock_replace.assert_called_once_with(self.runner, custom_cib)
+        self.snapshot.invalidate.assert_called_once_with()
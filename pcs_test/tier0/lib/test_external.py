@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from subprocess import DEVNULL
 from unittest import (
     TestCase,
@@ -393,6 +395,131 @@ class CommandRunnerTest(TestCase):
         )
 
 
+class ThreadRecordingReportProcessor(MockLibraryReportProcessor):
+    def __init__(self):
+        super().__init__()
+        self.thread_idents = set()
+
+    def _do_report(self, report_item):
+        self.thread_idents.add(threading.get_ident())
+        super()._do_report(report_item)
+
+
+@mock.patch("subprocess.Popen", autospec=True)
+class CommandRunnerMapConcurrently(TestCase):
+    def setUp(self):
+        self.mock_reporter = ThreadRecordingReportProcessor()
+        self.runner = lib.CommandRunner(
+            mock.MagicMock(logging.Logger), self.mock_reporter, {"a": "b"}
+        )
+
+    @staticmethod
+    def _fixture_popen(mock_popen):
+        def popen(args, **kwargs):
+            # make processes finish in a different order than started
+            time.sleep(0.01 * (5 - int(args[1])))
+            process = mock.MagicMock(spec_set=["communicate", "returncode"])
+            process.communicate.return_value = (f"out {args[1]}", "")
+            process.returncode = 0 if kwargs["env"] == {"a": "b"} else 1
+            return process
+
+        mock_popen.side_effect = popen
+
+    @staticmethod
+    def _run(runner, item):
+        stdout, dummy_stderr, retval = runner.run(["cmd", item])
+        if item == "3":
+            raise lib.KillServicesError(["service"])
+        return stdout, retval
+
+    @staticmethod
+    def _fixture_report_list(item_list):
+        report_list = []
+        for item in item_list:
+            report_list.extend(
+                [
+                    (
+                        severity.DEBUG,
+                        report_codes.RUN_EXTERNAL_PROCESS_STARTED,
+                        {
+                            "command": f"cmd {item}",
+                            "stdin": None,
+                            "environment": {"a": "b"},
+                        },
+                    ),
+                    (
+                        severity.DEBUG,
+                        report_codes.RUN_EXTERNAL_PROCESS_FINISHED,
+                        {
+                            "command": f"cmd {item}",
+                            "return_value": 0,
+                            "stdout": f"out {item}",
+                            "stderr": "",
+                        },
+                    ),
+                ]
+            )
+        return report_list
+
+    def test_results_and_reports_in_order(self, mock_popen):
+        self._fixture_popen(mock_popen)
+        self.assertEqual(
+            list(self.runner.map_concurrently(self._run, ["0", "1", "2"], 3)),
+            [("out 0", 0), ("out 1", 0), ("out 2", 0)],
+        )
+        assert_report_item_list_equal(
+            self.mock_reporter.report_item_list,
+            self._fixture_report_list(["0", "1", "2"]),
+        )
+        self.assertEqual(
+            self.mock_reporter.thread_idents, {threading.get_ident()}
+        )
+
+    def test_exception(self, mock_popen):
+        self._fixture_popen(mock_popen)
+        result_list = []
+        with self.assertRaises(lib.KillServicesError):
+            for result in self.runner.map_concurrently(
+                self._run, ["1", "2", "3", "4"], 4
+            ):
+                result_list.append(result)
+        self.assertEqual(result_list, [("out 1", 0), ("out 2", 0)])
+        assert_report_item_list_equal(
+            self.mock_reporter.report_item_list,
+            self._fixture_report_list(["1", "2", "3"]),
+        )
+        self.assertEqual(
+            self.mock_reporter.thread_idents, {threading.get_ident()}
+        )
+
+    def test_calls_started_right_away(self, mock_popen):
+        self._fixture_popen(mock_popen)
+        started = threading.Event()
+
+        def run(runner, item):
+            started.set()
+            return self._run(runner, item)
+
+        result_iter = self.runner.map_concurrently(run, ["0"], 2)
+        self.assertTrue(started.wait(5))
+        self.assertEqual(self.mock_reporter.report_item_list, [])
+        self.assertEqual(list(result_iter), [("out 0", 0)])
+        assert_report_item_list_equal(
+            self.mock_reporter.report_item_list,
+            self._fixture_report_list(["0"]),
+        )
+
+    def test_sequential(self, mock_popen):
+        self._fixture_popen(mock_popen)
+        runner_list = []
+        result_iter = self.runner.map_concurrently(
+            lambda runner, item: runner_list.append(runner), ["0"], 1
+        )
+        self.assertEqual(runner_list, [])
+        self.assertEqual(list(result_iter), [None])
+        self.assertEqual(runner_list, [self.runner])
+
+
 class KillServicesTest(TestCase):
     def setUp(self):
         self.mock_runner = mock.MagicMock(spec_set=lib.CommandRunner)
@@ -1,7 +1,15 @@
-from unittest import TestCase
+import json
+import os
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from pcs.lib import tools
 
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+from pcs_test.tools.misc import get_tmp_dir
+
 
 class EnvironmentFileToDictTest(TestCase):
     def test_success(self):
@@ -38,3 +46,90 @@ ANOTHER ONE="complex value"
 OPTION=value
 """
         self.assertEqual(expected, tools.dict_to_environment_file(cfg_dict))
+
+
+class GetTmpDir(TestCase):
+    def test_first_writable(self):
+        with get_tmp_dir("tools_tmp_dir") as tmp_dir:
+            with mock.patch(
+                "pcs.lib.tools.settings.tmp_file_dir_list",
+                ["/non/existing/dir", tmp_dir],
+            ):
+                self.assertEqual(tools.get_tmp_dir(), tmp_dir)
+                with tools.get_tmp_file("data") as tmp_file:
+                    self.assertEqual(os.path.dirname(tmp_file.name), tmp_dir)
+
+    def test_none_writable(self):
+        with mock.patch(
+            "pcs.lib.tools.settings.tmp_file_dir_list", ["/non/existing/dir"]
+        ):
+            self.assertIsNone(tools.get_tmp_dir())
+
+
+class WriteJsonFileAtomically(TestCase):
+    def test_success(self):
+        with get_tmp_dir("tools_write_json") as tmp_dir:
+            path = os.path.join(tmp_dir, "file.json")
+            tools.write_json_file_atomically(
+                path, {"key": ["value"]}, file_mode=0o640
+            )
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file), {"key": ["value"]})
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+            self.assertEqual(os.listdir(tmp_dir), ["file.json"])
+
+    def test_failure_leaves_no_tmp_file(self):
+        with get_tmp_dir("tools_write_json") as tmp_dir:
+            path = os.path.join(tmp_dir, "file.json")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("original")
+            with self.assertRaises(TypeError):
+                tools.write_json_file_atomically(path, {"key": object()})
+            with mock.patch("os.replace", side_effect=OSError("error")):
+                with self.assertRaises(OSError):
+                    tools.write_json_file_atomically(path, {"key": "value"})
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "original")
+            self.assertEqual(os.listdir(tmp_dir), ["file.json"])
+
+
+class TmpCibFiles(TestCase):
+    def setUp(self):
+        self.report_processor = MockLibraryReportProcessor()
+
+    def test_shared_for_reading(self):
+        with tools.TmpCibFiles(self.report_processor) as tmp_cib_files:
+            file_a = tmp_cib_files.get_for_reading("<cib a/>")
+            file_b = tmp_cib_files.get_for_reading("<cib b/>")
+            self.assertIs(file_a, tmp_cib_files.get_for_reading("<cib a/>"))
+            self.assertIsNot(file_a, file_b)
+            with open(file_a.name, encoding="utf-8") as cib_file:
+                self.assertEqual(cib_file.read(), "<cib a/>")
+            file_names = [file_a.name, file_b.name]
+        self.assertFalse(any(os.path.exists(name) for name in file_names))
+        self.assertEqual(len(self.report_processor.report_item_list), 2)
+
+    def test_not_shared_for_writing(self):
+        with tools.TmpCibFiles(self.report_processor) as tmp_cib_files:
+            file_read = tmp_cib_files.get_for_reading("<cib/>")
+            file_write = tmp_cib_files.get_for_writing("<cib/>")
+            self.assertIsNot(file_read, file_write)
+            self.assertIsNot(
+                file_write, tmp_cib_files.get_for_writing("<cib/>")
+            )
+
+    def test_read_back(self):
+        with tools.TmpCibFiles(self.report_processor) as tmp_cib_files:
+            tmp_file = tmp_cib_files.get_for_writing("<cib/>")
+            with open(tmp_file.name, "w", encoding="utf-8") as cib_file:
+                cib_file.write("<cib modified/>")
+            self.assertEqual(tmp_cib_files.read(tmp_file), "<cib modified/>")
+            self.assertIs(
+                tmp_file, tmp_cib_files.get_for_reading("<cib modified/>")
+            )
+            with open(tmp_file.name, "w", encoding="utf-8") as cib_file:
+                cib_file.write("<cib modified again/>")
+            tmp_cib_files.read(tmp_file)
+            self.assertIsNot(
+                tmp_file, tmp_cib_files.get_for_reading("<cib modified/>")
+            )
@@ -0,0 +1,33 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.lib import waiter as lib
+
+
+class Backoff(TestCase):
+    def test_intervals(self):
+        backoff = lib.Backoff(initial_interval=0.5, max_interval=3, factor=2)
+        self.assertEqual(
+            [backoff.next_interval() for _ in range(5)], [0.5, 1, 2, 3, 3]
+        )
+
+    def test_reset(self):
+        backoff = lib.Backoff(initial_interval=1, max_interval=10, factor=3)
+        backoff.next_interval()
+        backoff.next_interval()
+        backoff.reset()
+        self.assertEqual(backoff.next_interval(), 1)
+
+    @mock.patch("pcs.lib.waiter.time.sleep")
+    def test_sleep(self, mock_sleep):
+        backoff = lib.Backoff(initial_interval=1, max_interval=4, factor=2)
+        backoff.sleep()
+        backoff.sleep(remaining=1.5)
+        backoff.sleep(remaining=0)
+        backoff.sleep(remaining=10)
+        self.assertEqual(
+            mock_sleep.call_args_list,
+            [mock.call(1), mock.call(1.5), mock.call(4)],
+        )
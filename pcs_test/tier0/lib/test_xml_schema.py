@@ -0,0 +1,100 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
+
+from pcs.lib import xml_schema as lib
+
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
+
+SCHEMA_A = """
+    <grammar xmlns="http://relaxng.org/ns/structure/1.0">
+        <start><element name="a"><empty/></element></start>
+    </grammar>
+"""
+SCHEMA_B = """
+    <grammar xmlns="http://relaxng.org/ns/structure/1.0">
+        <start><element name="b"><empty/></element></start>
+    </grammar>
+"""
+
+
+@mock.patch("pcs.lib.xml_schema.etree.RelaxNG", wraps=etree.RelaxNG)
+class RelaxNgRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = lib.RelaxNgRegistry()
+        self.dom_a = etree.fromstring("<a/>")
+        self.dom_b = etree.fromstring("<b/>")
+
+    def test_compile_once(self, mock_relaxng):
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            self.registry.assert_valid(tmp_file.name, self.dom_a)
+            self.registry.assert_valid(tmp_file.name, self.dom_a)
+            self.assertIs(
+                self.registry.get_schema(tmp_file.name),
+                self.registry.get_schema(tmp_file.name),
+            )
+        mock_relaxng.assert_called_once_with(file=tmp_file.name)
+
+    def test_recompile_on_file_change(self, mock_relaxng):
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            self.registry.assert_valid(tmp_file.name, self.dom_a)
+            write_data_to_tmpfile(SCHEMA_B + " ", tmp_file)
+            self.registry.assert_valid(tmp_file.name, self.dom_b)
+            with self.assertRaises(etree.DocumentInvalid):
+                self.registry.assert_valid(tmp_file.name, self.dom_a)
+        self.assertEqual(mock_relaxng.call_count, 2)
+
+    def test_clear(self, mock_relaxng):
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            self.registry.get_schema(tmp_file.name)
+            self.registry.clear()
+            self.registry.get_schema(tmp_file.name)
+        self.assertEqual(mock_relaxng.call_count, 2)
+
+    def test_mode_always(self, mock_relaxng):
+        del mock_relaxng
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            self.registry.assert_valid(tmp_file.name, self.dom_a)
+            with self.assertRaises(etree.DocumentInvalid):
+                self.registry.assert_valid(tmp_file.name, self.dom_b)
+
+    def test_mode_on_schema_change(self, mock_relaxng):
+        del mock_relaxng
+        mode = lib.VALIDATION_MODE_ON_SCHEMA_CHANGE
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            with self.assertRaises(etree.DocumentInvalid):
+                self.registry.assert_valid(tmp_file.name, self.dom_b, mode)
+            self.registry.assert_valid(tmp_file.name, self.dom_a, mode)
+            # validation is skipped once a document has been valid
+            self.registry.assert_valid(tmp_file.name, self.dom_b, mode)
+            # changed schema, validation is done again
+            write_data_to_tmpfile(SCHEMA_A + " ", tmp_file)
+            with self.assertRaises(etree.DocumentInvalid):
+                self.registry.assert_valid(tmp_file.name, self.dom_b, mode)
+
+    def test_preload(self, mock_relaxng):
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile(SCHEMA_A, tmp_file)
+            self.registry.preload(["/non/existing/file.rng", tmp_file.name])
+            self.assertEqual(mock_relaxng.call_count, 2)
+            self.registry.assert_valid(tmp_file.name, self.dom_a)
+            self.assertEqual(mock_relaxng.call_count, 2)
+
+    def test_preload_invalid_schema(self, mock_relaxng):
+        del mock_relaxng
+        with get_tmp_file("xml_schema") as tmp_file:
+            write_data_to_tmpfile("<grammar/>", tmp_file)
+            self.registry.preload([tmp_file.name])
+            with self.assertRaises(etree.RelaxNGParseError):
+                self.registry.get_schema(tmp_file.name)
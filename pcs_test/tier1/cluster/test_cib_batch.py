@@ -0,0 +1,132 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs_test.tools.cib import get_assert_pcs_effect_mixin
+from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.misc import (
+    get_tmp_file,
+    write_data_to_tmpfile,
+    write_file_to_tmpfile,
+)
+from pcs_test.tools.pcs_runner import PcsRunner
+
+TAGS_XML = """
+    <tags>
+        <tag id="tag1">
+            <obj_ref id="x1"/>
+            <obj_ref id="x2"/>
+            <obj_ref id="x3"/>
+        </tag>
+        <tag id="tag2">
+            <obj_ref id="y1"/>
+            <obj_ref id="x2"/>
+        </tag>
+        <tag id="tag3">
+            <obj_ref id="y2-clone"/>
+        </tag>
+        <tag id="tag-mixed-stonith-devices-and-resources">
+            <obj_ref id="fence-rh-2"/>
+            <obj_ref id="y1"/>
+            <obj_ref id="fence-rh-1"/>
+            <obj_ref id="x3"/>
+        </tag>
+        {append}
+    </tags>
+"""
+
+
+class CibBatch(
+    get_assert_pcs_effect_mixin(
+        lambda cib: etree.tostring(etree.parse(cib).findall(".//tags")[0])
+    ),
+    TestCase,
+):
+    def setUp(self):
+        self.temp_cib = get_tmp_file("tier1_cluster_cib_batch")
+        write_file_to_tmpfile(rc("cib-tags.xml"), self.temp_cib)
+        self.pcs_runner = PcsRunner(self.temp_cib.name)
+        self.script = get_tmp_file("tier1_cluster_cib_batch_script")
+        self.batch_cmd = ["cluster", "cib-batch", self.script.name]
+
+    def tearDown(self):
+        self.temp_cib.close()
+        self.script.close()
+
+    def test_success(self):
+        write_data_to_tmpfile(
+            (
+                "# create tags\n"
+                "tag create new1 x1\n"
+                "\n"
+                "pcs tag create new2 x2 y1  # a comment\n"
+                "tag update new1 add x3\n"
+            ),
+            self.script,
+        )
+        self.assert_effect(
+            self.batch_cmd,
+            TAGS_XML.format(
+                append="""
+                    <tag id="new1">
+                        <obj_ref id="x1"/>
+                        <obj_ref id="x3"/>
+                    </tag>
+                    <tag id="new2">
+                        <obj_ref id="x2"/>
+                        <obj_ref id="y1"/>
+                    </tag>
+                """
+            ),
+        )
+
+    def test_command_failed(self):
+        write_data_to_tmpfile(
+            "tag create new1 x1\ntag create new2 noid-01\n", self.script
+        )
+        self.assert_pcs_fail(
+            self.batch_cmd,
+            (
+                "Error: bundle/clone/group/resource 'noid-01' does not exist\n"
+                "Error: Errors have occurred, therefore pcs is unable to "
+                "continue\n"
+                "Error: Command on line 2 failed, no changes have been made "
+                "to the CIB\n"
+            ),
+        )
+        self.assert_resources_xml_in_cib(TAGS_XML.format(append=""))
+
+    def test_no_commands(self):
+        write_data_to_tmpfile("# nothing to do\n\n", self.script)
+        self.assert_pcs_fail(self.batch_cmd, "Error: No commands specified\n")
+
+    def test_unable_to_parse_command(self):
+        write_data_to_tmpfile(
+            "tag create new1 x1\ntag create 'new2 x2\n", self.script
+        )
+        self.assert_pcs_fail(
+            self.batch_cmd,
+            "Error: Unable to parse command on line 2: No closing quotation\n",
+        )
+        self.assert_resources_xml_in_cib(TAGS_XML.format(append=""))
+
+    def test_nested_batch(self):
+        write_data_to_tmpfile(
+            f"tag create new1 x1\ncluster cib-batch {self.script.name}\n",
+            self.script,
+        )
+        self.assert_pcs_fail(
+            self.batch_cmd, "Error: Nested batches are not allowed, line 2\n"
+        )
+
+    def test_bad_args(self):
+        self.assert_pcs_fail(
+            "cluster cib-batch a b".split(), stderr_start="\nUsage: "
+        )
+
+    def test_wait_and_file(self):
+        write_data_to_tmpfile("tag create new1 x1\n", self.script)
+        self.assert_pcs_fail(
+            self.batch_cmd + ["--wait"],
+            "Error: Cannot use '-f' together with '--wait'\n",
+        )
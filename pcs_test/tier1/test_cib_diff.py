@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.pacemaker import cib_diff
+from pcs.lib.pacemaker.live import diff_cibs_xml
+
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+from pcs_test.tools.misc import read_test_resource
+from pcs_test.tools.misc import runner as real_runner
+from pcs_test.tools.xml import etree_to_str
+
+
+class NativeDiffMatchesCrmDiff(TestCase):
+    """
+    Compare patchsets computed by pcs with those produced by crm_diff
+    """
+
+    def setUp(self):
+        self.cib_xml = read_test_resource("cib-large.xml")
+        self.cib = etree.fromstring(self.cib_xml)
+
+    def assert_same_as_crm_diff(self):
+        crm_diff_xml = diff_cibs_xml(
+            real_runner,
+            MockLibraryReportProcessor(),
+            self.cib_xml,
+            etree_to_str(self.cib),
+        )
+        native_diff_xml = cib_diff.diff_cibs_xml(self.cib_xml, self.cib)
+        self.assertTrue(
+            cib_diff.are_patchsets_equivalent(native_diff_xml, crm_diff_xml),
+            f"pcs:\n{native_diff_xml}\ncrm_diff:\n{crm_diff_xml}",
+        )
+
+    def test_no_changes(self):
+        self.assert_same_as_crm_diff()
+
+    def test_attributes_changed(self):
+        primitive = self.cib.find(".//resources//primitive")
+        primitive.set("type", "Stateful")
+        primitive.set("description", "changed")
+        self.assert_same_as_crm_diff()
+
+    def test_element_created(self):
+        resources = self.cib.find(".//resources")
+        resources.insert(
+            1,
+            etree.fromstring(
+                """
+                <group id="new-group">
+                    <primitive id="new-primitive" class="ocf"
+                        provider="pacemaker" type="Dummy"
+                    />
+                </group>
+                """
+            ),
+        )
+        etree.SubElement(
+            self.cib.find(".//constraints"),
+            "rsc_order",
+            {"id": "new-order", "first": "new-group", "then": "new-primitive"},
+        )
+        self.assert_same_as_crm_diff()
+
+    def test_element_deleted(self):
+        nvpair = self.cib.find(".//resources//nvpair")
+        nvpair.getparent().remove(nvpair)
+        resources = self.cib.find(".//resources")
+        resources.remove(resources[0])
+        self.assert_same_as_crm_diff()
+
+    def test_element_moved(self):
+        resources = self.cib.find(".//resources")
+        resources.append(resources[0])
+        self.assert_same_as_crm_diff()
+
+    def test_element_moved_back(self):
+        resources = self.cib.find(".//resources")
+        resources.insert(0, resources[len(resources) - 1])
+        self.assert_same_as_crm_diff()
+
+    def test_element_without_id_changed(self):
+        self.cib.find("./configuration/crm_config").set("x", "y")
+        self.assert_same_as_crm_diff()
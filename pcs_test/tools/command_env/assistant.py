@@ -6,6 +6,7 @@ import shutil
 from functools import partial
 from unittest import mock
 
+from pcs import settings
 from pcs.common.file import RawFile
 from pcs.common.node_communicator import NodeCommunicatorFactory
 from pcs.lib.env import LibraryEnvironment
@@ -53,6 +54,7 @@ def patch_env(call_queue, config, init_env, is_systemd=True):
     orig_cmd_runner = init_env.cmd_runner
     get_node_communicator = init_env.get_node_communicator
     mock_communicator_factory = mock.Mock(spec_set=NodeCommunicatorFactory)
+    mock_communicator_factory.request_timeout = settings.default_request_timeout
     mock_communicator_factory.get_communicator = (
         # TODO: use request_timeout
         lambda request_timeout=None: (
@@ -205,3 +205,87 @@ class HttpConfig:
 
     def place_multinode_call(self, *args, **kwargs):
         place_multinode_call(self.__calls, *args, **kwargs)
+
+    def node_actions(
+        self, call_name_list, name="http.node_actions", before=None
+    ):
+        """
+        Replace calls by one call running their requests in one request per
+        node, see pcs.lib.communication.nodes.RunNodeActions
+
+        list call_name_list -- keys of already placed calls to replace, in the
+            order their requests are run on the nodes
+        string name -- the key of this call
+        string before -- key of a call before which this call is to be placed,
+            defaults to the place of the last replaced call
+        """
+        label_pairs = {}
+        for call_name in call_name_list:
+            request_list = self.__calls.get(
+                f"{call_name}_requests"
+            ).request_list
+            response_list = self.__calls.get(
+                f"{call_name}_responses"
+            ).response_list
+            for request, response in zip(request_list, response_list):
+                label_pairs.setdefault(request.target.label, []).append(
+                    (request, response)
+                )
+        communication_list = []
+        for label, pairs in label_pairs.items():
+            if len(pairs) == 1:
+                # a single request is sent as it is
+                request, response = pairs[0]
+                communication_list.append(
+                    dict(
+                        label=label,
+                        action=request.action,
+                        # pylint: disable=protected-access
+                        param_list=request._data.structured_data,
+                        response_code=response.response_code,
+                        output=response.data,
+                    )
+                )
+                continue
+            result_list = []
+            for request, response in pairs:
+                result_list.append(
+                    dict(
+                        command=request.action.split("/")[-1],
+                        code=response.response_code,
+                        data=response.data,
+                    )
+                )
+                # nodes stop running actions at the first failed one
+                if response.response_code != 200:
+                    break
+            communication_list.append(
+                dict(
+                    label=label,
+                    action="remote/node_actions",
+                    param_list=[
+                        (
+                            "data_json",
+                            json.dumps(
+                                [
+                                    dict(
+                                        command=request.action,
+                                        data=request.data,
+                                    )
+                                    for request, _ in pairs
+                                ]
+                            ),
+                        )
+                    ],
+                    output=json.dumps(dict(results=result_list)),
+                )
+            )
+        place_communication(
+            self.__calls,
+            name,
+            communication_list,
+            before=before or f"{call_name_list[-1]}_requests",
+        )
+        for call_name in call_name_list:
+            self.__calls.remove(f"{call_name}_requests")
+            self.__calls.remove(f"{call_name}_responses")
@@ -232,6 +232,7 @@ class HostShortcuts:
         pacemaker_started_node_list=(),
         pacemaker_not_started_node_list=(),
         communication_list=None,
+        wait=None,
         name="http.host.check_pacemaker_started",
     ):
         """
@@ -242,6 +243,7 @@ class HostShortcuts:
         pacemaker_not_started_node_list list -- listof node names on which
             pacemaker is not fully started yet
         communication_list list -- create custom responses
+        wait int -- how long the nodes are asked to wait for pacemaker to start
         name string -- the key of this call
         """
         if bool(
@@ -282,6 +284,7 @@ class HostShortcuts:
             name,
             communication_list,
             action="remote/pacemaker_node_status",
+            param_list=[("wait", str(wait))] if wait else None,
         )
 
     def get_quorum_status(
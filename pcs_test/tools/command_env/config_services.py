@@ -1,4 +1,5 @@
 from pcs.common.services import errors
+from pcs.common.services.types import ServiceState
 
 from pcs_test.tools.command_env.mock_service_manager import Call
 
@@ -146,6 +147,7 @@ class ServiceManagerConfig:
         name="services.is_enabled",
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -154,6 +156,7 @@ class ServiceManagerConfig:
                 service=service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
             ),
             before=before,
             instead=instead,
@@ -167,6 +170,7 @@ class ServiceManagerConfig:
         return_value=True,
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -175,6 +179,35 @@ class ServiceManagerConfig:
                 service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
+            ),
+            before=before,
+            instead=instead,
+        )
+
+    def get_states(
+        self,
+        state_dict,
+        name="services.get_states",
+        before=None,
+        instead=None,
+        exception=None,
+    ):
+        """
+        state_dict -- {service name: (enabled, running)} of the queried
+            services in the order they are queried
+        exception -- exception raised instead of returning the states
+        """
+        self.__calls.place(
+            name,
+            Call(
+                "get_states",
+                service=list(state_dict),
+                return_value={
+                    service: ServiceState(enabled, running)
+                    for service, (enabled, running) in state_dict.items()
+                },
+                exception=exception,
             ),
             before=before,
             instead=instead,
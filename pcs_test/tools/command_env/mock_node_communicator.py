@@ -1,5 +1,8 @@
 import json
-from urllib.parse import parse_qs
+from urllib.parse import (
+    parse_qs,
+    parse_qsl,
+)
 
 from pcs import settings
 from pcs.common import pcs_pycurl as pycurl
@@ -317,6 +320,7 @@ class StartLoopCall:
 
 
 def _compare_request_data(expected, real):
+    # pylint: disable=too-many-return-statements
     if expected == real:
         return True
 
@@ -339,10 +343,29 @@ def _compare_request_data(expected, real):
     try:
         expected_data = json.loads(expected[0][1])
         real_data = json.loads(real[0][1])
-        return expected_data == real_data
     except ValueError:
         return False
 
+    # Actions run in one request carry their own request data, compare them
+    # the same way.
+    if _is_node_action_list(expected_data) and _is_node_action_list(real_data):
+        return len(expected_data) == len(real_data) and all(
+            expected_action["command"] == real_action["command"]
+            and _compare_request_data(
+                parse_qsl(expected_action["data"]),
+                parse_qsl(real_action["data"]),
+            )
+            for expected_action, real_action in zip(expected_data, real_data)
+        )
+    return expected_data == real_data
+
+
+def _is_node_action_list(data):
+    return isinstance(data, list) and all(
+        isinstance(item, dict) and "command" in item and "data" in item
+        for item in data
+    )
+
 
 class NodeCommunicator:
     def __init__(self, call_queue=None):
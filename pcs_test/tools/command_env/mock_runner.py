@@ -138,3 +138,9 @@ class Runner:
                 f"Command #{i}: ENV doesn't match. Expected: {call.env}; Real: {env}"
             )
         return call.stdout, call.stderr, call.returncode
+
+    def map_concurrently(self, func, items, max_workers):
+        # mocked calls are expected in a defined order, run them one by one
+        del max_workers
+        for item in items:
+            yield func(self, item)
@@ -62,6 +62,7 @@ def remote(params, request, auth_user)
       :put_file => method(:put_file),
       :remove_file => method(:remove_file),
       :manage_services => method(:manage_services),
+      :node_actions => method(:node_actions),
       :check_host => method(:check_host),
       :reload_corosync_conf => method(:reload_corosync_conf),
       :remove_nodes_from_cib => method(:remove_nodes_from_cib),
@@ -722,7 +723,13 @@ def remote_pacemaker_node_status(params, request, auth_user)
   if not allowed_for_local_cluster(auth_user, Permissions::READ)
     return 403, 'Permission denied'
   end
-  output, stderr, retval = run_cmd(auth_user, PCS, '--', 'node', 'pacemaker-status')
+  cmd = [PCS, '--', 'node', 'pacemaker-status']
+  # wait for pacemaker to start to save the caller from polling the node
+  if params[:wait].to_s =~ /\A[1-9][0-9]*\z/
+    wait = [params[:wait].to_i, PACEMAKER_NODE_STATUS_MAX_WAIT].min
+    cmd.insert(1, "--wait=#{wait}")
+  end
+  output, stderr, retval = run_cmd(auth_user, *cmd)
   if retval != 0
     return [400, stderr]
   else
@@ -2152,6 +2159,75 @@ def manage_services(params, request, auth_user)
   end
 end
 
+# Runs several remote commands in one request. The commands are run in the
+# specified order until one of them fails. Each command checks permissions on
+# its own.
+def node_actions(params, request, auth_user)
+  command_handlers = {
+    :cluster_destroy => method(:cluster_destroy),
+    :cluster_enable => method(:cluster_enable),
+    :known_hosts_change => method(:known_hosts_change),
+    :manage_services => method(:manage_services),
+    :put_file => method(:put_file),
+    :remove_file => method(:remove_file),
+    :sbd_disable => method(:sbd_disable),
+    :sbd_enable => method(:sbd_enable),
+    :set_certs => method(:set_certs),
+    :set_corosync_conf => method(:set_corosync_conf),
+    :set_sbd_config => method(:set_sbd_config),
+  }
+  begin
+    action_list = check_request_data_for_json(params, auth_user)
+    PcsdExchangeFormat::validate_item_is_Array('actions', action_list)
+
+    result_list = []
+    action_list.each { |action|
+      PcsdExchangeFormat::validate_item_is_Hash('action', '', action)
+      command = action[:command].to_s.sub(/^remote\//, '').to_sym
+      unless command_handlers.include?(command)
+        raise PcsdRequestException.new(
+          "Unsupported command '#{action[:command]}'"
+        )
+      end
+      command_params = Sinatra::IndifferentHash[
+        Rack::Utils.parse_query(action[:data].to_s)
+      ]
+      result = command_handlers[command].call(
+        command_params, request, auth_user
+      )
+      code, output = result.is_a?(Array) ? result : [200, result]
+      result_list << {:command => command, :code => code, :data => output.to_s}
+      break if node_action_failed?(command, code, output)
+    }
+    return [200, JSON.generate({:results => result_list})]
+  rescue PcsdRequestException => e
+    return e.code, e.message
+  rescue PcsdExchangeFormat::Error => e
+    return 400, "Invalid input data format: #{e.message}"
+  end
+end
+
+def node_action_failed?(command, code, output)
+  return true if code != 200
+  # Commands processing several items respond with success even if some of
+  # the items failed.
+  item_success_codes = {
+    :manage_services => ['actions', ['success']],
+    :put_file => ['files', ['written', 'rewritten', 'same_content']],
+    :remove_file => ['files', ['deleted', 'not_found']],
+  }
+  return false unless item_success_codes.include?(command)
+  items_key, success_codes = item_success_codes[command]
+  begin
+    item_results = JSON.parse(output.to_s).fetch(items_key)
+    return item_results.values.any? { |item_result|
+      not success_codes.include?(item_result.fetch('code'))
+    }
+  rescue JSON::ParserError, KeyError, NoMethodError, TypeError
+    return true
+  end
+end
+
 def pcsd_success(msg)
   $logger.info(msg)
   return [200, msg]
@@ -2205,7 +2281,8 @@ def check_host(params, request, auth_user)
     :services => {},
     :cluster_configuration_exists => (
       File.exist?(Cfgsync::CorosyncConf.file_path) or File.exist?(CIB_PATH)
-    )
+    ),
+    :pcsd_capabilities => CAPABILITIES_PCSD,
   }
 
   service_checker = ServiceChecker.new(